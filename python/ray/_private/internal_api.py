@@ -42,8 +42,8 @@ def memory_summary(
     ) + get_store_stats(state)
 
 
-def get_store_stats(state, node_manager_address=None, node_manager_port=None):
-    """Returns a formatted string describing memory usage in the cluster."""
+def get_memory_info_reply(state, node_manager_address=None, node_manager_port=None):
+    """Returns global memory info."""
 
     from ray.core.generated import node_manager_pb2, node_manager_pb2_grpc
 
@@ -76,6 +76,13 @@ def get_store_stats(state, node_manager_address=None, node_manager_port=None):
         node_manager_pb2.FormatGlobalMemoryInfoRequest(include_memory_info=False),
         timeout=60.0,
     )
+    return reply
+
+
+def get_store_stats(state, node_manager_address=None, node_manager_port=None):
+    """Returns a formatted string describing memory usage in the cluster."""
+
+    reply = get_memory_info_reply(state, node_manager_address, node_manager_port)
     return store_stats_summary(reply)
 
 
@@ -1,6 +1,7 @@
 import fnmatch
 import os
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pkg_resources import packaging
 from typing import List, Optional, Tuple
 
@@ -286,6 +287,37 @@ def _upload_to_uri_with_exclude(
             )
 
 
+def upload_files_to_uri(
+    local_path: str, uri: str, files: List[str], num_threads: int = 1
+) -> None:
+    """Uploads files to a URI, keeping their paths relative to ``local_path``.
+
+    The files are uploaded in parallel by ``num_threads`` threads.
+    """
+    _assert_pyarrow_installed()
+
+    fs, bucket_path = get_fs_and_path(uri)
+    if not fs:
+        raise ValueError(
+            f"Could not upload to URI: "
+            f"URI `{uri}` is not a valid or supported cloud target. "
+            f"Hint: {fs_hint(uri)}"
+        )
+
+    def _upload(file: str):
+        _pyarrow_fs_copy_files(
+            os.path.normpath(os.path.join(local_path, file)),
+            os.path.normpath(os.path.join(bucket_path, file)),
+            destination_filesystem=fs,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(num_threads, 1)) as executor:
+        futures = [executor.submit(_upload, file) for file in files]
+        # Raises the first error, after all uploads finished
+        for future in futures:
+            future.result()
+
+
 def list_at_uri(uri: str) -> List[str]:
     """Returns the list of filenames at a URI (similar to os.listdir).
 
@@ -481,6 +481,18 @@ class ArrowBlockAccessor(TableBlockAccessor):
                 yield None, self.to_block()
                 return
 
+            if DatasetContext.get_current().use_polars:
+                # Find the group boundaries with a vectorized scan of the key
+                # column, instead of iterating over the rows.
+                if self._table.num_rows == 0:
+                    return
+                starts = transform_polars.group_start_indices(self._table, key)
+                ends = list(starts[1:]) + [self._table.num_rows]
+                keys = self._table[key]
+                for start, end in zip(starts, ends):
+                    yield keys[int(start)].as_py(), self.slice(int(start), int(end))
+                return
+
             start = end = 0
             iter = self.iter_rows()
             next_row = None
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING, List
 
+import numpy as np
+
 try:
     import pyarrow
 except ImportError:
@@ -7,6 +9,8 @@ except ImportError:
 
 
 if TYPE_CHECKING:
+    import polars
+
     from ray.data._internal.sort import SortKeyT
 
 pl = None
@@ -23,11 +27,24 @@ def check_polars_installed():
         )
 
 
+def is_polars_dataframe(batch) -> bool:
+    """Whether the batch is a polars DataFrame, without importing polars."""
+    return type(batch).__module__.startswith("polars") and hasattr(batch, "to_arrow")
+
+
+def _sort_df(df: "polars.DataFrame", col: str, descending: bool) -> "polars.DataFrame":
+    try:
+        return df.sort(col, descending=descending)
+    except TypeError:
+        # polars < 0.17 names this argument `reverse`.
+        return df.sort(col, reverse=descending)
+
+
 def sort(table: "pyarrow.Table", key: "SortKeyT", descending: bool) -> "pyarrow.Table":
     check_polars_installed()
     col, _ = key[0]
     df = pl.from_arrow(table)
-    return df.sort(col, reverse=descending).to_arrow()
+    return _sort_df(df, col, descending).to_arrow()
 
 
 def concat_and_sort(
@@ -36,5 +53,26 @@ def concat_and_sort(
     check_polars_installed()
     col, _ = key[0]
     blocks = [pl.from_arrow(block) for block in blocks]
-    df = pl.concat(blocks).sort(col, reverse=descending)
+    df = _sort_df(pl.concat(blocks), col, descending)
+    return df.to_arrow()
+
+
+def group_start_indices(table: "pyarrow.Table", key: str) -> np.ndarray:
+    """Return the index of the first row of each group of a table sorted by key."""
+    check_polars_installed()
+    keys = pl.from_arrow(table.select([key])).to_series()
+    prev_keys = keys.shift(1)
+    is_group_start = (keys != prev_keys).fill_null(True)
+    # Consecutive null keys belong to the same group.
+    is_group_start = is_group_start & ~(keys.is_null() & prev_keys.is_null())
+    # The first row always starts a group.
+    return np.union1d([0], is_group_start.arg_true().to_numpy())
+
+
+def to_polars(table: "pyarrow.Table") -> "polars.DataFrame":
+    check_polars_installed()
+    return pl.from_arrow(table)
+
+
+def from_polars(df: "polars.DataFrame") -> "pyarrow.Table":
     return df.to_arrow()
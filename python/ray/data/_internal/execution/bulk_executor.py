@@ -11,7 +11,7 @@ from ray.data._internal.execution.interfaces import (
 from ray.data._internal.dataset_logger import DatasetLogger
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.progress_bar import ProgressBar
-from ray.data._internal.stats import DatasetStats
+from ray.data._internal.stats import DatasetStats, get_spilled_bytes_total
 
 logger = DatasetLogger(__name__)
 
@@ -56,6 +56,11 @@ class BulkExecutor(Executor):
             # Fully execute this operator.
             logger.get_logger().debug("Executing op %s", op.name)
             builder = self._stats.child_builder(op.name)
+            context = DatasetContext.get_current()
+            if context.enable_operator_profiling:
+                # Operators run one at a time, so spilling that happens while this
+                # one runs is attributed to it.
+                spilled_bytes_before = get_spilled_bytes_total()
             try:
                 op.start(self._options)
                 for i, ref_bundles in enumerate(inputs):
@@ -70,12 +75,17 @@ class BulkExecutor(Executor):
             saved_outputs[op] = output
             op_stats = op.get_stats()
             op_metrics = op.get_metrics()
+            if context.enable_operator_profiling and spilled_bytes_before is not None:
+                spilled_bytes_after = get_spilled_bytes_total()
+                if spilled_bytes_after is not None:
+                    op_metrics["obj_store_mem_spilled"] = (
+                        spilled_bytes_after - spilled_bytes_before
+                    )
             if op_stats:
                 self._stats = builder.build_multistage(op_stats)
-                self._stats.extra_metrics = op_metrics
+                self._stats.extra_metrics.update(op_metrics)
             stats_summary = self._stats.to_summary()
             stats_summary_string = stats_summary.to_string(include_parent=False)
-            context = DatasetContext.get_current()
             logger.get_logger(log_to_stdout=context.enable_auto_log_stats).info(
                 stats_summary_string,
             )
@@ -20,6 +20,7 @@ from ray.data._internal.execution.interfaces import (
 )
 from ray.data._internal.memory_tracing import trace_allocation
 from ray.data._internal.stats import StatsDict
+from ray.data.context import DatasetContext
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 from ray.types import ObjectRef
 from ray._raylet import ObjectRefGenerator
@@ -56,6 +57,8 @@ class MapOperator(PhysicalOperator, ABC):
         self._output_queue: _OutputQueue = None
         # Output metadata, added to on get_next().
         self._output_metadata: List[BlockMetadata] = []
+        # Whether to look up input locations to attribute remote pulls to tasks.
+        self._profiling_enabled = DatasetContext.get_current().enable_operator_profiling
 
         super().__init__(name, [input_op])
 
@@ -185,6 +188,11 @@ class MapOperator(PhysicalOperator, ABC):
         """
         # Notify output queue that this task is pending.
         self._output_queue.notify_pending_task(task)
+        if self._profiling_enabled:
+            # Look up input locations before the task pulls copies of its inputs.
+            task.input_locations = ray.experimental.get_object_locations(
+                [block for block, _ in task.inputs.blocks]
+            )
 
     @abstractmethod
     def notify_work_completed(
@@ -211,6 +219,8 @@ class MapOperator(PhysicalOperator, ABC):
         """
         # Notify output queue that this task is complete.
         self._output_queue.notify_task_completed(task)
+        if task.input_locations is not None:
+            _record_remote_bytes_pulled(task)
         task.inputs.destroy_if_owned()
         # Update object store metrics.
         allocated = task.output.size_bytes()
@@ -307,10 +317,31 @@ class _TaskState:
     Attributes:
         inputs: The input ref bundle.
         output: The output ref bundle that is set when the task completes.
+        input_locations: The locations of the input blocks when the task was
+            submitted, if operator profiling is enabled.
     """
 
     inputs: RefBundle
     output: Optional[RefBundle] = None
+    input_locations: Optional[Dict[ObjectRef, Dict[str, Any]]] = None
+
+
+def _record_remote_bytes_pulled(task: _TaskState) -> None:
+    """Record the bytes of inputs that the completed task pulled from other nodes.
+
+    The bytes are attributed to the exec stats of the task's first output block.
+    """
+    if not task.output.blocks:
+        return
+    exec_stats = task.output.blocks[0][1].exec_stats
+    if exec_stats is None:
+        return
+    remote_bytes_pulled = 0
+    for block, _ in task.inputs.blocks:
+        location = task.input_locations.get(block)
+        if location is not None and exec_stats.node_id not in location["node_ids"]:
+            remote_bytes_pulled += location["object_size"]
+    exec_stats.remote_bytes_pulled = remote_bytes_pulled
 
 
 @dataclass
@@ -72,7 +72,9 @@ class MapBatches(AbstractMap):
         input_op: LogicalOperator,
         fn: BatchUDF,
         batch_size: Optional[int] = DEFAULT_BATCH_SIZE,
-        batch_format: Literal["default", "pandas", "pyarrow", "numpy"] = "default",
+        batch_format: Literal[
+            "default", "pandas", "pyarrow", "numpy", "polars"
+        ] = "default",
         prefetch_batches: int = 0,
         zero_copy_batch: bool = False,
         fn_args: Optional[Iterable[Any]] = None,
@@ -0,0 +1,284 @@
+"""Persistent, lineage-keyed cache of materialized Dataset blocks.
+
+When ``DatasetContext.materialization_cache_dir`` is set, ``Dataset.fully_executed()``
+fingerprints the dataset's lineage (read tasks, transformation stages and the size and
+modification time of every input file) and looks the fingerprint up in the cache
+directory before executing anything. On a miss, the plan is executed as usual and the
+output blocks are written to the cache as Parquet files, one file per block. On a hit,
+the plan's snapshot is replaced by a read of those files, so the same preprocessing
+plan rerun across Tune trials or driver restarts is computed only once.
+
+Layout of the cache directory::
+
+    <cache_dir>/<fingerprint>/block_000000.parquet
+    <cache_dir>/<fingerprint>/block_000001.parquet
+    ...
+    <cache_dir>/<fingerprint>/_manifest.json
+
+The manifest is written last, so an entry without a manifest is an incomplete write
+and is ignored. Entries are evicted in least-recently-used order once the total size
+of the cache exceeds ``DatasetContext.materialization_cache_max_bytes``.
+"""
+
+import hashlib
+import json
+import time
+import uuid
+from typing import TYPE_CHECKING, List, Optional
+
+import ray
+from ray.data._internal.dataset_logger import DatasetLogger
+from ray.data._internal.lazy_block_list import LazyBlockList
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data.block import Block, BlockAccessor
+from ray.data.context import DatasetContext
+
+if TYPE_CHECKING:
+    import pyarrow
+    from ray.data._internal.plan import ExecutionPlan
+
+logger = DatasetLogger(__name__)
+
+# Bump this whenever the fingerprint or the on-disk layout changes, so that entries
+# written by older versions are never reused.
+_CACHE_FORMAT_VERSION = "1"
+
+_MANIFEST_FILE = "_manifest.json"
+
+
+def compute_lineage_fingerprint(plan: "ExecutionPlan") -> Optional[str]:
+    """Compute a deterministic fingerprint of the plan's lineage.
+
+    Unlike ``Dataset.serialize_lineage()``, the fingerprint excludes the dataset UUID
+    and execution stats, which differ across otherwise identical runs.
+
+    Returns:
+        A hex digest, or None if the plan can't be fingerprinted (e.g. its input is
+        not lazy, it contains unseeded random stages, or a stage isn't picklable).
+    """
+    from ray.data._internal.stage_impl import RandomizeBlocksStage, RandomShuffleStage
+
+    in_blocks = plan._in_blocks
+    if not isinstance(in_blocks, LazyBlockList):
+        return None
+    stages = plan._stages_before_snapshot + plan._stages_after_snapshot
+    for stage in stages:
+        if (
+            isinstance(stage, (RandomizeBlocksStage, RandomShuffleStage))
+            and stage._seed is None
+        ):
+            # The output of unseeded random stages is not a function of the lineage.
+            return None
+
+    h = hashlib.sha256()
+    h.update(_CACHE_FORMAT_VERSION.encode())
+    try:
+        for task in in_blocks._tasks:
+            h.update(ray.cloudpickle.dumps(task))
+        for stage in stages:
+            h.update(stage.name.encode())
+            h.update(ray.cloudpickle.dumps(stage))
+    except Exception as e:
+        logger.get_logger().debug(f"Unable to fingerprint dataset lineage: {e}")
+        return None
+
+    input_files = set()
+    for task in in_blocks._tasks:
+        input_files.update(task.get_metadata().input_files or [])
+    if input_files:
+        fingerprints = _fingerprint_input_files(sorted(input_files))
+        if fingerprints is None:
+            return None
+        h.update(fingerprints.encode())
+    return h.hexdigest()
+
+
+def _fingerprint_input_files(paths: List[str]) -> Optional[str]:
+    """Describe the size and modification time of each input file."""
+    from pyarrow.fs import FileType
+
+    from ray.data.datasource.file_based_datasource import (
+        _resolve_paths_and_filesystem,
+    )
+
+    try:
+        resolved_paths, filesystem = _resolve_paths_and_filesystem(paths)
+        infos = filesystem.get_file_info(resolved_paths)
+    except Exception as e:
+        logger.get_logger().debug(f"Unable to fingerprint input files: {e}")
+        return None
+    entries = []
+    for info in infos:
+        if info.type == FileType.NotFound:
+            return None
+        mtime = info.mtime_ns if info.mtime_ns is not None else ""
+        entries.append(f"{info.path}:{info.size}:{mtime}")
+    return "\n".join(entries)
+
+
+class MaterializationCache:
+    """A directory of materialized datasets keyed by lineage fingerprint.
+
+    The directory can be local or on any filesystem supported by ``pyarrow.fs``. Note
+    that a local directory must be visible to every node in the cluster, since blocks
+    are written and read by remote tasks.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: Optional[int] = None):
+        from ray.data.datasource.file_based_datasource import (
+            _resolve_paths_and_filesystem,
+        )
+
+        [self._root], self._fs = _resolve_paths_and_filesystem(cache_dir)
+        self._fs.create_dir(self._root, recursive=True)
+        self._max_bytes = max_bytes
+
+    @staticmethod
+    def from_context(context: DatasetContext) -> Optional["MaterializationCache"]:
+        """Create the cache configured in the given context, if any."""
+        if not context.materialization_cache_dir:
+            return None
+        return MaterializationCache(
+            context.materialization_cache_dir,
+            context.materialization_cache_max_bytes,
+        )
+
+    def load(self, key: str, plan: "ExecutionPlan") -> bool:
+        """Replace the plan's output with the cached blocks for the key.
+
+        Returns:
+            Whether the key was found in the cache.
+        """
+        manifest = self._read_manifest(key)
+        if manifest is None:
+            return False
+        paths = [
+            f"{self._root}/{key}/{_block_file(i)}"
+            for i in range(manifest["num_blocks"])
+        ]
+        if not paths:
+            return False
+        try:
+            cached_plan = ray.data.read_parquet(paths, filesystem=self._fs)._plan
+            blocks = cached_plan.execute(force_read=True)
+        except Exception as e:
+            logger.get_logger().warning(
+                f"Failed to load dataset from materialization cache entry {key}, "
+                f"recomputing it: {e}"
+            )
+            return False
+        plan._set_computed_output(blocks, cached_plan.stats())
+        manifest["last_access_time"] = time.time()
+        self._write_manifest(key, manifest)
+        logger.get_logger().info(f"Loaded dataset from materialization cache: {key}")
+        return True
+
+    def store(self, key: str, plan: "ExecutionPlan") -> bool:
+        """Write the plan's computed output to the cache under the key.
+
+        Returns:
+            Whether the output was written to the cache.
+        """
+        from ray.data.datasource.file_based_datasource import (
+            _wrap_s3_serialization_workaround,
+        )
+
+        block_refs = plan.execute().get_blocks()
+        if not block_refs:
+            return False
+        tmp_dir = f"{self._root}/{key}.tmp-{uuid.uuid4().hex}"
+        self._fs.create_dir(tmp_dir, recursive=True)
+        write_block = cached_remote_fn(_write_block)
+        filesystem = _wrap_s3_serialization_workaround(self._fs)
+        try:
+            num_bytes = sum(
+                ray.get(
+                    [
+                        write_block.remote(
+                            block, filesystem, f"{tmp_dir}/{_block_file(i)}"
+                        )
+                        for i, block in enumerate(block_refs)
+                    ]
+                )
+            )
+        except Exception as e:
+            # Most likely a simple (non-tabular) dataset, which can't be written as
+            # Parquet.
+            logger.get_logger().debug(
+                f"Unable to write dataset to materialization cache: {e}"
+            )
+            self._fs.delete_dir(tmp_dir)
+            return False
+
+        final_dir = f"{self._root}/{key}"
+        if self._read_manifest(key) is not None:
+            # Another driver raced with us and already committed this entry.
+            self._fs.delete_dir(tmp_dir)
+            return True
+        try:
+            self._fs.delete_dir(final_dir)
+        except FileNotFoundError:
+            pass
+        self._fs.move(tmp_dir, final_dir)
+        self._write_manifest(
+            key,
+            {
+                "num_blocks": len(block_refs),
+                "num_bytes": num_bytes,
+                "last_access_time": time.time(),
+            },
+        )
+        self._evict_if_needed(keep=key)
+        return True
+
+    def _evict_if_needed(self, keep: str) -> None:
+        """Evict least recently used entries until the cache fits in max_bytes."""
+        if self._max_bytes is None:
+            return
+        from pyarrow.fs import FileSelector, FileType
+
+        entries = []
+        for info in self._fs.get_file_info(FileSelector(self._root)):
+            if info.type != FileType.Directory:
+                continue
+            manifest = self._read_manifest(info.base_name)
+            if manifest is not None:
+                entries.append((manifest["last_access_time"], info.base_name, manifest))
+        total_bytes = sum(manifest["num_bytes"] for _, _, manifest in entries)
+        for _, key, manifest in sorted(entries):
+            if total_bytes <= self._max_bytes:
+                break
+            if key == keep:
+                continue
+            self._fs.delete_dir(f"{self._root}/{key}")
+            total_bytes -= manifest["num_bytes"]
+            logger.get_logger().info(f"Evicted materialization cache entry {key}")
+
+    def _read_manifest(self, key: str) -> Optional[dict]:
+        try:
+            with self._fs.open_input_stream(
+                f"{self._root}/{key}/{_MANIFEST_FILE}"
+            ) as f:
+                return json.loads(f.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_manifest(self, key: str, manifest: dict) -> None:
+        with self._fs.open_output_stream(f"{self._root}/{key}/{_MANIFEST_FILE}") as f:
+            f.write(json.dumps(manifest).encode())
+
+
+def _block_file(block_index: int) -> str:
+    return f"block_{block_index:06}.parquet"
+
+
+def _write_block(block: Block, filesystem: "pyarrow.fs.FileSystem", path: str) -> int:
+    import pyarrow.parquet as pq
+
+    from ray.data.datasource.file_based_datasource import _S3FileSystemWrapper
+
+    if isinstance(filesystem, _S3FileSystemWrapper):
+        filesystem = filesystem.unwrap()
+    table = BlockAccessor.for_block(block).to_arrow()
+    pq.write_table(table, path, filesystem=filesystem)
+    return filesystem.get_file_info(path).size
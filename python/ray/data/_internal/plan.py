@@ -592,6 +592,18 @@ class ExecutionPlan:
             self._snapshot_blocks = self._snapshot_blocks.compute_to_blocklist()
         return self._snapshot_blocks
 
+    def _set_computed_output(self, blocks: BlockList, stats: DatasetStats) -> None:
+        """Set the output of this plan to blocks computed elsewhere.
+
+        This is used to satisfy the plan from the materialization cache; all stages
+        are considered executed afterwards.
+        """
+        self._snapshot_blocks = blocks
+        self._snapshot_stats = stats
+        self._snapshot_stats.dataset_uuid = self._dataset_uuid
+        self._stages_before_snapshot += self._stages_after_snapshot
+        self._stages_after_snapshot = []
+
     def clear_block_refs(self) -> None:
         """Clear all cached block references of this plan, including input blocks.
 
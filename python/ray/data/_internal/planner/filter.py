@@ -1,7 +1,7 @@
 from typing import Callable, Iterator
 
 from ray.data._internal.execution.interfaces import TaskContext
-from ray.data.block import Block, BlockAccessor, RowUDF
+from ray.data.block import Block, BlockAccessor, RowUDF, _apply_row_udf
 from ray.data.context import DatasetContext
 
 
@@ -21,8 +21,8 @@ def generate_filter_fn() -> Callable[
         for block in blocks:
             block = BlockAccessor.for_block(block)
             builder = block.builder()
-            for row in block.iter_rows():
-                if row_fn(row):
+            for row, keep in _apply_row_udf(row_fn, block.iter_rows()):
+                if keep:
                     builder.add(row)
             # NOTE: this yields an empty block if all rows are filtered out.
             # This causes different behavior between filter and other map-like
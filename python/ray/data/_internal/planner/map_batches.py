@@ -1,10 +1,12 @@
 import sys
+import time
 from typing import Callable, Iterator, Optional
 
+from ray.data._internal.arrow_ops import transform_polars
 from ray.data._internal.block_batching import batch_blocks
 from ray.data._internal.execution.interfaces import TaskContext
 from ray.data._internal.output_buffer import BlockOutputBuffer
-from ray.data.block import BatchUDF, Block, DataBatch
+from ray.data.block import BatchUDF, Block, DataBatch, _record_udf_time
 from ray.data.context import DEFAULT_BATCH_SIZE, DatasetContext
 
 
@@ -16,7 +18,9 @@ else:
 
 def generate_map_batches_fn(
     batch_size: Optional[int] = DEFAULT_BATCH_SIZE,
-    batch_format: Literal["default", "pandas", "pyarrow", "numpy"] = "default",
+    batch_format: Literal[
+        "default", "pandas", "pyarrow", "numpy", "polars"
+    ] = "default",
     prefetch_batches: int = 0,
     zero_copy_batch: bool = False,
 ) -> Callable[[Iterator[Block], TaskContext, BatchUDF], Iterator[Block]]:
@@ -40,12 +44,13 @@ def generate_map_batches_fn(
         def validate_batch(batch: Block) -> None:
             if not isinstance(
                 batch, (list, pa.Table, np.ndarray, dict, pd.core.frame.DataFrame)
-            ):
+            ) and not transform_polars.is_polars_dataframe(batch):
                 raise ValueError(
                     "The `fn` you passed to `map_batches` returned a value of type "
                     f"{type(batch)}. This isn't allowed -- `map_batches` expects "
                     "`fn` to return a `pandas.DataFrame`, `pyarrow.Table`, "
-                    "`numpy.ndarray`, `list`, or `dict[str, numpy.ndarray]`."
+                    "`polars.DataFrame`, `numpy.ndarray`, `list`, or "
+                    "`dict[str, numpy.ndarray]`."
                 )
 
             if isinstance(batch, dict):
@@ -63,7 +68,9 @@ def generate_map_batches_fn(
         def process_next_batch(batch: DataBatch) -> Iterator[Block]:
             # Apply UDF.
             try:
+                start = time.perf_counter()
                 batch = batch_fn(batch, *fn_args, **fn_kwargs)
+                _record_udf_time(time.perf_counter() - start)
             except ValueError as e:
                 read_only_msgs = [
                     "assignment destination is read-only",
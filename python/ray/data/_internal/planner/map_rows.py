@@ -2,7 +2,7 @@ from typing import Callable, Iterator
 
 from ray.data._internal.execution.interfaces import TaskContext
 from ray.data._internal.output_buffer import BlockOutputBuffer
-from ray.data.block import Block, BlockAccessor, RowUDF
+from ray.data.block import Block, BlockAccessor, RowUDF, _apply_row_udf
 from ray.data.context import DatasetContext
 
 
@@ -20,8 +20,8 @@ def generate_map_rows_fn() -> Callable[
         output_buffer = BlockOutputBuffer(None, context.target_max_block_size)
         for block in blocks:
             block = BlockAccessor.for_block(block)
-            for row in block.iter_rows():
-                output_buffer.add(row_fn(row))
+            for _, out in _apply_row_udf(row_fn, block.iter_rows()):
+                output_buffer.add(out)
                 if output_buffer.has_next():
                     yield output_buffer.next()
         output_buffer.finalize()
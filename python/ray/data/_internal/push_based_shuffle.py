@@ -1,5 +1,7 @@
+import collections
 import logging
 import math
+import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 import ray
@@ -7,8 +9,9 @@ from ray.data._internal.block_list import BlockList
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.shuffle import ShuffleOp
+from ray.data._internal.stats import EXTRA_METRICS_KEY
 from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
-from ray.data.context import DatasetContext
+from ray.data.context import ESTIMATED_SAFE_MEMORY_FRACTION, DatasetContext
 from ray.types import ObjectRef
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
@@ -132,6 +135,10 @@ class _PipelinedStageExecutor:
 
         self._rounds: List[List[ObjectRef]] = []
         self._task_idx = 0
+        # Wall time between the submission of each round and the driver
+        # observing its completion, in seconds.
+        self.round_times_s: List[float] = []
+        self._round_start_times: List[float] = []
 
         self._submit_round()
 
@@ -149,6 +156,7 @@ class _PipelinedStageExecutor:
 
         if len(self._rounds) >= self._max_concurrent_rounds:
             prev_metadata_refs = self._rounds.pop(0)
+            round_start_time = self._round_start_times.pop(0)
             if prev_metadata_refs:
                 if self._progress_bar is not None:
                     prev_metadata = self._progress_bar.fetch_until_complete(
@@ -156,6 +164,7 @@ class _PipelinedStageExecutor:
                     )
                 else:
                     prev_metadata = ray.get(prev_metadata_refs)
+                self.round_times_s.append(time.perf_counter() - round_start_time)
 
         self._submit_round()
 
@@ -170,6 +179,7 @@ class _PipelinedStageExecutor:
             except StopIteration:
                 break
         self._rounds.append(task_round)
+        self._round_start_times.append(time.perf_counter())
 
 
 class _MapStageIterator:
@@ -357,6 +367,12 @@ class PushBasedShufflePlan(ShuffleOp):
         M / N = merge factor - the ratio of map : merge tasks is to improve
           pipelined parallelism. For example, if map takes twice as long to
           execute as merge, then we should set this to 2.
+        M is further bounded so that the map outputs of the two rounds in
+          flight at any time (one being merged, one being produced) fit in a
+          safe fraction of the cluster's object store memory.
+        Merge tasks are placed on nodes in proportion to both their CPUs and
+          their object store capacity, since each merge task holds its outputs
+          until the final reduce stage.
         See paper at https://arxiv.org/abs/2203.05072 for more details.
     """
 
@@ -380,6 +396,7 @@ class PushBasedShufflePlan(ShuffleOp):
         # during map-merge stage, by limiting how many partitions can be
         # processed concurrently.
         input_blocks_list = input_blocks.get_blocks()
+        input_size_bytes = _get_total_size_bytes(input_blocks.get_metadata())
         owned_by_consumer = input_blocks._owned_by_consumer
         # Preemptively clear the blocks list since we will incrementally delete
         # the last remaining references as we submit the dependent map tasks
@@ -404,6 +421,8 @@ class PushBasedShufflePlan(ShuffleOp):
             len(input_blocks_list),
             merge_factor,
             output_num_blocks,
+            input_size_bytes=input_size_bytes,
+            object_store_memory_per_node_map=(_get_object_store_memory_per_node_map()),
         )
 
         map_fn = self._map_partition
@@ -514,6 +533,13 @@ class PushBasedShufflePlan(ShuffleOp):
             "map": map_stage_metadata,
             "merge": merge_stage_metadata,
             "reduce": reduce_stage_metadata,
+            EXTRA_METRICS_KEY: {
+                "num_rounds": stage.num_rounds,
+                "num_map_tasks_per_round": stage.num_map_tasks_per_round,
+                "num_merge_tasks_per_round": stage.num_merge_tasks_per_round,
+                "map_round_times_s": _round_times(map_stage_executor),
+                "merge_round_times_s": _round_times(merge_stage_executor),
+            },
         }
 
         return (
@@ -593,6 +619,8 @@ class PushBasedShufflePlan(ShuffleOp):
         num_input_blocks: int,
         merge_factor: int,
         num_output_blocks: int,
+        input_size_bytes: Optional[int] = None,
+        object_store_memory_per_node_map: Optional[Dict[str, int]] = None,
     ) -> _PushBasedShuffleStage:
         num_cpus_total = sum(v for v in num_cpus_per_node_map.values())
         task_parallelism = min(num_cpus_total, num_input_blocks)
@@ -629,6 +657,28 @@ class PushBasedShufflePlan(ShuffleOp):
         assert num_merge_tasks_per_round == len(merge_task_placement)
         num_map_tasks_per_round = max(task_parallelism - num_merge_tasks_per_round, 1)
 
+        if input_size_bytes and object_store_memory_per_node_map:
+            merge_task_placement = _rebalance_merge_task_placement(
+                merge_task_placement,
+                num_cpus_per_node_map,
+                object_store_memory_per_node_map,
+                num_tasks_per_map_merge_group,
+            )
+            # Map outputs are freed once merged, so at most two rounds of map
+            # outputs are in the object store at a time. Bound the round size so
+            # that these fit without spilling.
+            max_in_flight_bytes = ESTIMATED_SAFE_MEMORY_FRACTION * sum(
+                object_store_memory_per_node_map.get(node, 0)
+                for node in num_cpus_per_node_map
+            )
+            bytes_per_map_task = input_size_bytes / num_input_blocks
+            max_map_tasks_per_round = int(
+                max_in_flight_bytes // (2 * bytes_per_map_task)
+            )
+            num_map_tasks_per_round = max(
+                min(num_map_tasks_per_round, max_map_tasks_per_round), 1
+            )
+
         num_rounds = math.ceil(num_input_blocks / num_map_tasks_per_round)
         return _PushBasedShuffleStage(
             num_output_blocks,
@@ -667,6 +717,86 @@ def _execute_pipelined_stage(
     return prev_metadata, metadata_refs, data_outputs
 
 
+def _rebalance_merge_task_placement(
+    merge_task_placement: List[str],
+    num_cpus_per_node_map: Dict[str, int],
+    object_store_memory_per_node_map: Dict[str, int],
+    num_tasks_per_map_merge_group: int,
+) -> List[str]:
+    """Move merge tasks off of nodes with little object store memory.
+
+    Each merge task holds its outputs in its node's object store until the final
+    reduce stage, so a node should host a share of the merge tasks no greater
+    than its share of the cluster's object store memory. Merge tasks above a
+    node's share are moved to nodes with spare CPUs and memory, or dropped if no
+    such node exists.
+    """
+    memory = {
+        node: object_store_memory_per_node_map.get(node, 0)
+        for node in num_cpus_per_node_map
+    }
+    total_memory = sum(memory.values())
+    if total_memory == 0:
+        return merge_task_placement
+    num_merge_tasks = len(merge_task_placement)
+    max_tasks = {
+        node: min(
+            math.ceil(num_merge_tasks * node_memory / total_memory),
+            max(num_cpus_per_node_map[node] // num_tasks_per_map_merge_group, 1),
+        )
+        for node, node_memory in memory.items()
+    }
+    counts = collections.Counter(merge_task_placement)
+    num_excess = 0
+    for node in counts:
+        if counts[node] > max_tasks[node]:
+            num_excess += counts[node] - max_tasks[node]
+            counts[node] = max_tasks[node]
+    # Assign the excess merge tasks to the nodes with the most spare memory.
+    for node in sorted(memory, key=lambda n: memory[n], reverse=True):
+        while num_excess > 0 and counts[node] < max_tasks[node]:
+            counts[node] += 1
+            num_excess -= 1
+    if not any(counts.values()):
+        return merge_task_placement[:1]
+    # Preserve the interleaving of nodes in the original placement.
+    placement = []
+    for node in merge_task_placement:
+        if counts[node] > 0 and node not in placement:
+            placement += [node] * counts.pop(node)
+    for node, count in counts.items():
+        placement += [node] * count
+    return placement
+
+
+def _round_times(executor: _PipelinedStageExecutor) -> Dict[str, float]:
+    round_times_s = executor.round_times_s
+    if not round_times_s:
+        return {}
+    return {
+        "min": round(min(round_times_s), 3),
+        "max": round(max(round_times_s), 3),
+        "mean": round(sum(round_times_s) / len(round_times_s), 3),
+        "sum": round(sum(round_times_s), 3),
+    }
+
+
+def _get_total_size_bytes(metadata: List[BlockMetadata]) -> Optional[int]:
+    if any(m.size_bytes is None for m in metadata):
+        return None
+    return sum(m.size_bytes for m in metadata)
+
+
+def _get_object_store_memory_per_node_map() -> Dict[str, int]:
+    # Map from node ID to the object store capacity of that node, in bytes.
+    object_store_memory_per_node_map = {}
+    for node in ray.nodes():
+        object_store_memory_per_node_map[node["NodeID"]] = int(
+            node["Resources"].get("object_store_memory", 0)
+        )
+    return object_store_memory_per_node_map
+
+
 def _get_num_cpus_per_node_map() -> Dict[str, int]:
     nodes = ray.nodes()
     # Map from per-node resource name to number of CPUs available on that
@@ -99,6 +99,8 @@ class RandomShuffleStage(AllToAllStage):
         output_num_blocks: Optional[int],
         remote_args: Optional[Dict[str, Any]] = None,
     ):
+        self._seed = seed
+
         def do_shuffle(
             block_list,
             ctx: TaskContext,
@@ -8,16 +8,24 @@ import numpy as np
 
 import ray
 from ray.data._internal.block_list import BlockList
+from ray.data._internal.dataset_logger import DatasetLogger
 from ray.data.block import BlockMetadata
 from ray.data.context import DatasetContext
 from ray.util.annotations import DeveloperAPI
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
+logger = DatasetLogger(__name__)
+
 STATS_ACTOR_NAME = "datasets_stats_actor"
 STATS_ACTOR_NAMESPACE = "_dataset_stats_actor"
 
 StatsDict = Dict[str, List[BlockMetadata]]
 
+# Key of an optional StatsDict entry holding operator-level metrics (e.g., the
+# per-round timing of push-based shuffle) instead of block metadata. These are
+# reported as the extra metrics of the resulting DatasetStats.
+EXTRA_METRICS_KEY = "__extra_metrics__"
+
 
 def fmt(seconds: float) -> str:
     if seconds > 1:
@@ -28,6 +36,20 @@ def fmt(seconds: float) -> str:
         return str(round(seconds * 1000 * 1000, 2)) + "us"
 
 
+def get_spilled_bytes_total() -> Optional[int]:
+    """Return the number of bytes spilled across the cluster so far, if available."""
+    from ray._private.internal_api import get_memory_info_reply
+
+    try:
+        reply = get_memory_info_reply(ray._private.state.state)
+    except Exception as e:
+        logger.get_logger(log_to_stdout=False).debug(
+            f"Unable to get object store stats: {e}"
+        )
+        return None
+    return reply.store_stats.spilled_bytes_total
+
+
 class Timer:
     """Helper class for tracking accumulated time (in seconds)."""
 
@@ -62,6 +84,8 @@ class _DatasetStatsBuilder:
         self.start_time = time.perf_counter()
 
     def build_multistage(self, stages: StatsDict) -> "DatasetStats":
+        stages = dict(stages)
+        extra_metrics = stages.pop(EXTRA_METRICS_KEY, None)
         stage_infos = {}
         for i, (k, v) in enumerate(stages.items()):
             if len(stages) > 1:
@@ -77,6 +101,8 @@ class _DatasetStatsBuilder:
             base_name=self.stage_name,
         )
         stats.time_total_s = time.perf_counter() - self.start_time
+        if extra_metrics:
+            stats.extra_metrics = extra_metrics
         return stats
 
     def build(self, final_blocks: BlockList) -> "DatasetStats":
@@ -358,6 +384,29 @@ class DatasetStatsSummary:
             out += "* Extra metrics: " + str(self.extra_metrics) + "\n"
         return out
 
+    def to_dict(self, include_parent: bool = True) -> Dict[str, Any]:
+        """Return a structured summary of this Dataset's stats.
+
+        The result mirrors ``to_string()`` and is JSON-serializable, e.g. for
+        ``json.dumps(ds._get_stats_summary().to_dict())``.
+
+        Args:
+            include_parent: If true, also include the stats summaries of parents
+            under the "parents" key.
+        Returns:
+            Dict with summary statistics for executing the Dataset.
+        """
+        return {
+            "number": self.number,
+            "dataset_uuid": self.dataset_uuid,
+            "base_name": self.base_name,
+            "time_total_s": self.time_total_s,
+            "stages": [ss.to_dict() for ss in self.stages_stats],
+            "iter_stats": self.iter_stats.to_dict(),
+            "extra_metrics": dict(self.extra_metrics),
+            "parents": [p.to_dict() for p in self.parents] if include_parent else [],
+        }
+
     def get_total_wall_time(self) -> float:
         parent_wall_times = [p.get_total_wall_time() for p in self.parents]
         parent_max_wall_time = max(parent_wall_times) if parent_wall_times else 0
@@ -401,6 +450,12 @@ class StageStatsSummary:
     output_size_bytes: Optional[Dict[str, float]] = None
     # node_count: "count" stat instead of "sum"
     node_count: Optional[Dict[str, float]] = None
+    # Operator profiling stats, shown in the text summary only when
+    # `DatasetContext.enable_operator_profiling` is set.
+    udf_time: Optional[Dict[str, float]] = None
+    bytes_read: Optional[Dict[str, float]] = None
+    # remote_bytes_pulled: only collected when operator profiling is enabled
+    remote_bytes_pulled: Optional[Dict[str, float]] = None
 
     @classmethod
     def from_block_metadata(
@@ -510,6 +565,30 @@ class StageStatsSummary:
                 "count": len(node_counts),
             }
 
+        def summarize(values: List[float]) -> Optional[Dict[str, float]]:
+            if not values:
+                return None
+            return {
+                "min": min(values),
+                "max": max(values),
+                "mean": np.mean(values),
+                "sum": sum(values),
+            }
+
+        udf_time_stats = summarize(
+            [e.udf_time_s for e in exec_stats if e.udf_time_s is not None]
+        )
+        bytes_read_stats = summarize(
+            [e.bytes_read for e in exec_stats if e.bytes_read is not None]
+        )
+        remote_bytes_pulled_stats = summarize(
+            [
+                e.remote_bytes_pulled
+                for e in exec_stats
+                if e.remote_bytes_pulled is not None
+            ]
+        )
+
         return StageStatsSummary(
             stage_name=stage_name,
             is_substage=is_substage,
@@ -521,6 +600,9 @@ class StageStatsSummary:
             output_num_rows=output_num_rows_stats,
             output_size_bytes=output_size_bytes_stats,
             node_count=node_counts_stats,
+            udf_time=udf_time_stats,
+            bytes_read=bytes_read_stats,
+            remote_bytes_pulled=remote_bytes_pulled_stats,
         )
 
     def __str__(self) -> str:
@@ -592,8 +674,68 @@ class StageStatsSummary:
                 node_count_stats["mean"],
                 node_count_stats["count"],
             )
+
+        if DatasetContext.get_current().enable_operator_profiling:
+            out += self._profiling_summary_str()
         return out
 
+    def _profiling_summary_str(self) -> str:
+        """Return a human-friendly string summarizing operator profiling stats."""
+        indent = "\t" if self.is_substage else ""
+        out = ""
+        udf_time_stats = self.udf_time
+        if udf_time_stats:
+            out += indent
+            out += "* UDF time: {} min, {} max, {} mean, {} total".format(
+                fmt(udf_time_stats["min"]),
+                fmt(udf_time_stats["max"]),
+                fmt(udf_time_stats["mean"]),
+                fmt(udf_time_stats["sum"]),
+            )
+            if self.wall_time and self.wall_time["sum"] > 0:
+                out += " ({}% of remote wall time)".format(
+                    round(100 * udf_time_stats["sum"] / self.wall_time["sum"], 2)
+                )
+            out += "\n"
+
+        bytes_read_stats = self.bytes_read
+        if bytes_read_stats:
+            out += indent
+            out += "* Bytes read: {} min, {} max, {} mean, {} total\n".format(
+                bytes_read_stats["min"],
+                bytes_read_stats["max"],
+                int(bytes_read_stats["mean"]),
+                bytes_read_stats["sum"],
+            )
+
+        remote_bytes_pulled_stats = self.remote_bytes_pulled
+        if remote_bytes_pulled_stats:
+            out += indent
+            out += "* Remote bytes pulled: {} min, {} max, {} mean, {} total\n".format(
+                remote_bytes_pulled_stats["min"],
+                remote_bytes_pulled_stats["max"],
+                int(remote_bytes_pulled_stats["mean"]),
+                remote_bytes_pulled_stats["sum"],
+            )
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the stage stats as a JSON-serializable dict."""
+        return {
+            "stage_name": self.stage_name,
+            "is_substage": self.is_substage,
+            "time_total_s": self.time_total_s,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "memory": self.memory,
+            "output_num_rows": self.output_num_rows,
+            "output_size_bytes": self.output_size_bytes,
+            "node_count": self.node_count,
+            "udf_time": self.udf_time,
+            "bytes_read": self.bytes_read,
+            "remote_bytes_pulled": self.remote_bytes_pulled,
+        }
+
 
 @dataclass
 class IterStatsSummary:
@@ -628,6 +770,17 @@ class IterStatsSummary:
             out += "* Total time: {}\n".format(fmt(self.total_time.get()))
         return out
 
+    def to_dict(self) -> Dict[str, float]:
+        """Return the iterator time breakdown, in seconds, as a dict."""
+        return {
+            "wait_time_s": self.wait_time.get(),
+            "get_time_s": self.get_time.get(),
+            "next_time_s": self.next_time.get(),
+            "format_time_s": self.format_time.get(),
+            "user_time_s": self.user_time.get(),
+            "total_time_s": self.total_time.get(),
+        }
+
 
 class DatasetPipelineStats:
     """Holds the execution times for a pipeline of Datasets."""
@@ -1,3 +1,4 @@
+import itertools
 import os
 import sys
 import time
@@ -8,6 +9,7 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -143,7 +145,7 @@ BlockPartitionMetadata = List["BlockMetadata"]
 # is on by default. When block splitting is off, the type is a plain block.
 MaybeBlockPartition = Union[Block, ObjectRefGenerator]
 
-VALID_BATCH_FORMATS = ["default", "native", "pandas", "pyarrow", "numpy"]
+VALID_BATCH_FORMATS = ["default", "native", "pandas", "pyarrow", "numpy", "polars"]
 
 
 @DeveloperAPI
@@ -154,6 +156,16 @@ class BlockExecStats:
         wall_time_s: The wall-clock time it took to compute this block.
         cpu_time_s: The CPU time it took to compute this block.
         node_id: A unique id for the node that computed this block.
+        udf_time_s: The time spent in user-defined functions while computing this
+            block. The rest of the wall time is spent reading, converting batch
+            formats, building blocks and (de)serializing data.
+        bytes_read: The number of bytes the worker read from files and sockets
+            (i.e., storage) while computing this block, or None if the platform
+            doesn't report process I/O counters.
+        remote_bytes_pulled: The number of bytes of task inputs that had to be pulled
+            from other nodes' object stores. Only set when
+            ``DatasetContext.enable_operator_profiling`` is enabled, and attributed
+            to the first block produced by each task.
     """
 
     def __init__(self):
@@ -163,6 +175,9 @@ class BlockExecStats:
         # Max memory usage. May be an overestimate since we do not
         # differentiate from previous tasks on the same worker.
         self.max_rss_bytes: int = 0
+        self.udf_time_s: Optional[float] = None
+        self.bytes_read: Optional[int] = None
+        self.remote_bytes_pulled: Optional[int] = None
 
     @staticmethod
     def builder() -> "_BlockExecStatsBuilder":
@@ -174,10 +189,58 @@ class BlockExecStats:
                 "wall_time_s": self.wall_time_s,
                 "cpu_time_s": self.cpu_time_s,
                 "node_id": self.node_id,
+                "udf_time_s": self.udf_time_s,
+                "bytes_read": self.bytes_read,
+                "remote_bytes_pulled": self.remote_bytes_pulled,
             }
         )
 
 
+# Total time this worker process has spent in user-defined functions. Stats builders
+# record the difference between the start and the end of a block's computation.
+_udf_time_s: float = 0.0
+
+
+def _record_udf_time(seconds: float) -> None:
+    """Add to the time this worker process has spent in user-defined functions."""
+    global _udf_time_s
+    _udf_time_s += seconds
+
+
+# Row UDFs are timed per chunk of rows, to keep the timing overhead off the
+# per-row path.
+_ROW_UDF_TIMING_CHUNK_SIZE = 64
+
+
+def _apply_row_udf(row_fn: RowUDF, rows: Iterable[T]) -> Iterator[Tuple[T, Any]]:
+    """Apply a row UDF to rows, yielding each row with the UDF's output.
+
+    The UDF is applied to chunks of rows at a time, and the time spent in it is
+    recorded once per chunk.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, _ROW_UDF_TIMING_CHUNK_SIZE))
+        if not chunk:
+            return
+        start = time.perf_counter()
+        outputs = [row_fn(row) for row in chunk]
+        _record_udf_time(time.perf_counter() - start)
+        yield from zip(chunk, outputs)
+
+
+def _get_io_read_bytes() -> Optional[int]:
+    """Return the number of bytes read by this process, if the platform reports it."""
+    try:
+        io_counters = psutil.Process(os.getpid()).io_counters()
+    except (AttributeError, NotImplementedError, psutil.Error):
+        # NOTE: io_counters() isn't available on macOS.
+        return None
+    # On Linux, read_chars also counts reads from sockets, e.g. from cloud storage,
+    # and reads served from the page cache.
+    return getattr(io_counters, "read_chars", io_counters.read_bytes)
+
+
 class _BlockExecStatsBuilder:
     """Helper class for building block stats.
 
@@ -188,11 +251,18 @@ class _BlockExecStatsBuilder:
     def __init__(self):
         self.start_time = time.perf_counter()
         self.start_cpu = time.process_time()
+        self.start_udf_time = _udf_time_s
+        self.start_io_read_bytes = _get_io_read_bytes()
 
     def build(self) -> "BlockExecStats":
         stats = BlockExecStats()
         stats.wall_time_s = time.perf_counter() - self.start_time
         stats.cpu_time_s = time.process_time() - self.start_cpu
+        stats.udf_time_s = _udf_time_s - self.start_udf_time
+        if self.start_io_read_bytes is not None:
+            io_read_bytes = _get_io_read_bytes()
+            if io_read_bytes is not None:
+                stats.bytes_read = io_read_bytes - self.start_io_read_bytes
         if resource is None:
             # NOTE(swang): resource package is not supported on Windows. This
             # is only the memory usage at the end of the task, not the peak
@@ -325,6 +395,10 @@ class BlockAccessor(Generic[T]):
             return self.to_arrow()
         elif batch_format == "numpy":
             return self.to_numpy()
+        elif batch_format == "polars":
+            from ray.data._internal.arrow_ops import transform_polars
+
+            return transform_polars.to_polars(self.to_arrow())
         else:
             raise ValueError(
                 f"The batch format must be one of {VALID_BATCH_FORMATS}, got: "
@@ -363,10 +437,14 @@ class BlockAccessor(Generic[T]):
     @staticmethod
     def batch_to_block(batch: DataBatch) -> Block:
         """Create a block from user-facing data formats."""
+        from ray.data._internal.arrow_ops import transform_polars
+
         if isinstance(batch, (np.ndarray, dict)):
             from ray.data._internal.arrow_block import ArrowBlockAccessor
 
             return ArrowBlockAccessor.numpy_to_block(batch)
+        elif transform_polars.is_polars_dataframe(batch):
+            return transform_polars.from_polars(batch)
         return batch
 
     @staticmethod
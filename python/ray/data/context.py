@@ -66,7 +66,7 @@ DEFAULT_USE_PUSH_BASED_SHUFFLE = bool(
 DEFAULT_SCHEDULING_STRATEGY = "DEFAULT"
 
 # Whether to use Polars for tabular dataset sorts, groupbys, and aggregations.
-DEFAULT_USE_POLARS = False
+DEFAULT_USE_POLARS = bool(int(os.environ.get("RAY_DATASET_USE_POLARS", "0")))
 
 # Whether to use the new executor backend.
 DEFAULT_NEW_EXECUTION_BACKEND = bool(
@@ -104,6 +104,29 @@ DEFAULT_OPTIMIZER_ENABLED = bool(
     int(os.environ.get("RAY_DATASET_NEW_EXECUTION_OPTIMIZER", "0"))
 )
 
+# Directory in which to cache materialized datasets, keyed by lineage. Caching is
+# disabled if this is not set.
+DEFAULT_MATERIALIZATION_CACHE_DIR = os.environ.get(
+    "RAY_DATASET_MATERIALIZATION_CACHE_DIR", None
+)
+
+# The max total size in bytes of the materialization cache. Least recently used
+# entries are evicted beyond this size. No limit is applied if this is None.
+DEFAULT_MATERIALIZATION_CACHE_MAX_BYTES = (
+    int(os.environ["RAY_DATASET_MATERIALIZATION_CACHE_MAX_BYTES"])
+    if "RAY_DATASET_MATERIALIZATION_CACHE_MAX_BYTES" in os.environ
+    else None
+)
+
+# Whether to profile operators in Dataset stats. This shows UDF time and bytes read
+# in the stats summary, and attributes object store activity to operators: bytes that
+# tasks pull from remote nodes and bytes spilled while each operator runs. The latter
+# queries object locations and object store stats from the driver, so it's off by
+# default.
+DEFAULT_ENABLE_OPERATOR_PROFILING = bool(
+    int(os.environ.get("RAY_DATASET_ENABLE_OPERATOR_PROFILING", "0"))
+)
+
 # Use this to prefix important warning messages for the user.
 WARN_PREFIX = "⚠️ "
 
@@ -148,6 +171,9 @@ class DatasetContext:
         trace_allocations: bool,
         optimizer_enabled: bool,
         execution_options: "ExecutionOptions",
+        materialization_cache_dir: Optional[str],
+        materialization_cache_max_bytes: Optional[int],
+        enable_operator_profiling: bool,
     ):
         """Private constructor (use get_current() instead)."""
         self.block_splitting_enabled = block_splitting_enabled
@@ -177,6 +203,9 @@ class DatasetContext:
         self.optimizer_enabled = optimizer_enabled
         # TODO: expose execution options in Dataset public APIs.
         self.execution_options = execution_options
+        self.materialization_cache_dir = materialization_cache_dir
+        self.materialization_cache_max_bytes = materialization_cache_max_bytes
+        self.enable_operator_profiling = enable_operator_profiling
 
     @staticmethod
     def get_current() -> "DatasetContext":
@@ -222,6 +251,11 @@ class DatasetContext:
                     trace_allocations=DEFAULT_TRACE_ALLOCATIONS,
                     optimizer_enabled=DEFAULT_OPTIMIZER_ENABLED,
                     execution_options=ExecutionOptions(),
+                    materialization_cache_dir=DEFAULT_MATERIALIZATION_CACHE_DIR,
+                    materialization_cache_max_bytes=(
+                        DEFAULT_MATERIALIZATION_CACHE_MAX_BYTES
+                    ),
+                    enable_operator_profiling=DEFAULT_ENABLE_OPERATOR_PROFILING,
                 )
 
             return _default_context
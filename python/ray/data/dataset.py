@@ -373,7 +373,9 @@ class Dataset(Generic[T]):
         *,
         batch_size: Optional[Union[int, Literal["default"]]] = "default",
         compute: Optional[Union[str, ComputeStrategy]] = None,
-        batch_format: Literal["default", "pandas", "pyarrow", "numpy"] = "default",
+        batch_format: Literal[
+            "default", "pandas", "pyarrow", "numpy", "polars"
+        ] = "default",
         prefetch_batches: int = 0,
         zero_copy_batch: bool = False,
         fn_args: Optional[Iterable[Any]] = None,
@@ -519,7 +521,8 @@ class Dataset(Generic[T]):
                 :class:`ActorPoolStrategy <ray.data.ActorPoolStrategy>` or ``"actors"``.
             batch_format: Specify ``"default"`` to use the default block format
                 (promotes tables to Pandas and tensors to NumPy), ``"pandas"`` to select
-                ``pandas.DataFrame``, "pyarrow" to select ``pyarrow.Table``, or
+                ``pandas.DataFrame``, "pyarrow" to select ``pyarrow.Table``,
+                ``"polars"`` to select ``polars.DataFrame``, or
                 ``"numpy"`` to select ``numpy.ndarray`` for tensor datasets and
                 ``Dict[str, numpy.ndarray]`` for tabular datasets. Default is "default".
             prefetch_batches: The number of batches to fetch ahead of the current batch
@@ -2709,9 +2712,10 @@ class Dataset(Generic[T]):
                 logical_plan = LogicalPlan(write_op)
 
             try:
-                self._write_ds = Dataset(
-                    plan, self._epoch, self._lazy, logical_plan
-                ).fully_executed()
+                # NOTE: Execute the plan directly rather than via fully_executed(),
+                # so that writes never go through the materialization cache.
+                self._write_ds = Dataset(plan, self._epoch, self._lazy, logical_plan)
+                self._write_ds._plan.execute(force_read=True)
                 datasource.on_write_complete(
                     ray.get(self._write_ds._plan.execute().get_blocks())
                 )
@@ -3991,10 +3995,33 @@ class Dataset(Generic[T]):
         This can be used to read all blocks into memory. By default, Datasets
         doesn't read blocks from the datasource until the first transform.
 
+        If ``DatasetContext.materialization_cache_dir`` is set, the materialized
+        blocks of datasets with serializable lineage are also persisted to that
+        directory, keyed by a fingerprint of the lineage and the input files. Later
+        calls with the same lineage are then satisfied from the cache instead of
+        recomputing the blocks. Only tabular datasets are cached, and cached blocks
+        are restored in Arrow format.
+
         Returns:
             A Dataset with all blocks fully materialized in memory.
         """
+        cache = None
+        if not self._plan.has_computed_output() and self.has_serializable_lineage():
+            from ray.data._internal.materialization_cache import (
+                MaterializationCache,
+                compute_lineage_fingerprint,
+            )
+
+            cache = MaterializationCache.from_context(DatasetContext.get_current())
+            if cache is not None:
+                key = compute_lineage_fingerprint(self._plan)
+                if key is None:
+                    cache = None
+                elif cache.load(key, self._plan):
+                    return self
         self._plan.execute(force_read=True)
+        if cache is not None:
+            cache.store(key, self._plan)
         return self
 
     def is_fully_executed(self) -> bool:
@@ -425,42 +425,17 @@ class _FileBasedDatasourceReader(Reader):
                 block_udf=_block_udf, target_max_block_size=ctx.target_max_block_size
             )
             for read_path in read_paths:
-                compression = open_stream_args.pop("compression", None)
-                if compression is None:
-                    import pyarrow as pa
-
-                    try:
-                        # If no compression manually given, try to detect
-                        # compression codec from path.
-                        compression = pa.Codec.detect(read_path).name
-                    except (ValueError, TypeError):
-                        # Arrow's compression inference on the file path
-                        # doesn't work for Snappy, so we double-check ourselves.
-                        import pathlib
-
-                        suffix = pathlib.Path(read_path).suffix
-                        if suffix and suffix[1:] == "snappy":
-                            compression = "snappy"
-                        else:
-                            compression = None
-                if compression == "snappy":
-                    # Pass Snappy compression as a reader arg, so datasource subclasses
-                    # can manually handle streaming decompression in
-                    # self._delegate._read_stream().
-                    reader_args["compression"] = compression
-                    reader_args["filesystem"] = fs
-                elif compression is not None:
-                    # Non-Snappy compression, pass as open_input_stream() arg so Arrow
-                    # can take care of streaming decompression for us.
-                    open_stream_args["compression"] = compression
+                file_open_stream_args, file_reader_args = _resolve_compression_args(
+                    read_path, fs, open_stream_args, reader_args
+                )
 
                 partitions: Dict[str, str] = {}
                 if partitioning is not None:
                     parse = PathPartitionParser(partitioning)
                     partitions = parse(read_path)
 
-                with open_input_source(fs, read_path, **open_stream_args) as f:
-                    for data in read_stream(f, read_path, **reader_args):
+                with open_input_source(fs, read_path, **file_open_stream_args) as f:
+                    for data in read_stream(f, read_path, **file_reader_args):
                         if partitions:
                             data = convert_block_to_tabular_block(data, column_name)
                             data = _add_partitions(data, partitions)
@@ -496,6 +471,45 @@ class _FileBasedDatasourceReader(Reader):
         return read_tasks
 
 
+def _resolve_compression_args(
+    read_path: str,
+    filesystem: "pyarrow.fs.FileSystem",
+    open_stream_args: Dict[str, Any],
+    reader_args: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return the ``open_input_stream()`` and reader args to read a file with.
+
+    If no compression is given in ``open_stream_args``, it's detected from the file
+    path. Snappy compression is passed as a reader arg, so datasource subclasses can
+    manually handle streaming decompression in ``_read_stream()``. Other codecs are
+    passed to ``open_input_stream()``, so Arrow decompresses the stream.
+    """
+    open_stream_args = dict(open_stream_args)
+    reader_args = dict(reader_args)
+    compression = open_stream_args.pop("compression", None)
+    if compression is None:
+        import pyarrow as pa
+
+        try:
+            # If no compression manually given, try to detect
+            # compression codec from path.
+            compression = pa.Codec.detect(read_path).name
+        except (ValueError, TypeError):
+            # Arrow's compression inference on the file path
+            # doesn't work for Snappy, so we double-check ourselves.
+            suffix = pathlib.Path(read_path).suffix
+            if suffix and suffix[1:] == "snappy":
+                compression = "snappy"
+            else:
+                compression = None
+    if compression == "snappy":
+        reader_args["compression"] = compression
+        reader_args["filesystem"] = filesystem
+    elif compression is not None:
+        open_stream_args["compression"] = compression
+    return open_stream_args, reader_args
+
+
 def _add_partitions(
     data: Union["pyarrow.Table", "pd.DataFrame"], partitions: Dict[str, Any]
 ) -> Union["pyarrow.Table", "pd.DataFrame"]:
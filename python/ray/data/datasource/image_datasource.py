@@ -1,21 +1,34 @@
+import concurrent.futures
+import functools
 import io
 import logging
+import math
 import time
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 
+import ray
+from ray.data._internal.output_buffer import BlockOutputBuffer
 from ray.data._internal.util import _check_import
-from ray.data.block import Block, BlockMetadata
+from ray.data.block import Block, BlockAccessor, BlockMetadata
+from ray.data.context import DatasetContext
 from ray.data.datasource.binary_datasource import BinaryDatasource
-from ray.data.datasource.datasource import Reader
+from ray.data.datasource.datasource import Reader, ReadTask
 from ray.data.datasource.file_based_datasource import (
     _FileBasedDatasourceReader,
+    _resolve_compression_args,
+    _S3FileSystemWrapper,
+    _wrap_s3_serialization_workaround,
     FileBasedDatasource,
 )
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data.datasource.file_meta_provider import DefaultFileMetadataProvider
-from ray.data.datasource.partitioning import Partitioning, PathPartitionFilter
+from ray.data.datasource.partitioning import (
+    Partitioning,
+    PathPartitionFilter,
+    PathPartitionParser,
+)
 from ray.util.annotations import DeveloperAPI
 
 if TYPE_CHECKING:
@@ -33,6 +46,14 @@ IMAGE_ENCODING_RATIO_ESTIMATE_DEFAULT = 1
 # The lower bound value to estimate image encoding ratio.
 IMAGE_ENCODING_RATIO_ESTIMATE_LOWER_BOUND = 0.5
 
+# The number of threads used to read and decode images per CPU assigned to a read
+# task. Pillow releases the GIL while decoding, and reading from (remote) storage is
+# I/O-bound, so more threads than CPUs let reads overlap with decoding.
+IMAGE_DECODE_THREADS_PER_CPU = 2
+
+# The number of images read and decoded concurrently per thread in a read task.
+IMAGE_DECODE_BATCH_SIZE_PER_THREAD = 4
+
 
 @DeveloperAPI
 class ImageDatasource(BinaryDatasource):
@@ -80,21 +101,12 @@ class ImageDatasource(BinaryDatasource):
         mode: Optional[str],
         include_paths: bool,
     ) -> "pyarrow.Table":
-        from PIL import Image
-
         records = super()._read_file(f, path, include_paths=True)
         assert len(records) == 1
         path, data = records[0]
 
-        image = Image.open(io.BytesIO(data))
-        if size is not None:
-            height, width = size
-            image = image.resize((width, height))
-        if mode is not None:
-            image = image.convert(mode)
-
         builder = DelegatingBlockBuilder()
-        array = np.array(image)
+        array = _decode_image(data, size, mode)
         if include_paths:
             item = {"image": array, "path": path}
         else:
@@ -105,6 +117,26 @@ class ImageDatasource(BinaryDatasource):
         return block
 
 
+def _decode_image(
+    data: bytes, size: Optional[Tuple[int, int]], mode: Optional[str]
+) -> np.ndarray:
+    """Decode an encoded image, resizing it and converting its mode if requested."""
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    if size is not None:
+        height, width = size
+        # Let the decoder downscale while decoding, which for JPEG images is much
+        # cheaper than decoding at full resolution. This is a no-op for other
+        # formats, and the decoded image is at least as large as requested.
+        image.draft(mode, (width, height))
+        if image.size != (width, height):
+            image = image.resize((width, height))
+    if mode is not None and image.mode != mode:
+        image = image.convert(mode)
+    return np.asarray(image)
+
+
 class _ImageFileMetadataProvider(DefaultFileMetadataProvider):
     def _set_encoding_ratio(self, encoding_ratio: int):
         """Set image file encoding ratio, to provide accurate size in bytes metadata."""
@@ -135,6 +167,7 @@ class _ImageDatasourceReader(_FileBasedDatasourceReader):
         partition_filter: PathPartitionFilter,
         partitioning: Partitioning,
         meta_provider: _ImageFileMetadataProvider = _ImageFileMetadataProvider(),
+        open_stream_args: Optional[Dict[str, Any]] = None,
         **reader_args,
     ):
         super().__init__(
@@ -142,7 +175,7 @@ class _ImageDatasourceReader(_FileBasedDatasourceReader):
             paths=paths,
             filesystem=filesystem,
             schema=None,
-            open_stream_args=None,
+            open_stream_args=open_stream_args,
             meta_provider=meta_provider,
             partition_filter=partition_filter,
             partitioning=partitioning,
@@ -154,6 +187,104 @@ class _ImageDatasourceReader(_FileBasedDatasourceReader):
     def estimate_inmemory_data_size(self) -> Optional[int]:
         return sum(self._file_sizes) * self._encoding_ratio
 
+    def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
+        """Create read tasks that read and decode their images in a thread pool.
+
+        Each task decodes its images in batches, and writes each batch of images
+        straight into a tensor column, which has a fixed shape if all images in the
+        batch have the same shape (e.g., if ``size`` and ``mode`` are given). Files
+        are opened like in ``FileBasedDatasource``, with the given
+        ``open_stream_args`` and the compression detected from their paths.
+        """
+        size = self._reader_args.get("size")
+        mode = self._reader_args.get("mode")
+        include_paths = self._reader_args.get("include_paths", False)
+        partitioning = self._partitioning
+        _block_udf = self._block_udf
+        open_stream_args = self._open_stream_args or {}
+        open_input_source = self._delegate._open_input_source
+        # Reads the (possibly Snappy-compressed) bytes of a file.
+        read_bytes = functools.partial(BinaryDatasource._read_file, self._delegate)
+        filesystem = _wrap_s3_serialization_workaround(self._filesystem)
+
+        def read_images(
+            read_paths: List[str],
+            fs: Union["pyarrow.fs.FileSystem", _S3FileSystemWrapper],
+        ) -> Iterable[Block]:
+            logger.debug(f"Reading {len(read_paths)} images.")
+            if isinstance(fs, _S3FileSystemWrapper):
+                fs = fs.unwrap()
+            ctx = DatasetContext.get_current()
+            output_buffer = BlockOutputBuffer(
+                block_udf=_block_udf, target_max_block_size=ctx.target_max_block_size
+            )
+
+            def load(path: str) -> np.ndarray:
+                file_open_stream_args, file_reader_args = _resolve_compression_args(
+                    path, fs, open_stream_args, {}
+                )
+                with open_input_source(fs, path, **file_open_stream_args) as f:
+                    [data] = read_bytes(f, path, **file_reader_args)
+                return _decode_image(data, size, mode)
+
+            num_threads = _get_num_decode_threads()
+            batch_size = num_threads * IMAGE_DECODE_BATCH_SIZE_PER_THREAD
+            ndim = None
+            with concurrent.futures.ThreadPoolExecutor(num_threads) as pool:
+                for i in range(0, len(read_paths), batch_size):
+                    batch_paths = list(read_paths[i : i + batch_size])
+                    images = list(pool.map(load, batch_paths))
+                    for start, end in _same_ndim_ranges(images):
+                        if ndim is not None and images[start].ndim != ndim:
+                            # Tensor columns with different numbers of dimensions
+                            # can't be concatenated, so the buffered images are
+                            # output as a separate block.
+                            output_buffer.finalize()
+                            if output_buffer.has_next():
+                                yield output_buffer.next()
+                            output_buffer = BlockOutputBuffer(
+                                block_udf=_block_udf,
+                                target_max_block_size=ctx.target_max_block_size,
+                            )
+                        ndim = images[start].ndim
+                        block = _build_image_block(
+                            images[start:end],
+                            batch_paths[start:end],
+                            include_paths,
+                            partitioning,
+                        )
+                        for block in _split_block(block, ctx.target_max_block_size):
+                            output_buffer.add_block(block)
+                            if output_buffer.has_next():
+                                yield output_buffer.next()
+            output_buffer.finalize()
+            if output_buffer.has_next():
+                yield output_buffer.next()
+
+        # fix https://github.com/ray-project/ray/issues/24296
+        parallelism = min(parallelism, len(self._paths))
+
+        read_tasks = []
+        for read_paths, file_sizes in zip(
+            np.array_split(self._paths, parallelism),
+            np.array_split(self._file_sizes, parallelism),
+        ):
+            if len(read_paths) <= 0:
+                continue
+
+            meta = self._meta_provider(
+                read_paths,
+                self._schema,
+                rows_per_file=self._delegate._rows_per_file(),
+                file_sizes=file_sizes,
+            )
+            read_task = ReadTask(
+                lambda read_paths=read_paths: read_images(read_paths, filesystem), meta
+            )
+            read_tasks.append(read_task)
+
+        return read_tasks
+
     def _estimate_files_encoding_ratio(self) -> float:
         """Return an estimate of the image files encoding ratio."""
         start_time = time.perf_counter()
@@ -202,3 +333,65 @@ class _ImageDatasourceReader(_FileBasedDatasourceReader):
             )
         logger.debug(f"Estimated image encoding ratio from sampling is {ratio}.")
         return max(ratio, IMAGE_ENCODING_RATIO_ESTIMATE_LOWER_BOUND)
+
+
+def _get_num_decode_threads() -> int:
+    """Return the number of threads to read and decode images with in this task."""
+    num_cpus = ray.get_runtime_context().get_assigned_resources().get("CPU", 1)
+    return max(1, math.ceil(num_cpus)) * IMAGE_DECODE_THREADS_PER_CPU
+
+
+def _same_ndim_ranges(images: List[np.ndarray]) -> List[Tuple[int, int]]:
+    """Return the ranges of consecutive images with the same number of dimensions."""
+    ranges = []
+    start = 0
+    for i in range(1, len(images) + 1):
+        if i == len(images) or images[i].ndim != images[start].ndim:
+            ranges.append((start, i))
+            start = i
+    return ranges
+
+
+def _build_image_block(
+    images: List[np.ndarray],
+    paths: List[str],
+    include_paths: bool,
+    partitioning: Optional[Partitioning],
+) -> "pyarrow.Table":
+    """Build a block with one row per image, with its path and partition values.
+
+    The images must have the same number of dimensions. They're stored in a
+    fixed-shape tensor column if they all have the same shape, and in a
+    variable-shaped tensor column otherwise.
+    """
+    import pyarrow as pa
+
+    from ray.data.extensions import ArrowTensorArray, ArrowVariableShapedTensorArray
+
+    if all(image.shape == images[0].shape for image in images):
+        image_array = ArrowTensorArray.from_numpy(np.stack(images))
+    else:
+        image_array = ArrowVariableShapedTensorArray.from_numpy(images)
+    columns: Dict[str, "pyarrow.Array"] = {"image": image_array}
+    if include_paths:
+        columns["path"] = pa.array(paths)
+    if partitioning is not None:
+        parse = PathPartitionParser(partitioning)
+        partitions = [parse(path) for path in paths]
+        for field in partitions[0]:
+            columns[field] = pa.array([p[field] for p in partitions])
+    return pa.table(columns)
+
+
+def _split_block(block: "pyarrow.Table", target_max_block_size: int) -> List[Block]:
+    """Split a block into slices of at most the target size in bytes."""
+    accessor = BlockAccessor.for_block(block)
+    num_rows = accessor.num_rows()
+    size_bytes = accessor.size_bytes()
+    if num_rows <= 1 or size_bytes <= target_max_block_size:
+        return [block]
+    rows_per_slice = max(1, target_max_block_size * num_rows // size_bytes)
+    return [
+        accessor.slice(i, min(i + rows_per_slice, num_rows), copy=False)
+        for i in range(0, num_rows, rows_per_slice)
+    ]
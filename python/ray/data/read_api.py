@@ -573,7 +573,8 @@ def read_images(
         partitioning: A :class:`~ray.data.datasource.partitioning.Partitioning` object
             that describes how paths are organized. Defaults to ``None``.
         size: The desired height and width of loaded images. If unspecified, images
-            retain their original shape.
+            retain their original shape. JPEG images are downscaled while they're
+            decoded, which is much faster than decoding them at full resolution.
         mode: A `Pillow mode <https://pillow.readthedocs.io/en/stable/handbook/concepts.html#modes>`_
             describing the desired type and depth of pixels. If unspecified, image
             modes are inferred by
@@ -311,6 +311,61 @@ def test_dataset_lineage_serialization_unsupported(shutdown_only):
         ds2.serialize_lineage()
 
 
+def test_materialization_cache(
+    ray_start_regular_shared, restore_dataset_context, tmp_path
+):
+    data_path = os.path.join(tmp_path, "data")
+    os.mkdir(data_path)
+    pq.write_table(
+        pa.table({"one": list(range(10))}), os.path.join(data_path, "test.parquet")
+    )
+    cache_dir = os.path.join(tmp_path, "cache")
+    marker_path = os.path.join(tmp_path, "marker")
+    ctx = DatasetContext.get_current()
+    ctx.materialization_cache_dir = cache_dir
+
+    def add_one(df):
+        with open(marker_path, "a") as f:
+            f.write("x")
+        df["one"] += 1
+        return df
+
+    def num_udf_calls():
+        if not os.path.exists(marker_path):
+            return 0
+        with open(marker_path) as f:
+            return len(f.read())
+
+    ds = ray.data.read_parquet(data_path).map_batches(add_one, batch_format="pandas")
+    assert ds.fully_executed().take_all() == [{"one": i + 1} for i in range(10)]
+    assert num_udf_calls() == 1
+    assert len(os.listdir(cache_dir)) == 1
+
+    # The same lineage is served from the cache.
+    ds = ray.data.read_parquet(data_path).map_batches(add_one, batch_format="pandas")
+    assert ds.fully_executed().take_all() == [{"one": i + 1} for i in range(10)]
+    assert num_udf_calls() == 1
+
+    # A different lineage is a cache miss, and evicts the older entry.
+    ctx.materialization_cache_max_bytes = 1
+    ds = ray.data.read_parquet(data_path).map_batches(lambda df: df)
+    assert ds.fully_executed().take_all() == [{"one": i} for i in range(10)]
+    assert len(os.listdir(cache_dir)) == 1
+
+    # Changing an input file invalidates the cache.
+    pq.write_table(
+        pa.table({"one": list(range(5))}), os.path.join(data_path, "test.parquet")
+    )
+    ds = ray.data.read_parquet(data_path).map_batches(add_one, batch_format="pandas")
+    assert ds.fully_executed().take_all() == [{"one": i + 1} for i in range(5)]
+    assert num_udf_calls() == 2
+
+    # Datasets with unseeded random stages are never cached.
+    ds = ray.data.read_parquet(data_path).random_shuffle()
+    assert ds.fully_executed().count() == 5
+    assert len(os.listdir(cache_dir)) == 1
+
+
 @pytest.mark.parametrize("pipelined", [False, True])
 def test_basic(ray_start_regular_shared, pipelined):
     ds0 = ray.data.range(5)
@@ -2288,6 +2343,22 @@ def test_map_batches_basic(ray_start_regular_shared, tmp_path, restore_dataset_c
     values = [s["two"] for s in ds_list]
     assert values == [2, 3, 4]
 
+    # Test polars
+    import polars as pl
+
+    def check_polars(df):
+        assert isinstance(df, pl.DataFrame)
+        return df
+
+    ds = ray.data.read_parquet(str(tmp_path))
+    ds2 = ds.map_batches(check_polars, batch_size=1, batch_format="polars")
+    assert ds2.dataset_format() == "arrow"
+    ds_list = ds2.take()
+    values = [s["one"] for s in ds_list]
+    assert values == [1, 2, 3]
+    values = [s["two"] for s in ds_list]
+    assert values == [2, 3, 4]
+
     # Test batch
     size = 300
     ds = ray.data.range(size)
@@ -2984,6 +3055,22 @@ def test_groupby_arrow(ray_start_regular_shared, use_push_based_shuffle):
     assert agg_ds.count() == 0
 
 
+@pytest.mark.parametrize("use_polars", [False, True])
+def test_groupby_arrow_use_polars(
+    ray_start_regular_shared, restore_dataset_context, use_polars
+):
+    DatasetContext.get_current().use_polars = use_polars
+    xs = list(range(100))
+    random.shuffle(xs)
+    ds = ray.data.from_items([{"A": (x % 3), "B": x} for x in xs], parallelism=4)
+    agg_ds = ds.groupby("A").aggregate(Count(), Sum("B"), Max("B"))
+    assert agg_ds.sort("A").take_all() == [
+        {"A": 0, "count()": 34, "sum(B)": 1683, "max(B)": 99},
+        {"A": 1, "count()": 33, "sum(B)": 1617, "max(B)": 97},
+        {"A": 2, "count()": 33, "sum(B)": 1650, "max(B)": 98},
+    ]
+
+
 def test_groupby_errors(ray_start_regular_shared):
     ds = ray.data.range(100)
 
@@ -1,6 +1,7 @@
 import os
 import time
 from typing import Dict
+from unittest.mock import patch
 
 import numpy as np
 import pyarrow as pa
@@ -11,10 +12,12 @@ from fsspec.implementations.local import LocalFileSystem
 import ray
 from ray.data.datasource import Partitioning
 from ray.data.datasource.image_datasource import (
+    _build_image_block,
+    _decode_image,
     _ImageDatasourceReader,
     ImageDatasource,
 )
-from ray.data.extensions import ArrowTensorType
+from ray.data.extensions import ArrowTensorType, ArrowVariableShapedTensorType
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.mock_http_server import *  # noqa
 from ray.tests.conftest import *  # noqa
@@ -50,6 +53,46 @@ class TestReadImages:
         )
         assert all(record["image"].shape == (32, 32, 3) for record in ds.take())
 
+    def test_fixed_shape_blocks(self, ray_start_regular_shared):
+        # Images decoded by a read task are written into a single fixed-shape tensor
+        # column.
+        ds = ray.data.read_images(
+            "example://image-datasets/different-sizes",
+            size=(16, 16),
+            mode="RGB",
+            include_paths=True,
+            parallelism=1,
+        )
+        [block] = ray.get(ds.get_internal_block_refs())
+        assert block.num_rows == 3
+        assert block.schema.names == ["image", "path"]
+        column_type = block.schema.field("image").type
+        assert isinstance(column_type, ArrowTensorType)
+        assert column_type.shape == (16, 16, 3)
+
+    def test_decode_downscales_jpeg(self):
+        from PIL.JpegImagePlugin import JpegImageFile
+
+        path = os.path.join(
+            os.path.dirname(ray.data.__file__),
+            "examples/data/image-datasets/simple/image1.jpg",
+        )
+        with open(path, "rb") as f:
+            data = f.read()
+
+        draft_sizes = []
+        original_draft = JpegImageFile.draft
+
+        def draft(self, mode, size):
+            draft_sizes.append(size)
+            return original_draft(self, mode, size)
+
+        with patch.object(JpegImageFile, "draft", draft):
+            image = _decode_image(data, size=(8, 16), mode="L")
+        # The requested size is (height, width), whereas Pillow takes (width, height).
+        assert draft_sizes == [(16, 8)]
+        assert image.shape == (8, 16)
+
     def test_different_sizes(self, ray_start_regular_shared):
         ds = ray.data.read_images("example://image-datasets/different-sizes")
         assert sorted(record["image"].shape for record in ds.take()) == [
@@ -58,6 +101,60 @@ class TestReadImages:
             (64, 64, 3),
         ]
 
+    def test_mixed_shapes_in_read_task(self, ray_start_regular_shared):
+        # Without `size` and `mode`, images decoded by a read task can have different
+        # shapes and numbers of dimensions.
+        ds = ray.data.read_images(
+            [
+                "example://image-datasets/different-sizes",
+                "example://image-datasets/different-modes",
+            ],
+            parallelism=1,
+        )
+        assert sorted(record["image"].shape for record in ds.take()) == [
+            (16, 16, 3),
+            (32, 32),
+            (32, 32, 3),
+            (32, 32, 3),
+            (32, 32, 4),
+            (64, 64, 3),
+        ]
+
+    def test_build_image_block_variable_shapes(self):
+        images = [
+            np.zeros((375, 500, 3), dtype=np.uint8),
+            np.ones((375, 499, 3), dtype=np.uint8),
+        ]
+        block = _build_image_block(images, ["a.jpg", "b.jpg"], False, None)
+        column_type = block.schema.field("image").type
+        assert isinstance(column_type, ArrowVariableShapedTensorType)
+        for image, expected in zip(block.column("image").to_numpy(), images):
+            np.testing.assert_array_equal(image, expected)
+
+    def test_open_stream_args(self, ray_start_regular_shared, tmp_path):
+        # Images are opened with the given `open_stream_args`, like other files.
+        path = os.path.join(
+            os.path.dirname(ray.data.__file__),
+            "examples/data/image-datasets/simple/image1.jpg",
+        )
+        with open(path, "rb") as f:
+            data = f.read()
+        with pa.CompressedOutputStream(str(tmp_path / "image1.jpg"), "gzip") as f:
+            f.write(data)
+
+        ds = ray.data.read_datasource(
+            ImageDatasource(),
+            paths=str(tmp_path),
+            filesystem=None,
+            partition_filter=ImageDatasource.file_extension_filter(),
+            partitioning=None,
+            open_stream_args={"compression": "gzip"},
+        )
+        [record] = ds.take()
+        np.testing.assert_array_equal(
+            record["image"], _decode_image(data, size=None, mode=None)
+        )
+
     @pytest.mark.parametrize("size", [(-32, 32), (32, -32), (-32, -32)])
     def test_invalid_size(self, ray_start_regular_shared, size):
         with pytest.raises(ValueError):
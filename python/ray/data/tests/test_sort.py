@@ -288,6 +288,41 @@ def test_push_based_shuffle_schedule():
     _test(1000, 2, {f"node{i}": 16 for i in range(20)})
 
 
+def test_push_based_shuffle_schedule_object_store_memory():
+    num_cpus_per_node_map = {"node1": 16, "node2": 16}
+    block_size = 100 * 1024 * 1024
+    schedule = PushBasedShufflePlan._compute_shuffle_schedule(
+        num_cpus_per_node_map,
+        1000,
+        2,
+        1000,
+        input_size_bytes=1000 * block_size,
+        object_store_memory_per_node_map={
+            "node1": 10 * 1024 * 1024 * 1024,
+            "node2": 1 * 1024 * 1024 * 1024,
+        },
+    )
+    # Two rounds of map outputs fit in the safe fraction of the object store.
+    max_in_flight_bytes = (
+        ray.data.context.ESTIMATED_SAFE_MEMORY_FRACTION * 11 * 1024 * 1024 * 1024
+    )
+    assert 2 * schedule.num_map_tasks_per_round * block_size <= max_in_flight_bytes
+    assert schedule.num_rounds * schedule.num_map_tasks_per_round >= 1000
+
+    # Merge tasks are moved off of the node with little object store memory.
+    tasks_per_node = defaultdict(int)
+    for i in range(schedule.num_merge_tasks_per_round):
+        task_options = schedule.get_merge_task_options(i)
+        tasks_per_node[task_options["scheduling_strategy"].node_id] += 1
+    assert tasks_per_node["node1"] > tasks_per_node["node2"] >= 1
+
+    # Without memory information, the schedule only depends on CPUs.
+    schedule = PushBasedShufflePlan._compute_shuffle_schedule(
+        num_cpus_per_node_map, 1000, 2, 1000
+    )
+    assert schedule.num_map_tasks_per_round + schedule.num_merge_tasks_per_round == 32
+
+
 def test_push_based_shuffle_stats(ray_start_cluster):
     ctx = ray.data.context.DatasetContext.get_current()
     try:
@@ -308,6 +343,9 @@ def test_push_based_shuffle_stats(ray_start_cluster):
         parallelism = 100
         ds = ray.data.range(1000, parallelism=parallelism).random_shuffle()
         assert "random_shuffle_merge" in ds.stats()
+        # Check per-round timing is reported.
+        assert "map_round_times_s" in ds.stats()
+        assert "merge_round_times_s" in ds.stats()
         # Check all nodes used.
         assert "2 nodes used" in ds.stats()
         assert "1 nodes used" not in ds.stats()
@@ -1,5 +1,7 @@
 from collections import Counter
+import json
 import re
+import time
 import numpy as np
 
 import pytest
@@ -857,6 +859,103 @@ def test_get_total_stats(ray_start_regular_shared, stage_two_block):
     assert dataset_stats_summary.get_max_heap_memory() == peak_memory_stats.get("max")
 
 
+def test_dataset_stats_to_dict(ray_start_regular_shared):
+    ds = ray.data.range(1000, parallelism=10)
+    ds = ds.map_batches(dummy_map_batches).fully_executed()
+    ds = ds.map(dummy_map_batches).fully_executed()
+    for batch in ds.iter_batches():
+        pass
+
+    summary = ds._get_stats_summary().to_dict()
+    # The summary must be JSON-serializable.
+    summary = json.loads(json.dumps(summary))
+    assert len(summary["stages"]) == 1
+    stage = summary["stages"][0]
+    assert stage["stage_name"] == "map"
+    assert stage["output_num_rows"]["sum"] == 1000
+    assert stage["wall_time"]["sum"] > 0
+    assert 0 <= stage["udf_time"]["sum"] <= stage["wall_time"]["sum"]
+    assert summary["iter_stats"]["total_time_s"] > 0
+    [parent] = summary["parents"]
+    assert parent["stages"][0]["stage_name"] == "read->MapBatches(dummy_map_batches)"
+    assert ds._get_stats_summary().to_dict(include_parent=False)["parents"] == []
+
+
+def test_operator_profiling(ray_start_regular_shared, restore_dataset_context):
+    context = DatasetContext.get_current()
+    context.enable_operator_profiling = True
+
+    def slow_udf(batch):
+        time.sleep(0.1)
+        return batch
+
+    ds = ray.data.range(1000, parallelism=10)
+    ds = ds.map_batches(slow_udf).fully_executed()
+    stage = ds._get_stats_summary().stages_stats[0]
+    assert stage.udf_time["sum"] >= 10 * 0.1
+    if context.new_execution_backend:
+        # Everything runs on a single node.
+        assert stage.remote_bytes_pulled["sum"] == 0
+        assert ds._get_stats_summary().extra_metrics["obj_store_mem_spilled"] == 0
+
+    stats = canonicalize(ds.stats())
+    assert "* UDF time: T min, T max, T mean, T total (N% of remote wall time)" in (
+        stats
+    )
+    if context.new_execution_backend:
+        assert "* Remote bytes pulled: Z min, Z max, Z mean, Z total" in stats
+
+
+def test_summarize_profiling_stats(
+    ray_start_regular_shared, stage_two_block, restore_dataset_context
+):
+    context = DatasetContext.get_current()
+    block_params, block_meta_list = stage_two_block
+    for i, meta in enumerate(block_meta_list):
+        meta.exec_stats.udf_time_s = block_params["cpu_time"][i]
+        meta.exec_stats.bytes_read = block_params["size_bytes"][i]
+    stats = DatasetStats(
+        stages={"read": block_meta_list},
+        parent=None,
+    )
+    stage_stats = stats.to_summary().stages_stats[0]
+    assert stage_stats.udf_time == {
+        "min": min(block_params["cpu_time"]),
+        "max": max(block_params["cpu_time"]),
+        "mean": np.mean(block_params["cpu_time"]),
+        "sum": sum(block_params["cpu_time"]),
+    }
+    assert stage_stats.bytes_read["sum"] == sum(block_params["size_bytes"])
+    assert stage_stats.remote_bytes_pulled is None
+
+    # Profiling stats are only shown when operator profiling is enabled.
+    assert "UDF time" not in str(stage_stats)
+    context.enable_operator_profiling = True
+    summarized_lines = str(stage_stats).split("\n")
+    assert (
+        "* UDF time: {}s min, {}s max, {}s mean, {}s total ({}% of remote wall "
+        "time)".format(
+            min(block_params["cpu_time"]),
+            max(block_params["cpu_time"]),
+            np.mean(block_params["cpu_time"]),
+            sum(block_params["cpu_time"]),
+            round(
+                100 * sum(block_params["cpu_time"]) / sum(block_params["wall_time"]), 2
+            ),
+        )
+        == summarized_lines[7]
+    )
+    assert (
+        "* Bytes read: {} min, {} max, {} mean, {} total".format(
+            min(block_params["size_bytes"]),
+            max(block_params["size_bytes"]),
+            int(np.mean(block_params["size_bytes"])),
+            sum(block_params["size_bytes"]),
+        )
+        == summarized_lines[8]
+    )
+
+
 if __name__ == "__main__":
     import sys
 
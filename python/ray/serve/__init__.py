@@ -14,7 +14,9 @@ try:
     )
     from ray.serve.air_integrations import PredictorDeployment
     from ray.serve.batching import batch
+    from ray.serve.caching import cache
     from ray.serve.config import HTTPOptions
+    from ray.serve.multiplex import get_multiplexed_model_id, multiplexed
 except ModuleNotFoundError as e:
     e.msg += (
         '. You can run `pip install "ray[serve]"` to install all Ray Serve'
@@ -29,6 +31,7 @@ ray._private.worker.blocking_get_inside_async_warned = True
 
 __all__ = [
     "batch",
+    "cache",
     "start",
     "HTTPOptions",
     "get_replica_context",
@@ -40,4 +43,6 @@ __all__ = [
     "run",
     "PredictorDeployment",
     "delete",
+    "multiplexed",
+    "get_multiplexed_model_id",
 ]
@@ -2,16 +2,19 @@ import bisect
 import logging
 import threading
 import time
-from collections import defaultdict
+from collections import deque
 from dataclasses import dataclass, field
 from threading import Event
-from typing import Callable, DefaultDict, Dict, List, Optional, Type
+from typing import Callable, Deque, Dict, List, Optional, Type
 
 import ray
 from ray.serve._private.constants import SERVE_LOGGER_NAME
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
+# Enough for a metric pushed every 10ms over a 100s look back period.
+DEFAULT_MAX_POINTS_PER_KEY = 10000
+
 
 def start_metrics_pusher(
     interval_s: float,
@@ -89,11 +92,99 @@ class TimeStampedValue:
     value: float = field(compare=False)
 
 
+class _TimeSeries:
+    """Ring buffer of the data points of one metric, in timestamp order.
+
+    It keeps a running sum and a monotonic queue of the points that can still
+    become the max once older points are evicted, so window aggregates cost
+    amortized O(1) as the window moves forward.
+    """
+
+    def __init__(self, capacity: int):
+        self.points: Deque[TimeStampedValue] = deque()
+        self._capacity = capacity
+        self._sum = 0.0
+        # Subsequence of `points` with strictly decreasing values.
+        self._max_candidates: Deque[TimeStampedValue] = deque()
+
+    def add(self, point: TimeStampedValue):
+        if len(self.points) >= self._capacity:
+            self._pop_oldest()
+
+        if len(self.points) > 0 and point < self.points[-1]:
+            # Each series is pushed by a single sender, so this is rare.
+            points = list(self.points)
+            bisect.insort(a=points, x=point)
+            self.points = deque(points)
+            self._sum = sum(p.value for p in points)
+            self._max_candidates = deque()
+            for p in points:
+                self._push_max_candidate(p)
+        else:
+            self.points.append(point)
+            self._sum += point.value
+            self._push_max_candidate(point)
+
+    def _push_max_candidate(self, point: TimeStampedValue):
+        while (
+            len(self._max_candidates) > 0
+            and self._max_candidates[-1].value <= point.value
+        ):
+            self._max_candidates.pop()
+        self._max_candidates.append(point)
+
+    def _pop_oldest(self):
+        point = self.points.popleft()
+        if len(self.points) == 0:
+            # Reset instead of subtracting to not accumulate rounding errors.
+            self._sum = 0.0
+        else:
+            self._sum -= point.value
+        if len(self._max_candidates) > 0 and self._max_candidates[0] is point:
+            self._max_candidates.popleft()
+
+    def evict_before(self, window_start_timestamp_s: float):
+        while (
+            len(self.points) > 0
+            and self.points[0].timestamp <= window_start_timestamp_s
+        ):
+            self._pop_oldest()
+
+    def points_after(self, window_start_timestamp_s: float) -> List[TimeStampedValue]:
+        return [p for p in self.points if p.timestamp > window_start_timestamp_s]
+
+    def average(self) -> Optional[float]:
+        if len(self.points) == 0:
+            return None
+        return self._sum / len(self.points)
+
+    def max(self) -> Optional[float]:
+        if len(self._max_candidates) == 0:
+            return None
+        return self._max_candidates[0].value
+
+
 class InMemoryMetricsStore:
-    """A very simple, in memory time series database"""
+    """A very simple, in memory time series database.
+
+    Each metric keeps at most `max_points_per_key` data points in a ring
+    buffer. Aggregates over a window that only moves forward are amortized
+    O(1), because the points before it are compacted away as it moves.
+    """
 
-    def __init__(self):
-        self.data: DefaultDict[str, List[TimeStampedValue]] = defaultdict(list)
+    def __init__(self, max_points_per_key: int = DEFAULT_MAX_POINTS_PER_KEY):
+        self._max_points_per_key = max_points_per_key
+        self._series: Dict[str, _TimeSeries] = dict()
+
+    @property
+    def data(self) -> Dict[str, List[TimeStampedValue]]:
+        """All data points of each metric, in timestamp order."""
+        return {key: list(series.points) for key, series in self._series.items()}
+
+    def _get_series(self, key: str) -> _TimeSeries:
+        if key not in self._series:
+            self._series[key] = _TimeSeries(self._max_points_per_key)
+        return self._series[key]
 
     def add_metrics_point(self, data_points: Dict[str, float], timestamp: float):
         """Push new data points to the store.
@@ -106,21 +197,7 @@ class InMemoryMetricsStore:
               collected at.
         """
         for name, value in data_points.items():
-            # Using in-sort to insert while maintaining sorted ordering.
-            bisect.insort(a=self.data[name], x=TimeStampedValue(timestamp, value))
-
-    def _get_datapoints(self, key: str, window_start_timestamp_s: float) -> List[float]:
-        """Get all data points given key after window_start_timestamp_s"""
-
-        datapoints = self.data[key]
-
-        idx = bisect.bisect(
-            a=datapoints,
-            x=TimeStampedValue(
-                timestamp=window_start_timestamp_s, value=0  # dummy value
-            ),
-        )
-        return datapoints[idx:]
+            self._get_series(name).add(TimeStampedValue(timestamp, value))
 
     def window_average(
         self, key: str, window_start_timestamp_s: float, do_compact: bool = True
@@ -139,14 +216,15 @@ class InMemoryMetricsStore:
             The average of all the datapoints for the key on and after time
             window_start_timestamp_s, or None if there are no such points.
         """
-        points_after_idx = self._get_datapoints(key, window_start_timestamp_s)
-
+        series = self._get_series(key)
         if do_compact:
-            self.data[key] = points_after_idx
+            series.evict_before(window_start_timestamp_s)
+            return series.average()
 
-        if len(points_after_idx) == 0:
+        points = series.points_after(window_start_timestamp_s)
+        if len(points) == 0:
             return
-        return sum(point.value for point in points_after_idx) / len(points_after_idx)
+        return sum(point.value for point in points) / len(points)
 
     def max(self, key: str, window_start_timestamp_s: float, do_compact: bool = True):
         """Perform a max operation for metric `key`.
@@ -163,9 +241,10 @@ class InMemoryMetricsStore:
             Max value of the data points for the key on and after time
             window_start_timestamp_s, or None if there are no such points.
         """
-        points_after_idx = self._get_datapoints(key, window_start_timestamp_s)
-
+        series = self._get_series(key)
         if do_compact:
-            self.data[key] = points_after_idx
+            series.evict_before(window_start_timestamp_s)
+            return series.max()
 
-        return max((point.value for point in points_after_idx), default=None)
+        points = series.points_after(window_start_timestamp_s)
+        return max((point.value for point in points), default=None)
@@ -4,11 +4,17 @@ import math
 from ray.serve.config import AutoscalingConfig
 from ray.serve._private.constants import CONTROL_LOOP_PERIOD_S
 
-from typing import List
+from typing import List, Optional
+
+# Smoothing factors of the level and the trend in `LoadForecaster`.
+FORECAST_LEVEL_SMOOTHING = 0.5
+FORECAST_TREND_SMOOTHING = 0.3
 
 
 def calculate_desired_num_replicas(
-    autoscaling_config: AutoscalingConfig, current_num_ongoing_requests: List[float]
+    autoscaling_config: AutoscalingConfig,
+    current_num_ongoing_requests: List[float],
+    num_additional_requests: float = 0.0,
 ) -> int:  # (desired replicas):
     """Returns the number of replicas to scale to based on the given metrics.
 
@@ -18,6 +24,8 @@ def calculate_desired_num_replicas(
         current_num_ongoing_requests (List[float]): A list of the number of
             ongoing requests for each replica.  Assumes each entry has already
             been time-averaged over the desired lookback window.
+        num_additional_requests: Requests to provision for on top of the
+            ongoing ones, e.g. queries queued at handles or forecast growth.
 
     Returns:
         desired_num_replicas: The desired number of replicas to scale to, based
@@ -29,9 +37,9 @@ def calculate_desired_num_replicas(
         raise ValueError("Number of replicas cannot be zero")
 
     # The number of ongoing requests per replica, averaged over all replicas.
-    num_ongoing_requests_per_replica: float = sum(current_num_ongoing_requests) / len(
-        current_num_ongoing_requests
-    )
+    num_ongoing_requests_per_replica: float = (
+        sum(current_num_ongoing_requests) + num_additional_requests
+    ) / len(current_num_ongoing_requests)
 
     # Example: if error_ratio == 2.0, we have two times too many ongoing
     # requests per replica, so we desire twice as many replicas.
@@ -51,6 +59,47 @@ def calculate_desired_num_replicas(
     return desired_num_replicas
 
 
+class LoadForecaster:
+    """Forecasts the load with Holt's linear (double exponential) smoothing.
+
+    `update` is called with the observed load once per control loop period,
+    and `forecast` extrapolates the smoothed level along the smoothed trend.
+    """
+
+    def __init__(
+        self,
+        level_smoothing: float = FORECAST_LEVEL_SMOOTHING,
+        trend_smoothing: float = FORECAST_TREND_SMOOTHING,
+    ):
+        self.level_smoothing = level_smoothing
+        self.trend_smoothing = trend_smoothing
+        self.level: Optional[float] = None
+        self.trend = 0.0
+
+    def update(self, load: float):
+        if self.level is None:
+            self.level = load
+            return
+
+        prev_level = self.level
+        self.level = self.level_smoothing * load + (1 - self.level_smoothing) * (
+            self.level + self.trend
+        )
+        self.trend = (
+            self.trend_smoothing * (self.level - prev_level)
+            + (1 - self.trend_smoothing) * self.trend
+        )
+
+    def forecast(self, num_periods_ahead: float) -> Optional[float]:
+        if self.level is None:
+            return None
+        return max(0.0, self.level + self.trend * num_periods_ahead)
+
+    def reset(self):
+        self.level = None
+        self.trend = 0.0
+
+
 class AutoscalingPolicy:
     """Defines the interface for an autoscaling policy.
 
@@ -99,6 +148,11 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
     actually scaled. See config options for more details.  Assumes
     `get_decision_num_replicas` is called once every CONTROL_LOOP_PERIOD_S
     seconds.
+
+    With `queue_aware_scaling`, queries queued at handles count as load, and
+    scale up decisions skip `upscale_delay_s` while that queue is growing. With
+    a positive `forecast_horizon_s`, the deployment is also provisioned for the
+    load forecast that far ahead, if that's higher than the current load.
     """
 
     def __init__(self, config: AutoscalingConfig):
@@ -124,6 +178,12 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
         # scale_up_periods or scale_down_periods.
         self.decision_counter = 0
 
+        # The handle queue length seen in the previous period, used to tell
+        # whether the queue is growing.
+        self.prev_handle_queued_queries: Optional[float] = None
+        self.forecast_periods = config.forecast_horizon_s / self.loop_period_s
+        self.load_forecaster = LoadForecaster()
+
     def get_decision_num_replicas(
         self,
         curr_target_num_replicas: int,
@@ -132,6 +192,9 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
     ) -> int:
 
         if len(current_num_ongoing_requests) == 0:
+            # The load can't be measured without replicas, so start over.
+            self.prev_handle_queued_queries = None
+            self.load_forecaster.reset()
             # When 0 replica and queries queued, scale up the replicas
             if current_handle_queued_queries > 0:
                 return max(1, curr_target_num_replicas)
@@ -139,9 +202,33 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
 
         decision_num_replicas = curr_target_num_replicas
 
+        num_queued_queries = 0.0
+        queue_growing = False
+        if self.config.queue_aware_scaling:
+            num_queued_queries = current_handle_queued_queries
+            queue_growing = (
+                self.prev_handle_queued_queries is not None
+                and current_handle_queued_queries > self.prev_handle_queued_queries
+            )
+            self.prev_handle_queued_queries = current_handle_queued_queries
+
         desired_num_replicas = calculate_desired_num_replicas(
-            self.config, current_num_ongoing_requests
+            self.config, current_num_ongoing_requests, num_queued_queries
         )
+
+        if self.forecast_periods > 0:
+            load = sum(current_num_ongoing_requests) + num_queued_queries
+            self.load_forecaster.update(load)
+            forecast_load = self.load_forecaster.forecast(self.forecast_periods)
+            if forecast_load > load:
+                desired_num_replicas = max(
+                    desired_num_replicas,
+                    calculate_desired_num_replicas(
+                        self.config,
+                        current_num_ongoing_requests,
+                        forecast_load - sum(current_num_ongoing_requests),
+                    ),
+                )
         # Scale up.
         if desired_num_replicas > curr_target_num_replicas:
             # If the previous decision was to scale down (the counter was
@@ -153,7 +240,12 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
 
             # Only actually scale the replicas if we've made this decision for
             # 'scale_up_consecutive_periods' in a row.
-            if self.decision_counter > self.scale_up_consecutive_periods:
+            # A growing handle queue means the deployment is falling behind
+            # already, so don't wait for more periods to confirm it.
+            if (
+                self.decision_counter > self.scale_up_consecutive_periods
+                or queue_growing
+            ):
                 self.decision_counter = 0
                 decision_num_replicas = desired_num_replicas
 
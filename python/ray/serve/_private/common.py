@@ -1,7 +1,7 @@
 import json
 from enum import Enum
 from dataclasses import dataclass, field, asdict
-from typing import Any, List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 
 import ray
 from ray.actor import ActorHandle
@@ -292,3 +292,8 @@ class RunningReplicaInfo:
     actor_handle: ActorHandle
     max_concurrent_queries: int
     is_cross_language: bool = False
+    # Address of the replica's own HTTP server in direct ingress mode.
+    direct_ingress_address: Optional[str] = None
+    # IDs of the models the replica has loaded with `@serve.multiplexed`.
+    # These change while the replica runs, so they don't affect equality.
+    multiplexed_model_ids: Tuple[str, ...] = field(default=(), compare=False)
@@ -111,6 +111,10 @@ RAY_GCS_RPC_TIMEOUT_S = 3.0
 # Env var to control legacy sync deployment handle behavior in DAG.
 SYNC_HANDLE_IN_DAG_FEATURE_FLAG_ENV_KEY = "SERVE_DEPLOYMENT_HANDLE_IS_SYNC"
 
+# Key in a deployment node's other_args_to_resolve marking it as co-located
+# with the deployments it's passed to as an init arg.
+COLOCATE_DEPLOYMENT_KEY = "colocate"
+
 
 class ServeHandleType(str, Enum):
     SYNC = "SYNC"
@@ -125,3 +129,37 @@ MIGRATION_MESSAGE = (
 
 # [EXPERIMENTAL] Disable the http actor
 SERVE_EXPERIMENTAL_DISABLE_HTTP_PROXY = "SERVE_EXPERIMENTAL_DISABLE_HTTP_PROXY"
+
+# Stream HTTP responses that are produced incrementally (a starlette
+# StreamingResponse or a generator returned by the deployment) to the client
+# chunk by chunk, instead of buffering the whole body on the replica.
+RAY_SERVE_ENABLE_HTTP_STREAMING = (
+    os.environ.get("RAY_SERVE_ENABLE_HTTP_STREAMING", "1") == "1"
+)
+
+# Max number of ASGI messages a replica buffers per streaming response before
+# the response generator is paused until the HTTP proxy catches up.
+HTTP_STREAM_MAX_BUFFERED_MESSAGES = 16
+
+# A streaming response is cancelled if the HTTP proxy doesn't consume any of
+# its messages for this long, e.g. because the proxy died.
+HTTP_STREAM_IDLE_TIMEOUT_S = 60
+
+# HTTP header that selects the model a request is for, for deployments that
+# multiplex models with `@serve.multiplexed`.
+SERVE_MULTIPLEXED_MODEL_ID = "serve_multiplexed_model_id"
+
+# Have each replica serve HTTP requests on its own node-local port, so clients
+# or an external load balancer can send requests to replicas directly. The
+# HTTP proxy then only looks up the route and redirects requests to a replica.
+RAY_SERVE_ENABLE_DIRECT_INGRESS = (
+    os.environ.get("RAY_SERVE_ENABLE_DIRECT_INGRESS", "0") == "1"
+)
+
+# HTTP request bodies of at least this many bytes are sent from the HTTP proxy
+# to replicas as a separate buffer instead of being pickled with the request.
+# Large buffers go through the object store, and replicas read them without
+# copying.
+RAY_SERVE_HTTP_BODY_BUFFER_THRESHOLD_BYTES = int(
+    os.environ.get("RAY_SERVE_HTTP_BODY_BUFFER_THRESHOLD_BYTES", 100 * 1024)
+)
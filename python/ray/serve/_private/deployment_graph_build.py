@@ -4,6 +4,7 @@ from typing import List
 from collections import OrderedDict
 
 from ray.serve.deployment import Deployment, schema_to_deployment
+from ray.serve._private.constants import COLOCATE_DEPLOYMENT_KEY
 from ray.serve.deployment_graph import RayServeDAGHandle
 from ray.serve._private.deployment_method_node import DeploymentMethodNode
 from ray.serve._private.deployment_node import DeploymentNode
@@ -16,7 +17,10 @@ from ray.serve._private.deployment_function_executor_node import (
     DeploymentFunctionExecutorNode,
 )
 from ray.serve._private.json_serde import DAGNodeEncoder
-from ray.serve.handle import RayServeDeploymentHandle
+from ray.serve.handle import (
+    RayServeDeploymentHandle,
+    RayServeLocalDeploymentHandle,
+)
 from ray.serve.schema import DeploymentSchema
 
 
@@ -134,6 +138,30 @@ def get_and_validate_ingress_deployment(
     return ingress_deployments[0]
 
 
+def is_colocated(dag_node: DAGNode) -> bool:
+    """Whether the node is a deployment bound with `colocate()`."""
+    return isinstance(dag_node, DeploymentNode) and bool(
+        dag_node.get_other_args_to_resolve().get(COLOCATE_DEPLOYMENT_KEY)
+    )
+
+
+def get_local_deployment_handle(
+    deployment_node: DeploymentNode,
+) -> RayServeLocalDeploymentHandle:
+    """Handle that instantiates and calls a co-located deployment in the
+    process that holds it. Its init args already have deployment nodes
+    replaced by handles.
+    """
+    deployment = deployment_node._deployment
+    return RayServeLocalDeploymentHandle(
+        deployment.name,
+        deployment.func_or_class,
+        deployment.init_args,
+        deployment.init_kwargs,
+        user_config=deployment.user_config,
+    )
+
+
 def transform_ray_dag_to_serve_dag(
     dag_node: DAGNode, node_name_generator: _DAGNodeNameGenerator, name: str = None
 ):
@@ -157,6 +185,8 @@ def transform_ray_dag_to_serve_dag(
         # serve DAG end to end executable.
         def replace_with_handle(node):
             if isinstance(node, DeploymentNode):
+                if is_colocated(node):
+                    return get_local_deployment_handle(node)
                 return RayServeDeploymentHandle(node._deployment.name)
             elif isinstance(node, DeploymentExecutorNode):
                 return node._deployment_handle
@@ -233,6 +263,12 @@ def transform_ray_dag_to_serve_dag(
         other_args_to_resolve = dag_node.get_other_args_to_resolve()
         # TODO: (jiaodong) Need to capture DAGNodes in the parent node
         parent_deployment_node = other_args_to_resolve[PARENT_CLASS_NODE_KEY]
+        if is_colocated(parent_deployment_node):
+            raise ValueError(
+                f"Deployment '{parent_deployment_node._deployment.name}' is "
+                "co-located, so its methods can't be bound in the graph. Pass "
+                "it as an init arg to the deployment that calls it instead."
+            )
 
         parent_class = parent_deployment_node._deployment._func_or_class
         method = getattr(parent_class, dag_node._method_name)
@@ -295,6 +331,10 @@ def extract_deployments_from_serve_dag(
     deployments = OrderedDict()
 
     def extractor(dag_node):
+        # Co-located deployments run inside the deployments they're passed
+        # to, unless they're the root of the graph.
+        if is_colocated(dag_node) and dag_node is not serve_dag_root:
+            return dag_node
         if isinstance(dag_node, (DeploymentNode, DeploymentFunctionNode)):
             deployment = dag_node._deployment
             # In case same deployment is used in multiple DAGNodes
@@ -312,8 +352,12 @@ def transform_serve_dag_to_serve_executor_dag(serve_dag_root_node: DAGNode):
     execution.
     """
     if isinstance(serve_dag_root_node, DeploymentNode):
+        if is_colocated(serve_dag_root_node):
+            deployment_handle = get_local_deployment_handle(serve_dag_root_node)
+        else:
+            deployment_handle = serve_dag_root_node._deployment_handle
         return DeploymentExecutorNode(
-            serve_dag_root_node._deployment_handle,
+            deployment_handle,
             serve_dag_root_node.get_args(),
             serve_dag_root_node.get_kwargs(),
         )
@@ -34,6 +34,7 @@ from ray.serve.config import DeploymentConfig
 from ray.serve._private.constants import (
     MAX_DEPLOYMENT_CONSTRUCTOR_RETRY_COUNT,
     MAX_NUM_DELETED_DEPLOYMENTS,
+    RAY_SERVE_ENABLE_DIRECT_INGRESS,
     REPLICA_HEALTH_CHECK_UNHEALTHY_THRESHOLD,
     SERVE_LOGGER_NAME,
     SERVE_NAMESPACE,
@@ -198,7 +199,13 @@ class ActorReplicaWrapper:
 
         # Populated in either self.start() or self.recover()
         self._allocated_obj_ref: ObjectRef = None
+        self._allocated: bool = False
         self._ready_obj_ref: ObjectRef = None
+        # Only set when recovering, to tell apart standby replicas.
+        self._is_standby_obj_ref: Optional[ObjectRef] = None
+        self._is_standby: bool = False
+        self._direct_ingress_address_obj_ref: Optional[ObjectRef] = None
+        self._direct_ingress_address: Optional[str] = None
 
         self._actor_resources: Dict[str, float] = None
         self._max_concurrent_queries: int = None
@@ -260,18 +267,35 @@ class ActorReplicaWrapper:
     def max_concurrent_queries(self) -> int:
         return self._max_concurrent_queries
 
+    @property
+    def direct_ingress_address(self) -> Optional[str]:
+        return self._direct_ingress_address
+
     @property
     def node_id(self) -> Optional[str]:
         """Returns the node id of the actor, None if not placed."""
         return self._node_id
 
+    @property
+    def is_standby(self) -> bool:
+        """Whether a recovered actor is a standby replica that wasn't initialized."""
+        return self._is_standby
+
     def _check_obj_ref_ready(self, obj_ref: ObjectRef) -> bool:
         ready, _ = ray.wait([obj_ref], timeout=0)
         return len(ready) == 1
 
-    def start(self, deployment_info: DeploymentInfo, version: DeploymentVersion):
+    def start(
+        self,
+        deployment_info: DeploymentInfo,
+        version: DeploymentVersion,
+        standby: bool = False,
+    ):
         """
         Start a new actor for current DeploymentReplica instance.
+
+        If `standby` is set, the actor only loads the deployment definition,
+        and the user's constructor doesn't run until `initialize` is called.
         """
         self._max_concurrent_queries = (
             deployment_info.deployment_config.max_concurrent_queries
@@ -372,15 +396,25 @@ class ActorReplicaWrapper:
 
         # Perform auto method name translation for java handles.
         # See https://github.com/ray-project/ray/issues/21474
-        user_config = self._format_user_config(
-            deployment_info.deployment_config.user_config
-        )
         if self._is_cross_language:
+            assert not standby, "Standby replicas are only supported in Python."
             self._actor_handle = JavaActorHandleProxy(self._actor_handle)
-            self._allocated_obj_ref = self._actor_handle.is_allocated.remote()
+        self._allocated_obj_ref = self._actor_handle.is_allocated.remote()
+        if not self._is_cross_language and RAY_SERVE_ENABLE_DIRECT_INGRESS:
+            self._direct_ingress_address_obj_ref = (
+                self._actor_handle.get_direct_ingress_address.remote()
+            )
+
+        if not standby:
+            self.initialize(deployment_info.deployment_config.user_config)
+
+    def initialize(self, user_config: Any):
+        """Run the user's constructor in the started actor."""
+        self._is_standby = False
+        user_config = self._format_user_config(user_config)
+        if self._is_cross_language:
             self._ready_obj_ref = self._actor_handle.is_initialized.remote(user_config)
         else:
-            self._allocated_obj_ref = self._actor_handle.is_allocated.remote()
             self._ready_obj_ref = self._actor_handle.is_initialized.remote(
                 user_config,
                 # Ensure that `is_allocated` will execute before `reconfigure`,
@@ -390,6 +424,28 @@ class ActorReplicaWrapper:
                 self._allocated_obj_ref,
             )
 
+    def check_allocated(self) -> ReplicaStartupStatus:
+        """Check whether a started actor has been allocated, without initializing it.
+
+        Returns PENDING_ALLOCATION, SUCCEEDED, or FAILED if the actor died.
+        """
+        if self._allocated:
+            return ReplicaStartupStatus.SUCCEEDED
+
+        if not self._check_obj_ref_ready(self._allocated_obj_ref):
+            return ReplicaStartupStatus.PENDING_ALLOCATION
+
+        try:
+            self._node_id = ray.get(self._allocated_obj_ref)
+        except Exception:
+            logger.exception(
+                f"Standby replica {self.replica_tag} of deployment "
+                f"'{self._deployment_name}' failed to start."
+            )
+            return ReplicaStartupStatus.FAILED
+        self._allocated = True
+        return ReplicaStartupStatus.SUCCEEDED
+
     def _format_user_config(self, user_config: Any):
         temp = copy(user_config)
         if user_config is not None and self._deployment_is_cross_language:
@@ -428,6 +484,11 @@ class ActorReplicaWrapper:
             self._ready_obj_ref = self._actor_handle.check_health.remote()
         else:
             self._ready_obj_ref = self._actor_handle.get_metadata.remote()
+            self._is_standby_obj_ref = self._actor_handle.is_standby.remote()
+            if RAY_SERVE_ENABLE_DIRECT_INGRESS:
+                self._direct_ingress_address_obj_ref = (
+                    self._actor_handle.get_direct_ingress_address.remote()
+                )
 
     def check_ready(self) -> Tuple[ReplicaStartupStatus, Optional[DeploymentVersion]]:
         """
@@ -458,7 +519,17 @@ class ActorReplicaWrapper:
             return ReplicaStartupStatus.PENDING_ALLOCATION, None
 
         # Check whether relica initialization has completed.
-        replica_ready = self._check_obj_ref_ready(self._ready_obj_ref)
+        replica_ready = (
+            self._check_obj_ref_ready(self._ready_obj_ref)
+            and (
+                self._direct_ingress_address_obj_ref is None
+                or self._check_obj_ref_ready(self._direct_ingress_address_obj_ref)
+            )
+            and (
+                self._is_standby_obj_ref is None
+                or self._check_obj_ref_ready(self._is_standby_obj_ref)
+            )
+        )
         # In case of deployment constructor failure, ray.get will help to
         # surface exception to each update() cycle.
         if not replica_ready:
@@ -477,6 +548,14 @@ class ActorReplicaWrapper:
                 self._health_check_period_s = deployment_config.health_check_period_s
                 self._health_check_timeout_s = deployment_config.health_check_timeout_s
                 self._node_id = ray.get(self._allocated_obj_ref)
+                if self._direct_ingress_address_obj_ref is not None:
+                    self._direct_ingress_address = ray.get(
+                        self._direct_ingress_address_obj_ref
+                    )
+                if self._is_standby_obj_ref is not None:
+                    self._is_standby = ray.get(self._is_standby_obj_ref)
+                    self._is_standby_obj_ref = None
+                    self._allocated = True
             except Exception:
                 logger.exception(f"Exception in deployment '{self._deployment_name}'")
                 return ReplicaStartupStatus.FAILED, None
@@ -680,6 +759,8 @@ class DeploymentReplica(VersionedReplica):
         self._version = version
         self._start_time = None
         self._prev_slow_startup_warning_time = None
+        # Models the replica has loaded, as reported by the replica.
+        self.multiplexed_model_ids: Tuple[str, ...] = ()
 
     def get_running_replica_info(self) -> RunningReplicaInfo:
         return RunningReplicaInfo(
@@ -688,6 +769,8 @@ class DeploymentReplica(VersionedReplica):
             actor_handle=self._actor.actor_handle,
             max_concurrent_queries=self._actor.max_concurrent_queries,
             is_cross_language=self._actor.is_cross_language,
+            direct_ingress_address=self._actor.direct_ingress_address,
+            multiplexed_model_ids=self.multiplexed_model_ids,
         )
 
     @property
@@ -711,15 +794,39 @@ class DeploymentReplica(VersionedReplica):
         """Returns the node id of the actor, None if not placed."""
         return self._actor.node_id
 
-    def start(self, deployment_info: DeploymentInfo, version: DeploymentVersion):
+    def start(
+        self,
+        deployment_info: DeploymentInfo,
+        version: DeploymentVersion,
+        standby: bool = False,
+    ):
         """
         Start a new actor for current DeploymentReplica instance.
+
+        A standby replica has to be promoted with `promote` to run the user's
+        constructor.
         """
-        self._actor.start(deployment_info, version)
+        self._actor.start(deployment_info, version, standby=standby)
         self._start_time = time.time()
         self._prev_slow_startup_warning_time = time.time()
         self._version = version
 
+    def promote(self, deployment_info: DeploymentInfo):
+        """Initialize a standby replica so it can start serving."""
+        self._actor.initialize(deployment_info.deployment_config.user_config)
+        # The startup time only covers the time since the promotion.
+        self._start_time = time.time()
+        self._prev_slow_startup_warning_time = time.time()
+
+    def check_allocated(self) -> ReplicaStartupStatus:
+        """Check whether a standby replica's actor has been allocated."""
+        return self._actor.check_allocated()
+
+    @property
+    def is_standby(self) -> bool:
+        """Whether a recovered replica turned out to be a standby replica."""
+        return self._actor.is_standby
+
     def update_user_config(self, user_config: Any):
         """
         Update user config of existing actor behind current
@@ -986,6 +1093,10 @@ class DeploymentState:
         self._backoff_time_s: int = 1
         self._replica_constructor_retry_counter: int = 0
         self._replicas: ReplicaStateContainer = ReplicaStateContainer()
+        # Replicas whose actors are started but whose user constructor hasn't
+        # run yet. Scale ups promote these before starting new replicas.
+        self._standby_replicas: List[DeploymentReplica] = []
+        self._last_standby_failure: float = 0.0
         self._curr_status_info: DeploymentStatusInfo = DeploymentStatusInfo(
             self._name, DeploymentStatus.UPDATING
         )
@@ -1075,6 +1186,13 @@ class DeploymentState:
             for replica in self._replicas.get([ReplicaState.RUNNING])
         ]
 
+    def record_multiplexed_model_ids(self, replica_tag: str, model_ids: List[str]):
+        for replica in self._replicas.get([ReplicaState.RUNNING]):
+            if replica.replica_tag == replica_tag:
+                replica.multiplexed_model_ids = tuple(model_ids)
+                self._notify_running_replicas_changed()
+                return
+
     def _notify_running_replicas_changed(self):
         self._long_poll_host.notify_changed(
             (LongPollNamespace.RUNNING_REPLICAS, self._name),
@@ -1335,25 +1453,28 @@ class DeploymentState:
                     f"to deployment '{self._name}'."
                 )
                 for _ in range(to_add):
-                    replica_name = ReplicaName(self._name, get_random_letters())
-                    new_deployment_replica = DeploymentReplica(
-                        self._controller_name,
-                        self._detached,
-                        replica_name.replica_tag,
-                        replica_name.deployment_tag,
-                        self._target_state.version,
-                    )
-                    new_deployment_replica.start(
-                        self._target_state.info, self._target_state.version
-                    )
+                    new_deployment_replica = self._pop_standby_replica()
+                    if new_deployment_replica is not None:
+                        new_deployment_replica.promote(self._target_state.info)
+                    else:
+                        new_deployment_replica = self._create_replica()
+                        new_deployment_replica.start(
+                            self._target_state.info, self._target_state.version
+                        )
 
                     self._replicas.add(ReplicaState.STARTING, new_deployment_replica)
                     logger.debug(
                         "Adding STARTING to replica_tag: "
-                        f"{replica_name}, deployment: {self._name}"
+                        f"{new_deployment_replica.replica_tag}, "
+                        f"deployment: {self._name}"
                     )
 
         elif delta_replicas < 0:
+            if recovering_replicas > 0 and self._get_num_standby_replicas() > 0:
+                # Recovering replicas may turn out to be standby replicas, which
+                # don't count towards the target, so wait until they're recovered.
+                return replicas_stopped
+
             replicas_stopped = True
             to_remove = -delta_replicas
             logger.info(
@@ -1381,6 +1502,91 @@ class DeploymentState:
 
         return replicas_stopped
 
+    def _create_replica(self) -> DeploymentReplica:
+        replica_name = ReplicaName(self._name, get_random_letters())
+        return DeploymentReplica(
+            self._controller_name,
+            self._detached,
+            replica_name.replica_tag,
+            replica_name.deployment_tag,
+            self._target_state.version,
+        )
+
+    def _get_num_standby_replicas(self) -> int:
+        """The size of the standby pool, set in the autoscaling config."""
+        if self._target_state.deleting or self._target_state.info is None:
+            return 0
+
+        deployment_config = self._target_state.info.deployment_config
+        if (
+            deployment_config.autoscaling_config is None
+            or deployment_config.deployment_language != DeploymentLanguage.PYTHON
+            or deployment_config.is_cross_language
+        ):
+            return 0
+        return deployment_config.autoscaling_config.num_standby_replicas
+
+    def _pop_standby_replica(self) -> Optional[DeploymentReplica]:
+        """Take a standby replica of the target version out of the pool.
+
+        Replicas that are allocated already are preferred.
+        """
+        candidates = [
+            replica
+            for replica in self._standby_replicas
+            if replica.version == self._target_state.version
+        ]
+        for replica in candidates:
+            if replica.check_allocated() == ReplicaStartupStatus.SUCCEEDED:
+                self._standby_replicas.remove(replica)
+                return replica
+        if len(candidates) > 0:
+            self._standby_replicas.remove(candidates[0])
+            return candidates[0]
+        return None
+
+    def _update_standby_replicas(self):
+        """Keep the standby pool filled with replicas of the target version.
+
+        Standby replicas of other versions, failed ones, and ones beyond the
+        pool size are stopped like regular replicas.
+        """
+        num_standby_replicas = self._get_num_standby_replicas()
+        standby_replicas = []
+        for replica in self._standby_replicas:
+            status = replica.check_allocated()
+            if status == ReplicaStartupStatus.FAILED:
+                self._last_standby_failure = time.time()
+            if (
+                status == ReplicaStartupStatus.FAILED
+                or replica.version != self._target_state.version
+                or len(standby_replicas) >= num_standby_replicas
+            ):
+                replica.stop(graceful=False)
+                self._replicas.add(ReplicaState.STOPPING, replica)
+            else:
+                standby_replicas.append(replica)
+        self._standby_replicas = standby_replicas
+
+        # Don't keep recreating standby replicas that fail to start.
+        if time.time() - self._last_standby_failure < self._backoff_time_s:
+            return
+        # Recovered replicas may turn out to be standby replicas, so wait for
+        # them before refilling the pool.
+        if self._replicas.count(states=[ReplicaState.RECOVERING]) > 0:
+            return
+
+        for _ in range(num_standby_replicas - len(self._standby_replicas)):
+            replica = self._create_replica()
+            replica.start(
+                self._target_state.info, self._target_state.version, standby=True
+            )
+            self._standby_replicas.append(replica)
+            logger.debug(
+                f"Adding standby replica {replica.replica_tag} to deployment "
+                f"'{self._name}'."
+            )
+
     def _check_curr_status(self) -> bool:
         """Check the current deployment status.
 
@@ -1478,7 +1684,11 @@ class DeploymentState:
         replicas_failed = False
         for replica in self._replicas.pop(states=[original_state]):
             start_status = replica.check_started()
-            if start_status == ReplicaStartupStatus.SUCCEEDED:
+            if start_status == ReplicaStartupStatus.SUCCEEDED and replica.is_standby:
+                # A standby replica started by the previous controller goes
+                # back to the pool, which stops it if it's not needed.
+                self._standby_replicas.append(replica)
+            elif start_status == ReplicaStartupStatus.SUCCEEDED:
                 # This replica should be now be added to handle's replica
                 # set.
                 self._replicas.add(ReplicaState.RUNNING, replica)
@@ -1667,6 +1877,9 @@ class DeploymentState:
 
             running_replicas_changed = self._scale_deployment_replicas()
 
+            # Refill the standby pool after scale ups took from it.
+            self._update_standby_replicas()
+
             # Check the state of existing replicas and transition if necessary.
             running_replicas_changed |= self._check_and_update_replicas()
 
@@ -1991,6 +2204,13 @@ class DeploymentStateManager:
             for name, deployment_state in self._deployment_states.items()
         }
 
+    def record_multiplexed_model_ids(
+        self, deployment_name: str, replica_tag: str, model_ids: List[str]
+    ):
+        deployment_state = self._deployment_states.get(deployment_name)
+        if deployment_state is not None:
+            deployment_state.record_multiplexed_model_ids(replica_tag, model_ids)
+
     def get_deployment_configs(
         self, filter_tag: Optional[str] = None, include_deleted: Optional[bool] = False
     ) -> Dict[str, DeploymentConfig]:
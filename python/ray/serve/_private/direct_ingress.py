@@ -0,0 +1,90 @@
+import asyncio
+import logging
+import socket
+from typing import Callable, Dict, Optional
+
+import uvicorn
+
+import ray
+from ray._private.utils import get_or_create_event_loop
+from ray.actor import ActorHandle
+
+from ray.serve._private.common import EndpointInfo, EndpointTag
+from ray.serve._private.constants import SERVE_LOGGER_NAME
+from ray.serve._private.http_util import Response
+from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
+
+logger = logging.getLogger(SERVE_LOGGER_NAME)
+
+
+class DirectIngressServer:
+    """HTTP server that runs inside a replica in direct ingress mode.
+
+    It listens on a node-local port and handles requests in the replica's
+    event loop, skipping the HTTP proxy and the actor call to the replica. Like
+    the proxy, it strips the deployment's route prefix from the request path.
+    """
+
+    def __init__(
+        self,
+        deployment_name: str,
+        controller_handle: ActorHandle,
+        get_replica: Callable,
+    ):
+        self._deployment_name = deployment_name
+        # Returns the RayServeReplica, or None before it's initialized.
+        self._get_replica = get_replica
+        self._route_prefix: Optional[str] = None
+        self._long_poll_client = LongPollClient(
+            controller_handle,
+            {LongPollNamespace.ROUTE_TABLE: self._update_route_prefix},
+            call_in_event_loop=get_or_create_event_loop(),
+        )
+
+        host = ray.util.get_node_ip_address()
+        self._sock = socket.socket()
+        self._sock.bind((host, 0))
+        port = self._sock.getsockname()[1]
+        self.address = f"http://{host}:{port}"
+
+        config = uvicorn.Config(
+            self, host=host, port=port, lifespan="off", access_log=False
+        )
+        self._server = uvicorn.Server(config=config)
+        # See HTTPProxyActor.run: the default handlers only work in the main
+        # thread.
+        self._server.install_signal_handlers = lambda: None
+        self._serve_task = get_or_create_event_loop().create_task(
+            self._server.serve(sockets=[self._sock])
+        )
+
+    def _update_route_prefix(self, endpoints: Dict[EndpointTag, EndpointInfo]):
+        info = endpoints.get(self._deployment_name)
+        self._route_prefix = info.route if info is not None else None
+
+    async def __call__(self, scope, receive, send):
+        assert scope["type"] == "http"
+
+        replica = self._get_replica()
+        if replica is None:
+            return await Response(
+                "Replica is not initialized yet.", status_code=503
+            ).send(scope, receive, send)
+
+        # Strip the route prefix the same way as HTTPProxy does.
+        route_prefix = self._route_prefix
+        if route_prefix is not None and route_prefix != "/":
+            path = scope["path"]
+            if path != route_prefix and not path.startswith(route_prefix + "/"):
+                return await Response(
+                    f"Path '{path}' not found.", status_code=404
+                ).send(scope, receive, send)
+            scope["path"] = path.replace(route_prefix, "", 1)
+            scope["root_path"] = scope["root_path"] + route_prefix
+
+        await replica.handle_direct_http_request(scope, receive, send)
+
+    async def stop(self):
+        """Stop accepting requests and wait for ongoing ones to finish."""
+        self._server.should_exit = True
+        await asyncio.wait([self._serve_task])
@@ -1,5 +1,6 @@
 import asyncio
 from asyncio.tasks import FIRST_COMPLETED
+import dataclasses
 import os
 import logging
 import pickle
@@ -8,6 +9,7 @@ import time
 from typing import Callable, List, Dict, Optional, Tuple
 from ray._private.utils import get_or_create_event_loop
 
+import numpy as np
 import uvicorn
 import starlette.responses
 import starlette.routing
@@ -24,9 +26,16 @@ from ray.serve._private.http_util import (
     receive_http_body,
     Response,
     set_socket_reuse_port,
+    StreamingHTTPResponse,
 )
 from ray.serve._private.common import EndpointInfo, EndpointTag
-from ray.serve._private.constants import SERVE_LOGGER_NAME, SERVE_NAMESPACE
+from ray.serve._private.constants import (
+    RAY_SERVE_ENABLE_DIRECT_INGRESS,
+    RAY_SERVE_HTTP_BODY_BUFFER_THRESHOLD_BYTES,
+    SERVE_LOGGER_NAME,
+    SERVE_MULTIPLEXED_MODEL_ID,
+    SERVE_NAMESPACE,
+)
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
 from ray.serve._private.logging_utils import access_log_msg, configure_component_logger
 
@@ -57,10 +66,27 @@ if os.environ.get("SERVE_REQUEST_PROCESSING_TIMEOUT_S") is not None:
 async def _send_request_to_handle(handle, scope, receive, send) -> str:
     http_body_bytes = await receive_http_body(scope, receive, send)
 
+    # Route requests for a multiplexed model based on the model ID header.
+    handle_options = handle.handle_options
+    for key, value in scope["headers"]:
+        if key.decode("latin-1") == SERVE_MULTIPLEXED_MODEL_ID:
+            handle_options = dataclasses.replace(
+                handle_options, multiplexed_model_id=value.decode("latin-1")
+            )
+            break
+
     # NOTE(edoakes): it's important that we defer building the starlette
     # request until it reaches the replica to avoid unnecessary
     # serialization cost, so we use a simple dataclass here.
-    request = HTTPRequestWrapper(scope, http_body_bytes)
+    if len(http_body_bytes) >= RAY_SERVE_HTTP_BODY_BUFFER_THRESHOLD_BYTES:
+        # Send large bodies as a separate uint8 array, which Ray doesn't copy
+        # into a pickle and which the replica reads from the object store
+        # without copying.
+        request = HTTPRequestWrapper(scope, b"")
+        body_args = (np.frombuffer(http_body_bytes, dtype=np.uint8),)
+    else:
+        request = HTTPRequestWrapper(scope, http_body_bytes)
+        body_args = ()
     # Perform a pickle here to improve latency. Stdlib pickle for simple
     # dataclasses are 10-100x faster than cloudpickle.
     request = pickle.dumps(request)
@@ -73,7 +99,9 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
     # call might never arrive; if it does, it can only be `http.disconnect`.
     client_disconnection_task = loop.create_task(receive())
     while retries < MAX_REPLICA_FAILURE_RETRIES:
-        assignment_task: asyncio.Task = handle.remote(request)
+        assignment_task: asyncio.Task = handle._remote_with_options(
+            handle_options, request, *body_args
+        )
         done, _ = await asyncio.wait(
             [assignment_task, client_disconnection_task],
             return_when=FIRST_COMPLETED,
@@ -114,7 +142,6 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
                 backoff = True
             else:
                 result = await object_ref
-                client_disconnection_task.cancel()
                 break
         except asyncio.CancelledError:
             # Here because the client disconnected, we will return a custom
@@ -140,10 +167,17 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
             retries += 1
             backoff = False
     else:
+        client_disconnection_task.cancel()
         error_message = f"Task failed with {MAX_REPLICA_FAILURE_RETRIES} retries."
         await Response(error_message, status_code=500).send(scope, receive, send)
         return "500"
 
+    if isinstance(result, StreamingHTTPResponse):
+        return await _consume_response_stream(
+            result, client_disconnection_task, scope, receive, send
+        )
+
+    client_disconnection_task.cancel()
     if isinstance(result, (starlette.responses.Response, RawASGIResponse)):
         await result(scope, receive, send)
         return str(result.status_code)
@@ -152,6 +186,64 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
         return "200"
 
 
+async def _consume_response_stream(
+    stream: StreamingHTTPResponse,
+    client_disconnection_task: asyncio.Task,
+    scope,
+    receive,
+    send,
+) -> str:
+    """Forward a streaming response from a replica to the client.
+
+    Messages are pulled from the replica one batch at a time, and the next
+    batch is only requested once the previous one has been sent. Since
+    `send` blocks while the client isn't reading, a slow client pauses the
+    response on the replica instead of buffering it in the proxy.
+    """
+    status_code = None
+    messages, done = stream.messages, stream.done
+    try:
+        while True:
+            for message in messages:
+                if message["type"] == "http.response.start":
+                    status_code = str(message["status"])
+                await send(message)
+            if done:
+                return status_code or "500"
+
+            fetch_task = asyncio.ensure_future(
+                stream.replica_handle.get_stream_messages.remote(stream.stream_id)
+            )
+            await asyncio.wait(
+                [fetch_task, client_disconnection_task],
+                return_when=FIRST_COMPLETED,
+            )
+            if not fetch_task.done():
+                logger.warning(
+                    f"Client from {scope['client']} disconnected, cancelling the "
+                    "streaming response."
+                )
+                fetch_task.cancel()
+                stream.replica_handle.cancel_stream.remote(stream.stream_id)
+                return DISCONNECT_ERROR_CODE
+
+            try:
+                messages, done = await fetch_task
+            except (RayTaskError, RayActorError) as error:
+                if status_code is not None:
+                    # The response has already started, so the client can only
+                    # tell that it failed from the connection being closed.
+                    logger.warning(f"Streaming response failed: {error}")
+                    return "500"
+                error_message = "Task Error. Traceback: {}.".format(error)
+                await Response(error_message, status_code=500).send(
+                    scope, receive, send
+                )
+                return "500"
+    finally:
+        client_disconnection_task.cancel()
+
+
 class LongestPrefixRouter:
     """Router that performs longest prefix matches on incoming routes."""
 
@@ -321,6 +413,29 @@ class HTTPProxy:
         )
         await response.send(scope, receive, send)
 
+    def _get_direct_ingress_addresses(self) -> Dict[str, List[str]]:
+        """Addresses of the replicas that serve each route directly."""
+        addresses = {}
+        for route, endpoint in self.route_info.items():
+            handle = self.prefix_router.handles.get(endpoint)
+            if handle is not None:
+                addresses[route] = handle.router.get_direct_ingress_addresses()
+        return addresses
+
+    async def _redirect_to_replica(self, address, route_path, scope, receive, send):
+        """Redirect the request to a replica's direct ingress server.
+
+        The redirect preserves the method and body of the request. Clients that
+        send many requests should instead look up the replica addresses once
+        with `/-/direct-ingress`, so they skip the proxy entirely.
+        """
+        url = address + route_path
+        query_string = scope.get("query_string")
+        if query_string:
+            url += "?" + query_string.decode("latin-1")
+        response = starlette.responses.RedirectResponse(url, status_code=307)
+        await response(scope, receive, send)
+
     async def __call__(self, scope, receive, send):
         """Implements the ASGI protocol.
 
@@ -348,6 +463,11 @@ class HTTPProxy:
                 scope, receive, send
             )
 
+        if route_path == "/-/direct-ingress":
+            return await starlette.responses.JSONResponse(
+                self._get_direct_ingress_addresses()
+            )(scope, receive, send)
+
         route_prefix, handle = self.prefix_router.match_route(route_path)
         if route_prefix is None:
             self.request_error_counter.inc(
@@ -359,6 +479,13 @@ class HTTPProxy:
             )
             return await self._not_found(scope, receive, send)
 
+        if RAY_SERVE_ENABLE_DIRECT_INGRESS:
+            address = handle.router.choose_direct_ingress_address()
+            if address is not None:
+                return await self._redirect_to_replica(
+                    address, route_path, scope, receive, send
+                )
+
         # Modify the path and root path so that reverse lookups and redirection
         # work as expected. We do this here instead of in replicas so it can be
         # changed without restarting the replicas.
@@ -4,13 +4,15 @@ from dataclasses import dataclass
 import inspect
 import json
 import logging
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
+import numpy as np
 import starlette.responses
 import starlette.requests
-from starlette.types import Send, ASGIApp
+from starlette.types import Send, ASGIApp, Receive
 from fastapi.encoders import jsonable_encoder
 
+from ray._private.utils import get_or_create_event_loop
 from ray.serve.exceptions import RayServeException
 from ray.serve._private.constants import SERVE_LOGGER_NAME
 
@@ -24,11 +26,17 @@ class HTTPRequestWrapper:
     body: bytes
 
 
-def build_starlette_request(scope, serialized_body: bytes):
+# Attribute of `request.state` that holds the body of requests built by
+# replicas, if the HTTP proxy sent it as a separate uint8 array.
+BODY_BUFFER_STATE_KEY = "ray_serve_body_buffer"
+
+
+def build_starlette_request(scope, serialized_body: Union[bytes, np.ndarray]):
     """Build and return a Starlette Request from ASGI payload.
 
     This function is intended to be used immediately before task invocation
-    happens.
+    happens. The body can also be a uint8 array, e.g. one read from the object
+    store, in which case it isn't copied until `request.body()` is called.
     """
 
     # Simulates receiving HTTP body from TCP socket.  In reality, the body has
@@ -46,9 +54,30 @@ def build_starlette_request(scope, serialized_body: bytes):
             await block_forever.wait()
 
         received = True
-        return {"body": serialized_body, "type": "http.request", "more_body": False}
+        body = serialized_body
+        if not isinstance(body, bytes):
+            body = body.tobytes()
+        return {"body": body, "type": "http.request", "more_body": False}
+
+    request = starlette.requests.Request(scope, mock_receive)
+    if isinstance(serialized_body, np.ndarray):
+        # The state is kept in the scope, so it's also available to requests
+        # built from it later, e.g. by FastAPI.
+        setattr(request.state, BODY_BUFFER_STATE_KEY, serialized_body)
+    return request
 
-    return starlette.requests.Request(scope, mock_receive)
+
+async def get_request_body_buffer(request: starlette.requests.Request) -> memoryview:
+    """Return the body of the request as a buffer.
+
+    The body of requests forwarded by the HTTP proxy is returned without
+    copying it, so it's read-only. For other requests, it's read with
+    `request.body()`.
+    """
+    buffer = getattr(request.state, BODY_BUFFER_STATE_KEY, None)
+    if buffer is None:
+        buffer = await request.body()
+    return memoryview(buffer)
 
 
 class Response:
@@ -159,6 +188,131 @@ class ASGIHTTPSender(Send):
         return RawASGIResponse(self.messages)
 
 
+class ASGIAppResponse(ASGIApp):
+    """An ASGI response produced by running an ASGI app on a given request.
+
+    Unlike calling the app with an `ASGIHTTPSender`, this defers running the
+    app until the response is sent, so the replica can stream its output.
+    """
+
+    def __init__(self, app: ASGIApp, scope: Dict[Any, Any], receive: Receive):
+        self.app = app
+        self.scope = scope
+        self.receive = receive
+
+    async def __call__(self, _scope, _receive, send):
+        await self.app(self.scope, self.receive, send)
+
+
+@dataclass
+class StreamingHTTPResponse:
+    """Placeholder a replica returns in place of a streaming HTTP response.
+
+    It carries the first messages of the response. If the response isn't
+    complete yet, the HTTP proxy pulls the rest from the replica with
+    `get_stream_messages(stream_id)` until it is.
+    """
+
+    messages: List[Dict[str, Any]]
+    done: bool
+    stream_id: Optional[str] = None
+    replica_handle: Any = None
+
+
+class _StreamIdleTimeout(Exception):
+    pass
+
+
+_STREAM_END = object()
+
+
+class ASGIResponseStream:
+    """Runs an ASGI response in the background and buffers its messages.
+
+    The buffer is bounded, so a response that produces messages faster than
+    they are consumed is paused until the consumer catches up. If the consumer
+    doesn't take any messages for `idle_timeout_s`, the response is cancelled
+    and the stream is marked as abandoned.
+    """
+
+    def __init__(
+        self,
+        response: ASGIApp,
+        max_buffered_messages: int,
+        idle_timeout_s: float,
+    ):
+        self._queue = asyncio.Queue(maxsize=max_buffered_messages)
+        self._idle_timeout_s = idle_timeout_s
+        self._error: Optional[Exception] = None
+        self.abandoned = False
+        self._task = get_or_create_event_loop().create_task(self._run(response))
+
+    async def _receive(self):
+        # Starlette polls this for an http disconnect while streaming, which
+        # the HTTP proxy reports by cancelling the stream instead.
+        await asyncio.Event().wait()
+
+    async def _send(self, message):
+        assert message["type"] in ("http.response.start", "http.response.body")
+        await self._put(message)
+
+    async def _put(self, item):
+        try:
+            await asyncio.wait_for(self._queue.put(item), self._idle_timeout_s)
+        except asyncio.TimeoutError:
+            raise _StreamIdleTimeout() from None
+
+    async def _run(self, response: ASGIApp):
+        try:
+            try:
+                await response(None, self._receive, self._send)
+                await self._put(_STREAM_END)
+            except _StreamIdleTimeout:
+                raise
+            except Exception as e:
+                logger.exception("Streaming response failed.")
+                await self._put(e)
+        except _StreamIdleTimeout:
+            logger.warning(
+                "Cancelling streaming response because it wasn't consumed for "
+                f"{self._idle_timeout_s}s."
+            )
+            self.abandoned = True
+
+    async def get_messages(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """Wait for the next messages of the response.
+
+        Returns all buffered messages and whether the response is complete.
+        Unless it is complete, the messages include at least one body message,
+        so a response that fails before producing any body can still be
+        reported with an error status. Otherwise, the exception the response
+        failed with is raised once the messages before it are consumed.
+        """
+        if self._error is not None:
+            raise self._error
+        messages = []
+        has_body = False
+        while not has_body or not self._queue.empty():
+            item = await self._queue.get()
+            if item is _STREAM_END:
+                return messages, True
+            elif isinstance(item, Exception):
+                if not has_body:
+                    raise item
+                self._error = item
+                break
+            messages.append(item)
+            if item["type"] == "http.response.body":
+                if not item.get("more_body", False):
+                    # This is the last message of the response.
+                    return messages, True
+                has_body = True
+        return messages, False
+
+    def cancel(self):
+        self._task.cancel()
+
+
 def make_fastapi_class_based_view(fastapi_app, cls: Type) -> None:
     """Transform the `cls`'s methods and class annotations to FastAPI routes.
 
@@ -27,6 +27,7 @@ from ray.serve.handle import (
     HandleOptions,
     RayServeHandle,
     RayServeDeploymentHandle,
+    RayServeLocalDeploymentHandle,
     _serve_handle_to_json_dict,
     _serve_handle_from_json_dict,
 )
@@ -101,6 +102,11 @@ class DAGNodeEncoder(json.JSONEncoder):
                 DAGNODE_TYPE_KEY: RayServeDAGHandle.__name__,
                 "dag_node_json": obj.dag_node_json,
             }
+        elif isinstance(obj, RayServeLocalDeploymentHandle):
+            raise ValueError(
+                f"Deployment '{obj.deployment_name}' is co-located, so it can "
+                "only be passed as an init arg to other deployments."
+            )
         elif isinstance(obj, RayServeDeploymentHandle):
             return {
                 DAGNODE_TYPE_KEY: RayServeDeploymentHandle.__name__,
@@ -1,15 +1,27 @@
 import asyncio
 from asyncio.events import AbstractEventLoop
-from collections import defaultdict
-from dataclasses import dataclass
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, fields, is_dataclass
 from enum import Enum, auto
 import logging
 import os
 import random
-from typing import Any, Tuple, Callable, DefaultDict, Dict, Set, Union
+import uuid
+from typing import (
+    Any,
+    Tuple,
+    Callable,
+    DefaultDict,
+    Deque,
+    Dict,
+    Hashable,
+    Optional,
+    Set,
+    Union,
+)
 from ray._private.utils import get_or_create_event_loop
 
-from ray.serve._private.common import ReplicaName
+from ray.serve._private.common import ReplicaName, RunningReplicaInfo
 from ray.serve.generated.serve_pb2 import (
     LongPollRequest,
     UpdatedObject as UpdatedObjectProto,
@@ -37,6 +49,18 @@ LISTEN_FOR_CHANGE_REQUEST_TIMEOUT_S = (
     int(os.environ.get("LISTEN_FOR_CHANGE_REQUEST_TIMEOUT_S_UPPER_BOUND", "60")),
 )
 
+# After a key changes, wait this long for more changes before responding, so
+# a burst of changes reaches clients as one update.
+LONG_POLL_COALESCE_WINDOW_S = float(
+    os.environ.get("RAY_SERVE_LONG_POLL_COALESCE_WINDOW_S", "0.01")
+)
+
+# The number of most recent changes to each key kept as deltas. Clients that
+# are further behind receive the full snapshot.
+LONG_POLL_MAX_DELTAS_PER_KEY = int(
+    os.environ.get("RAY_SERVE_LONG_POLL_MAX_DELTAS_PER_KEY", "32")
+)
+
 
 class LongPollNamespace(Enum):
     def __repr__(self):
@@ -46,12 +70,94 @@ class LongPollNamespace(Enum):
     ROUTE_TABLE = auto()
 
 
+@dataclass
+class SnapshotDelta:
+    """The changes between two snapshots of a dict, or of a list of replicas.
+
+    Replicas are identified by their replica tag.
+    """
+
+    updated: Dict[Hashable, Any] = field(default_factory=dict)
+    removed: Set[Hashable] = field(default_factory=set)
+
+    def __len__(self) -> int:
+        return len(self.updated) + len(self.removed)
+
+    def merge(self, other: "SnapshotDelta"):
+        """Add the changes of a later delta to this one."""
+        for key in other.removed:
+            self.updated.pop(key, None)
+            self.removed.add(key)
+        for key, value in other.updated.items():
+            self.removed.discard(key)
+            self.updated[key] = value
+
+
+def _items_by_key(snapshot: Any) -> Optional[Dict[Hashable, Any]]:
+    """The items of a snapshot that can be sent as deltas, by their key."""
+    if isinstance(snapshot, dict):
+        return snapshot
+    if isinstance(snapshot, list) and all(
+        isinstance(item, RunningReplicaInfo) for item in snapshot
+    ):
+        return {item.replica_tag: item for item in snapshot}
+    return None
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    # Dataclass fields can be excluded from equality, like the multiplexed
+    # model IDs of a replica, but changes to them still have to be sent.
+    if is_dataclass(a) and is_dataclass(b):
+        return type(a) is type(b) and all(
+            getattr(a, f.name) == getattr(b, f.name) for f in fields(a)
+        )
+    return a == b
+
+
+def compute_delta(old_snapshot: Any, new_snapshot: Any) -> Optional[SnapshotDelta]:
+    """Returns the delta from the old to the new snapshot, if it has one."""
+    if type(old_snapshot) is not type(new_snapshot):
+        return None
+    old_items = _items_by_key(old_snapshot)
+    new_items = _items_by_key(new_snapshot)
+    if old_items is None or new_items is None:
+        return None
+
+    return SnapshotDelta(
+        updated={
+            key: value
+            for key, value in new_items.items()
+            if key not in old_items or not _same_value(old_items[key], value)
+        },
+        removed={key for key in old_items if key not in new_items},
+    )
+
+
+def apply_delta(snapshot: Any, delta: SnapshotDelta) -> Any:
+    """Returns the snapshot with the delta applied, in the same type."""
+    items = {
+        key: value
+        for key, value in _items_by_key(snapshot).items()
+        if key not in delta.removed
+    }
+    items.update(delta.updated)
+    if isinstance(snapshot, dict):
+        return items
+    return list(items.values())
+
+
 @dataclass
 class UpdatedObject:
     object_snapshot: Any
     # The identifier for the object's version. There is not sequential relation
     # among different object's snapshot_ids.
     snapshot_id: int
+    # If set, the update is this delta to the snapshot the client has, and
+    # `object_snapshot` is None. Only sent to clients that accept deltas.
+    delta: Optional[SnapshotDelta] = None
+    # Identifies the host instance that sent the update. Snapshot IDs are only
+    # comparable between updates of the same host instance.
+    epoch: Optional[str] = None
 
 
 # Type signature for the update state callbacks. E.g.
@@ -100,6 +206,8 @@ class LongPollClient:
             key: -1 for key in self.key_listeners.keys()
         }
         self.object_snapshots: Dict[KeyType, Any] = dict()
+        # The epoch of the host that sent the snapshots.
+        self.host_epoch: Optional[str] = None
 
         self._current_ref = None
         self._callbacks_processed_count = 0
@@ -123,7 +231,9 @@ class LongPollClient:
         """Poll the update. The callback is expected to scheduler another
         _poll_next call.
         """
-        self._current_ref = self.host_actor.listen_for_change.remote(self.snapshot_ids)
+        self._current_ref = self.host_actor.listen_for_change.remote(
+            self.snapshot_ids, accept_deltas=True, epoch=self.host_epoch
+        )
         self._current_ref._on_completed(lambda update: self._process_update(update))
 
     def _schedule_to_event_loop(self, callback):
@@ -160,22 +270,38 @@ class LongPollClient:
             return
 
         if updates == LongPollState.TIME_OUT:
+            # The snapshots are kept: if the host restarted, it sees that the
+            # client's epoch is outdated and sends full snapshots.
             logger.debug("LongPollClient polling timed out. Retrying.")
-            self._schedule_to_event_loop(self._reset)
+            self._schedule_to_event_loop(self._poll_next)
             return
 
         logger.debug(
             f"LongPollClient {self} received updates for keys: "
             f"{list(updates.keys())}."
         )
+        epoch = next(iter(updates.values())).epoch if updates else self.host_epoch
+        if epoch != self.host_epoch:
+            # The host restarted. The snapshot IDs of the keys it didn't send
+            # yet are from the previous host, so they are reset to get full
+            # snapshots for them.
+            for key in self.snapshot_ids:
+                if key not in updates:
+                    self.snapshot_ids[key] = -1
+            self.host_epoch = epoch
+
         for key, update in updates.items():
-            self.object_snapshots[key] = update.object_snapshot
+            if update.delta is not None:
+                object_snapshot = apply_delta(self.object_snapshots[key], update.delta)
+            else:
+                object_snapshot = update.object_snapshot
+            self.object_snapshots[key] = object_snapshot
             self.snapshot_ids[key] = update.snapshot_id
             callback = self.key_listeners[key]
 
             # Bind the parameters because closures are late-binding.
             # https://docs.python-guide.org/writing/gotchas/#late-binding-closures # noqa: E501
-            def chained(callback=callback, arg=update.object_snapshot):
+            def chained(callback=callback, arg=object_snapshot):
                 callback(arg)
                 self._on_callback_completed(trigger_at=len(updates))
 
@@ -194,40 +320,111 @@ class LongPollHost:
     outdated object and immediately return the result. If the client has the
     up-to-date verison, then the listen_for_change call will only return when
     the object is updated.
+
+    For dicts and lists of replicas, the host also keeps the deltas of the most
+    recent changes. Clients that accept deltas and are only a few changes
+    behind receive the merged delta instead of the full snapshot, so the size
+    of an update depends on the size of the change.
+
+    Snapshot IDs start at a random value for each host instance, and each
+    instance has a unique epoch that is sent with its updates. Clients that
+    pass the epoch of a different instance, e.g. from before the host
+    restarted, receive full snapshots of all keys.
     """
 
     def __init__(self):
+        self.epoch: str = uuid.uuid4().hex
         # Map object_key -> int
         self.snapshot_ids: DefaultDict[KeyType, int] = defaultdict(
             lambda: random.randint(0, 1_000_000)
         )
         # Map object_key -> object
         self.object_snapshots: Dict[KeyType, Any] = dict()
+        # Map object_key -> (snapshot_id, delta from the previous snapshot),
+        # for the most recent consecutive changes.
+        self.deltas: DefaultDict[
+            KeyType, Deque[Tuple[int, SnapshotDelta]]
+        ] = defaultdict(lambda: deque(maxlen=LONG_POLL_MAX_DELTAS_PER_KEY))
         # Map object_key -> set(asyncio.Event waiting for updates)
         self.notifier_events: DefaultDict[KeyType, Set[asyncio.Event]] = defaultdict(
             set
         )
 
+    def _get_updated_object(
+        self, key: KeyType, client_snapshot_id: int, accept_deltas: bool
+    ) -> UpdatedObject:
+        snapshot_id = self.snapshot_ids[key]
+        if accept_deltas:
+            delta = self._get_delta_since(key, client_snapshot_id)
+            # Only send the delta if it's smaller than the snapshot.
+            snapshot_items = _items_by_key(self.object_snapshots[key])
+            if delta is not None and len(delta) < len(snapshot_items):
+                return UpdatedObject(None, snapshot_id, delta=delta, epoch=self.epoch)
+        return UpdatedObject(self.object_snapshots[key], snapshot_id, epoch=self.epoch)
+
+    def _get_delta_since(
+        self, key: KeyType, client_snapshot_id: int
+    ) -> Optional[SnapshotDelta]:
+        """Merge the deltas since the client's snapshot, if they are all kept."""
+        deltas = self.deltas.get(key)
+        if not deltas:
+            return None
+        first_snapshot_id = deltas[0][0]
+        if not (first_snapshot_id - 1 <= client_snapshot_id < self.snapshot_ids[key]):
+            return None
+
+        merged = SnapshotDelta()
+        for snapshot_id, delta in deltas:
+            if snapshot_id > client_snapshot_id:
+                merged.merge(delta)
+        return merged
+
+    def _get_outdated_keys(
+        self,
+        keys_to_snapshot_ids: Dict[KeyType, int],
+        accept_deltas: bool,
+        epoch: Optional[str],
+    ) -> Dict[KeyType, UpdatedObject]:
+        if epoch is not None and epoch != self.epoch:
+            # The client's snapshot IDs are from another host instance.
+            return {
+                key: self._get_updated_object(key, -1, accept_deltas=False)
+                for key in keys_to_snapshot_ids
+                if key in self.object_snapshots
+            }
+        return {
+            key: self._get_updated_object(key, snapshot_id, accept_deltas)
+            for key, snapshot_id in keys_to_snapshot_ids.items()
+            if key in self.object_snapshots and self.snapshot_ids[key] != snapshot_id
+        }
+
     async def listen_for_change(
         self,
         keys_to_snapshot_ids: Dict[KeyType, int],
+        accept_deltas: bool = False,
+        epoch: Optional[str] = None,
     ) -> Union[LongPollState, Dict[KeyType, UpdatedObject]]:
         """Listen for changed objects.
 
         This method will returns a dictionary of updated objects. It returns
         immediately if the snapshot_ids are outdated, otherwise it will block
-        until there's one updates.
+        until there's one updates. Changes that follow shortly after are
+        returned together with it.
+
+        If `accept_deltas` is set, updated objects can be deltas to the
+        snapshot the client has (see `UpdatedObject.delta`).
+
+        `epoch` is the `UpdatedObject.epoch` of the client's snapshots. If
+        it's not the epoch of this host, full snapshots of all keys are
+        returned right away.
         """
         watched_keys = keys_to_snapshot_ids.keys()
-        existent_keys = set(watched_keys).intersection(set(self.snapshot_ids.keys()))
 
         # If there are any outdated keys (by comparing snapshot ids)
         # return immediately.
-        client_outdated_keys = {
-            key: UpdatedObject(self.object_snapshots[key], self.snapshot_ids[key])
-            for key in existent_keys
-            if self.snapshot_ids[key] != keys_to_snapshot_ids[key]
-        }
+        client_outdated_keys = self._get_outdated_keys(
+            keys_to_snapshot_ids, accept_deltas, epoch
+        )
         if len(client_outdated_keys) > 0:
             return client_outdated_keys
 
@@ -254,13 +451,9 @@ class LongPollHost:
         if len(done) == 0:
             return LongPollState.TIME_OUT
         else:
-            updated_object_key: str = async_task_to_watched_keys[done.pop()]
-            return {
-                updated_object_key: UpdatedObject(
-                    self.object_snapshots[updated_object_key],
-                    self.snapshot_ids[updated_object_key],
-                )
-            }
+            if LONG_POLL_COALESCE_WINDOW_S > 0:
+                await asyncio.sleep(LONG_POLL_COALESCE_WINDOW_S)
+            return self._get_outdated_keys(keys_to_snapshot_ids, accept_deltas, epoch)
 
     async def listen_for_change_java(
         self,
@@ -351,8 +544,16 @@ class LongPollHost:
         object_key: KeyType,
         updated_object: Any,
     ):
+        delta = None
+        if object_key in self.object_snapshots:
+            delta = compute_delta(self.object_snapshots[object_key], updated_object)
+        if delta is None:
+            self.deltas.pop(object_key, None)
+
         self.snapshot_ids[object_key] += 1
         self.object_snapshots[object_key] = updated_object
+        if delta is not None:
+            self.deltas[object_key].append((self.snapshot_ids[object_key], delta))
         logger.debug(f"LongPollHost: Notify change for key {object_key}.")
 
         if object_key in self.notifier_events:
@@ -5,8 +5,11 @@ import inspect
 import logging
 import pickle
 import time
-from typing import Any, Callable, Optional, Tuple, Dict
+import types
+import uuid
+from typing import Any, Callable, Optional, Tuple, Dict, List
 
+import starlette.requests
 import starlette.responses
 
 import ray
@@ -23,15 +26,28 @@ from ray.serve._private.constants import (
     HEALTH_CHECK_METHOD,
     RECONFIGURE_METHOD,
     DEFAULT_LATENCY_BUCKET_MS,
+    HTTP_STREAM_IDLE_TIMEOUT_S,
+    HTTP_STREAM_MAX_BUFFERED_MESSAGES,
+    RAY_SERVE_ENABLE_DIRECT_INGRESS,
+    RAY_SERVE_ENABLE_HTTP_STREAMING,
     SERVE_LOGGER_NAME,
+    SERVE_MULTIPLEXED_MODEL_ID,
     SERVE_NAMESPACE,
 )
 from ray.serve.deployment import Deployment
+from ray.serve._private.direct_ingress import DirectIngressServer
 from ray.serve.exceptions import RayServeException
-from ray.serve._private.http_util import ASGIHTTPSender
+from ray.serve._private.http_util import (
+    ASGIAppResponse,
+    ASGIHTTPSender,
+    ASGIResponseStream,
+    Response,
+    StreamingHTTPResponse,
+)
 from ray.serve._private.logging_utils import access_log_msg, configure_component_logger
 from ray.serve._private.router import Query, RequestMetadata
 from ray.serve._private.utils import (
+    get_random_letters,
     parse_import_path,
     parse_request_item,
     wrap_to_ray_error,
@@ -168,6 +184,18 @@ def create_replica_wrapper(name: str):
             # or, alternatively, create an async get_replica() method?
             self.replica = None
             self._initialize_replica = initialize_replica
+            # Set once `is_initialized` runs the user's constructor. Until then
+            # (e.g., for standby replicas), `get_metadata` reports the config
+            # and version this actor was started with.
+            self._initialization_task: Optional[asyncio.Task] = None
+            self._deployment_config = deployment_config
+            self._version = version
+
+            self._direct_ingress_server = None
+            if RAY_SERVE_ENABLE_DIRECT_INGRESS:
+                self._direct_ingress_server = DirectIngressServer(
+                    deployment_name, controller_handle, lambda: self.replica
+                )
 
         @ray.method(num_returns=2)
         async def handle_request(
@@ -201,6 +229,20 @@ def create_replica_wrapper(name: str):
             query = Query(request_args, request_kwargs, request_metadata, return_num=1)
             return await self.replica.handle_request(query)
 
+        async def get_stream_messages(
+            self, stream_id: str
+        ) -> Tuple[List[Dict[str, Any]], bool]:
+            return await self.replica.get_stream_messages(stream_id)
+
+        async def cancel_stream(self, stream_id: str):
+            self.replica.cancel_stream(stream_id)
+
+        async def get_direct_ingress_address(self) -> Optional[str]:
+            """Address of this replica's own HTTP server, if it runs one."""
+            if self._direct_ingress_server is None:
+                return None
+            return self._direct_ingress_server.address
+
         async def is_allocated(self) -> str:
             """poke the replica to check whether it's alive.
 
@@ -219,7 +261,11 @@ def create_replica_wrapper(name: str):
         ):
             # Unused `_after` argument is for scheduling: passing an ObjectRef
             # allows delaying reconfiguration until after this call has returned.
-            await self._initialize_replica()
+            if self._initialization_task is None:
+                self._initialization_task = asyncio.ensure_future(
+                    self._initialize_replica()
+                )
+            await self._initialization_task
 
             metadata = await self.reconfigure(user_config)
 
@@ -235,14 +281,26 @@ def create_replica_wrapper(name: str):
             if user_config is not None:
                 await self.replica.reconfigure(user_config)
 
-            return self.get_metadata()
+            return await self.get_metadata()
+
+        async def get_metadata(self) -> Tuple[DeploymentConfig, DeploymentVersion]:
+            if self._initialization_task is None:
+                return self._deployment_config, self._version
 
-        def get_metadata(self) -> Tuple[DeploymentConfig, DeploymentVersion]:
+            # Wait for a running initialization, e.g., when the controller
+            # recovers a replica that it's still starting.
+            await self._initialization_task
             return self.replica.deployment_config, self.replica.version
 
+        async def is_standby(self) -> bool:
+            """Whether the user's constructor hasn't been called yet."""
+            return self._initialization_task is None
+
         async def prepare_for_shutdown(self):
             if self.replica is not None:
-                return await self.replica.prepare_for_shutdown()
+                await self.replica.prepare_for_shutdown()
+            if self._direct_ingress_server is not None:
+                await self._direct_ingress_server.stop()
 
         @ray.method(concurrency_group=HEALTH_CHECK_CONCURRENCY_GROUP)
         async def check_health(self):
@@ -257,6 +315,13 @@ def create_replica_wrapper(name: str):
     )
 
 
+def _wrap_generator_response(response: Any) -> Any:
+    """Turn a generator returned for an HTTP request into a streaming response."""
+    if isinstance(response, (types.GeneratorType, types.AsyncGeneratorType)):
+        return starlette.responses.StreamingResponse(response, media_type="text/plain")
+    return response
+
+
 class RayServeReplica:
     """Handles requests with the provided callable."""
 
@@ -289,6 +354,12 @@ class RayServeReplica:
         self.user_health_check = sync_to_async(user_health_check)
 
         self.num_ongoing_requests = 0
+        # Requests received by the direct ingress server. Unlike requests sent
+        # through handles, these aren't tracked in the actor call stats.
+        self.num_direct_requests = 0
+
+        # Streaming HTTP responses that the HTTP proxy is still consuming.
+        self._response_streams: Dict[str, ASGIResponseStream] = dict()
 
         self.request_counter = metrics.Counter(
             "serve_deployment_request_counter",
@@ -387,9 +458,9 @@ class RayServeReplica:
     def _collect_autoscaling_metrics(self):
         method_stat = self._get_handle_request_stats()
 
-        num_inflight_requests = 0
+        num_inflight_requests = self.num_direct_requests
         if method_stat is not None:
-            num_inflight_requests = method_stat["pending"] + method_stat["running"]
+            num_inflight_requests += method_stat["pending"] + method_stat["running"]
 
         return {self.replica_tag: num_inflight_requests}
 
@@ -415,8 +486,18 @@ class RayServeReplica:
             return self.callable
         return getattr(self.callable, method_name)
 
-    async def ensure_serializable_response(self, response: Any) -> Any:
-        if isinstance(response, starlette.responses.StreamingResponse):
+    async def ensure_serializable_response(
+        self, response: Any, request_item: Query
+    ) -> Any:
+        is_http_request = request_item.metadata.http_arg_is_pickled
+        if is_http_request:
+            response = _wrap_generator_response(response)
+
+        if isinstance(
+            response, (starlette.responses.StreamingResponse, ASGIAppResponse)
+        ):
+            if is_http_request and RAY_SERVE_ENABLE_HTTP_STREAMING:
+                return await self._start_response_stream(response)
 
             async def mock_receive():
                 # This is called in a tight loop in response() just to check
@@ -430,11 +511,63 @@ class RayServeReplica:
             return sender.build_asgi_response()
         return response
 
-    async def invoke_single(self, request_item: Query) -> Tuple[Any, bool]:
+    async def _start_response_stream(self, response) -> StreamingHTTPResponse:
+        """Start streaming the response and return its first messages.
+
+        Responses that complete right away are returned whole, so only
+        responses that are actually incremental cost extra round trips.
+        """
+        for stream_id, stream in list(self._response_streams.items()):
+            if stream.abandoned:
+                del self._response_streams[stream_id]
+
+        stream = ASGIResponseStream(
+            response, HTTP_STREAM_MAX_BUFFERED_MESSAGES, HTTP_STREAM_IDLE_TIMEOUT_S
+        )
+        messages, done = await stream.get_messages()
+        if done:
+            return StreamingHTTPResponse(messages, done)
+
+        stream_id = uuid.uuid4().hex
+        self._response_streams[stream_id] = stream
+        return StreamingHTTPResponse(
+            messages,
+            done,
+            stream_id=stream_id,
+            replica_handle=ray.get_runtime_context().current_actor,
+        )
+
+    async def get_stream_messages(
+        self, stream_id: str
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Wait for the next messages of a streaming response."""
+        stream = self._response_streams.get(stream_id)
+        if stream is None:
+            raise RayServeException(f"Streaming response {stream_id} not found.")
+        try:
+            messages, done = await stream.get_messages()
+        except Exception:
+            del self._response_streams[stream_id]
+            raise
+        if done:
+            del self._response_streams[stream_id]
+        return messages, done
+
+    def cancel_stream(self, stream_id: str):
+        """Cancel a streaming response, e.g. because the client disconnected."""
+        stream = self._response_streams.pop(stream_id, None)
+        if stream is not None:
+            stream.cancel()
+
+    async def invoke_single(
+        self, request_item: Query, serialize_response: bool = True
+    ) -> Tuple[Any, bool]:
         """Executes the provided request on this replica.
 
         Returns the user-provided output and a boolean indicating if the
-        request succeeded (user code didn't raise an exception).
+        request succeeded (user code didn't raise an exception). Unless
+        `serialize_response` is False, the output is first converted to a form
+        that can be returned from the replica actor.
         """
         logger.debug(
             "Replica {} started executing request {}".format(
@@ -442,6 +575,11 @@ class RayServeReplica:
             )
         )
         args, kwargs = parse_request_item(request_item)
+        ray.serve.context._serve_request_context.set(
+            ray.serve.context.RequestContext(
+                multiplexed_model_id=request_item.metadata.multiplexed_model_id
+            )
+        )
 
         method_to_call = None
         success = True
@@ -465,7 +603,8 @@ class RayServeReplica:
                     # call with non-empty args
                     result = await method_to_call(*args, **kwargs)
 
-            result = await self.ensure_serializable_response(result)
+            if serialize_response:
+                result = await self.ensure_serializable_response(result, request_item)
             self.request_counter.inc()
         except Exception as e:
             logger.exception(f"Request failed due to {type(e).__name__}:")
@@ -529,6 +668,55 @@ class RayServeReplica:
                 # Returns a small object for router to track request status.
                 return b"", result
 
+    async def handle_direct_http_request(self, scope, receive, send):
+        """Handle a request received by the replica's direct ingress server."""
+        request = starlette.requests.Request(scope, receive)
+        query = Query(
+            [request],
+            {},
+            RequestMetadata(
+                get_random_letters(10),
+                self.deployment_name,
+                multiplexed_model_id=request.headers.get(
+                    SERVE_MULTIPLEXED_MODEL_ID, ""
+                ),
+            ),
+        )
+        self.num_direct_requests += 1
+        try:
+            async with self.rwlock.reader_lock:
+                start_time = time.time()
+                result, success = await self.invoke_single(
+                    query, serialize_response=False
+                )
+                latency_ms = (time.time() - start_time) * 1000
+
+                self.processing_latency_tracker.observe(latency_ms)
+
+                logger.info(
+                    access_log_msg(
+                        method=scope["method"],
+                        route=scope["root_path"] + scope["path"],
+                        status="OK" if success else "ERROR",
+                        latency_ms=latency_ms,
+                    )
+                )
+
+            if not success:
+                error_message = "Task Error. Traceback: {}.".format(result)
+                await Response(error_message, status_code=500).send(
+                    scope, receive, send
+                )
+                return
+
+            result = _wrap_generator_response(result)
+            if isinstance(result, (starlette.responses.Response, ASGIAppResponse)):
+                await result(scope, receive, send)
+            else:
+                await Response(result).send(scope, receive, send)
+        finally:
+            self.num_direct_requests -= 1
+
     async def prepare_for_shutdown(self):
         """Perform graceful shutdown.
 
@@ -540,17 +728,21 @@ class RayServeReplica:
             # the notification to remove this replica first.
             await asyncio.sleep(self._shutdown_wait_loop_s)
             method_stat = self._get_handle_request_stats()
-            # The handle_request method wasn't even invoked.
-            if method_stat is None:
-                break
-            # The handle_request method has 0 inflight requests.
-            if method_stat["running"] + method_stat["pending"] == 0:
+            num_active_streams = sum(
+                not stream.abandoned for stream in self._response_streams.values()
+            )
+            num_ongoing_requests = self.num_direct_requests + num_active_streams
+            # The handle_request method is None if it wasn't even invoked.
+            if method_stat is not None:
+                num_ongoing_requests += method_stat["running"] + method_stat["pending"]
+            # No inflight requests and no responses are still being streamed.
+            if num_ongoing_requests == 0:
                 break
             else:
                 logger.info(
                     "Waiting for an additional "
                     f"{self._shutdown_wait_loop_s}s to shut down because "
-                    f"there are {self.num_ongoing_requests} ongoing requests."
+                    f"there are {num_ongoing_requests} ongoing requests."
                 )
 
         # Explicitly call the del method to trigger clean up.
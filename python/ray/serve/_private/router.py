@@ -37,6 +37,9 @@ class RequestMetadata:
     # and it needs to be deserialized by the replica.
     http_arg_is_pickled: bool = False
 
+    # The model the request is for, if the deployment multiplexes models.
+    multiplexed_model_id: str = ""
+
 
 @dataclass
 class Query:
@@ -117,14 +120,14 @@ class ReplicaSet:
             self.in_flight_queries.keys(), running_replicas
         )
 
-        for new_replica in added:
-            self.in_flight_queries[new_replica] = set()
-
-        for removed_replica in removed:
-            # Delete it directly because shutdown is processed by controller.
-            # Replicas might already been deleted due to early detection of
-            # actor error.
-            self.in_flight_queries.pop(removed_replica, None)
+        # Rebuild the dict from the new replica infos instead of only adding
+        # and removing keys, so existing replicas pick up their updated
+        # multiplexed model IDs. Removed replicas are dropped directly because
+        # shutdown is processed by controller.
+        self.in_flight_queries = {
+            replica: self.in_flight_queries.get(replica, set())
+            for replica in running_replicas
+        }
 
         if len(added) > 0 or len(removed) > 0:
             logger.debug(f"ReplicaSet: +{len(added)}, -{len(removed)} replicas.")
@@ -135,47 +138,84 @@ class ReplicaSet:
         """Try to assign query to a replica, return the object ref if succeeded
         or return None if it can't assign this query to any replicas.
         """
+        model_id = query.metadata.multiplexed_model_id
+        if model_id:
+            # Prefer the least loaded replica that already has the model loaded,
+            # to avoid loading it again elsewhere.
+            replicas_with_model = [
+                replica
+                for replica, in_flight in self.in_flight_queries.items()
+                if model_id in replica.multiplexed_model_ids
+                and len(in_flight) < replica.max_concurrent_queries
+            ]
+            if len(replicas_with_model) > 0:
+                replica = min(
+                    replicas_with_model,
+                    key=lambda replica: len(self.in_flight_queries[replica]),
+                )
+                return self._send_query_to_replica(replica, query)
+
         for _ in range(len(self.in_flight_queries.keys())):
             replica = next(self.replica_iterator)
             if len(self.in_flight_queries[replica]) >= replica.max_concurrent_queries:
                 # This replica is overloaded, try next one
                 continue
+            return self._send_query_to_replica(replica, query)
+        return None
 
-            logger.debug(
-                f"Assigned query {query.metadata.request_id} "
-                f"to replica {replica.replica_tag}."
+    def _send_query_to_replica(
+        self, replica: RunningReplicaInfo, query: Query
+    ) -> ray.ObjectRef:
+        logger.debug(
+            f"Assigned query {query.metadata.request_id} "
+            f"to replica {replica.replica_tag}."
+        )
+        if replica.is_cross_language:
+            # Handling requests for Java replica
+            arg = query.args[0]
+            if query.metadata.http_arg_is_pickled:
+                assert isinstance(arg, bytes)
+                loaded_http_input = pickle.loads(arg)
+                query_string = loaded_http_input.scope.get("query_string")
+                if query_string:
+                    arg = query_string.decode().split("=", 1)[1]
+                elif len(query.args) > 1:
+                    # The body was sent as a separate buffer.
+                    arg = query.args[1].tobytes().decode()
+                elif loaded_http_input.body:
+                    arg = loaded_http_input.body.decode()
+            user_ref = JavaActorHandleProxy(replica.actor_handle).handle_request.remote(
+                RequestMetadataProto(
+                    request_id=query.metadata.request_id,
+                    endpoint=query.metadata.endpoint,
+                    call_method=query.metadata.call_method
+                    if query.metadata.call_method != "__call__"
+                    else "call",
+                ).SerializeToString(),
+                [arg],
             )
-            if replica.is_cross_language:
-                # Handling requests for Java replica
-                arg = query.args[0]
-                if query.metadata.http_arg_is_pickled:
-                    assert isinstance(arg, bytes)
-                    loaded_http_input = pickle.loads(arg)
-                    query_string = loaded_http_input.scope.get("query_string")
-                    if query_string:
-                        arg = query_string.decode().split("=", 1)[1]
-                    elif loaded_http_input.body:
-                        arg = loaded_http_input.body.decode()
-                user_ref = JavaActorHandleProxy(
-                    replica.actor_handle
-                ).handle_request.remote(
-                    RequestMetadataProto(
-                        request_id=query.metadata.request_id,
-                        endpoint=query.metadata.endpoint,
-                        call_method=query.metadata.call_method
-                        if query.metadata.call_method != "__call__"
-                        else "call",
-                    ).SerializeToString(),
-                    [arg],
-                )
-                self.in_flight_queries[replica].add(user_ref)
-            else:
-                # Directly passing args because it might contain an ObjectRef.
-                tracker_ref, user_ref = replica.actor_handle.handle_request.remote(
-                    pickle.dumps(query.metadata), *query.args, **query.kwargs
-                )
-                self.in_flight_queries[replica].add(tracker_ref)
-            return user_ref
+            self.in_flight_queries[replica].add(user_ref)
+        else:
+            # Directly passing args because it might contain an ObjectRef.
+            tracker_ref, user_ref = replica.actor_handle.handle_request.remote(
+                pickle.dumps(query.metadata), *query.args, **query.kwargs
+            )
+            self.in_flight_queries[replica].add(tracker_ref)
+        return user_ref
+
+    def get_direct_ingress_addresses(self) -> List[str]:
+        return [
+            replica.direct_ingress_address
+            for replica in self.in_flight_queries.keys()
+            if replica.direct_ingress_address is not None
+        ]
+
+    def choose_direct_ingress_address(self) -> Optional[str]:
+        """Pick a replica that serves HTTP directly, in round-robin order."""
+        for _ in range(len(self.in_flight_queries.keys())):
+            replica = next(self.replica_iterator)
+            if replica.direct_ingress_address is not None:
+                return replica.direct_ingress_address
         return None
 
     @property
@@ -295,6 +335,12 @@ class Router:
     def get_num_queued_queries(self):
         return self._replica_set.num_queued_queries
 
+    def get_direct_ingress_addresses(self) -> List[str]:
+        return self._replica_set.get_direct_ingress_addresses()
+
+    def choose_direct_ingress_address(self) -> Optional[str]:
+        return self._replica_set.choose_direct_ingress_address()
+
     async def assign_request(
         self,
         request_meta: RequestMetadata,
@@ -49,12 +49,13 @@ Default = Union[DEFAULT, T]
 
 
 def parse_request_item(request_item):
-    if len(request_item.args) == 1:
+    if request_item.metadata.http_arg_is_pickled and len(request_item.args) in (1, 2):
         arg = request_item.args[0]
-        if request_item.metadata.http_arg_is_pickled:
-            assert isinstance(arg, bytes)
-            arg: HTTPRequestWrapper = pickle.loads(arg)
-            return (build_starlette_request(arg.scope, arg.body),), {}
+        assert isinstance(arg, bytes)
+        arg: HTTPRequestWrapper = pickle.loads(arg)
+        # Large bodies are sent as a separate buffer.
+        body = arg.body if len(request_item.args) == 1 else request_item.args[1]
+        return (build_starlette_request(arg.scope, body),), {}
 
     return request_item.args, request_item.kwargs
 
@@ -20,6 +20,7 @@ from ray.serve._private.constants import (
     DEFAULT_HTTP_HOST,
     DEFAULT_HTTP_PORT,
     MIGRATION_MESSAGE,
+    RAY_SERVE_ENABLE_HTTP_STREAMING,
 )
 from ray.serve.context import (
     ReplicaContext,
@@ -35,7 +36,11 @@ from ray.serve._private.deployment_graph_build import (
 )
 from ray.serve.exceptions import RayServeException
 from ray.serve.handle import RayServeHandle
-from ray.serve._private.http_util import ASGIHTTPSender, make_fastapi_class_based_view
+from ray.serve._private.http_util import (
+    ASGIAppResponse,
+    ASGIHTTPSender,
+    make_fastapi_class_based_view,
+)
 from ray.serve._private.logging_utils import LoggingContext
 from ray.serve._private.utils import (
     DEFAULT,
@@ -218,6 +223,11 @@ def ingress(app: Union["FastAPI", "APIRouter", Callable]):
                     await self._serve_asgi_lifespan.startup()
 
             async def __call__(self, request: Request):
+                if RAY_SERVE_ENABLE_HTTP_STREAMING:
+                    # The replica runs the app as it streams the response.
+                    return ASGIAppResponse(
+                        self._serve_app, request.scope, request.receive
+                    )
                 sender = ASGIHTTPSender()
                 await self._serve_app(
                     request.scope,
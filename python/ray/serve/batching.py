@@ -1,9 +1,11 @@
 import asyncio
+from collections import deque
 from functools import wraps
 from inspect import iscoroutinefunction
+import math
 import time
 from typing import Any, Callable, Dict, List, Optional, overload, Tuple, TypeVar
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 from ray._private.signature import extract_signature, flatten_args, recover_args
@@ -17,6 +19,7 @@ class _SingleRequest:
     self_arg: Optional[Any]
     flattened_args: List[Any]
     future: asyncio.Future
+    enqueue_time: float = field(default_factory=time.time)
 
 
 def _batch_args_kwargs(
@@ -44,12 +47,116 @@ def _batch_args_kwargs(
     return recover_args(batched_flattened_args)
 
 
+class _AdaptiveBatchTuner:
+    """Tunes the batch size and wait timeout of a batch queue online.
+
+    The batch size is adjusted with additive increase, multiplicative decrease
+    (AIMD) on the p99 latency of recent requests, measured from enqueue to result:
+    it shrinks when the p99 exceeds the target, and grows while there's headroom
+    and batches are full (i.e., there's demand for larger batches). After each
+    adjustment, the latency window is reset so the next decision only sees
+    requests served with the new batch size.
+
+    The wait timeout is the expected time to fill a batch at the current arrival
+    rate, if that fits in the latency budget left after executing a batch.
+    Otherwise, waiting wouldn't fill the batch in time, so batches are executed
+    with whatever is queued.
+    """
+
+    # Shrink the batch size by this factor when the p99 exceeds the target.
+    DECREASE_FACTOR = 0.75
+    # Grow the batch size while the p99 is below this fraction of the target.
+    HEADROOM = 0.8
+    # The min number of requests to observe before adjusting the batch size.
+    MIN_SAMPLES = 20
+    # Smoothing factor for the moving averages of inter-arrival time and batch
+    # execution latency.
+    EWMA_ALPHA = 0.2
+
+    def __init__(
+        self,
+        max_batch_size: int,
+        max_timeout_s: float,
+        target_p99_latency_s: float,
+        window_size: int = 100,
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_timeout_s = max_timeout_s
+        self.target_p99_latency_s = target_p99_latency_s
+        self.batch_size = 1
+        self.timeout_s = 0.0
+
+        self._latencies_s = deque(maxlen=window_size)
+        self._num_full_batches = 0
+        self._num_batches = 0
+        self._last_arrival_time: Optional[float] = None
+        self._arrival_interval_s: Optional[float] = None
+        self._batch_latency_s: Optional[float] = None
+
+    def _ewma(self, prev: Optional[float], value: float) -> float:
+        if prev is None:
+            return value
+        return self.EWMA_ALPHA * value + (1 - self.EWMA_ALPHA) * prev
+
+    def record_arrival(self, arrival_time: float) -> None:
+        if self._last_arrival_time is not None:
+            self._arrival_interval_s = self._ewma(
+                self._arrival_interval_s, arrival_time - self._last_arrival_time
+            )
+        self._last_arrival_time = arrival_time
+
+    def record_batch(
+        self, batch: List[_SingleRequest], start_time: float, end_time: float
+    ) -> None:
+        """Record a completed batch and re-tune the batch size and timeout."""
+        self._batch_latency_s = self._ewma(self._batch_latency_s, end_time - start_time)
+        self._num_batches += 1
+        if len(batch) >= self.batch_size:
+            self._num_full_batches += 1
+        self._latencies_s.extend(end_time - item.enqueue_time for item in batch)
+
+        if len(self._latencies_s) >= self.MIN_SAMPLES:
+            p99 = self.get_p99_latency_s()
+            if p99 > self.target_p99_latency_s:
+                self._set_batch_size(math.floor(self.batch_size * self.DECREASE_FACTOR))
+            elif (
+                p99 < self.HEADROOM * self.target_p99_latency_s
+                and self._num_full_batches > self._num_batches / 2
+            ):
+                self._set_batch_size(self.batch_size + 1)
+
+        self.timeout_s = self._get_timeout_s()
+
+    def get_p99_latency_s(self) -> float:
+        latencies = sorted(self._latencies_s)
+        return latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))]
+
+    def _set_batch_size(self, batch_size: int) -> None:
+        batch_size = max(1, min(self.max_batch_size, batch_size))
+        if batch_size != self.batch_size:
+            self.batch_size = batch_size
+            self._latencies_s.clear()
+            self._num_full_batches = 0
+            self._num_batches = 0
+
+    def _get_timeout_s(self) -> float:
+        if self._arrival_interval_s is None or self._batch_latency_s is None:
+            return 0.0
+        fill_time_s = (self.batch_size - 1) * self._arrival_interval_s
+        slack_s = self.target_p99_latency_s - self._batch_latency_s
+        if fill_time_s > slack_s:
+            return 0.0
+        return min(fill_time_s, self.max_timeout_s)
+
+
 class _BatchQueue:
     def __init__(
         self,
         max_batch_size: int,
         timeout_s: float,
         handle_batch_func: Optional[Callable] = None,
+        max_concurrent_batches: int = 1,
+        target_p99_latency_s: Optional[float] = None,
     ) -> None:
         """Async queue that accepts individual items and returns batches.
 
@@ -66,11 +173,25 @@ class _BatchQueue:
                 batch.
             handle_batch_func(Optional[Callable]): callback to run in the
                 background to handle batches if provided.
+            max_concurrent_batches: max number of batches that
+                handle_batch_func runs concurrently.
+            target_p99_latency_s: if set, the batch size and timeout are
+                tuned online to meet this p99 latency, with max_batch_size and
+                timeout_s as upper bounds.
         """
         self.queue: asyncio.Queue[_SingleRequest] = asyncio.Queue()
         self.full_batch_event = asyncio.Event()
         self.max_batch_size = max_batch_size
         self.timeout_s = timeout_s
+        self.max_concurrent_batches = max_concurrent_batches
+
+        self._tuner: Optional[_AdaptiveBatchTuner] = None
+        if target_p99_latency_s is not None:
+            self._tuner = _AdaptiveBatchTuner(
+                max_batch_size, timeout_s, target_p99_latency_s
+            )
+            self.max_batch_size = self._tuner.batch_size
+            self.timeout_s = self._tuner.timeout_s
 
         self._handle_batch_task = None
         if handle_batch_func is not None:
@@ -80,9 +201,11 @@ class _BatchQueue:
 
     def put(self, request: Tuple[_SingleRequest, asyncio.Future]) -> None:
         self.queue.put_nowait(request)
+        if self._tuner is not None:
+            self._tuner.record_arrival(request.enqueue_time)
         # Signal when the full batch is ready. The event will be reset
         # in wait_for_batch.
-        if self.queue.qsize() == self.max_batch_size:
+        if self.queue.qsize() >= self.max_batch_size:
             self.full_batch_event.set()
 
     async def wait_for_batch(self) -> List[Any]:
@@ -130,33 +253,62 @@ class _BatchQueue:
         return batch
 
     async def _handle_batches(self, func):
+        # Bounds the number of batches in flight. A batch is only pulled off
+        # the queue once a slot is free, so requests keep accumulating into the
+        # next batch while the current ones run.
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+        # Hold references to in-flight tasks so they aren't garbage collected.
+        tasks = set()
         while True:
+            await semaphore.acquire()
             batch: List[_SingleRequest] = await self.wait_for_batch()
             assert len(batch) > 0
-            self_arg = batch[0].self_arg
-            args, kwargs = _batch_args_kwargs([item.flattened_args for item in batch])
-            futures = [item.future for item in batch]
-
-            try:
-                # Method call.
-                if self_arg is not None:
-                    results = await func(self_arg, *args, **kwargs)
-                # Normal function call.
-                else:
-                    results = await func(*args, **kwargs)
-
-                if len(results) != len(batch):
-                    raise RayServeException(
-                        "Batched function doesn't preserve batch size. "
-                        f"The input list has length {len(batch)} but the "
-                        f"returned list has length {len(results)}."
-                    )
-
-                for i, result in enumerate(results):
-                    futures[i].set_result(result)
-            except Exception as e:
-                for future in futures:
-                    future.set_exception(e)
+            task = get_or_create_event_loop().create_task(
+                self._process_batch(func, batch)
+            )
+            tasks.add(task)
+
+            def on_done(task):
+                tasks.discard(task)
+                semaphore.release()
+
+            task.add_done_callback(on_done)
+
+    async def _process_batch(self, func, batch: List[_SingleRequest]) -> None:
+        self_arg = batch[0].self_arg
+        args, kwargs = _batch_args_kwargs([item.flattened_args for item in batch])
+        futures = [item.future for item in batch]
+        start_time = time.time()
+
+        try:
+            # Method call.
+            if self_arg is not None:
+                results = await func(self_arg, *args, **kwargs)
+            # Normal function call.
+            else:
+                results = await func(*args, **kwargs)
+
+            if len(results) != len(batch):
+                raise RayServeException(
+                    "Batched function doesn't preserve batch size. "
+                    f"The input list has length {len(batch)} but the "
+                    f"returned list has length {len(results)}."
+                )
+
+            for i, result in enumerate(results):
+                futures[i].set_result(result)
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+
+        if self._tuner is not None:
+            self._tuner.record_batch(batch, start_time, time.time())
+            self.max_batch_size = self._tuner.batch_size
+            self.timeout_s = self._tuner.timeout_s
+            # If the batch size shrank, the requests already queued may now
+            # make up a full batch.
+            if self.queue.qsize() >= self.max_batch_size:
+                self.full_batch_event.set()
 
     def __del__(self):
         if (
@@ -210,13 +362,24 @@ def batch(func: F) -> G:
 # "Decorator factory" use case (called with arguments).
 @overload
 def batch(
-    max_batch_size: Optional[int] = 10, batch_wait_timeout_s: Optional[float] = 0.0
+    max_batch_size: Optional[int] = 10,
+    batch_wait_timeout_s: Optional[float] = 0.0,
+    *,
+    max_concurrent_batches: int = 1,
+    target_p99_latency_s: Optional[float] = None,
 ) -> Callable[[F], G]:
     pass
 
 
 @PublicAPI(stability="beta")
-def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
+def batch(
+    _func=None,
+    max_batch_size=10,
+    batch_wait_timeout_s=0.0,
+    *,
+    max_concurrent_batches=1,
+    target_p99_latency_s=None,
+):
     """Converts a function to asynchronously handle batches.
 
     The function can be a standalone function or a class method. In both
@@ -242,6 +405,15 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
             one call to the underlying function.
         batch_wait_timeout_s: the maximum duration to wait for
             `max_batch_size` elements before running the underlying function.
+        max_concurrent_batches: the maximum number of batches that the
+            underlying function executes concurrently. Setting this above 1 lets,
+            e.g., the preprocessing of the next batch overlap with inference on
+            the current one.
+        target_p99_latency_s: if set, the batch size and wait timeout are tuned
+            online from the measured batch latency and request arrival rate, to
+            keep the p99 latency of requests (from the call to the result) under
+            this target. `max_batch_size` and `batch_wait_timeout_s` are then
+            upper bounds.
     """
     # `_func` will be None in the case when the decorator is parametrized.
     # See the comment at the end of this function for a detailed explanation.
@@ -269,6 +441,19 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
     if batch_wait_timeout_s < 0:
         raise ValueError("batch_wait_timeout_s must be a float >= 0")
 
+    if not isinstance(max_concurrent_batches, int):
+        raise TypeError("max_concurrent_batches must be integer >= 1")
+
+    if max_concurrent_batches < 1:
+        raise ValueError("max_concurrent_batches must be an integer >= 1")
+
+    if target_p99_latency_s is not None:
+        if not isinstance(target_p99_latency_s, (float, int)):
+            raise TypeError("target_p99_latency_s must be a float > 0")
+
+        if target_p99_latency_s <= 0:
+            raise ValueError("target_p99_latency_s must be a float > 0")
+
     def _batch_decorator(_func):
         @wraps(_func)
         async def batch_wrapper(*args, **kwargs):
@@ -291,7 +476,13 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
             # runs, we just get a reference to the attribute.
             batch_queue_attr = f"__serve_batch_queue_{_func.__name__}"
             if not hasattr(batch_queue_object, batch_queue_attr):
-                batch_queue = _BatchQueue(max_batch_size, batch_wait_timeout_s, _func)
+                batch_queue = _BatchQueue(
+                    max_batch_size,
+                    batch_wait_timeout_s,
+                    _func,
+                    max_concurrent_batches=max_concurrent_batches,
+                    target_p99_latency_s=target_p99_latency_s,
+                )
                 setattr(batch_queue_object, batch_queue_attr, batch_queue)
             else:
                 batch_queue = getattr(batch_queue_object, batch_queue_attr)
@@ -0,0 +1,176 @@
+"""Replay a traffic trace against the autoscaling policy in simulated time.
+
+No cluster is started. A fluid model of the deployment stands in for the
+replicas: requests wait in the handle queue until a replica has a free slot,
+each ongoing request finishes at a rate of 1 / `service_time_s`, and replicas
+only start serving `startup_s` after they are added. Metrics go through the
+same `InMemoryMetricsStore` aggregations the controller uses.
+
+A trace is a CSV file with `timestamp_s` and `requests_per_s` columns; the rate
+is held until the next row. Without a trace, a synthetic one with a ramp and a
+spike is used.
+"""
+import bisect
+from typing import Dict, List, Optional
+
+import click
+import pandas as pd
+
+from ray.serve._private.autoscaling_metrics import InMemoryMetricsStore
+from ray.serve._private.autoscaling_policy import BasicAutoscalingPolicy
+from ray.serve._private.constants import CONTROL_LOOP_PERIOD_S
+from ray.serve.config import AutoscalingConfig
+
+POLICIES = {
+    "reactive": {},
+    "queue_aware": {"queue_aware_scaling": True},
+    "queue_aware_forecast": {
+        "queue_aware_scaling": True,
+        "forecast_horizon_s": 5.0,
+    },
+}
+
+
+def synthetic_trace() -> pd.DataFrame:
+    rows = [(0, 10)]
+    # Ramp from 10 to 200 requests/s over a minute.
+    rows += [(60 + t, 10 + 190 * t / 60) for t in range(0, 60, 5)]
+    rows += [(120, 200), (240, 50)]
+    # A short spike.
+    rows += [(300, 400), (330, 50), (420, 10), (600, 10)]
+    return pd.DataFrame(rows, columns=["timestamp_s", "requests_per_s"])
+
+
+def simulate(
+    trace: pd.DataFrame,
+    config: AutoscalingConfig,
+    service_time_s: float,
+    max_concurrent_queries: int,
+    startup_s: float,
+) -> Dict[str, float]:
+    policy = BasicAutoscalingPolicy(config)
+    replica_store = InMemoryMetricsStore()
+    handle_store = InMemoryMetricsStore()
+
+    dt = CONTROL_LOOP_PERIOD_S
+    timestamps = trace["timestamp_s"].tolist()
+    rates = trace["requests_per_s"].tolist()
+
+    target_num_replicas = config.initial_replicas or config.min_replicas
+    # Times at which replicas finished or will finish starting.
+    ready_at: List[float] = [0.0] * target_num_replicas
+    queued = 0.0
+    ongoing = 0.0
+    total_arrived = 0.0
+    queue_seconds = 0.0
+    replica_seconds = 0.0
+    max_replicas = target_num_replicas
+    queue_lengths = []
+    next_metrics_push = 0.0
+
+    now = timestamps[0]
+    while now < timestamps[-1]:
+        rate = rates[bisect.bisect_right(timestamps, now) - 1]
+        arrived = rate * dt
+        total_arrived += arrived
+        queued += arrived
+
+        num_ready = sum(1 for t in ready_at if t <= now)
+        capacity = num_ready * max_concurrent_queries
+        admitted = min(queued, max(capacity - ongoing, 0.0))
+        queued -= admitted
+        ongoing += admitted
+
+        queue_seconds += queued * dt
+        replica_seconds += len(ready_at) * dt
+        queue_lengths.append(queued)
+
+        if now >= next_metrics_push:
+            next_metrics_push += config.metrics_interval_s
+            for i in range(num_ready):
+                replica_store.add_metrics_point(
+                    {f"replica-{i}": ongoing / num_ready}, now
+                )
+            handle_store.add_metrics_point({"handle": queued}, now)
+
+        ongoing -= ongoing * min(dt / service_time_s, 1.0)
+
+        window_start_s = now - config.look_back_period_s
+        current_num_ongoing_requests = []
+        for i in range(num_ready):
+            value = replica_store.window_average(f"replica-{i}", window_start_s)
+            if value is not None:
+                current_num_ongoing_requests.append(value)
+        current_handle_queued_queries = handle_store.max("handle", window_start_s) or 0
+
+        new_target = policy.get_decision_num_replicas(
+            curr_target_num_replicas=target_num_replicas,
+            current_num_ongoing_requests=current_num_ongoing_requests,
+            current_handle_queued_queries=current_handle_queued_queries,
+        )
+        if new_target > target_num_replicas:
+            ready_at += [now + startup_s] * (new_target - target_num_replicas)
+        elif new_target < target_num_replicas:
+            # Stop the newest replicas first.
+            ready_at = sorted(ready_at)[:new_target]
+        target_num_replicas = new_target
+        max_replicas = max(max_replicas, target_num_replicas)
+
+        now += dt
+
+    queue_lengths = pd.Series(queue_lengths)
+    return {
+        "mean_queue_wait_s": queue_seconds / max(total_arrived, 1.0),
+        "p99_queue_length": queue_lengths.quantile(0.99),
+        "max_queue_length": queue_lengths.max(),
+        "replica_seconds": replica_seconds,
+        "max_replicas": max_replicas,
+    }
+
+
+@click.command()
+@click.option("--trace", type=click.Path(exists=True), default=None)
+@click.option("--service-time-s", type=float, default=0.1)
+@click.option("--max-concurrent-queries", type=int, default=10)
+@click.option("--target-num-ongoing-requests-per-replica", type=float, default=5)
+@click.option("--startup-s", type=float, default=5.0)
+@click.option("--upscale-delay-s", type=float, default=30.0)
+@click.option("--downscale-delay-s", type=float, default=600.0)
+@click.option("--max-replicas", type=int, default=100)
+def main(
+    trace: Optional[str],
+    service_time_s: float,
+    max_concurrent_queries: int,
+    target_num_ongoing_requests_per_replica: float,
+    startup_s: float,
+    upscale_delay_s: float,
+    downscale_delay_s: float,
+    max_replicas: int,
+):
+    """Compare autoscaling policies on a recorded or synthetic traffic trace."""
+    trace_df = pd.read_csv(trace) if trace is not None else synthetic_trace()
+    trace_df = trace_df.sort_values("timestamp_s").reset_index(drop=True)
+
+    results = {}
+    for name, options in POLICIES.items():
+        config = AutoscalingConfig(
+            min_replicas=1,
+            max_replicas=max_replicas,
+            target_num_ongoing_requests_per_replica=(
+                target_num_ongoing_requests_per_replica
+            ),
+            metrics_interval_s=1.0,
+            look_back_period_s=5.0,
+            upscale_delay_s=upscale_delay_s,
+            downscale_delay_s=downscale_delay_s,
+            **options,
+        )
+        results[name] = simulate(
+            trace_df, config, service_time_s, max_concurrent_queries, startup_s
+        )
+
+    print(pd.DataFrame(results).T.round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
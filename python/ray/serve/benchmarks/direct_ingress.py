@@ -0,0 +1,85 @@
+import time
+
+import click
+import pandas as pd
+import requests
+from tqdm import tqdm
+
+import ray
+from ray import serve
+from ray.serve._private.constants import DEFAULT_HTTP_ADDRESS
+
+
+def run_latency_benchmark(url, payload, num_queries):
+    latency = []
+    with requests.Session() as session:
+        for _ in tqdm(range(num_queries + 200)):
+            start = time.perf_counter()
+            resp = session.post(url, data=payload)
+            end = time.perf_counter()
+            assert len(resp.content) == len(payload)
+            latency.append(end - start)
+
+    # Remove initial samples
+    latency = latency[200:]
+
+    return pd.Series(latency) * 1000
+
+
+def run_mode(direct_ingress: bool, num_replicas: int, payload_size: int, num_queries):
+    ray.init(
+        runtime_env={
+            "env_vars": {
+                "RAY_SERVE_ENABLE_DIRECT_INGRESS": "1" if direct_ingress else "0"
+            }
+        }
+    )
+    serve.start()
+
+    @serve.deployment(num_replicas=num_replicas, max_concurrent_queries=1000)
+    class Echo:
+        async def __call__(self, request):
+            return await request.body()
+
+    serve.run(Echo.bind(), route_prefix="/echo")
+
+    url = f"{DEFAULT_HTTP_ADDRESS}/echo"
+    if direct_ingress:
+        # Look up a replica address once, like an external load balancer would.
+        while True:
+            addresses = requests.get(f"{DEFAULT_HTTP_ADDRESS}/-/direct-ingress")
+            addresses = addresses.json().get("/echo", [])
+            if len(addresses) == num_replicas:
+                break
+            time.sleep(0.5)
+        url = f"{addresses[0]}/echo"
+
+    latency = run_latency_benchmark(url, b"x" * payload_size, num_queries)
+
+    serve.shutdown()
+    ray.shutdown()
+    return latency
+
+
+@click.command()
+@click.option("--num-queries", type=int, default=2000)
+@click.option("--num-replicas", type=int, default=1)
+@click.option("--payload-size", type=int, default=1024)
+def main(num_queries: int, num_replicas: int, payload_size: int):
+    """Compare request latency through the HTTP proxy and in direct ingress mode.
+
+    Requests carry `payload_size` bytes to an echo deployment, one at a time,
+    over a keep-alive connection.
+    """
+    results = {}
+    for mode, direct_ingress in [("proxy", False), ("direct", True)]:
+        results[mode] = run_mode(
+            direct_ingress, num_replicas, payload_size, num_queries
+        )
+
+    print(f"Latency for {payload_size} byte echo requests (ms)")
+    print(pd.DataFrame(results).describe(percentiles=[0.5, 0.9, 0.95, 0.99]).round(3))
+
+
+if __name__ == "__main__":
+    main()
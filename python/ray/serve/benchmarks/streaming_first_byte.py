@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+import click
+import pandas as pd
+import requests
+from tqdm import tqdm
+
+from ray import serve
+from ray.serve._private.constants import DEFAULT_HTTP_ADDRESS
+
+
+def run_first_byte_benchmark(url, num_queries):
+    first_byte_latency = []
+    total_latency = []
+    for _ in tqdm(range(num_queries + 20)):
+        start = time.perf_counter()
+        with requests.get(url, stream=True) as resp:
+            chunks = resp.iter_content(chunk_size=None)
+            next(chunks)
+            first_byte_latency.append(time.perf_counter() - start)
+            for _ in chunks:
+                pass
+        total_latency.append(time.perf_counter() - start)
+
+    # Remove initial samples
+    first_byte_latency = first_byte_latency[20:]
+    total_latency = total_latency[20:]
+
+    return pd.DataFrame(
+        {
+            "first_byte_ms": pd.Series(first_byte_latency) * 1000,
+            "total_ms": pd.Series(total_latency) * 1000,
+        }
+    )
+
+
+@click.command()
+@click.option("--num-queries", type=int, default=200)
+@click.option("--num-chunks", type=int, default=20)
+@click.option("--chunk-size", type=int, default=1024)
+@click.option("--chunk-delay-s", type=float, default=0.01)
+def main(num_queries: int, num_chunks: int, chunk_size: int, chunk_delay_s: float):
+    """Compare time-to-first-byte of streamed and buffered responses.
+
+    Both deployments produce `num_chunks` chunks, one every `chunk_delay_s`.
+    The streaming one yields them as they are produced, so the proxy forwards
+    the first chunk right away, while the buffered one returns the whole body
+    at the end.
+    """
+    serve.start()
+
+    chunk = b"x" * chunk_size
+
+    @serve.deployment
+    async def streamed(_):
+        for _ in range(num_chunks):
+            await asyncio.sleep(chunk_delay_s)
+            yield chunk
+
+    @serve.deployment
+    async def buffered(_):
+        chunks = []
+        for _ in range(num_chunks):
+            await asyncio.sleep(chunk_delay_s)
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    serve.run(streamed.bind(), name="streamed", route_prefix="/streamed")
+    serve.run(buffered.bind(), name="buffered", route_prefix="/buffered")
+
+    print(
+        f"num_chunks={num_chunks}, chunk_size={chunk_size}, "
+        f"chunk_delay_s={chunk_delay_s}"
+    )
+    for name in ["streamed", "buffered"]:
+        results = run_first_byte_benchmark(
+            f"{DEFAULT_HTTP_ADDRESS}/{name}", num_queries
+        )
+        print(f"Latency for {name} response (ms)")
+        print(results.describe(percentiles=[0.5, 0.9, 0.95, 0.99]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+import asyncio
+from collections import OrderedDict
+from functools import wraps
+from inspect import isawaitable, iscoroutinefunction
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ray._private.utils import get_or_create_event_loop
+from ray.serve.batching import _extract_self_if_method_call
+from ray.serve.context import get_internal_replica_context
+from ray.util import metrics
+from ray.util.annotations import PublicAPI
+
+_MISSING = object()
+
+
+def _default_cache_key(*args, **kwargs) -> Hashable:
+    return args, tuple(sorted(kwargs.items()))
+
+
+class _ResponseCache:
+    """LRU cache whose entries expire `ttl_s` seconds after being added."""
+
+    def __init__(self, max_size: int, ttl_s: Optional[float]):
+        self._max_size = max_size
+        self._ttl_s = ttl_s
+        # Key -> (expiration time, value), in least to most recently used order.
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Get the value for the key, or _MISSING if it's not cached."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._entries[key]
+            return _MISSING
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        expires_at = None
+        if self._ttl_s is not None:
+            expires_at = time.time() + self._ttl_s
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+class _CachedMethodWrapper:
+    """Caches the responses of a function or method in the replica.
+
+    Concurrent calls with the same key while the response isn't cached yet
+    wait for the same call instead of computing the response again.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        self_arg: Any,
+        key_fn: Callable,
+        max_size: int,
+        ttl_s: Optional[float],
+    ):
+        self._func = func
+        self._self_arg = self_arg
+        self._key_fn = key_fn
+        self._cache = _ResponseCache(max_size, ttl_s)
+        self._pending: Dict[Hashable, asyncio.Task] = dict()
+
+        context = get_internal_replica_context()
+        tags = {"method": func.__name__}
+        if context is not None:
+            tags.update(deployment=context.deployment, replica=context.replica_tag)
+        tag_keys = ("deployment", "replica", "method")
+
+        self._hit_counter = metrics.Counter(
+            "serve_deployment_cache_hits",
+            description=(
+                "The number of calls that were served from the response cache."
+            ),
+            tag_keys=tag_keys,
+        )
+        self._miss_counter = metrics.Counter(
+            "serve_deployment_cache_misses",
+            description=(
+                "The number of calls that weren't served from the response cache."
+            ),
+            tag_keys=tag_keys,
+        )
+        self._size_gauge = metrics.Gauge(
+            "serve_deployment_cache_size",
+            description="The number of responses in the response cache.",
+            tag_keys=tag_keys,
+        )
+        for metric in [self._hit_counter, self._miss_counter, self._size_gauge]:
+            metric.set_default_tags(tags)
+
+    async def _call_func(self, args: Tuple, kwargs: Dict) -> Any:
+        if self._self_arg is None:
+            return await self._func(*args, **kwargs)
+        return await self._func(self._self_arg, *args, **kwargs)
+
+    async def call(self, args: Tuple, kwargs: Dict) -> Any:
+        key = self._key_fn(*args, **kwargs)
+        if isawaitable(key):
+            key = await key
+        if key is None:
+            # The key function opted this call out of caching.
+            return await self._call_func(args, kwargs)
+
+        try:
+            value = self._cache.get(key)
+        except TypeError as e:
+            raise TypeError(
+                f"Cache key {key!r} is not hashable. Pass a `key_fn` to "
+                "@serve.cache that returns a hashable key."
+            ) from e
+
+        if value is not _MISSING:
+            self._hit_counter.inc()
+            return value
+
+        if key in self._pending:
+            self._hit_counter.inc()
+        else:
+            self._miss_counter.inc()
+            self._pending[key] = get_or_create_event_loop().create_task(
+                self._compute(key, args, kwargs)
+            )
+        # Shield the call from the cancellation of any single request.
+        return await asyncio.shield(self._pending[key])
+
+    async def _compute(self, key: Hashable, args: Tuple, kwargs: Dict) -> Any:
+        try:
+            value = await self._call_func(args, kwargs)
+            self._cache.put(key, value)
+            self._size_gauge.set(len(self._cache))
+            return value
+        finally:
+            del self._pending[key]
+
+
+@PublicAPI(stability="alpha")
+def cache(
+    _func: Optional[Callable] = None,
+    *,
+    key_fn: Optional[Callable] = None,
+    max_size: int = 1024,
+    ttl_s: Optional[float] = None,
+):
+    """Cache the responses of an async function or method in each replica.
+
+    Calls with a cached key return the cached response without calling the
+    function. The least recently used responses are evicted once more than
+    `max_size` are cached, and exceptions are never cached. Cache hits and
+    misses are exported as the `serve_deployment_cache_hits` and
+    `serve_deployment_cache_misses` metrics.
+
+    Cached responses are shared by all calls with the same key, so callers
+    shouldn't modify them in place.
+
+    Example:
+        >>> from ray import serve
+        >>> @serve.deployment # doctest: +SKIP
+        ... class Model:
+        ...     @serve.cache(
+        ...         key_fn=lambda request: request.query_params["q"], ttl_s=60
+        ...     )
+        ...     async def __call__(self, request):
+        ...         return self.model(request.query_params["q"])
+
+    Args:
+        key_fn: called with the same arguments as the function, not including
+            `self`, and returns the hashable cache key. It may be async, and
+            may return None to not cache the call. By default, the key is made
+            of the arguments, which then must be hashable.
+        max_size: the max number of responses cached in each replica.
+        ttl_s: if set, responses expire this many seconds after being cached.
+    """
+    if _func is not None and not callable(_func):
+        raise TypeError(
+            "@serve.cache can only be used to decorate functions or methods."
+        )
+
+    if key_fn is not None and not callable(key_fn):
+        raise TypeError("key_fn must be callable")
+
+    if not isinstance(max_size, int):
+        raise TypeError("max_size must be an integer >= 1")
+
+    if max_size < 1:
+        raise ValueError("max_size must be an integer >= 1")
+
+    if ttl_s is not None:
+        if not isinstance(ttl_s, (int, float)):
+            raise TypeError("ttl_s must be a number > 0")
+
+        if ttl_s <= 0:
+            raise ValueError("ttl_s must be a number > 0")
+
+    def _cache_decorator(_func):
+        if not iscoroutinefunction(_func):
+            raise TypeError("Functions decorated with @serve.cache must be 'async def'")
+
+        @wraps(_func)
+        async def cache_wrapper(*args, **kwargs):
+            self = _extract_self_if_method_call(args, _func)
+            if self is None:
+                # For functions, inject the wrapper as an attribute of the
+                # function.
+                wrapper_object = _func
+                call_args = args
+            else:
+                # For methods, inject the wrapper as an attribute of the object.
+                wrapper_object = self
+                call_args = args[1:]
+
+            wrapper_attr = f"__serve_cache_wrapper_{_func.__name__}"
+            if not hasattr(wrapper_object, wrapper_attr):
+                cached_method_wrapper = _CachedMethodWrapper(
+                    _func,
+                    self,
+                    key_fn or _default_cache_key,
+                    max_size,
+                    ttl_s,
+                )
+                setattr(wrapper_object, wrapper_attr, cached_method_wrapper)
+            else:
+                cached_method_wrapper = getattr(wrapper_object, wrapper_attr)
+
+            return await cached_method_wrapper.call(call_args, kwargs)
+
+        return cache_wrapper
+
+    return _cache_decorator(_func) if callable(_func) else _cache_decorator
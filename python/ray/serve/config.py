@@ -67,6 +67,16 @@ class AutoscalingConfig(BaseModel):
     # How long to wait before scaling up replicas
     upscale_delay_s: NonNegativeFloat = 30.0
 
+    # Whether to count queries queued at handles as load, and to scale up
+    # without waiting for `upscale_delay_s` while that queue keeps growing.
+    queue_aware_scaling: bool = False
+    # If positive, scale up for the load forecast this far ahead from the
+    # trend of the load over recent control loop periods.
+    forecast_horizon_s: NonNegativeFloat = 0.0
+    # Number of replicas to keep started, but not initialized, so scale ups
+    # only wait for the deployment's constructor. They hold their resources.
+    num_standby_replicas: NonNegativeInt = 0
+
     @validator("max_replicas", always=True)
     def replicas_settings_valid(cls, max_replicas, values):
         min_replicas = values.get("min_replicas")
@@ -3,6 +3,7 @@ This file stores global state for a Serve application. Deployment replicas
 can use this state to access metadata or the Serve controller.
 """
 
+import contextvars
 import logging
 from dataclasses import dataclass
 from typing import Callable
@@ -32,6 +33,18 @@ class ReplicaContext:
     servable_object: Callable
 
 
+@dataclass(frozen=True)
+class RequestContext:
+    """Metadata of the request a replica is currently handling."""
+
+    multiplexed_model_id: str = ""
+
+
+_serve_request_context = contextvars.ContextVar(
+    "Serve internal request context variable", default=RequestContext()
+)
+
+
 @PublicAPI(stability="alpha")
 def get_global_client(_health_check_controller: bool = False) -> ServeControllerClient:
     """Gets the global client, which stores the controller's handle.
@@ -164,6 +164,14 @@ class ServeController:
     def record_handle_metrics(self, data: Dict[str, float], send_timestamp: float):
         self.deployment_state_manager.record_handle_metrics(data, send_timestamp)
 
+    def record_multiplexed_model_ids(
+        self, deployment_name: str, replica_tag: str, model_ids: List[str]
+    ):
+        """Record the models a replica has loaded with `@serve.multiplexed`."""
+        self.deployment_state_manager.record_multiplexed_model_ids(
+            deployment_name, replica_tag, model_ids
+        )
+
     def _dump_autoscaling_metrics_for_testing(self):
         return self.deployment_state_manager.get_autoscaling_metrics()
 
@@ -177,15 +185,27 @@ class ServeController:
             deployment_name
         ]._stop_one_running_replica_for_testing()
 
-    async def listen_for_change(self, keys_to_snapshot_ids: Dict[str, int]):
+    async def listen_for_change(
+        self,
+        keys_to_snapshot_ids: Dict[str, int],
+        accept_deltas: bool = False,
+        epoch: Optional[str] = None,
+    ):
         """Proxy long pull client's listen request.
 
         Args:
             keys_to_snapshot_ids (Dict[str, int]): Snapshot IDs are used to
               determine whether or not the host should immediately return the
               data or wait for the value to be changed.
+            accept_deltas: Whether the client can apply delta updates.
+            epoch: The epoch of the long poll host the client's snapshots
+              are from.
         """
-        return await (self.long_poll_host.listen_for_change(keys_to_snapshot_ids))
+        return await (
+            self.long_poll_host.listen_for_change(
+                keys_to_snapshot_ids, accept_deltas, epoch
+            )
+        )
 
     async def listen_for_change_java(self, keys_to_snapshot_ids_bytes: bytes):
         """Proxy long pull client's listen request.
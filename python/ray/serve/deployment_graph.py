@@ -7,6 +7,7 @@ from ray.dag.function_node import FunctionNode  # noqa: F401
 from ray.dag.input_node import InputNode  # noqa: F401
 from ray.dag import DAGNode  # noqa: F401
 from ray.serve._private.constants import (
+    COLOCATE_DEPLOYMENT_KEY,
     SYNC_HANDLE_IN_DAG_FEATURE_FLAG_ENV_KEY,
 )
 from ray.util.annotations import PublicAPI
@@ -59,3 +60,54 @@ class RayServeDAGHandle:
             return await self.dag_node.execute(
                 *args, _ray_cache_refs=_ray_cache_refs, **kwargs
             )
+
+
+@PublicAPI(stability="alpha")
+def colocate(node: ClassNode) -> ClassNode:
+    """Run a bound deployment inside the deployments it's passed to.
+
+    Instead of being deployed on its own, the deployment is instantiated in
+    each replica of every deployment that takes it as an init arg, and calls
+    through the handle the replica receives are direct Python calls. This
+    avoids the actor call and serialization per call, and large arguments such
+    as NumPy arrays are passed by reference without copies. Callers and the
+    co-located deployment share these objects, so neither should modify them
+    in place.
+
+    A co-located deployment can only be passed as an init arg. Its methods
+    can't be bound as nodes of the call graph.
+
+    Example:
+        >>> from ray import serve
+        >>> from ray.serve.deployment_graph import colocate
+        >>> @serve.deployment # doctest: +SKIP
+        ... class Preprocessor:
+        ...     def __call__(self, x):
+        ...         return x / 255
+        >>> @serve.deployment # doctest: +SKIP
+        ... class Model:
+        ...     def __init__(self, preprocessor):
+        ...         self.preprocessor = preprocessor
+        ...
+        ...     async def __call__(self, x):
+        ...         return await (await self.preprocessor.remote(x))
+        >>> app = Model.bind(colocate(Preprocessor.bind())) # doctest: +SKIP
+    """
+    if not isinstance(node, ClassNode) or not node.get_other_args_to_resolve().get(
+        "is_from_serve_deployment"
+    ):
+        raise TypeError(
+            "colocate() takes a deployment class bound with .bind(), "
+            f"got {type(node)}."
+        )
+
+    return ClassNode(
+        node._body,
+        node.get_args(),
+        node.get_kwargs(),
+        node.get_options(),
+        other_args_to_resolve={
+            **node.get_other_args_to_resolve(),
+            COLOCATE_DEPLOYMENT_KEY: True,
+        },
+    )
@@ -1,10 +1,10 @@
 import asyncio
 import concurrent.futures
 from dataclasses import dataclass
-from functools import wraps
+from functools import partial, wraps
 import inspect
 import os
-from typing import Coroutine, Dict, Optional, Union
+from typing import Any, Coroutine, Dict, Optional, Tuple, Union
 import threading
 
 import ray
@@ -72,6 +72,7 @@ class HandleOptions:
     """Options for each ServeHandle instances. These fields are immutable."""
 
     method_name: str = "__call__"
+    multiplexed_model_id: str = ""
 
 
 @PublicAPI(stability="beta")
@@ -189,16 +190,24 @@ class RayServeHandle:
         self,
         *,
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
+        multiplexed_model_id: Union[str, DEFAULT] = DEFAULT.VALUE,
     ):
         """Set options for this handle.
 
         Args:
             method_name: The method to invoke.
+            multiplexed_model_id: The model to send requests to, for
+                deployments that multiplex models with `@serve.multiplexed`.
+                Requests are preferably routed to replicas that have the model
+                loaded already.
         """
         new_options_dict = self.handle_options.__dict__.copy()
         user_modified_options_dict = {
             key: value
-            for key, value in zip(["method_name"], [method_name])
+            for key, value in zip(
+                ["method_name", "multiplexed_model_id"],
+                [method_name, multiplexed_model_id],
+            )
             if value != DEFAULT.VALUE
         }
         new_options_dict.update(user_modified_options_dict)
@@ -218,6 +227,7 @@ class RayServeHandle:
             deployment_name,
             call_method=handle_options.method_name,
             http_arg_is_pickled=self._pickled_http_request,
+            multiplexed_model_id=handle_options.multiplexed_model_id,
         )
         coro = self.router.assign_request(request_metadata, *args, **kwargs)
         return coro
@@ -243,6 +253,18 @@ class RayServeHandle:
             self.deployment_name, self.handle_options, args, kwargs
         )
 
+    @_wrap_into_async_task
+    async def _remote_with_options(
+        self, handle_options: HandleOptions, *args, **kwargs
+    ):
+        """Like `remote`, but with the given options instead of the handle's.
+
+        Unlike `options(...).remote(...)`, this doesn't create a new handle, so
+        it's cheap enough to use for every request.
+        """
+        self.request_counter.inc()
+        return await self._remote(self.deployment_name, handle_options, args, kwargs)
+
     def __repr__(self):
         return f"{self.__class__.__name__}" f"(deployment='{self.deployment_name}')"
 
@@ -365,6 +387,119 @@ class RayServeDeploymentHandle:
         return f"{self.__class__.__name__}" f"(deployment='{self.deployment_name}')"
 
 
+async def _call_local_method(method, args, kwargs):
+    # Resolve results of other calls passed in as arguments, like replicas
+    # do for ObjectRefs.
+    args = [
+        await arg if isinstance(arg, (asyncio.Future, ray.ObjectRef)) else arg
+        for arg in args
+    ]
+    kwargs = {
+        key: await arg if isinstance(arg, (asyncio.Future, ray.ObjectRef)) else arg
+        for key, arg in kwargs.items()
+    }
+    result = method(*args, **kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+@DeveloperAPI
+class RayServeLocalDeploymentHandle(RayServeDeploymentHandle):
+    """Calls a co-located deployment directly in the current process.
+
+    Used in place of RayServeDeploymentHandle for deployments bound with
+    `ray.serve.deployment_graph.colocate`. The deployment's class is
+    instantiated on the first call in the process holding the handle, and
+    calls are plain Python calls: arguments and results, such as large NumPy
+    arrays, are passed by reference instead of being serialized and copied.
+
+    Like the default asynchronous handle, `remote()` returns an awaitable
+    that resolves to another awaitable for the result.
+    """
+
+    def __init__(
+        self,
+        deployment_name: str,
+        deployment_class: type,
+        init_args: Tuple[Any],
+        init_kwargs: Dict[str, Any],
+        user_config: Any = None,
+        handle_options: Optional[HandleOptions] = None,
+    ):
+        super().__init__(deployment_name, handle_options)
+        self.deployment_class = deployment_class
+        self.init_args = init_args
+        self.init_kwargs = init_kwargs
+        self.user_config = user_config
+        # Shared with the handles returned by options() so there's one
+        # instance per handle in each process.
+        self._instance_holder: Dict[str, Any] = {}
+
+    async def _get_instance(self) -> Any:
+        if "instance" not in self._instance_holder:
+            # Concurrent first calls wait for the same instance to be built.
+            lock = self._instance_holder.setdefault("lock", asyncio.Lock())
+            async with lock:
+                if "instance" not in self._instance_holder:
+                    self._instance_holder["instance"] = await self._build_instance()
+        return self._instance_holder["instance"]
+
+    async def _build_instance(self) -> Any:
+        """Build the instance like a replica does.
+
+        Async `__init__` and `reconfigure` methods are awaited, and sync ones run
+        in a thread so they don't block the event loop.
+        """
+        loop = get_or_create_event_loop()
+        instance = self.deployment_class.__new__(self.deployment_class)
+        if inspect.iscoroutinefunction(instance.__init__):
+            await instance.__init__(*self.init_args, **self.init_kwargs)
+        else:
+            await loop.run_in_executor(
+                None,
+                partial(instance.__init__, *self.init_args, **self.init_kwargs),
+            )
+        if self.user_config is not None:
+            if inspect.iscoroutinefunction(instance.reconfigure):
+                await instance.reconfigure(self.user_config)
+            else:
+                await loop.run_in_executor(None, instance.reconfigure, self.user_config)
+        return instance
+
+    def options(self, *, method_name: str):
+        handle = self.__class__(
+            self.deployment_name,
+            self.deployment_class,
+            self.init_args,
+            self.init_kwargs,
+            self.user_config,
+            HandleOptions(method_name=method_name),
+        )
+        handle._instance_holder = self._instance_holder
+        return handle
+
+    async def remote(
+        self, *args, _ray_cache_refs: bool = False, **kwargs
+    ) -> asyncio.Task:
+        instance = await self._get_instance()
+        method = getattr(instance, self.handle_options.method_name)
+        return get_or_create_event_loop().create_task(
+            _call_local_method(method, args, kwargs)
+        )
+
+    def __reduce__(self):
+        serialized_data = {
+            "deployment_name": self.deployment_name,
+            "deployment_class": self.deployment_class,
+            "init_args": self.init_args,
+            "init_kwargs": self.init_kwargs,
+            "user_config": self.user_config,
+            "handle_options": self.handle_options,
+        }
+        return RayServeLocalDeploymentHandle._deserialize, (serialized_data,)
+
+
 def _serve_handle_to_json_dict(handle: RayServeHandle) -> Dict[str, str]:
     """Converts a Serve handle to a JSON-serializable dictionary.
 
@@ -1,12 +1,14 @@
 from io import BytesIO
 from typing import Any, Dict, List, Optional, Union
 
-from fastapi import File, Request
+from fastapi import File, HTTPException, Request
 from pydantic import BaseModel, Field
+import msgpack
 import numpy as np
 import starlette.requests
 
 from ray.util.annotations import PublicAPI
+from ray.serve._private.http_util import get_request_body_buffer
 from ray.serve._private.utils import require_packages
 
 
@@ -55,6 +57,32 @@ def json_to_ndarray(payload: NdArray) -> np.ndarray:
     return arr
 
 
+@PublicAPI(stability="alpha")
+async def binary_to_ndarray(request: Request) -> np.ndarray:
+    """Accepts the raw data of a numpy array in the HTTP body.
+
+    The dtype of the array is read from the `x-ndarray-dtype` header, e.g.
+    `float32`, and its shape from the `x-ndarray-shape` header, e.g. `2,3`.
+    Without a shape, the array is flat. The returned array is a read-only view
+    of the request body, so neither JSON decoding nor copies are needed.
+    """
+    dtype = request.headers.get("x-ndarray-dtype")
+    if dtype is None:
+        raise HTTPException(
+            status_code=400, detail="The x-ndarray-dtype header is required."
+        )
+    shape = request.headers.get("x-ndarray-shape")
+
+    buffer = await get_request_body_buffer(request)
+    try:
+        arr = np.frombuffer(buffer, dtype=dtype)
+        if shape:
+            arr = arr.reshape([int(dim) for dim in shape.split(",")])
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return arr
+
+
 @PublicAPI(stability="beta")
 def json_to_multi_ndarray(payload: Dict[str, NdArray]) -> Dict[str, np.ndarray]:
     """Accepts a JSON of shape {str_key: NdArray} and converts it to dict of arrays."""
@@ -99,3 +127,23 @@ async def pandas_read_json(raw_request: Request):
     if isinstance(raw_json, bytes):
         raw_json = raw_json.decode("utf-8")
     return pd.read_json(raw_json, **raw_request.query_params)
+
+
+@require_packages(["pyarrow"])
+@PublicAPI(stability="alpha")
+async def arrow_to_table(request: Request):
+    """Accepts an Arrow IPC stream in the HTTP body and reads it as a Table.
+
+    The columns of the returned `pyarrow.Table` are read from the request body
+    without copies.
+    """
+    import pyarrow as pa
+
+    buffer = await get_request_body_buffer(request)
+    return pa.ipc.open_stream(pa.py_buffer(buffer)).read_all()
+
+
+@PublicAPI(stability="alpha")
+async def msgpack_request(request: Request) -> Any:
+    """Return the MessagePack object from request body."""
+    return msgpack.unpackb(await get_request_body_buffer(request))
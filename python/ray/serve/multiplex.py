@@ -0,0 +1,284 @@
+import asyncio
+from collections import OrderedDict
+from functools import wraps
+from inspect import iscoroutinefunction
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, Optional
+
+import psutil
+
+import ray
+from ray._private.utils import get_or_create_event_loop
+from ray.serve._private.constants import (
+    DEFAULT_LATENCY_BUCKET_MS,
+    SERVE_LOGGER_NAME,
+    SERVE_NAMESPACE,
+)
+from ray.serve.batching import _extract_self_if_method_call
+from ray.serve.context import _serve_request_context, get_internal_replica_context
+from ray.util import metrics
+from ray.util.annotations import PublicAPI
+
+logger = logging.getLogger(SERVE_LOGGER_NAME)
+
+
+def _get_rss_bytes() -> int:
+    return psutil.Process(os.getpid()).memory_info().rss
+
+
+class _ModelMultiplexWrapper:
+    """Loads models on demand and keeps the most recently used ones loaded.
+
+    Models are evicted in least recently used order once more than
+    `max_num_models` are loaded or, if `max_memory_bytes` is set, once the
+    loaded models use more memory than that. The memory used by a model is
+    measured as the growth of the process' resident set size while loading it.
+
+    Whenever the set of loaded models changes, it is reported to the controller,
+    which advertises it to routers so they prefer replicas that have the
+    requested model loaded already.
+    """
+
+    def __init__(
+        self,
+        load_fn: Callable,
+        self_arg: Any,
+        max_num_models: int,
+        max_memory_bytes: Optional[int],
+    ):
+        self._load_fn = load_fn
+        self._self_arg = self_arg
+        self._max_num_models = max_num_models
+        self._max_memory_bytes = max_memory_bytes
+
+        # Model ID -> model, in least to most recently used order.
+        self._models: "OrderedDict[str, Any]" = OrderedDict()
+        self._model_sizes: Dict[str, int] = dict()
+        # Concurrent requests for a model that's being loaded wait for the
+        # same load instead of loading it again.
+        self._loading: Dict[str, asyncio.Task] = dict()
+
+        context = get_internal_replica_context()
+        self._replica_context = context
+        self._controller_handle = None
+        tags = {}
+        if context is not None:
+            tags = {"deployment": context.deployment, "replica": context.replica_tag}
+        tag_keys = ("deployment", "replica")
+
+        self._load_counter = metrics.Counter(
+            "serve_multiplexed_model_load_counter",
+            description="The number of times a multiplexed model was loaded.",
+            tag_keys=tag_keys,
+        )
+        self._unload_counter = metrics.Counter(
+            "serve_multiplexed_model_unload_counter",
+            description="The number of times a multiplexed model was evicted.",
+            tag_keys=tag_keys,
+        )
+        self._load_latency_ms = metrics.Histogram(
+            "serve_multiplexed_model_load_latency_ms",
+            description="The time it took to load a multiplexed model.",
+            boundaries=DEFAULT_LATENCY_BUCKET_MS,
+            tag_keys=tag_keys,
+        )
+        self._num_models_gauge = metrics.Gauge(
+            "serve_num_multiplexed_models",
+            description="The number of multiplexed models loaded in the replica.",
+            tag_keys=tag_keys,
+        )
+        self._memory_bytes_gauge = metrics.Gauge(
+            "serve_multiplexed_models_memory_bytes",
+            description="The memory used by the multiplexed models in the replica.",
+            tag_keys=tag_keys,
+        )
+        for metric in [
+            self._load_counter,
+            self._unload_counter,
+            self._load_latency_ms,
+            self._num_models_gauge,
+            self._memory_bytes_gauge,
+        ]:
+            if tags:
+                metric.set_default_tags(tags)
+
+    async def load_model(self, model_id: str) -> Any:
+        if model_id in self._models:
+            self._models.move_to_end(model_id)
+            return self._models[model_id]
+
+        if model_id not in self._loading:
+            self._loading[model_id] = get_or_create_event_loop().create_task(
+                self._load(model_id)
+            )
+        # Shield the load from the cancellation of any single request.
+        return await asyncio.shield(self._loading[model_id])
+
+    async def _load(self, model_id: str) -> Any:
+        try:
+            if len(self._models) >= self._max_num_models:
+                # Make room before loading, so the evicted models don't add to
+                # the memory needed for the load.
+                while len(self._models) >= self._max_num_models:
+                    self._evict_lru()
+                self._on_models_changed()
+
+            logger.info(f"Loading multiplexed model {model_id}.")
+            rss_before = _get_rss_bytes()
+            start_time = time.time()
+            if self._self_arg is None:
+                model = await self._load_fn(model_id)
+            else:
+                model = await self._load_fn(self._self_arg, model_id)
+            self._load_latency_ms.observe((time.time() - start_time) * 1000)
+            self._load_counter.inc()
+
+            self._models[model_id] = model
+            self._model_sizes[model_id] = max(_get_rss_bytes() - rss_before, 0)
+            # Other models may have been loaded concurrently. The model that
+            # was just loaded is always kept.
+            while len(self._models) > 1 and (
+                len(self._models) > self._max_num_models
+                or (
+                    self._max_memory_bytes is not None
+                    and sum(self._model_sizes.values()) > self._max_memory_bytes
+                )
+            ):
+                self._evict_lru()
+            self._on_models_changed()
+            return model
+        finally:
+            del self._loading[model_id]
+
+    def _evict_lru(self):
+        model_id, _ = self._models.popitem(last=False)
+        self._model_sizes.pop(model_id, None)
+        self._unload_counter.inc()
+        logger.info(f"Evicted multiplexed model {model_id}.")
+
+    def _on_models_changed(self):
+        self._num_models_gauge.set(len(self._models))
+        self._memory_bytes_gauge.set(sum(self._model_sizes.values()))
+        context = self._replica_context
+        if context is None:
+            return
+        if self._controller_handle is None:
+            self._controller_handle = ray.get_actor(
+                context._internal_controller_name, namespace=SERVE_NAMESPACE
+            )
+        self._controller_handle.record_multiplexed_model_ids.remote(
+            context.deployment, context.replica_tag, list(self._models.keys())
+        )
+
+
+@PublicAPI(stability="alpha")
+def get_multiplexed_model_id() -> str:
+    """Get the ID of the model the current request is for.
+
+    It's set with the `serve_multiplexed_model_id` HTTP header, or with
+    `handle.options(multiplexed_model_id=...)` for requests sent through a
+    ServeHandle. Returns an empty string if the request didn't set it.
+
+    Example:
+        >>> from ray import serve
+        >>> @serve.deployment # doctest: +SKIP
+        ... class Model:
+        ...     @serve.multiplexed(max_num_models_per_replica=10)
+        ...     async def get_model(self, model_id: str):
+        ...         return await load_model_from_storage(model_id)
+        ...
+        ...     async def __call__(self, request):
+        ...         model = await self.get_model(serve.get_multiplexed_model_id())
+        ...         return model.predict(await request.json())
+    """
+    return _serve_request_context.get().multiplexed_model_id
+
+
+@PublicAPI(stability="alpha")
+def multiplexed(
+    _func: Optional[Callable] = None,
+    *,
+    max_num_models_per_replica: int = 3,
+    max_memory_bytes_per_replica: Optional[int] = None,
+):
+    """Serve many models from one deployment, loading them on demand.
+
+    Decorate an async function or method that takes a model ID and loads the
+    model. Calls return the loaded model, loading it only if it isn't loaded
+    in this replica already. Each replica keeps the most recently used models
+    loaded, and requests for a model are preferably routed to replicas that
+    have it loaded.
+
+    Args:
+        max_num_models_per_replica: the max number of models a replica keeps
+            loaded. Least recently used models are evicted beyond that.
+        max_memory_bytes_per_replica: if set, least recently used models are
+            also evicted while the loaded models use more memory than this.
+            The memory used by a model is measured as the growth of the
+            replica's resident set size while loading it.
+    """
+    if _func is not None:
+        if not callable(_func):
+            raise TypeError(
+                "@serve.multiplexed can only be used to decorate functions or methods."
+            )
+
+        if not iscoroutinefunction(_func):
+            raise TypeError(
+                "Functions decorated with @serve.multiplexed must be 'async def'"
+            )
+
+    if not isinstance(max_num_models_per_replica, int):
+        raise TypeError("max_num_models_per_replica must be an integer >= 1")
+
+    if max_num_models_per_replica < 1:
+        raise ValueError("max_num_models_per_replica must be an integer >= 1")
+
+    if max_memory_bytes_per_replica is not None:
+        if not isinstance(max_memory_bytes_per_replica, int):
+            raise TypeError("max_memory_bytes_per_replica must be an integer > 0")
+
+        if max_memory_bytes_per_replica <= 0:
+            raise ValueError("max_memory_bytes_per_replica must be an integer > 0")
+
+    def _multiplex_decorator(_func):
+        @wraps(_func)
+        async def multiplex_wrapper(*args):
+            self = _extract_self_if_method_call(args, _func)
+            if self is None:
+                # For functions, inject the wrapper as an attribute of the
+                # function.
+                wrapper_object = _func
+                model_args = args
+            else:
+                # For methods, inject the wrapper as an attribute of the object.
+                wrapper_object = self
+                model_args = args[1:]
+
+            if len(model_args) != 1:
+                raise TypeError(
+                    "Functions decorated with @serve.multiplexed must take exactly "
+                    "one argument, the model ID."
+                )
+
+            # The first time the function runs, we lazily construct the wrapper
+            # and inject it under a custom attribute name.
+            wrapper_attr = f"__serve_multiplex_wrapper_{_func.__name__}"
+            if not hasattr(wrapper_object, wrapper_attr):
+                model_multiplex_wrapper = _ModelMultiplexWrapper(
+                    _func,
+                    self,
+                    max_num_models_per_replica,
+                    max_memory_bytes_per_replica,
+                )
+                setattr(wrapper_object, wrapper_attr, model_multiplex_wrapper)
+            else:
+                model_multiplex_wrapper = getattr(wrapper_object, wrapper_attr)
+
+            return await model_multiplex_wrapper.load_model(model_args[0])
+
+        return multiplex_wrapper
+
+    return _multiplex_decorator(_func) if callable(_func) else _multiplex_decorator
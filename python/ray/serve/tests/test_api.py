@@ -118,6 +118,90 @@ def test_starlette_response(serve_instance):
     assert resp.status_code == 418
 
 
+@pytest.mark.parametrize("use_async", [False, True])
+def test_http_streaming_generator(serve_instance, use_async):
+    signal = SignalActor.remote()
+
+    if use_async:
+
+        @serve.deployment
+        async def stream(_):
+            yield "first"
+            await signal.wait.remote()
+            for i in range(3):
+                yield str(i)
+
+    else:
+
+        @serve.deployment
+        def stream(_):
+            yield "first"
+            ray.get(signal.wait.remote())
+            for i in range(3):
+                yield str(i)
+
+    serve.run(stream.bind())
+
+    resp = requests.get("http://127.0.0.1:8000/stream", stream=True, timeout=10)
+    assert resp.status_code == 200
+    chunks = resp.iter_content(chunk_size=None, decode_unicode=True)
+    # The first chunk arrives while the generator is still blocked.
+    assert next(chunks) == "first"
+    ray.get(signal.send.remote())
+    assert "".join(chunks) == "012"
+
+
+def test_http_streaming_fastapi(serve_instance):
+    app = FastAPI()
+
+    @serve.deployment
+    @serve.ingress(app)
+    class Events:
+        @app.get("/")
+        def events(self):
+            def gen():
+                for i in range(3):
+                    yield f"data: {i}\n\n"
+
+            return starlette.responses.StreamingResponse(
+                gen(), media_type="text/event-stream"
+            )
+
+        @app.get("/plain")
+        def plain(self):
+            return {"hello": "world"}
+
+    serve.run(Events.bind())
+
+    resp = requests.get("http://127.0.0.1:8000/Events")
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert resp.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+    assert requests.get("http://127.0.0.1:8000/Events/plain").json() == {
+        "hello": "world"
+    }
+
+
+def test_http_streaming_error(serve_instance):
+    @serve.deployment
+    async def fail_before_start(_):
+        raise RuntimeError("oops")
+        yield
+
+    @serve.deployment
+    async def fail_mid_stream(_):
+        yield "first"
+        await asyncio.sleep(0.1)
+        raise RuntimeError("oops")
+
+    serve.run(fail_before_start.bind())
+    resp = requests.get("http://127.0.0.1:8000/fail_before_start")
+    assert resp.status_code == 500
+
+    serve.run(fail_mid_stream.bind())
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        requests.get("http://127.0.0.1:8000/fail_mid_stream")
+
+
 @pytest.mark.parametrize("use_async", [False, True])
 def test_deploy_function_no_params(serve_instance, use_async):
     serve.start()
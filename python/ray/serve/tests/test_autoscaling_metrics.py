@@ -1,5 +1,7 @@
 import time
 
+import pytest
+
 import ray
 from ray import serve
 from ray._private.test_utils import wait_for_condition
@@ -69,6 +71,30 @@ class TestInMemoryMetricsStore:
         assert s.max("m1", window_start_timestamp_s=0) == 2
         assert s.max("m2", window_start_timestamp_s=0) == -1
 
+    def test_max_points_per_key(self):
+        s = InMemoryMetricsStore(max_points_per_key=3)
+        for i in range(1, 6):
+            s.add_metrics_point({"m1": i}, timestamp=i)
+        # Only the 3 newest points are kept.
+        assert [p.value for p in s.data["m1"]] == [3, 4, 5]
+        assert s.window_average("m1", window_start_timestamp_s=0) == 4
+
+    def test_moving_window(self):
+        s = InMemoryMetricsStore()
+        values = [5, 1, 4, 2, 3, 0]
+        for i, value in enumerate(values):
+            s.add_metrics_point({"m1": value}, timestamp=i)
+
+        for start in range(len(values)):
+            window = values[start:]
+            assert s.max("m1", window_start_timestamp_s=start - 0.5) == max(window)
+            assert s.window_average(
+                "m1", window_start_timestamp_s=start - 0.5
+            ) == pytest.approx(sum(window) / len(window))
+
+        assert s.max("m1", window_start_timestamp_s=10) is None
+        assert s.window_average("m1", window_start_timestamp_s=10) is None
+
 
 def test_e2e(serve_instance):
     @serve.deployment(
@@ -111,6 +137,4 @@ def test_e2e(serve_instance):
 if __name__ == "__main__":
     import sys
 
-    import pytest
-
     sys.exit(pytest.main(["-v", "-s", __file__]))
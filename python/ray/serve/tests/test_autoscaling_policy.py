@@ -12,6 +12,7 @@ import requests
 from ray._private.test_utils import SignalActor, wait_for_condition
 from ray.serve._private.autoscaling_policy import (
     BasicAutoscalingPolicy,
+    LoadForecaster,
     calculate_desired_num_replicas,
 )
 from ray.serve._private.common import DeploymentInfo
@@ -584,6 +585,112 @@ def test_single_replica_receives_all_requests(ongoing_requests):
     assert new_num_replicas == sum(ongoing_requests) / target_requests
 
 
+def test_queue_aware_scaling():
+    config = AutoscalingConfig(
+        min_replicas=1,
+        max_replicas=10,
+        target_num_ongoing_requests_per_replica=1,
+        upscale_delay_s=30.0,
+        queue_aware_scaling=True,
+    )
+    policy = BasicAutoscalingPolicy(config)
+
+    # Queued queries count as load, but a single measurement of the queue
+    # doesn't override the upscale delay.
+    new_num_replicas = policy.get_decision_num_replicas(
+        current_num_ongoing_requests=[1, 1],
+        curr_target_num_replicas=2,
+        current_handle_queued_queries=4,
+    )
+    assert new_num_replicas == 2
+
+    # The queue is growing, so scale up right away.
+    new_num_replicas = policy.get_decision_num_replicas(
+        current_num_ongoing_requests=[1, 1],
+        curr_target_num_replicas=2,
+        current_handle_queued_queries=6,
+    )
+    assert new_num_replicas == 8
+
+    # The queue stopped growing, so the upscale delay applies again.
+    new_num_replicas = policy.get_decision_num_replicas(
+        current_num_ongoing_requests=[1] * 8,
+        curr_target_num_replicas=8,
+        current_handle_queued_queries=6,
+    )
+    assert new_num_replicas == 8
+
+    # Without queue_aware_scaling, queued queries are ignored.
+    config.queue_aware_scaling = False
+    policy = BasicAutoscalingPolicy(config)
+    for queued in [4, 6, 100]:
+        new_num_replicas = policy.get_decision_num_replicas(
+            current_num_ongoing_requests=[1, 1],
+            curr_target_num_replicas=2,
+            current_handle_queued_queries=queued,
+        )
+        assert new_num_replicas == 2
+
+
+def test_load_forecaster():
+    forecaster = LoadForecaster()
+    assert forecaster.forecast(1) is None
+
+    # Converges to a linear trend.
+    for load in range(50):
+        forecaster.update(load)
+    assert forecaster.forecast(5) == pytest.approx(54, abs=0.01)
+
+    # Never forecasts a negative load.
+    for load in range(50, -50, -10):
+        forecaster.update(max(load, 0))
+    assert forecaster.forecast(100) == 0
+
+    forecaster.reset()
+    assert forecaster.forecast(1) is None
+
+
+def test_forecast_scaling():
+    def make_policy(forecast_horizon_s):
+        config = AutoscalingConfig(
+            min_replicas=1,
+            max_replicas=100,
+            target_num_ongoing_requests_per_replica=1,
+            upscale_delay_s=0.0,
+            downscale_delay_s=0.0,
+            forecast_horizon_s=forecast_horizon_s,
+        )
+        return BasicAutoscalingPolicy(config)
+
+    reactive_policy = make_policy(0)
+    predictive_policy = make_policy(5 * CONTROL_LOOP_PERIOD_S)
+
+    # On a ramp, the predictive policy provisions ahead of the load.
+    for num_ongoing_requests in range(1, 6):
+        reactive_decision = reactive_policy.get_decision_num_replicas(
+            current_num_ongoing_requests=[num_ongoing_requests] * 10,
+            curr_target_num_replicas=10,
+            current_handle_queued_queries=0,
+        )
+        predictive_decision = predictive_policy.get_decision_num_replicas(
+            current_num_ongoing_requests=[num_ongoing_requests] * 10,
+            curr_target_num_replicas=10,
+            current_handle_queued_queries=0,
+        )
+        assert reactive_decision == 10 * num_ongoing_requests
+        if num_ongoing_requests > 1:
+            assert predictive_decision > reactive_decision
+
+    # A falling forecast never scales down below the current load.
+    for num_ongoing_requests in range(5, 0, -1):
+        predictive_decision = predictive_policy.get_decision_num_replicas(
+            current_num_ongoing_requests=[num_ongoing_requests] * 10,
+            curr_target_num_replicas=10,
+            current_handle_queued_queries=0,
+        )
+        assert predictive_decision >= 10 * num_ongoing_requests
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="Failing on Windows.")
 def test_e2e_bursty(serve_instance):
     """
@@ -132,6 +132,25 @@ async def test_decorator_validation():
             async def method(self, requests):
                 pass
 
+    with pytest.raises(ValueError):
+
+        class ZeroConcurrentBatches:
+            @serve.batch(max_concurrent_batches=0)
+            async def method(self, requests):
+                pass
+
+    with pytest.raises(ValueError):
+
+        class NegativeTargetLatency:
+            @serve.batch(target_p99_latency_s=-1)
+            async def method(self, requests):
+                pass
+
+    class AdaptiveBatch:
+        @serve.batch(max_batch_size=32, target_p99_latency_s=0.1)
+        async def method(self, requests):
+            pass
+
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("use_class", [True, False])
@@ -258,6 +277,64 @@ async def test_batch_size_multiple_long_timeout(use_class):
         t3.result()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrent_batches", [1, 2])
+async def test_max_concurrent_batches(max_concurrent_batches):
+    num_running = 0
+    max_running = 0
+
+    @serve.batch(
+        max_batch_size=2,
+        batch_wait_timeout_s=0,
+        max_concurrent_batches=max_concurrent_batches,
+    )
+    async def handle_batch(requests):
+        nonlocal num_running, max_running
+        num_running += 1
+        max_running = max(max_running, num_running)
+        await asyncio.sleep(0.2)
+        num_running -= 1
+        return requests
+
+    tasks = [get_or_create_event_loop().create_task(handle_batch(i)) for i in range(8)]
+    assert await asyncio.gather(*tasks) == list(range(8))
+    assert max_running == max_concurrent_batches
+
+
+def test_adaptive_batch_tuner():
+    from ray.serve.batching import _AdaptiveBatchTuner, _SingleRequest
+
+    tuner = _AdaptiveBatchTuner(
+        max_batch_size=8, max_timeout_s=1.0, target_p99_latency_s=0.1
+    )
+    assert tuner.batch_size == 1
+
+    def run_batches(num_batches: int, batch_latency_s: float):
+        now = 0.0
+        for _ in range(num_batches):
+            batch = []
+            for _ in range(tuner.batch_size):
+                # Requests arrive every 1ms.
+                now += 0.001
+                tuner.record_arrival(now)
+                batch.append(_SingleRequest(None, [], None, enqueue_time=now))
+            tuner.record_batch(batch, now, now + batch_latency_s)
+            now += batch_latency_s
+
+    # Full batches well under the target latency grow the batch size, up to the
+    # max batch size.
+    run_batches(200, batch_latency_s=0.01)
+    assert tuner.batch_size == 8
+    # There's enough slack to wait for a full batch at the arrival rate.
+    assert 0 < tuner.timeout_s < 0.1
+
+    # Batches over the target latency shrink the batch size.
+    run_batches(200, batch_latency_s=0.2)
+    assert tuner.batch_size == 1
+    # There's no slack left to wait for more requests.
+    assert tuner.timeout_s == 0
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("mode", ["args", "kwargs", "mixed", "out-of-order"])
 @pytest.mark.parametrize("use_class", [True, False])
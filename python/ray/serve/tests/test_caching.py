@@ -0,0 +1,192 @@
+import asyncio
+
+import pytest
+import requests
+
+from ray import serve
+from ray.serve import caching
+
+
+@pytest.mark.asyncio
+async def test_decorator_validation():
+    @serve.cache
+    async def f(x):
+        pass
+
+    @serve.cache(key_fn=lambda x: x, max_size=10, ttl_s=1)
+    async def f2(x):
+        pass
+
+    class Model:
+        @serve.cache
+        async def f(self, x):
+            pass
+
+    with pytest.raises(TypeError, match="async def"):
+
+        @serve.cache
+        def f_sync(x):
+            pass
+
+    with pytest.raises(TypeError, match="async def"):
+
+        @serve.cache(max_size=10)
+        def f_sync_2(x):
+            pass
+
+    with pytest.raises(ValueError):
+
+        @serve.cache(max_size=0)
+        async def f3(x):
+            pass
+
+    with pytest.raises(TypeError):
+
+        @serve.cache(max_size="1")
+        async def f4(x):
+            pass
+
+    with pytest.raises(ValueError):
+
+        @serve.cache(ttl_s=0)
+        async def f5(x):
+            pass
+
+    with pytest.raises(TypeError):
+
+        @serve.cache(key_fn="x")
+        async def f6(x):
+            pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_class", [True, False])
+async def test_lru_eviction(use_class):
+    calls = []
+
+    if use_class:
+
+        class Model:
+            @serve.cache(max_size=2)
+            async def predict(self, x):
+                calls.append(x)
+                return x * 2
+
+        predict = Model().predict
+    else:
+
+        @serve.cache(max_size=2)
+        async def predict(x):
+            calls.append(x)
+            return x * 2
+
+    assert await predict(1) == 2
+    assert await predict(2) == 4
+    assert await predict(1) == 2
+    assert calls == [1, 2]
+
+    # 2 is the least recently used response, so it's evicted.
+    assert await predict(3) == 6
+    assert await predict(1) == 2
+    assert calls == [1, 2, 3]
+    assert await predict(2) == 4
+    assert calls == [1, 2, 3, 2]
+
+
+@pytest.mark.asyncio
+async def test_ttl(monkeypatch):
+    now = 0
+    monkeypatch.setattr(caching.time, "time", lambda: now)
+    calls = []
+
+    @serve.cache(ttl_s=10)
+    async def predict(x):
+        calls.append(x)
+        return x
+
+    await predict(1)
+    now = 5
+    await predict(1)
+    assert calls == [1]
+
+    now = 10
+    await predict(1)
+    assert calls == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_key_fn():
+    calls = []
+
+    async def key_fn(request):
+        return request.get("q")
+
+    @serve.cache(key_fn=key_fn)
+    async def predict(request):
+        calls.append(request)
+        return request.get("q")
+
+    await predict({"q": "a", "request_id": 1})
+    await predict({"q": "a", "request_id": 2})
+    assert len(calls) == 1
+
+    # A None key isn't cached.
+    await predict({"request_id": 3})
+    await predict({"request_id": 4})
+    assert len(calls) == 3
+
+    @serve.cache
+    async def predict_unhashable(request):
+        return request
+
+    with pytest.raises(TypeError, match="key_fn"):
+        await predict_unhashable({"q": "a"})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_and_errors():
+    calls = []
+
+    @serve.cache
+    async def predict(x):
+        calls.append(x)
+        await asyncio.sleep(0.1)
+        if x < 0:
+            raise ValueError("negative")
+        return x
+
+    results = await asyncio.gather(*[predict(1) for _ in range(5)])
+    assert results == [1] * 5
+    assert calls == [1]
+
+    # Exceptions aren't cached.
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await predict(-1)
+    assert calls == [1, -1, -1]
+
+
+def test_cached_deployment(serve_instance):
+    @serve.deployment
+    class Model:
+        def __init__(self):
+            self.num_calls = 0
+
+        @serve.cache(key_fn=lambda request: request.query_params["q"])
+        async def __call__(self, request):
+            self.num_calls += 1
+            return {"q": request.query_params["q"], "num_calls": self.num_calls}
+
+    serve.run(Model.bind())
+
+    for _ in range(3):
+        resp = requests.get("http://127.0.0.1:8000/Model", params={"q": "a"})
+        assert resp.json() == {"q": "a", "num_calls": 1}
+    resp = requests.get("http://127.0.0.1:8000/Model", params={"q": "b"})
+    assert resp.json() == {"q": "b", "num_calls": 2}
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s", __file__]))
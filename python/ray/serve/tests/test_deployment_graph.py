@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import os
 import sys
@@ -12,7 +13,7 @@ from ray.serve.application import Application
 from ray.serve.api import build as build_app
 from ray.serve.deployment_graph import RayServeDAGHandle
 from ray.serve._private.deployment_graph_build import build as pipeline_build
-from ray.serve.deployment_graph import ClassNode, InputNode
+from ray.serve.deployment_graph import ClassNode, InputNode, colocate
 from ray.serve.drivers import DAGDriver
 import starlette.requests
 
@@ -408,6 +409,80 @@ def test_run_non_json_serializable_args(serve_instance):
     )
 
 
+@serve.deployment
+class ColocatedChild:
+    def __call__(self, arr):
+        return os.getpid(), arr.__array_interface__["data"][0]
+
+
+@serve.deployment
+class ColocatedParent:
+    def __init__(self, child):
+        self._child = child
+
+    async def __call__(self, *args):
+        arr = np.zeros(1000)
+        pid, address = await (await self._child.remote(arr))
+        # The child runs in this process and gets the array without a copy.
+        return pid == os.getpid(), address == arr.__array_interface__["data"][0]
+
+
+def test_colocate(serve_instance):
+    handle = serve.run(ColocatedParent.bind(colocate(ColocatedChild.bind())))
+    assert ray.get(handle.remote()) == (True, True)
+    assert "ColocatedChild" not in serve.list_deployments()
+
+    driver = DAGDriver.bind(colocate(Adder.bind(1)), http_adapter=json_resolver)
+    handle = serve.run(driver)
+    assert ray.get(handle.predict.remote(1)) == 2
+    assert "Adder" not in serve.list_deployments()
+
+
+@serve.deployment(user_config={"increment": 2})
+class AsyncColocatedChild:
+    async def __init__(self):
+        await asyncio.sleep(0.1)
+        self.increment = 0
+
+    async def reconfigure(self, config):
+        await asyncio.sleep(0.1)
+        self.increment = config["increment"]
+
+    def __call__(self, inp: int):
+        return inp + self.increment, id(self)
+
+
+@serve.deployment
+class AsyncColocatedParent:
+    def __init__(self, child):
+        self._child = child
+
+    async def __call__(self, *args):
+        refs = await asyncio.gather(*[self._child.remote(i) for i in range(3)])
+        return await asyncio.gather(*refs)
+
+
+def test_colocate_async_init(serve_instance):
+    # The child's async constructor and reconfigure are awaited, and concurrent
+    # first calls share a single instance.
+    handle = serve.run(AsyncColocatedParent.bind(colocate(AsyncColocatedChild.bind())))
+    results, instance_ids = zip(*ray.get(handle.remote()))
+    assert results == (2, 3, 4)
+    assert len(set(instance_ids)) == 1
+
+
+def test_colocate_method_node_unsupported():
+    with InputNode() as dag_input:
+        model = colocate(Adder.bind(1))
+        dag = DAGDriver.bind(model.forward.bind(dag_input))
+
+    with pytest.raises(ValueError, match="co-located"):
+        pipeline_build(dag)
+
+    with pytest.raises(TypeError):
+        colocate(func.bind())
+
+
 @serve.deployment
 def func():
     return 1
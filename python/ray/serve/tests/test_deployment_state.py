@@ -53,6 +53,12 @@ class MockReplicaActorWrapper:
         self.recovering = False
         # Will be set when `start()` is called.
         self.version = None
+        # Unset for standby replicas until `initialize()` is called.
+        self.initialized = False
+        # Returned by `check_allocated()`.
+        self.allocated = ReplicaStartupStatus.SUCCEEDED
+        # Expected to be set in the test for recovered standby replicas.
+        self.is_standby = False
         # Initial state for a replica is PENDING_ALLOCATION.
         self.ready = ReplicaStartupStatus.PENDING_ALLOCATION
         # Will be set when `graceful_stop()` is called.
@@ -88,6 +94,10 @@ class MockReplicaActorWrapper:
     def max_concurrent_queries(self) -> int:
         return 100
 
+    @property
+    def direct_ingress_address(self) -> Optional[str]:
+        return None
+
     @property
     def node_id(self) -> Optional[str]:
         if isinstance(self._scheduling_strategy, NodeAffinitySchedulingStrategy):
@@ -112,11 +122,24 @@ class MockReplicaActorWrapper:
         """Mocked deployment_worker return version from reconfigure()"""
         self.starting_version = version
 
-    def start(self, deployment_info: DeploymentInfo, version: DeploymentVersion):
+    def start(
+        self,
+        deployment_info: DeploymentInfo,
+        version: DeploymentVersion,
+        standby: bool = False,
+    ):
         self.started = True
+        self.initialized = not standby
         self.version = version
         self.deployment_info = deployment_info
 
+    def initialize(self, user_config: Any):
+        self.initialized = True
+        self.is_standby = False
+
+    def check_allocated(self) -> ReplicaStartupStatus:
+        return self.allocated
+
     def update_user_config(self, user_config: Any):
         self.started = True
         self.version = DeploymentVersion(
@@ -2185,6 +2208,84 @@ def test_resume_deployment_state_from_replica_tags(
     assert deployment_state._replicas.get()[0].replica_tag == mocked_replica.replica_tag
 
 
+def test_resume_standby_replicas_from_replica_tags(mock_deployment_state_manager):
+    deployment_state_manager, timer = mock_deployment_state_manager
+
+    tag = "test"
+    b_info_1, b_version_1 = deployment_info(
+        version="1",
+        autoscaling_config={
+            "min_replicas": 1,
+            "max_replicas": 5,
+            "num_standby_replicas": 1,
+        },
+    )
+    deployment_state_manager.deploy(tag, b_info_1)
+    deployment_state = deployment_state_manager._deployment_states[tag]
+
+    deployment_state_manager.update()
+    deployment_state._replicas.get()[0]._actor.set_ready()
+    deployment_state_manager.update()
+    check_counts(deployment_state, total=1, by_state=[(ReplicaState.RUNNING, 1)])
+    [running_replica] = deployment_state._replicas.get()
+    [standby_replica] = deployment_state._standby_replicas
+
+    # Recover both the running and the standby replica.
+    deployment_state._replicas = ReplicaStateContainer()
+    deployment_state_manager._recover_from_checkpoint(
+        [
+            ReplicaName.prefix + running_replica.replica_tag,
+            ReplicaName.prefix + standby_replica.replica_tag,
+        ]
+    )
+    deployment_state = deployment_state_manager._deployment_states[tag]
+    check_counts(deployment_state, total=2, by_state=[(ReplicaState.RECOVERING, 2)])
+
+    # Neither is the pool refilled nor are replicas stopped while recovering.
+    deployment_state_manager.update()
+    check_counts(deployment_state, total=2, by_state=[(ReplicaState.RECOVERING, 2)])
+    assert len(deployment_state._standby_replicas) == 0
+
+    for replica in deployment_state._replicas.get():
+        replica._actor.set_ready()
+        replica._actor.set_starting_version(b_version_1)
+        replica._actor.is_standby = replica.replica_tag == standby_replica.replica_tag
+
+    # The standby replica goes back to the pool instead of failing to start.
+    deployment_state_manager.update()
+    check_counts(
+        deployment_state,
+        total=1,
+        version=b_version_1,
+        by_state=[(ReplicaState.RUNNING, 1)],
+    )
+    assert deployment_state._replicas.get()[0].replica_tag == (
+        running_replica.replica_tag
+    )
+    [recovered_standby_replica] = deployment_state._standby_replicas
+    assert recovered_standby_replica.replica_tag == standby_replica.replica_tag
+    assert not recovered_standby_replica._actor.stopped
+    assert deployment_state._replica_constructor_retry_counter == 0
+
+    # It's kept in the pool and promoted on scale up.
+    deployment_state_manager.update()
+    assert deployment_state._standby_replicas == [recovered_standby_replica]
+    b_info_2, _ = deployment_info(
+        version="1",
+        num_replicas=2,
+        autoscaling_config={
+            "min_replicas": 1,
+            "max_replicas": 5,
+            "num_standby_replicas": 1,
+        },
+    )
+    deployment_state_manager.deploy(tag, b_info_2)
+    deployment_state_manager.update()
+    starting = deployment_state._replicas.get([ReplicaState.STARTING])
+    assert starting == [recovered_standby_replica]
+    assert recovered_standby_replica._actor.initialized
+
+
 def test_stopping_replicas_ranking():
     @dataclass
     class MockReplica:
@@ -2223,6 +2324,83 @@ def test_resource_requirements_none(mock_get_all_node_ids, mock_deployment_state
     replica.resource_requirements()
 
 
+@pytest.mark.parametrize("mock_deployment_state", [False], indirect=True)
+def test_standby_replicas(mock_deployment_state):
+    deployment_state, timer = mock_deployment_state
+    autoscaling_config = {"min_replicas": 1, "max_replicas": 5}
+
+    def standby_info(version, num_replicas):
+        return deployment_info(
+            version=version,
+            num_replicas=num_replicas,
+            autoscaling_config=dict(autoscaling_config, num_standby_replicas=2),
+        )
+
+    b_info_1, b_version_1 = standby_info("1", 1)
+    deployment_state.deploy(b_info_1)
+
+    # The standby pool is filled next to the regular replica, without
+    # initializing its replicas.
+    deployment_state.update()
+    check_counts(deployment_state, total=1, by_state=[(ReplicaState.STARTING, 1)])
+    standby_replicas = list(deployment_state._standby_replicas)
+    assert len(standby_replicas) == 2
+    assert all(r._actor.started and not r._actor.initialized for r in standby_replicas)
+
+    deployment_state._replicas.get()[0]._actor.set_ready()
+    deployment_state.update()
+    check_counts(deployment_state, total=1, by_state=[(ReplicaState.RUNNING, 1)])
+    assert deployment_state.curr_status_info.status == DeploymentStatus.HEALTHY
+
+    # Scaling up promotes the standby replicas and refills the pool.
+    b_info_2, _ = standby_info("1", 3)
+    deployment_state.deploy(b_info_2)
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=3,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STARTING, 2)],
+    )
+    starting = deployment_state._replicas.get([ReplicaState.STARTING])
+    assert set(starting) == set(standby_replicas)
+    assert all(r._actor.initialized for r in starting)
+    assert len(deployment_state._standby_replicas) == 2
+    assert not set(deployment_state._standby_replicas) & set(standby_replicas)
+
+    for replica in starting:
+        replica._actor.set_ready()
+    deployment_state.update()
+    check_counts(deployment_state, total=3, by_state=[(ReplicaState.RUNNING, 3)])
+
+    # Standby replicas that failed to start are replaced.
+    deployment_state._standby_replicas[0]._actor.allocated = ReplicaStartupStatus.FAILED
+    deployment_state.update()
+    check_counts(deployment_state, by_state=[(ReplicaState.STOPPING, 1)])
+    assert len(deployment_state._standby_replicas) == 1
+    timer.advance(deployment_state._backoff_time_s + 0.1)
+    deployment_state.update()
+    assert len(deployment_state._standby_replicas) == 2
+    deployment_state._replicas.get([ReplicaState.STOPPING])[
+        0
+    ]._actor.set_done_stopping()
+
+    # Standby replicas of an old version are stopped and replaced.
+    old_standby_replicas = list(deployment_state._standby_replicas)
+    b_info_3, b_version_3 = standby_info("2", 3)
+    deployment_state.deploy(b_info_3)
+    deployment_state.update()
+    assert all(r._actor.stopped for r in old_standby_replicas)
+    assert len(deployment_state._standby_replicas) == 2
+    assert all(r.version == b_version_3 for r in deployment_state._standby_replicas)
+
+    # Deleting the deployment stops the standby replicas.
+    standby_replicas = list(deployment_state._standby_replicas)
+    deployment_state.delete()
+    deployment_state.update()
+    assert len(deployment_state._standby_replicas) == 0
+    assert all(r._actor.stopped for r in standby_replicas)
+
+
 @pytest.mark.parametrize("mock_deployment_state", [True], indirect=True)
 @patch.object(DriverDeploymentState, "_get_all_node_ids")
 def test_add_and_remove_nodes_for_driver_deployment(
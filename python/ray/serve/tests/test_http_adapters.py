@@ -1,18 +1,30 @@
+import copy
 import io
+import pickle
 from dataclasses import dataclass
 
+from fastapi import HTTPException
+import msgpack
 import numpy as np
 import pytest
 from PIL import Image
 import pandas as pd
+import pyarrow as pa
 
 from ray.serve.http_adapters import (
     NdArray,
+    arrow_to_table,
+    binary_to_ndarray,
     json_to_multi_ndarray,
     json_to_ndarray,
     image_to_ndarray,
+    msgpack_request,
     pandas_read_json,
 )
+from ray.serve._private.http_util import (
+    build_starlette_request,
+    get_request_body_buffer,
+)
 from ray.serve._private.utils import require_packages
 
 
@@ -96,6 +108,82 @@ async def test_pandas_dataframe():
     assert parsed_df.equals(df)
 
 
+def make_request(body, headers=None):
+    # Like requests built by replicas, with the body as a uint8 array.
+    scope = {
+        "type": "http",
+        "headers": [
+            (key.encode("latin-1"), value.encode("latin-1"))
+            for key, value in (headers or {}).items()
+        ],
+    }
+    return build_starlette_request(scope, np.frombuffer(body, dtype=np.uint8))
+
+
+@pytest.mark.asyncio
+async def test_binary_to_ndarray():
+    arr = np.arange(6, dtype="float32").reshape(2, 3)
+    request = make_request(
+        arr.tobytes(), {"x-ndarray-dtype": "float32", "x-ndarray-shape": "2,3"}
+    )
+    result = await binary_to_ndarray(request)
+    np.testing.assert_equal(result, arr)
+    # The array is a view of the request body.
+    assert np.shares_memory(result, request.state.ray_serve_body_buffer)
+    # The body can still be read as bytes.
+    assert await request.body() == arr.tobytes()
+
+    result = await binary_to_ndarray(
+        make_request(arr.tobytes(), {"x-ndarray-dtype": "float32"})
+    )
+    np.testing.assert_equal(result, arr.flatten())
+
+    with pytest.raises(HTTPException):
+        await binary_to_ndarray(make_request(arr.tobytes()))
+
+    with pytest.raises(HTTPException):
+        await binary_to_ndarray(
+            make_request(
+                arr.tobytes(), {"x-ndarray-dtype": "float32", "x-ndarray-shape": "4,4"}
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_request_body_buffer():
+    body = b"abc"
+    request = make_request(body)
+    # The scope stays copyable and picklable, e.g. for middlewares.
+    for scope in [
+        copy.deepcopy(request.scope),
+        pickle.loads(pickle.dumps(request.scope)),
+    ]:
+        assert scope["state"]["ray_serve_body_buffer"].tobytes() == body
+    assert await get_request_body_buffer(request) == body
+
+    # Bodies sent inline aren't kept in the request state.
+    request = build_starlette_request({"type": "http", "headers": []}, body)
+    assert not hasattr(request.state, "ray_serve_body_buffer")
+    assert await get_request_body_buffer(request) == body
+
+
+@pytest.mark.asyncio
+async def test_arrow_to_table():
+    table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    result = await arrow_to_table(make_request(sink.getvalue().to_pybytes()))
+    assert result.equals(table)
+
+
+@pytest.mark.asyncio
+async def test_msgpack_request():
+    obj = {"a": [1, 2, 3], "b": "x"}
+    assert await msgpack_request(make_request(msgpack.packb(obj))) == obj
+
+
 if __name__ == "__main__":
     import sys
 
@@ -12,8 +12,11 @@ from ray.serve._private.common import EndpointTag, EndpointInfo, RunningReplicaI
 from ray.serve._private.long_poll import (
     LongPollClient,
     LongPollHost,
+    SnapshotDelta,
     UpdatedObject,
     LongPollNamespace,
+    apply_delta,
+    compute_delta,
 )
 from ray.serve.generated.serve_pb2 import (
     LongPollRequest,
@@ -169,6 +172,167 @@ async def test_client_threadsafe(serve_instance):
     await e.wait()
 
 
+def make_replicas(tags, **kwargs):
+    return [
+        RunningReplicaInfo(
+            deployment_name="deployment_name",
+            replica_tag=tag,
+            actor_handle=None,
+            max_concurrent_queries=1,
+            **kwargs,
+        )
+        for tag in tags
+    ]
+
+
+def test_snapshot_deltas():
+    old = {"a": 1, "b": 2, "c": 3}
+    new = {"a": 1, "b": 20, "d": 4}
+    delta = compute_delta(old, new)
+    assert delta == SnapshotDelta(updated={"b": 20, "d": 4}, removed={"c"})
+    assert apply_delta(old, delta) == new
+
+    old = make_replicas(["1", "2", "3"])
+    new = make_replicas(["1", "3", "4"])
+    delta = compute_delta(old, new)
+    assert set(delta.updated.keys()) == {"4"}
+    assert delta.removed == {"2"}
+    assert apply_delta(old, delta) == new
+
+    # Fields that are excluded from equality are still compared.
+    new = make_replicas(["1", "2", "3"], multiplexed_model_ids=("model",))
+    delta = compute_delta(old, new)
+    assert set(delta.updated.keys()) == {"1", "2", "3"}
+    result = apply_delta(old, delta)
+    assert [r.multiplexed_model_ids for r in result] == [("model",)] * 3
+
+    # Merging keeps the latest change of each key.
+    delta = SnapshotDelta(updated={"a": 1}, removed={"b"})
+    delta.merge(SnapshotDelta(updated={"b": 2}, removed={"a"}))
+    assert delta == SnapshotDelta(updated={"b": 2}, removed={"a"})
+
+    # Other snapshots don't have deltas.
+    assert compute_delta(1, 2) is None
+    assert compute_delta([1], [2]) is None
+    assert compute_delta({"a": 1}, make_replicas(["1"])) is None
+
+
+def test_host_deltas(serve_instance):
+    host = ray.remote(LongPollHost).remote()
+    key = (LongPollNamespace.RUNNING_REPLICAS, "deployment_name")
+
+    replicas = make_replicas([str(i) for i in range(10)])
+    ray.get(host.notify_changed.remote(key, replicas))
+    result = ray.get(host.listen_for_change.remote({key: -1}, accept_deltas=True))
+    assert result[key].object_snapshot == replicas
+    assert result[key].delta is None
+    snapshot_id = result[key].snapshot_id
+    epoch = result[key].epoch
+
+    # Two changes are coalesced into one delta.
+    ray.get(host.notify_changed.remote(key, replicas[1:]))
+    ray.get(host.notify_changed.remote(key, replicas[1:] + make_replicas(["new"])))
+    result = ray.get(
+        host.listen_for_change.remote(
+            {key: snapshot_id}, accept_deltas=True, epoch=epoch
+        )
+    )
+    assert result[key].snapshot_id == snapshot_id + 2
+    assert result[key].object_snapshot is None
+    assert set(result[key].delta.updated.keys()) == {"new"}
+    assert result[key].delta.removed == {"0"}
+
+    # Clients that don't accept deltas get the full snapshot.
+    result = ray.get(host.listen_for_change.remote({key: snapshot_id}))
+    assert result[key].delta is None
+    assert len(result[key].object_snapshot) == 10
+
+    # So do clients whose snapshot is too old for the kept deltas.
+    result = ray.get(
+        host.listen_for_change.remote(
+            {key: snapshot_id - 1}, accept_deltas=True, epoch=epoch
+        )
+    )
+    assert result[key].delta is None
+
+
+def test_host_epoch(serve_instance):
+    host = ray.remote(LongPollHost).remote()
+    key = (LongPollNamespace.RUNNING_REPLICAS, "deployment_name")
+    replicas = make_replicas([str(i) for i in range(10)])
+    ray.get(host.notify_changed.remote(key, replicas))
+    ray.get(host.notify_changed.remote(key, replicas[1:]))
+    result = ray.get(host.listen_for_change.remote({key: -1}, accept_deltas=True))
+    snapshot_id = result[key].snapshot_id
+
+    # Snapshot IDs from another host instance are not compared, even if they
+    # match, and no deltas are sent for them.
+    for client_snapshot_id in [snapshot_id, snapshot_id - 1]:
+        result = ray.get(
+            host.listen_for_change.remote(
+                {key: client_snapshot_id, "other_key": 0},
+                accept_deltas=True,
+                epoch="previous_host",
+            )
+        )
+        assert set(result.keys()) == {key}
+        assert result[key].delta is None
+        assert result[key].object_snapshot == replicas[1:]
+
+
+@pytest.mark.asyncio
+async def test_client_deltas(serve_instance):
+    host = ray.remote(LongPollHost).remote()
+    key = (LongPollNamespace.RUNNING_REPLICAS, "deployment_name")
+    replicas = make_replicas([str(i) for i in range(10)])
+    ray.get(host.notify_changed.remote(key, replicas))
+
+    callback_results = []
+    client = LongPollClient(
+        host,
+        {key: callback_results.append},
+        call_in_event_loop=get_or_create_event_loop(),
+    )
+    while len(callback_results) == 0:
+        await asyncio.sleep(0.1)
+    assert callback_results[-1] == replicas
+
+    new_replicas = replicas[2:] + make_replicas(["new"])
+    ray.get(host.notify_changed.remote(key, new_replicas))
+    while callback_results[-1] != new_replicas:
+        await asyncio.sleep(0.1)
+    assert client.object_snapshots[key] == new_replicas
+
+
+@pytest.mark.asyncio
+async def test_client_host_restart(serve_instance):
+    host = ray.remote(LongPollHost).remote()
+    callback_results = {"key_1": [], "key_2": []}
+    client = LongPollClient(
+        host,
+        {key: callback_results[key].append for key in callback_results},
+        call_in_event_loop=get_or_create_event_loop(),
+    )
+    ray.get(host.notify_changed.remote("key_1", 1))
+    ray.get(host.notify_changed.remote("key_2", 2))
+    while not all(callback_results.values()):
+        await asyncio.sleep(0.1)
+
+    # The restarted host only has one of the keys yet. The pending poll of the
+    # previous host returns after a change and the client polls the new host.
+    new_host = ray.remote(LongPollHost).remote()
+    ray.get(new_host.notify_changed.remote("key_1", 10))
+    client.host_actor = new_host
+    ray.get(host.notify_changed.remote("key_1", 1))
+
+    while callback_results["key_1"][-1] != 10:
+        await asyncio.sleep(0.1)
+    assert client.snapshot_ids["key_2"] == -1
+    ray.get(new_host.notify_changed.remote("key_2", 20))
+    while callback_results["key_2"][-1] != 20:
+        await asyncio.sleep(0.1)
+
+
 def test_listen_for_change_java(serve_instance):
     host = ray.remote(LongPollHost).remote()
     ray.get(host.notify_changed.remote("key_1", 999))
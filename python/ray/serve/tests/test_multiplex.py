@@ -0,0 +1,163 @@
+import asyncio
+
+import pytest
+import requests
+
+import ray
+from ray import serve
+from ray._private.test_utils import wait_for_condition
+from ray.serve import multiplex
+from ray.serve.context import get_global_client
+
+
+@pytest.mark.asyncio
+async def test_decorator_validation():
+    @serve.multiplexed
+    async def load_model(model_id: str):
+        pass
+
+    @serve.multiplexed(max_num_models_per_replica=10)
+    async def load_model_2(model_id: str):
+        pass
+
+    class Model:
+        @serve.multiplexed
+        async def load_model(self, model_id: str):
+            pass
+
+    with pytest.raises(TypeError, match="async def"):
+
+        @serve.multiplexed
+        def load_model_sync(model_id: str):
+            pass
+
+    with pytest.raises(ValueError):
+
+        @serve.multiplexed(max_num_models_per_replica=0)
+        async def load_model_3(model_id: str):
+            pass
+
+    with pytest.raises(TypeError):
+
+        @serve.multiplexed(max_num_models_per_replica="1")
+        async def load_model_4(model_id: str):
+            pass
+
+    with pytest.raises(ValueError):
+
+        @serve.multiplexed(max_memory_bytes_per_replica=0)
+        async def load_model_5(model_id: str):
+            pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_class", [True, False])
+async def test_lru_eviction(use_class):
+    loads = []
+
+    if use_class:
+
+        class Model:
+            @serve.multiplexed(max_num_models_per_replica=2)
+            async def load_model(self, model_id: str):
+                loads.append(model_id)
+                return f"model-{model_id}"
+
+        load_model = Model().load_model
+    else:
+
+        @serve.multiplexed(max_num_models_per_replica=2)
+        async def load_model(model_id: str):
+            loads.append(model_id)
+            return f"model-{model_id}"
+
+    assert await load_model("1") == "model-1"
+    assert await load_model("2") == "model-2"
+    # Both models are loaded, so they aren't loaded again.
+    assert await load_model("1") == "model-1"
+    assert loads == ["1", "2"]
+
+    # "2" is the least recently used model, so it's evicted.
+    assert await load_model("3") == "model-3"
+    assert await load_model("1") == "model-1"
+    assert loads == ["1", "2", "3"]
+    assert await load_model("2") == "model-2"
+    assert loads == ["1", "2", "3", "2"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_of_same_model():
+    loads = []
+
+    @serve.multiplexed
+    async def load_model(model_id: str):
+        loads.append(model_id)
+        await asyncio.sleep(0.1)
+        return f"model-{model_id}"
+
+    results = await asyncio.gather(*[load_model("1") for _ in range(5)])
+    assert results == ["model-1"] * 5
+    assert loads == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_memory_budget(monkeypatch):
+    rss = 0
+    monkeypatch.setattr(multiplex, "_get_rss_bytes", lambda: rss)
+
+    @serve.multiplexed(max_num_models_per_replica=10, max_memory_bytes_per_replica=250)
+    async def load_model(model_id: str):
+        nonlocal rss
+        rss += 100
+        return model_id
+
+    await load_model("1")
+    await load_model("2")
+    wrapper = getattr(load_model.__wrapped__, "__serve_multiplex_wrapper_load_model")
+    assert list(wrapper._models) == ["1", "2"]
+
+    # Loading a third model exceeds the budget, so the oldest one is evicted.
+    await load_model("3")
+    assert list(wrapper._models) == ["2", "3"]
+
+
+def test_multiplexed_deployment(serve_instance):
+    @serve.deployment(num_replicas=2)
+    class Model:
+        @serve.multiplexed(max_num_models_per_replica=2)
+        async def get_model(self, model_id: str):
+            return model_id
+
+        async def __call__(self, request):
+            model_id = serve.get_multiplexed_model_id()
+            model = await self.get_model(model_id)
+            return {"model": model, "replica": serve.get_replica_context().replica_tag}
+
+    handle = serve.run(Model.bind())
+
+    # The model ID is available through HTTP headers and handle options.
+    resp = requests.get(
+        "http://127.0.0.1:8000/Model", headers={"serve_multiplexed_model_id": "1"}
+    )
+    assert resp.json()["model"] == "1"
+    result = ray.get(handle.options(multiplexed_model_id="2").remote("blah"))
+    assert result["model"] == "2"
+
+    # Loaded models are advertised to routers, which then send requests for a
+    # model to the replica that has it loaded.
+    client = get_global_client()
+
+    def model_is_advertised():
+        replicas = ray.get(client._controller._all_running_replicas.remote())
+        return any("2" in r.multiplexed_model_ids for r in replicas["Model"])
+
+    wait_for_condition(model_is_advertised)
+    model_handle = handle.options(multiplexed_model_id="2")
+    replica_tags = {ray.get(model_handle.remote("blah"))["replica"] for _ in range(10)}
+    assert replica_tags == {result["replica"]}
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s", __file__]))
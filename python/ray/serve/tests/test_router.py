@@ -138,6 +138,53 @@ async def test_replica_set(ray_instance):
     assert num_queries_set == {2, 1}
 
 
+async def test_replica_set_multiplexed_model_routing(ray_instance):
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        _num_queries = 0
+
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            self._num_queries += 1
+            return b"", "DONE"
+
+        async def num_queries(self):
+            return self._num_queries
+
+    rs = ReplicaSet("my_deployment", get_or_create_event_loop())
+    workers = [MockWorker.remote() for _ in range(2)]
+
+    def make_replicas(model_ids):
+        return [
+            RunningReplicaInfo(
+                deployment_name="my_deployment",
+                replica_tag=str(i),
+                actor_handle=workers[i],
+                max_concurrent_queries=100,
+                multiplexed_model_ids=model_ids[i],
+            )
+            for i in range(2)
+        ]
+
+    rs.update_running_replicas(make_replicas([(), ("a",)]))
+
+    # Requests for a loaded model go to the replica that has it.
+    query = Query(
+        [], {}, RequestMetadata("request-id", "endpoint", multiplexed_model_id="a")
+    )
+    refs = [await rs.assign_replica(query) for _ in range(4)]
+    assert await asyncio.gather(*refs) == ["DONE"] * 4
+    assert await workers[0].num_queries.remote() == 0
+    assert await workers[1].num_queries.remote() == 4
+
+    # Updated model IDs of existing replicas are picked up.
+    rs.update_running_replicas(make_replicas([("a",), ()]))
+    refs = [await rs.assign_replica(query) for _ in range(4)]
+    assert await asyncio.gather(*refs) == ["DONE"] * 4
+    assert await workers[0].num_queries.remote() == 4
+    assert await workers[1].num_queries.remote() == 4
+
+
 if __name__ == "__main__":
     import sys
 
@@ -402,6 +402,38 @@ def test_http_root_path(ray_shutdown):
     assert resp.json() == {"/hello": "hello"}
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="Failing on Windows")
+def test_direct_ingress(ray_shutdown):
+    ray.init(runtime_env={"env_vars": {"RAY_SERVE_ENABLE_DIRECT_INGRESS": "1"}})
+
+    @serve.deployment(num_replicas=2)
+    class Echo:
+        async def __call__(self, request):
+            return {
+                "path": request.url.path,
+                "body": (await request.body()).decode(),
+                "query": request.query_params.get("q"),
+            }
+
+    serve.run(Echo.bind(), route_prefix="/echo")
+
+    def get_addresses():
+        return requests.get("http://127.0.0.1:8000/-/direct-ingress").json()
+
+    wait_for_condition(lambda: len(get_addresses().get("/echo", [])) == 2)
+
+    # Replicas serve requests directly, under the deployment's route prefix.
+    for address in get_addresses()["/echo"]:
+        resp = requests.post(f"{address}/echo/a?q=1", data="hi")
+        assert resp.json() == {"path": "/echo/a", "body": "hi", "query": "1"}
+        assert requests.get(f"{address}/other").status_code == 404
+
+    # The proxy redirects requests to a replica, keeping the method and body.
+    resp = requests.post("http://127.0.0.1:8000/echo/a?q=1", data="hi")
+    assert resp.history[0].status_code == 307
+    assert resp.json() == {"path": "/echo/a", "body": "hi", "query": "1"}
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="Failing on Windows")
 def test_http_proxy_fail_loudly(ray_shutdown):
     # Test that if the http server fail to start, serve.start should fail.
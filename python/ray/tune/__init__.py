@@ -39,7 +39,11 @@ from ray.tune.search.sample import (
 from ray.tune.search import create_searcher
 from ray.tune.schedulers import create_scheduler
 from ray.tune.execution.placement_groups import PlacementGroupFactory
-from ray.tune.trainable.util import with_parameters, with_resources
+from ray.tune.trainable.util import (
+    with_parameters,
+    with_reported_metrics,
+    with_resources,
+)
 from ray.tune.result_grid import ResultGrid
 from ray.tune.tuner import Tuner
 from ray.tune.tune_config import TuneConfig
@@ -54,6 +58,7 @@ __all__ = [
     "run",
     "run_experiments",
     "with_parameters",
+    "with_reported_metrics",
     "with_resources",
     "Stopper",
     "Experiment",
@@ -1,15 +1,16 @@
+import glob
 import json
 import logging
 import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from numbers import Number
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from ray.air.checkpoint import Checkpoint
 from ray.tune.syncer import SyncConfig
 from ray.tune.utils import flatten_dict
-from ray.tune.utils.serialization import TuneFunctionDecoder
 from ray.tune.utils.util import is_nan_or_inf, is_nan
 from ray.util import log_once
 
@@ -25,11 +26,15 @@ from ray.tune.result import (
     DEFAULT_METRIC,
     EXPR_PROGRESS_FILE,
     EXPR_RESULT_FILE,
+    EXPR_RESULT_PARQUET_DIR,
+    EXPR_RESULTS_INDEX_FILE,
     EXPR_PARAM_FILE,
     CONFIG_PREFIX,
     TRAINING_ITERATION,
 )
 from ray.tune.experiment import Trial
+from ray.tune.logger.parquet import _load_parquet_results, _read_parquet_columns
+from ray.tune.execution.experiment_state import _load_experiment_state
 from ray.tune.execution.trial_runner import _find_newest_experiment_checkpoint
 from ray.tune.trainable.util import TrainableUtil
 from ray.tune.utils.util import unflattened_lookup
@@ -40,6 +45,205 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_FILE_TYPE = "csv"
 
+# Column of the results index that holds the trial directories.
+_RESULTS_INDEX_TRIAL_DIR_COLUMN = "__trial_dir"
+# Key of the results index metadata that holds the columns of each trial.
+_RESULTS_INDEX_METADATA_KEY = b"ray.tune.results_index"
+
+
+def _experiment_state_mtime(experiment_dir: str) -> float:
+    paths = glob.glob(os.path.join(experiment_dir, "experiment_state*.json"))
+    paths += glob.glob(os.path.join(experiment_dir, "experiment_journal-*.jsonl"))
+    return max((os.path.getmtime(path) for path in paths), default=0)
+
+
+def _write_results_index(experiment_dir: str, trial_dataframes: Dict[str, DataFrame]):
+    """Write the results of the trials of an experiment into one Parquet file.
+
+    ``trial_dataframes`` maps trial directories relative to
+    ``experiment_dir`` to their results. The columns of each trial and their
+    dtypes are stored in the file metadata, so that the dataframes can be
+    split again. Concatenating the trials upcasts columns that only some
+    trials have, e.g. from int to float, so these are cast back on load.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    column_sets = {}
+    trial_column_sets = {}
+    for trial_dir, df in trial_dataframes.items():
+        columns = tuple((column, str(dtype)) for column, dtype in df.dtypes.items())
+        trial_column_sets[trial_dir] = column_sets.setdefault(columns, len(column_sets))
+
+    df = pd.concat(
+        [
+            df.assign(**{_RESULTS_INDEX_TRIAL_DIR_COLUMN: trial_dir})
+            for trial_dir, df in trial_dataframes.items()
+        ],
+        ignore_index=True,
+    )
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = {
+        "column_sets": [dict(columns) for columns in column_sets],
+        "trials": trial_column_sets,
+    }
+    table = table.replace_schema_metadata(
+        {
+            **(table.schema.metadata or {}),
+            _RESULTS_INDEX_METADATA_KEY: json.dumps(metadata),
+        }
+    )
+
+    tmp_file = os.path.join(experiment_dir, f".tmp_{EXPR_RESULTS_INDEX_FILE}")
+    pq.write_table(table, tmp_file)
+    os.replace(tmp_file, os.path.join(experiment_dir, EXPR_RESULTS_INDEX_FILE))
+
+
+def _load_results_index(
+    experiment_dir: str, columns: Optional[List[str]] = None
+) -> Optional[Dict[str, DataFrame]]:
+    """Load the results index of an experiment, if it's up to date.
+
+    Returns a dict mapping trial directories relative to ``experiment_dir``
+    to their results, or None if there is no index or if the experiment state
+    changed after the index was written.
+    """
+    path = os.path.join(experiment_dir, EXPR_RESULTS_INDEX_FILE)
+    if not os.path.exists(path) or os.path.getmtime(path) < _experiment_state_mtime(
+        experiment_dir
+    ):
+        return None
+
+    import pyarrow.parquet as pq
+
+    metadata = json.loads(pq.read_schema(path).metadata[_RESULTS_INDEX_METADATA_KEY])
+    if columns is not None:
+        columns = [
+            column for column in columns if column != _RESULTS_INDEX_TRIAL_DIR_COLUMN
+        ]
+        columns.append(_RESULTS_INDEX_TRIAL_DIR_COLUMN)
+    df = _read_parquet_columns(path, columns).to_pandas()
+    groups = dict(iter(df.groupby(_RESULTS_INDEX_TRIAL_DIR_COLUMN, sort=False)))
+
+    trial_dataframes = {}
+    for trial_dir, column_set in metadata["trials"].items():
+        dtypes = metadata["column_sets"][column_set]
+        if columns is not None:
+            dtypes = {
+                column: dtype for column, dtype in dtypes.items() if column in columns
+            }
+        if trial_dir in groups:
+            df = groups[trial_dir][list(dtypes)].reset_index(drop=True)
+        else:
+            df = pd.DataFrame(columns=list(dtypes))
+        trial_dataframes[trial_dir] = df.astype(dtypes)
+    return trial_dataframes
+
+
+def _results_file_type(path: str, file_type: str = DEFAULT_FILE_TYPE) -> str:
+    """Return the file type to load the results of the trial in ``path`` from."""
+    if os.path.isdir(os.path.join(path, EXPR_RESULT_PARQUET_DIR)):
+        # Results logged by the ParquetLoggerCallback are
+        # loaded much faster than csv files.
+        return "parquet"
+    return file_type
+
+
+def _load_trial_results(
+    path: str, file_type: str, metrics: Optional[List[str]] = None
+) -> DataFrame:
+    """Load the results of the trial in ``path`` from files of ``file_type``."""
+    if file_type == "parquet":
+        return _load_parquet_results(
+            os.path.join(path, EXPR_RESULT_PARQUET_DIR), columns=metrics
+        )
+    elif file_type == "json":
+        with open(os.path.join(path, EXPR_RESULT_FILE), "r") as f:
+            json_list = [json.loads(line) for line in f if line]
+        df = pd.json_normalize(json_list, sep="/")
+        if metrics is not None:
+            df = df[[metric for metric in metrics if metric in df.columns]]
+        return df
+    else:
+        force_dtype = {"trial_id": str}  # Never convert trial_id to float.
+        usecols = None
+        if metrics is not None:
+            metrics = set(metrics)
+            usecols = lambda column: column in metrics  # noqa: E731
+        return pd.read_csv(
+            os.path.join(path, EXPR_PROGRESS_FILE),
+            dtype=force_dtype,
+            usecols=usecols,
+        )
+
+
+def _load_trial_dataframes(
+    paths: List[str], load_fn: Callable[[str], DataFrame]
+) -> Dict[str, DataFrame]:
+    """Load the results of trials with ``TUNE_RESULT_LOADING_NUM_THREADS`` threads.
+
+    Paths whose results can't be loaded are skipped.
+    """
+
+    def load_trial_dataframe(path: str) -> Optional[DataFrame]:
+        try:
+            return load_fn(path)
+        except Exception:
+            return None
+
+    trial_dataframes = {}
+    if not paths:
+        return trial_dataframes
+    num_threads = int(os.environ.get("TUNE_RESULT_LOADING_NUM_THREADS", "16"))
+    with ThreadPoolExecutor(max_workers=max(1, min(num_threads, len(paths)))) as pool:
+        for path, df in zip(paths, pool.map(load_trial_dataframe, paths)):
+            if df is not None:
+                trial_dataframes[path] = df
+    return trial_dataframes
+
+
+def _trials_by_experiment_dir(trials: List[Trial]) -> Dict[str, List[Trial]]:
+    trials_by_experiment_dir = {}
+    for trial in trials:
+        if trial.logdir:
+            trials_by_experiment_dir.setdefault(trial.local_dir, []).append(trial)
+    return trials_by_experiment_dir
+
+
+def _write_results_indexes(trials: List[Trial]):
+    """Write the results of the trials into an index file per experiment.
+
+    This is called at the end of ``tune.run``, so that analyzing the
+    experiment later reads one file instead of one file per trial. The
+    results are read from the files of the trials like ``ExperimentAnalysis``
+    reads them by default. Requires ``pyarrow``.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return
+
+    for experiment_dir, experiment_trials in _trials_by_experiment_dir(trials).items():
+        relative_logdirs = {
+            str(trial.logdir): str(trial.relative_logdir) for trial in experiment_trials
+        }
+        trial_dataframes = _load_trial_dataframes(
+            list(relative_logdirs),
+            lambda path: _load_trial_results(path, _results_file_type(path)),
+        )
+        if not trial_dataframes:
+            continue
+        try:
+            _write_results_index(
+                experiment_dir,
+                {relative_logdirs[path]: df for path, df in trial_dataframes.items()},
+            )
+        except Exception:
+            logger.debug(
+                f"Could not write the results index of {experiment_dir}",
+                exc_info=True,
+            )
+
 
 @PublicAPI(stability="beta")
 class ExperimentAnalysis:
@@ -88,13 +292,15 @@ class ExperimentAnalysis:
         self.trials = trials
 
         self._configs = {}
-        self._trial_dataframes = {}
+        # Loaded on first access, see `trial_dataframes`.
+        self._trial_dataframes: Optional[Dict[str, DataFrame]] = None
 
         self.default_metric = default_metric
         if default_mode and default_mode not in ["min", "max"]:
             raise ValueError("`default_mode` has to be None or one of [min, max]")
         self.default_mode = default_mode
         self._file_type = self._validate_filetype(None)
+        self._file_type_set = False
 
         if self.default_metric is None and self.default_mode:
             # If only a mode was passed, use anonymous metric
@@ -107,8 +313,9 @@ class ExperimentAnalysis:
                 "pandas not installed. Run `pip install pandas` for "
                 "ExperimentAnalysis utilities."
             )
+            self._trial_dataframes = {}
         else:
-            self.fetch_trial_dataframes()
+            self._get_trial_paths()
 
         self._sync_config = sync_config
 
@@ -134,9 +341,8 @@ class ExperimentAnalysis:
     def _load_checkpoints_from_latest(self, latest_checkpoint: List[str]) -> None:
         # Collect all checkpoints and their directory paths.
         for path in latest_checkpoint:
-            with open(path) as f:
-                experiment_state = json.load(f, cls=TuneFunctionDecoder)
-                self._experiment_states.append(experiment_state)
+            experiment_state = _load_experiment_state(path)
+            self._experiment_states.append(experiment_state)
 
             if "checkpoints" not in experiment_state:
                 raise TuneError("Experiment state invalid; no checkpoints found.")
@@ -359,8 +565,10 @@ class ExperimentAnalysis:
         """List of all dataframes of the trials.
 
         Each dataframe is indexed by iterations and contains reported
-        metrics.
+        metrics. The dataframes are loaded the first time this is accessed.
         """
+        if self._trial_dataframes is None:
+            self.fetch_trial_dataframes()
         return self._trial_dataframes
 
     def dataframe(
@@ -711,31 +919,79 @@ class ExperimentAnalysis:
 
         return self.get_best_checkpoint(trial, "training_iteration", "max")
 
-    def fetch_trial_dataframes(self) -> Dict[str, DataFrame]:
+    def fetch_trial_dataframes(
+        self, metrics: Optional[List[str]] = None
+    ) -> Dict[str, DataFrame]:
         """Fetches trial dataframes from files.
 
+        The results of the trials are loaded in parallel by
+        ``TUNE_RESULT_LOADING_NUM_THREADS`` threads. Unless a file type was
+        set with ``set_filetype``, they are read from the results index
+        written at the end of the experiment if it's up to date, and from
+        the files of the ``ParquetLoggerCallback`` if they exist.
+
+        Args:
+            metrics: If set, only these columns of the results are loaded.
+                This is much faster for results with many columns. These
+                dataframes are returned, but not stored in
+                ``trial_dataframes``.
+
         Returns:
             A dictionary containing "trial dir" to Dataframe.
         """
-        fail_count = 0
-        force_dtype = {"trial_id": str}  # Never convert trial_id to float.
-        for path in self._get_trial_paths():
-            try:
-                if self._file_type == "json":
-                    with open(os.path.join(path, EXPR_RESULT_FILE), "r") as f:
-                        json_list = [json.loads(line) for line in f if line]
-                    df = pd.json_normalize(json_list, sep="/")
-                elif self._file_type == "csv":
-                    df = pd.read_csv(
-                        os.path.join(path, EXPR_PROGRESS_FILE), dtype=force_dtype
-                    )
-                self.trial_dataframes[path] = df
-            except Exception:
-                fail_count += 1
+        trial_paths = self._get_trial_paths()
+        trial_dataframes = {}
+        if not self._file_type_set:
+            trial_dataframes.update(self._load_results_indexes(metrics))
+
+        paths_to_load = [path for path in trial_paths if path not in trial_dataframes]
+        loaded = _load_trial_dataframes(
+            paths_to_load, lambda path: self._load_trial_dataframe(path, metrics)
+        )
+        trial_dataframes.update(loaded)
 
+        fail_count = len(paths_to_load) - len(loaded)
         if fail_count:
             logger.debug("Couldn't read results from {} paths".format(fail_count))
-        return self.trial_dataframes
+        trial_dataframes = {
+            path: trial_dataframes[path]
+            for path in trial_paths
+            if path in trial_dataframes
+        }
+        if metrics is None:
+            self._trial_dataframes = trial_dataframes
+        return trial_dataframes
+
+    def _load_trial_dataframe(
+        self, path: str, metrics: Optional[List[str]] = None
+    ) -> DataFrame:
+        file_type = self._file_type
+        if not self._file_type_set:
+            file_type = _results_file_type(path, file_type)
+        return _load_trial_results(path, file_type, metrics)
+
+    def _load_results_indexes(
+        self, metrics: Optional[List[str]] = None
+    ) -> Dict[str, DataFrame]:
+        trial_dataframes = {}
+        for experiment_dir, trials in _trials_by_experiment_dir(
+            self.trials or []
+        ).items():
+            try:
+                results_index = _load_results_index(experiment_dir, metrics)
+            except Exception:
+                logger.debug(
+                    f"Could not load the results index of {experiment_dir}",
+                    exc_info=True,
+                )
+                continue
+            if results_index is None:
+                continue
+            for trial in trials:
+                df = results_index.get(str(trial.relative_logdir))
+                if df is not None:
+                    trial_dataframes[str(trial.logdir)] = df
+        return trial_dataframes
 
     def stats(self) -> Dict:
         """Returns a dictionary of the statistics of the experiment.
@@ -757,10 +1013,14 @@ class ExperimentAnalysis:
         """Overrides the existing file type.
 
         Args:
-            file_type: Read results from json or csv files. Has to be one
-                of [None, json, csv]. Defaults to csv.
+            file_type: Read results from json, csv or parquet files. Has to
+                be one of [None, json, csv, parquet]. Defaults to the
+                results index written at the end of the experiment, then to
+                parquet files if they were logged with the
+                ``ParquetLoggerCallback``, and csv otherwise.
         """
         self._file_type = self._validate_filetype(file_type)
+        self._file_type_set = file_type is not None
         self.fetch_trial_dataframes()
         return True
 
@@ -815,8 +1075,10 @@ class ExperimentAnalysis:
         return _trial_paths
 
     def _validate_filetype(self, file_type: Optional[str] = None):
-        if file_type not in {None, "json", "csv"}:
-            raise ValueError("`file_type` has to be None or one of [json, csv].")
+        if file_type not in {None, "json", "csv", "parquet"}:
+            raise ValueError(
+                "`file_type` has to be None or one of [json, csv, parquet]."
+            )
         return file_type or DEFAULT_FILE_TYPE
 
     def _validate_metric(self, metric: str) -> str:
@@ -1,8 +1,9 @@
 from collections import Counter
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import click
+import json
 import logging
 import os
 import time
@@ -13,6 +14,7 @@ from ray.tune import TuneError
 
 from ray.tune.syncer import SyncConfig, get_node_to_storage_syncer
 from ray.tune.experiment import Trial
+from ray.tune.utils.serialization import TuneFunctionDecoder, TuneFunctionEncoder
 
 
 logger = logging.getLogger(__name__)
@@ -85,6 +87,174 @@ def _find_newest_experiment_checkpoint(experiment_dir: str) -> Optional[str]:
     return max(candidate_paths)
 
 
+def _load_experiment_state(experiment_state_path: str) -> Dict[str, Any]:
+    """Load an experiment state file and replay its journal, if any.
+
+    See ``_ExperimentStateJournal`` for the format.
+    """
+    with open(experiment_state_path, "r") as f:
+        runner_state = json.load(f, cls=TuneFunctionDecoder)
+
+    journal_file = runner_state.pop("journal", None)
+    trial_ids = runner_state.pop("trial_ids", None)
+    if journal_file is None:
+        return runner_state
+
+    trial_states = dict(zip(trial_ids, runner_state["checkpoints"]))
+    journal_path = os.path.join(os.path.dirname(experiment_state_path), journal_file)
+    if os.path.exists(journal_path):
+        with open(journal_path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line, cls=TuneFunctionDecoder)
+                except json.JSONDecodeError:
+                    # Only the last entry can be incomplete, if the experiment
+                    # stopped while it was written.
+                    logger.warning(
+                        f"Ignoring incomplete entry at the end of {journal_path}."
+                    )
+                    break
+                if "trial_id" in entry:
+                    trial_states[entry["trial_id"]] = entry["state"]
+                else:
+                    runner_state["runner_data"] = entry["runner_data"]
+                    runner_state["stats"] = entry["stats"]
+
+    runner_state["checkpoints"] = list(trial_states.values())
+    return runner_state
+
+
+class _ExperimentStateJournal:
+    """Saves the experiment state as a snapshot plus an append-only journal.
+
+    The snapshot has the same format as an experiment state written in full,
+    plus the trial IDs and the name of its journal. Each save appends the
+    runner state and the states of the trials that changed since the last save
+    to the journal, so its cost doesn't grow with the number of unchanged
+    trials. Once the journal has more entries than the snapshot has trials
+    (and at least ``min_compaction_entries``), or when compaction is forced,
+    a new snapshot is written and a new journal started. This keeps restoring
+    within about twice the cost of reading a full snapshot.
+    """
+
+    def __init__(
+        self,
+        experiment_dir: str,
+        experiment_state_file_name: str,
+        session_str: str,
+        min_compaction_entries: int = 100,
+    ):
+        self.experiment_dir = experiment_dir
+        self._experiment_state_file_name = experiment_state_file_name
+        self._session_str = session_str
+        self._min_compaction_entries = min_compaction_entries
+
+        self._generation = 0
+        # Not set until the first snapshot is written.
+        self._journal_file: Optional[str] = None
+        self._num_journal_entries = 0
+        self._num_snapshot_trials = 0
+        # Trial ID -> JSON state last written to the snapshot or journal.
+        self._saved_trial_states: Dict[str, str] = {}
+
+    def save(
+        self,
+        trial_states: Dict[str, str],
+        runner_data: Dict[str, Any],
+        stats: Dict[str, Any],
+        compact: bool = False,
+    ):
+        """Save the experiment state.
+
+        Args:
+            trial_states: Mapping of trial IDs to their JSON states. Trials
+                whose state is the same object as in the last save are
+                considered unchanged.
+            runner_data: State of the trial runner.
+            stats: Experiment metadata.
+            compact: Write a new snapshot even if the journal is short.
+        """
+        changed_trial_states = {
+            trial_id: state
+            for trial_id, state in trial_states.items()
+            if self._saved_trial_states.get(trial_id) is not state
+        }
+        max_journal_entries = max(
+            self._num_snapshot_trials, self._min_compaction_entries
+        )
+        if (
+            compact
+            or self._journal_file is None
+            or self._num_journal_entries + len(changed_trial_states)
+            >= max_journal_entries
+        ):
+            self._write_snapshot(trial_states, runner_data, stats)
+        else:
+            self._append_to_journal(changed_trial_states, runner_data, stats)
+        self._saved_trial_states.update(changed_trial_states)
+
+    def _write_snapshot(
+        self,
+        trial_states: Dict[str, str],
+        runner_data: Dict[str, Any],
+        stats: Dict[str, Any],
+    ):
+        self._generation += 1
+        journal_file = (
+            f"experiment_journal-{self._session_str}-{self._generation}.jsonl"
+        )
+        # Create the new journal before the snapshot that refers to it.
+        open(os.path.join(self.experiment_dir, journal_file), "w").close()
+
+        runner_state = {
+            # Trials
+            "checkpoints": list(trial_states.values()),
+            "trial_ids": list(trial_states.keys()),
+            "journal": journal_file,
+            # Experiment data
+            "runner_data": runner_data,
+            # Metadata
+            "stats": stats,
+        }
+
+        tmp_file_name = os.path.join(self.experiment_dir, ".tmp_experiment_state")
+        with open(tmp_file_name, "w") as f:
+            json.dump(runner_state, f, indent=2, cls=TuneFunctionEncoder)
+
+        os.replace(
+            tmp_file_name,
+            os.path.join(self.experiment_dir, self._experiment_state_file_name),
+        )
+
+        if self._journal_file is not None:
+            try:
+                os.remove(os.path.join(self.experiment_dir, self._journal_file))
+            except FileNotFoundError:
+                pass
+        self._journal_file = journal_file
+        self._num_journal_entries = 0
+        self._num_snapshot_trials = len(trial_states)
+
+    def _append_to_journal(
+        self,
+        changed_trial_states: Dict[str, str],
+        runner_data: Dict[str, Any],
+        stats: Dict[str, Any],
+    ):
+        entries = [
+            json.dumps({"trial_id": trial_id, "state": state})
+            for trial_id, state in changed_trial_states.items()
+        ]
+        entries.append(
+            json.dumps(
+                {"runner_data": runner_data, "stats": stats}, cls=TuneFunctionEncoder
+            )
+        )
+        with open(os.path.join(self.experiment_dir, self._journal_file), "a") as f:
+            f.write("\n".join(entries) + "\n")
+        self._num_journal_entries += len(entries)
+
+
 class _ExperimentCheckpointManager:
     """Helper class for managing experiment-level checkpoints.
 
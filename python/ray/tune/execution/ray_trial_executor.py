@@ -10,7 +10,17 @@ from collections import deque, defaultdict, Counter
 from contextlib import contextmanager
 from enum import Enum
 from functools import partial
-from typing import Callable, Dict, Iterable, List, Optional, Set, Union, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+    Tuple,
+)
 
 import ray
 from ray.actor import ActorHandle
@@ -52,6 +62,22 @@ ENV_VARS_TO_PROPAGATE = {
 }
 
 
+def _get_reuse_key(resource_request: ResourceRequest) -> Hashable:
+    """Return a key shared by requests whose resources are interchangeable.
+
+    The placement strategy doesn't matter for placement groups with a single
+    bundle, so their resources can be used by any request for the same bundle.
+    """
+    bundles = resource_request.bundles
+    if len(bundles) > 1:
+        return "request", resource_request
+    return (
+        "bundle",
+        resource_request.head_bundle_is_empty,
+        tuple(sorted(bundles[0].items())),
+    )
+
+
 class _ActorClassCache:
     """Caches actor classes.
 
@@ -214,6 +240,11 @@ class RayTrialExecutor:
         self._get_next_event_wait = int(
             os.environ.get("TUNE_GET_EXECUTOR_EVENT_WAIT_S", "5")
         )
+        # Max number of ready training results returned at once by
+        # `get_next_executor_events`.
+        self._max_results_per_step = int(
+            os.environ.get("TUNE_MAX_RESULTS_PER_STEP", "1000")
+        )
         if force_trial_cleanup:
             self._trial_cleanup = _TrialCleanup(force_trial_cleanup)
         else:
@@ -230,9 +261,13 @@ class RayTrialExecutor:
         # Actor re-use.
         # For details, see docstring of `_maybe_cache_trial_actor()`
         self._reuse_actors = reuse_actors
+        # Resource request -> list of (actor, resources, trainable name)
         self._resource_request_to_cached_actors: Dict[
-            ResourceRequest, List[Tuple[ray.actor.ActorHandle, AcquiredResources]]
+            ResourceRequest,
+            List[Tuple[ray.actor.ActorHandle, AcquiredResources, str]],
         ] = defaultdict(list)
+        # Trainables that failed to reset, so that we don't try again.
+        self._trainables_without_reset: Set[str] = set()
 
         # Trials for which we requested resources
         self._staged_trials = set()  # Staged trials
@@ -340,7 +375,7 @@ class RayTrialExecutor:
         for trial in self._staged_trials:
             resource_request = trial.placement_group_factory
             # If we have a cached actor for these resources, return
-            if self._resource_request_to_cached_actors[resource_request]:
+            if self._has_cached_actor(resource_request):
                 return trial
 
             # If the resources are available from the resource manager, return
@@ -351,38 +386,89 @@ class RayTrialExecutor:
 
         return None
 
+    def _has_cached_actor(self, resource_request: ResourceRequest) -> bool:
+        if self._resource_request_to_cached_actors[resource_request]:
+            return True
+        reuse_key = _get_reuse_key(resource_request)
+        cached_actors = self._resource_request_to_cached_actors
+        return any(
+            actors and _get_reuse_key(cached_request) == reuse_key
+            for cached_request, actors in cached_actors.items()
+        )
+
+    def _pop_cached_actor(
+        self, resource_request: ResourceRequest
+    ) -> Optional[Tuple[ray.actor.ActorHandle, AcquiredResources, str]]:
+        """Pop a cached actor whose resources can be used for the request."""
+        if self._resource_request_to_cached_actors[resource_request]:
+            return self._resource_request_to_cached_actors[resource_request].pop(0)
+        reuse_key = _get_reuse_key(resource_request)
+        for cached_request, actors in self._resource_request_to_cached_actors.items():
+            if actors and _get_reuse_key(cached_request) == reuse_key:
+                return actors.pop(0)
+        return None
+
     def _maybe_use_cached_actor(self, trial, logger_creator) -> Optional[ActorHandle]:
+        """Reuse a cached actor, or at least its resources, for the trial.
+
+        The actor is reused if it runs the same trainable and can be reset to
+        the trial config. Otherwise, it is stopped and the trial starts a new
+        actor in its placement group, which is still faster than scheduling a
+        new placement group.
+        """
         if not self._reuse_actors:
             return None
 
         resource_request = trial.placement_group_factory
-        if not self._resource_request_to_cached_actors[resource_request]:
+        cached = self._pop_cached_actor(resource_request)
+        if not cached:
             return None
 
-        actor, acquired_resources = self._resource_request_to_cached_actors[
-            resource_request
-        ].pop(0)
-
-        logger.debug(f"Trial {trial}: Reusing cached actor " f"{actor}")
+        actor, acquired_resources, trainable_name = cached
+        self._trial_to_acquired_resources[trial] = acquired_resources
 
-        trial.set_runner(actor)
+        # We are reusing existing resources, so we need to cancel the
+        # resource request that we originally scheduled for this trial.
+        self._resource_manager.cancel_resource_request(resource_request)
 
-        if not self.reset_trial(
-            trial, trial.config, trial.experiment_tag, logger_creator
+        if (
+            trainable_name == trial.trainable_name
+            and trainable_name not in self._trainables_without_reset
         ):
-            raise _AbortTrialExecution(
-                "Trainable runner reuse requires reset_config() to be "
-                "implemented and return True."
-            )
-
-        self._trial_to_acquired_resources[trial] = acquired_resources
+            logger.debug(f"Trial {trial}: Reusing cached actor " f"{actor}")
+            trial.set_runner(actor)
+            try:
+                reset = self._reset_trial(
+                    trial, trial.config, trial.experiment_tag, logger_creator
+                )
+            except GetTimeoutError:
+                # Only this actor is replaced, as other actors of the
+                # trainable may still be reset in time.
+                logger.exception("Trial %s: reset timed out.", trial)
+            else:
+                if reset:
+                    return actor
 
-        # We are reusing an existing actor (and its resources),
-        # so we need to cancel the resource request that we originally scheduled
-        # for this trial.
-        self._resource_manager.cancel_resource_request(resource_request)
+                self._trainables_without_reset.add(trainable_name)
+                if log_once("tune_actor_reuse_reset_failed"):
+                    logger.warning(
+                        f"Could not reuse the actor of trainable {trainable_name} "
+                        "as its reset_config() is not implemented or returned "
+                        "False. Tune will start new actors in the resources of "
+                        "the cached actors instead. Implement reset_config() to "
+                        "reuse actors, or set `reuse_actors=False`."
+                    )
+            trial.set_runner(None)
 
-        return actor
+        logger.debug(f"Trial {trial}: Reusing resources of cached actor {actor}")
+        future = actor.stop.remote()
+        # The trial uses the resources now, so they aren't freed when the stop
+        # future resolves. Instead, the actor exits once it's stopped.
+        actor.__ray_terminate__.remote()
+        self._futures[future] = (_ExecutorEventType.STOP_RESULT, None)
+        if self._trial_cleanup:  # force trial cleanup within a deadline
+            self._trial_cleanup.add(future)
+        return None
 
     def _setup_remote_runner(self, trial):
         trial.init_logdir()
@@ -406,15 +492,18 @@ class RayTrialExecutor:
             )
         _actor_cls = _class_cache.get(trainable_cls)
 
-        resource_request = trial.placement_group_factory
-        acquired_resources = self._resource_manager.acquire_resources(
-            resource_request=resource_request
-        )
-
+        # The resources of a cached actor may have been reused above.
+        acquired_resources = self._trial_to_acquired_resources.get(trial)
         if not acquired_resources:
-            return None
+            resource_request = trial.placement_group_factory
+            acquired_resources = self._resource_manager.acquire_resources(
+                resource_request=resource_request
+            )
 
-        self._trial_to_acquired_resources[trial] = acquired_resources
+            if not acquired_resources:
+                return None
+
+            self._trial_to_acquired_resources[trial] = acquired_resources
 
         [full_actor_class] = acquired_resources.annotate_remote_entities([_actor_cls])
 
@@ -588,15 +677,15 @@ class RayTrialExecutor:
 
         acquired_resources = self._trial_to_acquired_resources[trial]
         cached_resource_request = acquired_resources.resource_request
+        reuse_key = _get_reuse_key(cached_resource_request)
 
-        staged_resource_count = self._count_staged_resources()
         if (
             # If we have at least one cached actor already
             any(v for v in self._resource_request_to_cached_actors.values())
-            # and we haven't requested resources for an actor with the
-            # same resources as the actor we want to cache
-            and len(self._resource_request_to_cached_actors[cached_resource_request])
-            >= staged_resource_count[cached_resource_request]
+            # and we haven't requested resources for an actor with
+            # compatible resources as the actor we want to cache
+            and self._count_cached_actors_by_reuse_key()[reuse_key]
+            >= self._count_staged_resources_by_reuse_key()[reuse_key]
             # then we don't have an immediate need for the actor and don't
             # want to cache it.
         ):
@@ -610,7 +699,7 @@ class RayTrialExecutor:
         logger.debug(f"Caching actor of trial {trial} for re-use")
 
         self._resource_request_to_cached_actors[cached_resource_request].append(
-            (trial.runner, acquired_resources)
+            (trial.runner, acquired_resources, trial.trainable_name)
         )
         self._trial_to_acquired_resources.pop(trial)
 
@@ -783,6 +872,22 @@ class RayTrialExecutor:
         Returns:
             True if `reset_config` is successful else False.
         """
+        try:
+            return self._reset_trial(
+                trial, new_config, new_experiment_tag, logger_creator
+            )
+        except GetTimeoutError:
+            logger.exception("Trial %s: reset timed out.", trial)
+            return False
+
+    def _reset_trial(
+        self,
+        trial: Trial,
+        new_config: Dict,
+        new_experiment_tag: str,
+        logger_creator: Optional[Callable[[Dict], "ray.tune.Logger"]] = None,
+    ) -> bool:
+        """Like `reset_trial`, but raises GetTimeoutError if the reset timed out."""
         trial.set_experiment_tag(new_experiment_tag)
         trial.set_config(new_config)
         trainable = trial.runner
@@ -797,15 +902,10 @@ class RayTrialExecutor:
 
         with self._change_working_directory(trial):
             with warn_if_slow("reset"):
-                try:
-                    reset_val = ray.get(
-                        trainable.reset.remote(extra_config, logger_creator),
-                        timeout=DEFAULT_GET_TIMEOUT,
-                    )
-                except GetTimeoutError:
-                    logger.exception("Trial %s: reset timed out.", trial)
-                    return False
-        return reset_val
+                return ray.get(
+                    trainable.reset.remote(extra_config, logger_creator),
+                    timeout=DEFAULT_GET_TIMEOUT,
+                )
 
     def has_resources_for_trial(self, trial: Trial) -> bool:
         """Returns whether there are resources available for this trial.
@@ -825,7 +925,7 @@ class RayTrialExecutor:
 
         return (
             trial in self._staged_trials
-            or self._resource_request_to_cached_actors[resource_request]
+            or self._has_cached_actor(resource_request)
             or len(self._staged_trials) < self._max_staged_actors
             or self._resource_manager.has_resources_ready(resource_request)
         )
@@ -856,6 +956,18 @@ class RayTrialExecutor:
     def _count_staged_resources(self):
         return self._staged_resources
 
+    def _count_staged_resources_by_reuse_key(self) -> Counter:
+        counts = Counter()
+        for resource_request, count in self._staged_resources.items():
+            counts[_get_reuse_key(resource_request)] += count
+        return counts
+
+    def _count_cached_actors_by_reuse_key(self) -> Counter:
+        counts = Counter()
+        for resource_request, actors in self._resource_request_to_cached_actors.items():
+            counts[_get_reuse_key(resource_request)] += len(actors)
+        return counts
+
     def _cleanup_cached_actors(
         self, search_ended: bool = False, force_all: bool = False
     ):
@@ -894,14 +1006,18 @@ class RayTrialExecutor:
             # (if the search ended).
             return
 
-        staged_resources = self._count_staged_resources()
+        staged_resources = self._count_staged_resources_by_reuse_key()
+        # Cached actors can be used by staged trials with compatible resources,
+        # so we keep as many of them as there are such trials.
+        kept_actors = Counter()
 
         for resource_request, actors in self._resource_request_to_cached_actors.items():
-            while len(actors) > staged_resources.get(resource_request, 0) or (
-                force_all and len(actors)
+            reuse_key = _get_reuse_key(resource_request)
+            while actors and (
+                force_all
+                or kept_actors[reuse_key] + len(actors) > staged_resources[reuse_key]
             ):
-                actor, acquired_resources = actors[-1]
-                actors.pop()
+                actor, acquired_resources, _ = actors.pop()
                 future = actor.stop.remote()
                 self._futures[future] = (
                     _ExecutorEventType.STOP_RESULT,
@@ -909,14 +1025,18 @@ class RayTrialExecutor:
                 )
                 if self._trial_cleanup:  # force trial cleanup within a deadline
                     self._trial_cleanup.add(future)
+            kept_actors[reuse_key] += len(actors)
 
     def _resolve_stop_event(
         self,
         future: ray.ObjectRef,
-        acquired_resources: AcquiredResources,
+        acquired_resources: Optional[AcquiredResources],
         timeout: Optional[float] = None,
     ):
-        """Resolve stopping future (Trainable.cleanup() and free resources."""
+        """Resolve stopping future (Trainable.cleanup() and free resources.
+
+        ``acquired_resources`` is None if they were passed on to another trial.
+        """
         try:
             # Let's check one more time if the future resolved. If not,
             # we remove the PG which will terminate the actor.
@@ -934,7 +1054,8 @@ class RayTrialExecutor:
                     f"{traceback.format_exc()}"
                 )
         finally:
-            self._resource_manager.free_resources(acquired_resources)
+            if acquired_resources is not None:
+                self._resource_manager.free_resources(acquired_resources)
 
     def _do_force_trial_cleanup(self) -> None:
         if self._trial_cleanup:
@@ -1299,24 +1420,88 @@ class RayTrialExecutor:
                     _ExecutorEventType.SAVING_RESULT,
                     _ExecutorEventType.RESTORING_RESULT,
                 )
-                try:
-                    future_result = ray.get(ready_future)
-                    # For local mode
-                    if isinstance(future_result, _LocalWrapper):
-                        future_result = future_result.unwrap()
-                    logger.debug(f"Returning [{result_type}] for trial {trial}")
-                    return _ExecutorEvent(
-                        result_type,
-                        trial,
-                        result={_ExecutorEvent.KEY_FUTURE_RESULT: future_result},
-                    )
-                except Exception as e:
-                    return _ExecutorEvent(
-                        result_type,
-                        trial,
-                        result={
-                            _ExecutorEvent.KEY_EXCEPTION: e.as_instanceof_cause()
-                            if isinstance(e, RayTaskError)
-                            else _TuneNoNextExecutorEventError(traceback.format_exc())
-                        },
-                    )
+                return self._resolve_future(ready_future, result_type, trial)
+
+    def _resolve_future(
+        self, future: ray.ObjectRef, result_type: _ExecutorEventType, trial: Trial
+    ) -> _ExecutorEvent:
+        try:
+            future_result = ray.get(future)
+            # For local mode
+            if isinstance(future_result, _LocalWrapper):
+                future_result = future_result.unwrap()
+            logger.debug(f"Returning [{result_type}] for trial {trial}")
+            return _ExecutorEvent(
+                result_type,
+                trial,
+                result={_ExecutorEvent.KEY_FUTURE_RESULT: future_result},
+            )
+        except Exception as e:
+            return _ExecutorEvent(
+                result_type,
+                trial,
+                result={
+                    _ExecutorEvent.KEY_EXCEPTION: e.as_instanceof_cause()
+                    if isinstance(e, RayTaskError)
+                    else _TuneNoNextExecutorEventError(traceback.format_exc())
+                },
+            )
+
+    def get_next_executor_events(
+        self, live_trials: Set[Trial], next_trial_exists: bool
+    ) -> List[_ExecutorEvent]:
+        """Get the next executor events to be processed in TrialRunner.
+
+        Waits for the next event like ``get_next_executor_event``. If it is a
+        training result, the training results of other trials that are already
+        ready are returned with it, so that TrialRunner can process them in one
+        step. These are fetched with a single ``ray.get``. At most
+        ``TUNE_MAX_RESULTS_PER_STEP`` events are returned.
+        """
+        event = self.get_next_executor_event(live_trials, next_trial_exists)
+        if (
+            event.type != _ExecutorEventType.TRAINING_RESULT
+            or self._max_results_per_step <= 1
+        ):
+            return [event]
+
+        batch = []
+        remaining = []
+        for future in self._cached_ready_futures:
+            result_type, _ = self._futures.get(future, (None, None))
+            if (
+                result_type == _ExecutorEventType.TRAINING_RESULT
+                and len(batch) + 1 < self._max_results_per_step
+            ):
+                batch.append(future)
+            else:
+                remaining.append(future)
+        self._cached_ready_futures = remaining
+        if not batch:
+            return [event]
+
+        trials = [self._futures.pop(future)[1] for future in batch]
+        try:
+            future_results = ray.get(batch)
+        except Exception:
+            # At least one of the trials failed, resolve the futures one by one
+            # to attribute the error.
+            return [event] + [
+                self._resolve_future(future, _ExecutorEventType.TRAINING_RESULT, trial)
+                for future, trial in zip(batch, trials)
+            ]
+
+        events = [event]
+        for trial, future_result in zip(trials, future_results):
+            # For local mode
+            if isinstance(future_result, _LocalWrapper):
+                future_result = future_result.unwrap()
+            events.append(
+                _ExecutorEvent(
+                    _ExecutorEventType.TRAINING_RESULT,
+                    trial,
+                    result={_ExecutorEvent.KEY_FUTURE_RESULT: future_result},
+                )
+            )
+        logger.debug(f"Returning {len(events)} training results")
+        return events
@@ -1,7 +1,6 @@
 from typing import Any, Dict, List, Optional, Union, Tuple, Set
 
 from datetime import datetime
-import json
 import logging
 import os
 import time
@@ -15,8 +14,10 @@ from ray.exceptions import RayTaskError
 from ray.tune.error import _TuneStopTrialError, _TuneRestoreError
 from ray.tune.execution.experiment_state import (
     _ExperimentCheckpointManager,
+    _ExperimentStateJournal,
     _find_newest_experiment_checkpoint,
     _experiment_checkpoint_exists,
+    _load_experiment_state,
 )
 from ray.util import get_node_ip_address
 from ray.tune import TuneError
@@ -46,7 +47,6 @@ from ray.tune.experiment import Trial
 from ray.tune.utils import warn_if_slow, flatten_dict
 from ray.tune.utils.log import Verbosity, has_verbosity
 from ray.tune.execution.placement_groups import PlacementGroupFactory
-from ray.tune.utils.serialization import TuneFunctionDecoder, TuneFunctionEncoder
 from ray.tune.web_server import TuneServer
 from ray.util.annotations import DeveloperAPI, Deprecated
 from ray.util.debug import log_once
@@ -211,6 +211,8 @@ class TrialRunner:
         self._checkpoint_period = checkpoint_period
         self._trial_checkpoint_config = trial_checkpoint_config or CheckpointConfig()
         self._checkpoint_manager = self._create_checkpoint_manager()
+        # Created on the first save, see `save_to_dir`.
+        self._experiment_state_journal: Optional[_ExperimentStateJournal] = None
 
         self._resumed = False
         resume_config = self._checkpoint_manager.resume(resume_type=resume)
@@ -302,7 +304,7 @@ class TrialRunner:
 
         return _experiment_checkpoint_exists(directory)
 
-    def save_to_dir(self, experiment_dir: Optional[str] = None):
+    def save_to_dir(self, experiment_dir: Optional[str] = None, compact: bool = False):
         """Save TrialRunner state to experiment directory.
 
         Accepts an ``experiment_dir`` argument which defaults to the
@@ -310,30 +312,35 @@ class TrialRunner:
 
         This method will save the trial runner state, the searcher state,
         and the callback states into the experiment directory.
+
+        The trial runner state is saved as a snapshot and a journal, so only
+        the states of trials that changed since the last save are written.
+        Pass ``compact=True`` to write a full snapshot.
         """
         experiment_dir = experiment_dir or self._local_checkpoint_dir
 
+        if (
+            self._experiment_state_journal is None
+            or self._experiment_state_journal.experiment_dir != experiment_dir
+        ):
+            self._experiment_state_journal = _ExperimentStateJournal(
+                experiment_dir,
+                self.experiment_state_file_name,
+                self._session_str,
+            )
+
         # Get state from trial executor and runner
-        runner_state = {
+        self._experiment_state_journal.save(
             # Trials
-            "checkpoints": list(self.trial_executor.get_checkpoints().values()),
+            trial_states=self.trial_executor.get_checkpoints(),
             # Experiment data
-            "runner_data": self.__getstate__(),
+            runner_data=self.__getstate__(),
             # Metadata
-            "stats": {
+            stats={
                 "start_time": self._start_time,
                 "timestamp": self._last_checkpoint_time,
             },
-        }
-
-        tmp_file_name = os.path.join(experiment_dir, ".tmp_experiment_state")
-
-        with open(tmp_file_name, "w") as f:
-            json.dump(runner_state, f, indent=2, cls=TuneFunctionEncoder)
-
-        os.replace(
-            tmp_file_name,
-            os.path.join(experiment_dir, self.experiment_state_file_name),
+            compact=compact,
         )
 
         self._search_alg.save_to_dir(
@@ -381,8 +388,7 @@ class TrialRunner:
         )
 
         # Actually load data
-        with open(newest_state_path, "r") as f:
-            runner_state = json.load(f, cls=TuneFunctionDecoder)
+        runner_state = _load_experiment_state(newest_state_path)
 
         # 1. Restore trial runner state
         self.__setstate__(runner_state["runner_data"])
@@ -415,7 +421,12 @@ class TrialRunner:
 
         return trials
 
-    def checkpoint(self, force: bool = False, wait: bool = False):
+    def checkpoint(
+        self,
+        force: bool = False,
+        wait: bool = False,
+        write_results_index: bool = False,
+    ):
         """Saves execution state to `self._local_checkpoint_dir`.
 
         Overwrites the current session checkpoint, which starts when self
@@ -427,8 +438,24 @@ class TrialRunner:
         Args:
             force: Forces a checkpoint despite checkpoint_period.
             wait: Wait until syncing to cloud has finished.
+            write_results_index: Also write the results of all trials into
+                one file, which is synced with the experiment state.
 
         """
+
+        def save_fn():
+            # Forced checkpoints, e.g. at the end of the experiment, write a
+            # full snapshot.
+            self.save_to_dir(compact=force)
+            if write_results_index:
+                # The index is only used while it's newer than the experiment
+                # state, so it's written after it.
+                from ray.tune.analysis.experiment_analysis import (
+                    _write_results_indexes,
+                )
+
+                _write_results_indexes(self.get_trials())
+
         with warn_if_slow(
             "experiment_checkpoint",
             message="Checkpointing the experiment state took "
@@ -442,9 +469,7 @@ class TrialRunner:
             # for previous sync to finish.
             disable=self._checkpoint_manager.auto_checkpoint_enabled or force or wait,
         ):
-            self._checkpoint_manager.checkpoint(
-                save_fn=self.save_to_dir, force=force, wait=wait
-            )
+            self._checkpoint_manager.checkpoint(save_fn=save_fn, force=force, wait=wait)
 
     def resume(
         self,
@@ -529,52 +554,67 @@ class TrialRunner:
 
     def _wait_and_handle_event(self, next_trial: Optional[Trial]):
         try:
-            # Single wait of entire tune loop.
-            event = self.trial_executor.get_next_executor_event(
+            # Single wait of entire tune loop. If the first event is a training
+            # result, the other training results that are already ready are
+            # returned with it and processed in the same step.
+            events = self.trial_executor.get_next_executor_events(
                 self._live_trials, next_trial is not None
             )
-            if event.type == _ExecutorEventType.PG_READY:
-                self._on_pg_ready(next_trial)
-            elif event.type == _ExecutorEventType.NO_RUNNING_TRIAL_TIMEOUT:
-                self._insufficient_resources_manager.on_no_available_trials(
-                    self.get_trials()
-                )
-            elif event.type == _ExecutorEventType.YIELD:
-                pass
-            else:
-                assert event.type in (
-                    _ExecutorEventType.TRAINING_RESULT,
-                    _ExecutorEventType.SAVING_RESULT,
-                    _ExecutorEventType.RESTORING_RESULT,
-                )
-                trial = event.trial
-                result = event.result
-                if _ExecutorEvent.KEY_EXCEPTION in result:
-                    self._on_executor_error(
-                        trial, event.type, result[_ExecutorEvent.KEY_EXCEPTION]
+            self._handle_event(events[0], next_trial)
+            for event in events[1:]:
+                if event.trial.status != Trial.RUNNING:
+                    # The trial was stopped or paused while processing an
+                    # earlier event, which discards its pending result.
+                    logger.debug(
+                        f"Dropping [{event.type}] for trial {event.trial} "
+                        f"with status {event.trial.status}"
                     )
-                elif event.type == _ExecutorEventType.RESTORING_RESULT:
-                    self._on_restoring_result(trial)
-                else:
-                    assert event.type in (
-                        _ExecutorEventType.SAVING_RESULT,
-                        _ExecutorEventType.TRAINING_RESULT,
-                    ), f"Unexpected future type - {event.type}"
-                    if event.type == _ExecutorEventType.TRAINING_RESULT:
-                        self._on_training_result(
-                            trial, result[_ExecutorEvent.KEY_FUTURE_RESULT]
-                        )
-                    else:
-                        self._on_saving_result(
-                            trial, result[_ExecutorEvent.KEY_FUTURE_RESULT]
-                        )
-                    self._post_process_on_training_saving_result(trial)
+                    continue
+                self._handle_event(event, next_trial)
         except Exception as e:
             if e is TuneError or self._fail_fast == TrialRunner.RAISE:
                 raise e
             else:
                 raise TuneError(traceback.format_exc())
 
+    def _handle_event(self, event: _ExecutorEvent, next_trial: Optional[Trial]):
+        if event.type == _ExecutorEventType.PG_READY:
+            self._on_pg_ready(next_trial)
+        elif event.type == _ExecutorEventType.NO_RUNNING_TRIAL_TIMEOUT:
+            self._insufficient_resources_manager.on_no_available_trials(
+                self.get_trials()
+            )
+        elif event.type == _ExecutorEventType.YIELD:
+            pass
+        else:
+            assert event.type in (
+                _ExecutorEventType.TRAINING_RESULT,
+                _ExecutorEventType.SAVING_RESULT,
+                _ExecutorEventType.RESTORING_RESULT,
+            )
+            trial = event.trial
+            result = event.result
+            if _ExecutorEvent.KEY_EXCEPTION in result:
+                self._on_executor_error(
+                    trial, event.type, result[_ExecutorEvent.KEY_EXCEPTION]
+                )
+            elif event.type == _ExecutorEventType.RESTORING_RESULT:
+                self._on_restoring_result(trial)
+            else:
+                assert event.type in (
+                    _ExecutorEventType.SAVING_RESULT,
+                    _ExecutorEventType.TRAINING_RESULT,
+                ), f"Unexpected future type - {event.type}"
+                if event.type == _ExecutorEventType.TRAINING_RESULT:
+                    self._on_training_result(
+                        trial, result[_ExecutorEvent.KEY_FUTURE_RESULT]
+                    )
+                else:
+                    self._on_saving_result(
+                        trial, result[_ExecutorEvent.KEY_FUTURE_RESULT]
+                    )
+                self._post_process_on_training_saving_result(trial)
+
     def step(self):
         """Runs one step of the trial event loop.
 
@@ -1214,6 +1254,7 @@ class TrialRunner:
             "trial_executor",
             "_callbacks",
             "_checkpoint_manager",
+            "_experiment_state_journal",
             "_local_checkpoint_dir",
             "_sync_config",
             "_experiment_dir_name",
@@ -0,0 +1,101 @@
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_ALL_KEYS = object()
+
+
+def _append_to_file(path: str, chunks: List[str]):
+    with open(path, "at") as f:
+        f.write("".join(chunks))
+
+
+class _BufferedWriter:
+    """Buffers items by key and writes them from a background thread.
+
+    ``write_fn(key, items)`` is called with the items added for a key since
+    they were last written, in order. Buffered items are written every
+    ``flush_interval_s`` seconds by a daemon thread, so that slow file systems
+    don't block the caller. ``flush`` writes them right away from the calling
+    thread. If ``flush_interval_s`` is 0, items are written as they are added.
+
+    Items that weren't flushed yet are lost if the process exits without
+    calling ``close``.
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Any, List[Any]], None],
+        flush_interval_s: Optional[float] = None,
+    ):
+        if flush_interval_s is None:
+            flush_interval_s = float(
+                os.environ.get("TUNE_LOGGER_FLUSH_INTERVAL_S", "5")
+            )
+        self._write_fn = write_fn
+        self._flush_interval_s = flush_interval_s
+        self._init()
+
+    def _init(self):
+        # Protects `_buffers`.
+        self._lock = threading.Lock()
+        # Makes sure the items of a key are written in order.
+        self._write_lock = threading.Lock()
+        self._buffers: Dict[Any, List[Any]] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __getstate__(self) -> Dict:
+        return {
+            "_write_fn": self._write_fn,
+            "_flush_interval_s": self._flush_interval_s,
+        }
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._init()
+
+    def add(self, key: Any, item: Any):
+        if self._flush_interval_s <= 0:
+            with self._write_lock:
+                self._write_fn(key, [item])
+            return
+
+        with self._lock:
+            self._buffers.setdefault(key, []).append(item)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def flush(self, key: Any = _ALL_KEYS):
+        """Write the buffered items of the key, or of all keys."""
+        with self._write_lock:
+            with self._lock:
+                if key is _ALL_KEYS:
+                    buffers, self._buffers = self._buffers, {}
+                elif key in self._buffers:
+                    buffers = {key: self._buffers.pop(key)}
+                else:
+                    buffers = {}
+            for buffered_key, items in buffers.items():
+                self._write_fn(buffered_key, items)
+
+    def _run(self):
+        while not self._stop_event.wait(self._flush_interval_s):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to write buffered results.")
+
+    def close(self):
+        """Stop the background thread and write all buffered items."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop_event.set()
+            thread.join()
+            self._stop_event.clear()
+        self.flush()
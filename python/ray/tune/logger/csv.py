@@ -1,9 +1,11 @@
 import csv
+import io
 import logging
 import os
 
-from typing import TYPE_CHECKING, Dict, TextIO
+from typing import TYPE_CHECKING, Dict, List
 
+from ray.tune.logger.buffered import _BufferedWriter, _append_to_file
 from ray.tune.logger.logger import Logger, LoggerCallback
 from ray.tune.result import EXPR_PROGRESS_FILE
 from ray.tune.utils import flatten_dict
@@ -74,16 +76,24 @@ class CSVLoggerCallback(LoggerCallback):
 
         {"a": {"b": 1, "c": 2}} -> {"a/b": 1, "a/c": 2}
 
+    Results are buffered and written to disk by a background thread every
+    ``TUNE_LOGGER_FLUSH_INTERVAL_S`` seconds, and when a trial saves a
+    checkpoint or ends.
+
     """
 
     def __init__(self):
         self._trial_continue: Dict["Trial", bool] = {}
-        self._trial_files: Dict["Trial", TextIO] = {}
+        self._trial_files: Dict["Trial", str] = {}
         self._trial_csv: Dict["Trial", csv.DictWriter] = {}
+        # Rows are formatted into this buffer and written to the progress
+        # files by a background thread.
+        self._csv_buffer = io.StringIO()
+        self._writer = _BufferedWriter(_append_to_file)
 
     def _setup_trial(self, trial: "Trial"):
         if trial in self._trial_files:
-            self._trial_files[trial].close()
+            self._writer.flush(self._trial_files[trial])
 
         # Make sure logdir exists
         trial.init_logdir()
@@ -91,7 +101,7 @@ class CSVLoggerCallback(LoggerCallback):
         self._trial_continue[trial] = (
             os.path.exists(local_file) and os.path.getsize(local_file) > 0
         )
-        self._trial_files[trial] = open(local_file, "at")
+        self._trial_files[trial] = local_file
         self._trial_csv[trial] = None
 
     def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
@@ -103,21 +113,28 @@ class CSVLoggerCallback(LoggerCallback):
         result = flatten_dict(tmp, delimiter="/")
 
         if not self._trial_csv[trial]:
-            self._trial_csv[trial] = csv.DictWriter(
-                self._trial_files[trial], result.keys()
-            )
+            self._trial_csv[trial] = csv.DictWriter(self._csv_buffer, result.keys())
             if not self._trial_continue[trial]:
                 self._trial_csv[trial].writeheader()
 
         self._trial_csv[trial].writerow(
             {k: v for k, v in result.items() if k in self._trial_csv[trial].fieldnames}
         )
-        self._trial_files[trial].flush()
+        self._writer.add(self._trial_files[trial], self._csv_buffer.getvalue())
+        self._csv_buffer.seek(0)
+        self._csv_buffer.truncate()
+
+    def log_trial_save(self, trial: "Trial"):
+        if trial in self._trial_files:
+            self._writer.flush(self._trial_files[trial])
 
     def log_trial_end(self, trial: "Trial", failed: bool = False):
         if trial not in self._trial_files:
             return
 
         del self._trial_csv[trial]
-        self._trial_files[trial].close()
+        self._writer.flush(self._trial_files[trial])
         del self._trial_files[trial]
+
+    def on_experiment_end(self, trials: List["Trial"], **info):
+        self._writer.close()
@@ -3,10 +3,11 @@ import logging
 import numpy as np
 import os
 
-from typing import TYPE_CHECKING, Dict, TextIO
+from typing import TYPE_CHECKING, Dict, List
 
 import ray.cloudpickle as cloudpickle
 
+from ray.tune.logger.buffered import _BufferedWriter, _append_to_file
 from ray.tune.logger.logger import Logger, LoggerCallback
 from ray.tune.utils.util import SafeFallbackEncoder
 from ray.tune.result import (
@@ -71,38 +72,51 @@ class JsonLoggerCallback(LoggerCallback):
     Also writes to a results file and param.json file when results or
     configurations are updated. Experiments must be executed with the
     JsonLoggerCallback to be compatible with the ExperimentAnalysis tool.
+
+    Results are buffered and written to disk by a background thread every
+    ``TUNE_LOGGER_FLUSH_INTERVAL_S`` seconds, and when a trial saves a
+    checkpoint or ends.
     """
 
     def __init__(self):
         self._trial_configs: Dict["Trial", Dict] = {}
-        self._trial_files: Dict["Trial", TextIO] = {}
+        self._trial_files: Dict["Trial", str] = {}
+        # Results are written by a background thread.
+        self._writer = _BufferedWriter(_append_to_file)
 
     def log_trial_start(self, trial: "Trial"):
         if trial in self._trial_files:
-            self._trial_files[trial].close()
+            self._writer.flush(self._trial_files[trial])
 
         # Update config
         self.update_config(trial, trial.config)
 
         # Make sure logdir exists
         trial.init_logdir()
-        local_file = os.path.join(trial.logdir, EXPR_RESULT_FILE)
-        self._trial_files[trial] = open(local_file, "at")
+        self._trial_files[trial] = os.path.join(trial.logdir, EXPR_RESULT_FILE)
 
     def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
         if trial not in self._trial_files:
             self.log_trial_start(trial)
-        json.dump(result, self._trial_files[trial], cls=SafeFallbackEncoder)
-        self._trial_files[trial].write("\n")
-        self._trial_files[trial].flush()
+        self._writer.add(
+            self._trial_files[trial],
+            json.dumps(result, cls=SafeFallbackEncoder) + "\n",
+        )
+
+    def log_trial_save(self, trial: "Trial"):
+        if trial in self._trial_files:
+            self._writer.flush(self._trial_files[trial])
 
     def log_trial_end(self, trial: "Trial", failed: bool = False):
         if trial not in self._trial_files:
             return
 
-        self._trial_files[trial].close()
+        self._writer.flush(self._trial_files[trial])
         del self._trial_files[trial]
 
+    def on_experiment_end(self, trials: List["Trial"], **info):
+        self._writer.close()
+
     def update_config(self, trial: "Trial", config: Dict):
         self._trial_configs[trial] = config
 
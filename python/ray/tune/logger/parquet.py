@@ -0,0 +1,200 @@
+import glob
+import json
+import logging
+import os
+
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+
+from ray.tune.logger.buffered import _BufferedWriter
+from ray.tune.logger.logger import LoggerCallback
+from ray.tune.result import EXPR_RESULT_PARQUET_DIR
+from ray.tune.utils import flatten_dict
+from ray.tune.utils.util import SafeFallbackEncoder
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    from ray.tune.experiment.trial import Trial  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+_PART_FILE_TMPL = "part-{:06d}.parquet"
+
+
+def _to_column_value(value):
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    # Lists, arrays and other values are stored as JSON strings.
+    return json.dumps(value, cls=SafeFallbackEncoder)
+
+
+def _rows_to_table(rows: List[Dict]):
+    import pyarrow as pa
+
+    columns = {}
+    for i, row in enumerate(rows):
+        for key, value in row.items():
+            columns.setdefault(key, [None] * len(rows))[i] = _to_column_value(value)
+
+    arrays = []
+    for key, values in columns.items():
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Columns with values of different types are stored as strings.
+            arrays.append(
+                pa.array(
+                    [
+                        v if v is None or isinstance(v, str) else json.dumps(v)
+                        for v in values
+                    ]
+                )
+            )
+    return pa.Table.from_arrays(arrays, names=list(columns))
+
+
+def _part_files(parquet_dir: str) -> List[str]:
+    return sorted(glob.glob(os.path.join(parquet_dir, "part-*.parquet")))
+
+
+def _write_parquet_part(parquet_dir: str, rows: List[Dict]):
+    import pyarrow.parquet as pq
+
+    part_files = _part_files(parquet_dir)
+    index = 0
+    if part_files:
+        index = int(os.path.basename(part_files[-1])[len("part-") : -8]) + 1
+    pq.write_table(
+        _rows_to_table(rows),
+        os.path.join(parquet_dir, _PART_FILE_TMPL.format(index)),
+    )
+
+
+def _concat_part_tables(tables: List["pa.Table"]) -> "pa.Table":
+    """Concatenate part tables, whose columns can differ.
+
+    Missing columns are filled with nulls. Columns whose type differs between
+    parts are stored as doubles if they're numeric and as strings otherwise,
+    like in ``_rows_to_table()``.
+    """
+    import pyarrow as pa
+
+    column_types = {}
+    for table in tables:
+        for field in table.schema:
+            if not pa.types.is_null(field.type):
+                column_types.setdefault(field.name, set()).add(field.type)
+
+    unified_tables = []
+    for table in tables:
+        for i, field in enumerate(table.schema):
+            types = column_types.get(field.name, set())
+            if len(types) < 2 or pa.types.is_null(field.type):
+                continue
+            if all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in types):
+                column_type = pa.float64()
+            else:
+                column_type = pa.string()
+            table = table.set_column(i, field.name, table.column(i).cast(column_type))
+        unified_tables.append(table)
+    return pa.concat_tables(unified_tables, promote=True)
+
+
+def _compact_parquet_parts(parquet_dir: str):
+    """Merge the part files of a trial into its first part file."""
+    import pyarrow.parquet as pq
+
+    part_files = _part_files(parquet_dir)
+    if len(part_files) < 2:
+        return
+    table = _concat_part_tables([pq.read_table(f) for f in part_files])
+    tmp_file = os.path.join(parquet_dir, ".tmp_part.parquet")
+    pq.write_table(table, tmp_file)
+    os.replace(tmp_file, part_files[0])
+    for part_file in part_files[1:]:
+        os.remove(part_file)
+
+
+def _read_parquet_columns(path: str, columns: Optional[List[str]] = None):
+    """Read a Parquet file, only loading the given columns if they exist."""
+    import pyarrow.parquet as pq
+
+    if columns is not None:
+        names = set(pq.read_schema(path).names)
+        columns = [column for column in columns if column in names]
+    return pq.read_table(path, columns=columns)
+
+
+def _load_parquet_results(
+    parquet_dir: str, columns: Optional[List[str]] = None
+) -> "pd.DataFrame":
+    """Load the results logged by the ``ParquetLoggerCallback`` for a trial."""
+    import pandas as pd
+
+    return pd.concat(
+        [
+            _read_parquet_columns(f, columns).to_pandas()
+            for f in _part_files(parquet_dir)
+        ],
+        ignore_index=True,
+    )
+
+
+@PublicAPI(stability="alpha")
+class ParquetLoggerCallback(LoggerCallback):
+    """Logs results in Parquet format under the trial directory.
+
+    Results are flattened like in ``result.json`` dataframes, buffered, and
+    written by a background thread every ``TUNE_LOGGER_FLUSH_INTERVAL_S``
+    seconds as a new part file in ``result.parquet/``. The part files of a
+    trial are merged into one when the trial ends. Values that aren't
+    scalars, like lists, are stored as JSON strings.
+
+    ``ExperimentAnalysis`` loads these files instead of ``progress.csv``
+    when they exist, which is much faster for trials with many results.
+
+    This callback requires ``pyarrow``.
+    """
+
+    def __init__(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            logger.warning("pip install pyarrow to log results in Parquet format.")
+            raise
+        self._trial_dirs: Dict["Trial", str] = {}
+        self._writer = _BufferedWriter(_write_parquet_part)
+
+    def log_trial_start(self, trial: "Trial"):
+        if trial in self._trial_dirs:
+            self._writer.flush(self._trial_dirs[trial])
+
+        trial.init_logdir()
+        parquet_dir = os.path.join(trial.logdir, EXPR_RESULT_PARQUET_DIR)
+        os.makedirs(parquet_dir, exist_ok=True)
+        self._trial_dirs[trial] = parquet_dir
+
+    def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
+        if trial not in self._trial_dirs:
+            self.log_trial_start(trial)
+        self._writer.add(self._trial_dirs[trial], flatten_dict(result, delimiter="/"))
+
+    def log_trial_save(self, trial: "Trial"):
+        if trial in self._trial_dirs:
+            self._writer.flush(self._trial_dirs[trial])
+
+    def log_trial_end(self, trial: "Trial", failed: bool = False):
+        if trial not in self._trial_dirs:
+            return
+
+        parquet_dir = self._trial_dirs.pop(trial)
+        self._writer.flush(parquet_dir)
+        _compact_parquet_parts(parquet_dir)
+
+    def on_experiment_end(self, trials: List["Trial"], **info):
+        self._writer.close()
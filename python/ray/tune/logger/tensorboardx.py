@@ -227,7 +227,12 @@ class TBXLoggerCallback(LoggerCallback):
                         )
 
         self._trial_result[trial] = valid_result
-        self._trial_writer[trial].flush()
+
+    def log_trial_save(self, trial: "Trial"):
+        # The summary writer flushes periodically in the background, so
+        # only flush here to include all results with the checkpoint.
+        if trial in self._trial_writer:
+            self._trial_writer[trial].flush()
 
     def log_trial_end(self, trial: "Trial", failed: bool = False):
         if trial in self._trial_writer:
@@ -144,5 +144,15 @@ EXPR_PROGRESS_FILE = "progress.csv"
 # File that stores results of the trial.
 EXPR_RESULT_FILE = "result.json"
 
+# File that stores the full results of a trial that only reports some
+# metrics to the driver (see `tune.with_reported_metrics`).
+EXPR_FULL_RESULT_FILE = "result_full.json"
+
+# Directory that stores results of the trial in Parquet files.
+EXPR_RESULT_PARQUET_DIR = "result.parquet"
+
+# File that caches the results of all trials of an experiment.
+EXPR_RESULTS_INDEX_FILE = "results_index.parquet"
+
 # Config prefix when using ExperimentAnalysis.
 CONFIG_PREFIX = "config"
@@ -1,5 +1,7 @@
+import bisect
 import logging
-from typing import Dict, Optional, Union
+import math
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 import pickle
@@ -182,6 +184,65 @@ class AsyncHyperBandScheduler(FIFOScheduler):
         self.__dict__.update(save_object)
 
 
+class _RungRecord:
+    """Rewards recorded at a rung, by trial ID.
+
+    The rewards are also kept in sorted order, so percentiles are computed
+    in constant time instead of sorting all the rewards of the rung. NaN
+    rewards are recorded but ignored by ``percentile``, like in
+    ``np.nanpercentile``.
+    """
+
+    def __init__(self, rewards: Optional[Dict[str, float]] = None):
+        self._rewards: Dict[str, float] = {}
+        self._sorted_rewards: List[float] = []
+        for trial_id, reward in (rewards or {}).items():
+            self[trial_id] = reward
+
+    def __contains__(self, trial_id: str) -> bool:
+        return trial_id in self._rewards
+
+    def __len__(self) -> int:
+        return len(self._rewards)
+
+    def __getitem__(self, trial_id: str) -> float:
+        return self._rewards[trial_id]
+
+    def __setitem__(self, trial_id: str, reward: float):
+        if trial_id in self._rewards:
+            self._remove_sorted(self._rewards[trial_id])
+        self._rewards[trial_id] = reward
+        if not math.isnan(reward):
+            bisect.insort(self._sorted_rewards, reward)
+
+    def values(self):
+        return self._rewards.values()
+
+    def _remove_sorted(self, reward: float):
+        if math.isnan(reward):
+            return
+        del self._sorted_rewards[bisect.bisect_left(self._sorted_rewards, reward)]
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Equivalent to ``np.nanpercentile(list(self.values()), q)``, or None
+        if no rewards were recorded."""
+        if not self._rewards:
+            return None
+        n = len(self._sorted_rewards)
+        if n == 0:
+            return float("nan")
+        # Linear interpolation, like numpy's default method.
+        q = q / 100
+        index = n * q + (1 - q) - 1
+        lower = min(int(math.floor(index)), n - 1)
+        upper = min(lower + 1, n - 1)
+        a, b = self._sorted_rewards[lower], self._sorted_rewards[upper]
+        t = index - math.floor(index)
+        if t >= 0.5:
+            return b - (b - a) * (1 - t)
+        return a + (b - a) * t
+
+
 class _Bracket:
     """Bookkeeping system to track the cutoffs.
 
@@ -213,14 +274,28 @@ class _Bracket:
         self.rf = reduction_factor
         MAX_RUNGS = int(np.log(max_t / min_t) / np.log(self.rf) - s + 1)
         self._rungs = [
-            (min_t * self.rf ** (k + s), {}) for k in reversed(range(MAX_RUNGS))
+            (min_t * self.rf ** (k + s), _RungRecord())
+            for k in reversed(range(MAX_RUNGS))
         ]
         self._stop_last_trials = stop_last_trials
 
-    def cutoff(self, recorded) -> Optional[Union[int, float, complex, np.ndarray]]:
-        if not recorded:
-            return None
-        return np.nanpercentile(list(recorded.values()), (1 - 1 / self.rf) * 100)
+    def __setstate__(self, state: Dict):
+        # Scheduler checkpoints from older versions recorded rewards in dicts.
+        state["_rungs"] = [
+            (
+                milestone,
+                recorded
+                if isinstance(recorded, _RungRecord)
+                else _RungRecord(recorded),
+            )
+            for milestone, recorded in state["_rungs"]
+        ]
+        self.__dict__.update(state)
+
+    def cutoff(
+        self, recorded: _RungRecord
+    ) -> Optional[Union[int, float, complex, np.ndarray]]:
+        return recorded.percentile((1 - 1 / self.rf) * 100)
 
     def on_result(self, trial: Trial, cur_iter: int, cur_rew: Optional[float]) -> str:
         action = TrialScheduler.CONTINUE
@@ -268,4 +343,4 @@ if __name__ == "__main__":
     sched = AsyncHyperBandScheduler(grace_period=1, max_t=10, reduction_factor=2)
     print(sched.debug_string())
     bracket = sched._brackets[0]
-    print(bracket.cutoff({str(i): i for i in range(20)}))
+    print(bracket.cutoff(_RungRecord({str(i): i for i in range(20)})))
@@ -392,6 +392,9 @@ class _Bracket:
         self._total_work = self._calculate_total_work(self._n0, self._r0, s)
         self._completed_progress = 0
         self.stop_last_trials = stop_last_trials
+        # Number of live trials with less than `self._cumul_r` progress, so
+        # that `cur_iter_done` doesn't have to check every trial.
+        self._num_trials_behind = 0
 
     def add_trial(self, trial: Trial):
         """Add trial to bracket assuming bracket is not filled.
@@ -401,15 +404,19 @@ class _Bracket:
         assert not self.filled(), "Cannot add trial to filled bracket!"
         self._live_trials[trial] = None
         self._all_trials.append(trial)
+        self._num_trials_behind += self._is_behind(None)
 
     def cur_iter_done(self) -> bool:
         """Checks if all iterations have completed.
 
         TODO(rliaw): also check that `t.iterations == self._r`"""
-        return all(
-            self._get_result_time(result) >= self._cumul_r
-            for result in self._live_trials.values()
-        )
+        return self._num_trials_behind == 0
+
+    def _is_behind(self, result: Optional[Dict]) -> bool:
+        return self._get_result_time(result) < self._cumul_r
+
+    def _count_trials_behind(self) -> int:
+        return sum(self._is_behind(result) for result in self._live_trials.values())
 
     def finished(self) -> bool:
         if not self.stop_last_trials:
@@ -448,6 +455,7 @@ class _Bracket:
         self._r *= self._eta
         self._r = int(min(self._r, self._max_t_attr - self._cumul_r))
         self._cumul_r = self._r
+        self._num_trials_behind = self._count_trials_behind()
         sorted_trials = sorted(
             self._live_trials, key=lambda t: metric_op * self._live_trials[t][metric]
         )
@@ -474,6 +482,9 @@ class _Bracket:
                 "Previous={}; Now={}".format(last_observed, observed_time)
             )
         self._completed_progress += delta
+        self._num_trials_behind += self._is_behind(result) - self._is_behind(
+            self._live_trials[trial]
+        )
         self._live_trials[trial] = result
 
     def cleanup_trial(self, trial: Trial):
@@ -483,7 +494,8 @@ class _Bracket:
         This may cause bad trials to continue for a long time, in the case
         where all the good trials finish early and there are only bad trials
         left in a bracket with a large max-iteration."""
-        self._live_trials.pop(trial, None)
+        if trial in self._live_trials:
+            self._num_trials_behind -= self._is_behind(self._live_trials.pop(trial))
 
     def cleanup_full(self, trial_runner: "trial_runner.TrialRunner"):
         """Cleans up bracket after bracket is completely finished.
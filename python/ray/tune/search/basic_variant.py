@@ -3,6 +3,7 @@ import glob
 import itertools
 import os
 import uuid
+from collections import deque
 from typing import Dict, List, Optional, Union, TYPE_CHECKING
 import warnings
 import numpy as np
@@ -13,7 +14,7 @@ from ray.tune.search.sample import np_random_generator, _BackwardsCompatibleNump
 from ray.tune.search.variant_generator import (
     _count_variants,
     _count_spec_samples,
-    generate_variants,
+    _generate_variants_internal,
     format_vars,
     _flatten_resolved_vars,
     _get_preset_variants,
@@ -34,6 +35,9 @@ class _VariantIterator:
     This object also toggles between lazy evaluation and
     eager evaluation of samples. If lazy evaluation is enabled,
     this object cannot be serialized.
+
+    Variants share the unchanged parts of the spec with each other, so
+    eagerly generated variants only hold copies of the resolved paths.
     """
 
     def __init__(self, iterable, lazy_eval=False):
@@ -43,7 +47,7 @@ class _VariantIterator:
         if lazy_eval:
             self._load_value()
         else:
-            self.iterable = list(iterable)
+            self.iterable = deque(iterable)
             self._has_next = bool(self.iterable)
 
     def _load_value(self):
@@ -60,7 +64,7 @@ class _VariantIterator:
             current_value = self.next_value
             self._load_value()
             return current_value
-        current_value = self.iterable.pop(0)
+        current_value = self.iterable.popleft()
         self._has_next = bool(self.iterable)
         return current_value
 
@@ -118,6 +122,9 @@ class _TrialIterator:
         self.random_state = random_state
 
     def create_trial(self, resolved_vars, spec):
+        # Variants share unchanged parts of the spec, so only copy the spec
+        # when the trial is actually created
+        spec = copy.deepcopy(spec)
         trial_id = self.uuid_prefix + ("%05d" % self.counter)
         experiment_tag = str(self.counter)
         # Always append resolved vars to experiment tag?
@@ -170,7 +177,7 @@ class _TrialIterator:
             return self.create_trial(resolved_vars, spec)
         elif self.num_samples_left > 0:
             self.variants = _VariantIterator(
-                generate_variants(
+                _generate_variants_internal(
                     self.unresolved_spec,
                     constant_grid_search=self.constant_grid_search,
                     random_state=self.random_state,
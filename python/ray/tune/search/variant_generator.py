@@ -55,7 +55,8 @@ def generate_variants(
         random_state=random_state,
     ):
         assert not _unresolved_values(spec)
-        yield resolved_vars, spec
+        # Variants share unchanged parts of the spec, so copy them here
+        yield resolved_vars, copy.deepcopy(spec)
 
 
 @PublicAPI(stability="beta")
@@ -231,13 +232,22 @@ def _count_variants(spec: Dict, presets: Optional[List[Dict]] = None) -> int:
 def _generate_variants_internal(
     spec: Dict, constant_grid_search: bool = False, random_state: "RandomState" = None
 ) -> Tuple[Dict, Dict]:
-    spec = copy.deepcopy(spec)
+    """Generates variants from a spec without copying the whole spec.
+
+    The yielded specs share all parts that don't contain unresolved values
+    with the passed spec and with each other. Callers have to copy them
+    before modifying them.
+    """
     _, domain_vars, grid_vars = parse_spec_vars(spec)
 
     if not domain_vars and not grid_vars:
         yield {}, spec
         return
 
+    # Only copy the containers holding unresolved values, so that resolving
+    # them doesn't modify the passed spec
+    spec = _copy_paths(spec, [path for path, _ in domain_vars + grid_vars])
+
     # Variables to resolve
     to_resolve = domain_vars
 
@@ -253,7 +263,9 @@ def _generate_variants_internal(
             # Not all variables have been resolved, but remove those that have
             # from the `to_resolve` list.
             to_resolve = [(r, d) for r, d in to_resolve if r not in resolved_vars]
-    grid_search = _grid_search_generator(spec, grid_vars)
+    grid_search = _grid_search_generator(
+        spec, grid_vars, copy_paths=[path for path, _ in to_resolve]
+    )
     for resolved_spec in grid_search:
         if not constant_grid_search or not all_resolved:
             # In this path, we sample the remaining random variables
@@ -261,11 +273,24 @@ def _generate_variants_internal(
                 resolved_spec, to_resolve, random_state=random_state
             )
 
-        for resolved, spec in _generate_variants_internal(
-            resolved_spec,
-            constant_grid_search=constant_grid_search,
-            random_state=random_state,
+        # Resolved values can contain further unresolved values, e.g. when
+        # grid searching over nested search spaces. Only the assigned values
+        # have to be checked, everything else was resolved already.
+        if _has_unresolved_values(
+            {
+                path: _get_value(resolved_spec, path)
+                for path, _ in grid_vars + domain_vars
+            }
         ):
+            variants = _generate_variants_internal(
+                resolved_spec,
+                constant_grid_search=constant_grid_search,
+                random_state=random_state,
+            )
+        else:
+            variants = [({}, resolved_spec)]
+
+        for resolved, spec in variants:
             for path, value in grid_vars:
                 resolved_vars[path] = _get_value(spec, path)
             for k, v in resolved.items():
@@ -370,6 +395,33 @@ def _get_value(spec: Dict, path: Tuple) -> Any:
     return spec
 
 
+def _copy_paths(spec: Any, paths: List[Tuple]) -> Any:
+    """Copies the containers along the given paths of a nested spec.
+
+    All other values are shared with ``spec``, so that values can be
+    assigned along the paths without modifying ``spec``.
+    """
+    if isinstance(spec, tuple):
+        # Tuples are re-constructed by `assign_value`, but may contain
+        # mutable containers along the paths.
+        copied = list(spec)
+    elif isinstance(spec, (dict, list)):
+        copied = copy.copy(spec)
+    else:
+        return spec
+
+    sub_paths = {}
+    for path in paths:
+        if len(path) > 1:
+            sub_paths.setdefault(path[0], []).append(path[1:])
+    for key, key_paths in sub_paths.items():
+        copied[key] = _copy_paths(copied[key], key_paths)
+
+    if isinstance(spec, tuple):
+        return spec._make(copied) if hasattr(spec, "_make") else tuple(copied)
+    return copied
+
+
 def _resolve_domain_vars(
     spec: Dict,
     domain_vars: List[Tuple[Tuple, Domain]],
@@ -407,8 +459,15 @@ def _resolve_domain_vars(
 
 
 def _grid_search_generator(
-    unresolved_spec: Dict, grid_vars: List
+    unresolved_spec: Dict, grid_vars: List, copy_paths: Optional[List[Tuple]] = None
 ) -> Generator[Dict, None, None]:
+    """Yields the grid points of a spec.
+
+    Only the containers along the grid variable paths and ``copy_paths``
+    are copied for each grid point, everything else is shared with
+    ``unresolved_spec``.
+    """
+    paths = [path for path, _ in grid_vars] + (copy_paths or [])
     value_indices = [0] * len(grid_vars)
 
     def increment(i):
@@ -426,7 +485,7 @@ def _grid_search_generator(
         return
 
     while value_indices[-1] < len(grid_vars[-1][1]):
-        spec = copy.deepcopy(unresolved_spec)
+        spec = _copy_paths(unresolved_spec, paths)
         for i, (path, values) in enumerate(grid_vars):
             assign_value(spec, path, values[value_indices[i]])
         yield spec
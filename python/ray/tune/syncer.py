@@ -1,5 +1,7 @@
 import abc
+import fnmatch
 from functools import partial
+import hashlib
 import threading
 from typing import (
     Any,
@@ -22,7 +24,7 @@ import ray
 from ray.air._internal.checkpoint_manager import CheckpointStorage, _TrackedCheckpoint
 from ray.air._internal.remote_storage import (
     fs_hint,
-    upload_to_uri,
+    upload_files_to_uri,
     download_from_uri,
     delete_at_uri,
     is_non_local_path_uri,
@@ -578,17 +580,139 @@ class _BackgroundSyncer(Syncer):
         return state
 
 
+def _hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    file_hash = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _list_files_to_sync(local_path: str, exclude: Optional[List] = None) -> List[str]:
+    """Returns the paths relative to ``local_path`` of all files to sync.
+
+    Exclude patterns are matched against the relative paths like in
+    ``upload_to_uri``, e.g. ``./checkpoint_*/*``.
+    """
+    files = []
+    for root, dirs, filenames in os.walk(local_path):
+        rel_root = os.path.relpath(root, local_path)
+        for filename in filenames:
+            candidate = os.path.join(rel_root, filename)
+            if exclude and any(
+                fnmatch.fnmatch(candidate, pattern) for pattern in exclude
+            ):
+                continue
+            files.append(candidate)
+    return files
+
+
 class _DefaultSyncer(_BackgroundSyncer):
-    """Default syncer between local storage and remote URI."""
+    """Default syncer between local storage and remote URI.
+
+    Uploads are incremental: files that this syncer uploaded to the same
+    remote path before are skipped if they didn't change since. Changes are
+    detected by file size and modification time, and by a hash of the file
+    contents if these differ. The remaining files are uploaded in parallel
+    by ``TUNE_SYNC_UPLOAD_NUM_THREADS`` threads.
+
+    This assumes that the remote files are only modified through this syncer.
+    """
+
+    def __init__(
+        self,
+        sync_period: float = DEFAULT_SYNC_PERIOD,
+        sync_timeout: float = DEFAULT_SYNC_TIMEOUT,
+    ):
+        super(_DefaultSyncer, self).__init__(
+            sync_period=sync_period, sync_timeout=sync_timeout
+        )
+        self._upload_num_threads = int(
+            os.environ.get("TUNE_SYNC_UPLOAD_NUM_THREADS", "8")
+        )
+        self._reset_upload_state()
+
+    def _reset_upload_state(self):
+        # Maps remote file URIs to the (size, mtime, content hash) of the
+        # local file that was last uploaded there
+        self._uploaded_files: Dict[str, Tuple[int, int, str]] = {}
+        self._sync_up_stats = {
+            "num_sync_ups": 0,
+            "num_files_uploaded": 0,
+            "num_files_skipped": 0,
+            "bytes_uploaded": 0,
+            "upload_time_s": 0.0,
+        }
+
+    @property
+    def sync_up_stats(self) -> Dict[str, float]:
+        """Statistics about the uploads of this syncer.
+
+        Contains the number of finished sync ups, the number of uploaded and
+        skipped (unchanged) files, the number of uploaded bytes, the time
+        spent uploading, and the resulting upload throughput in bytes per
+        second.
+        """
+        stats = self._sync_up_stats.copy()
+        stats["upload_throughput_bytes_per_s"] = (
+            stats["bytes_uploaded"] / stats["upload_time_s"]
+            if stats["upload_time_s"]
+            else 0.0
+        )
+        return stats
 
     def _sync_up_command(
         self, local_path: str, uri: str, exclude: Optional[List] = None
     ) -> Tuple[Callable, Dict]:
         return (
-            upload_to_uri,
+            self._upload_changed_files,
             dict(local_path=local_path, uri=uri, exclude=exclude),
         )
 
+    def _upload_changed_files(
+        self, local_path: str, uri: str, exclude: Optional[List] = None
+    ):
+        uri = uri.rstrip("/")
+        to_upload = []
+        uploaded_files = {}
+        num_skipped = 0
+        num_bytes = 0
+        for file in _list_files_to_sync(local_path, exclude=exclude):
+            file_uri = uri + "/" + os.path.normpath(file).replace(os.sep, "/")
+            stat = os.stat(os.path.join(local_path, file))
+            previous = self._uploaded_files.get(file_uri)
+            if previous and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                num_skipped += 1
+                continue
+
+            file_hash = _hash_file(os.path.join(local_path, file))
+            uploaded_files[file_uri] = (stat.st_size, stat.st_mtime_ns, file_hash)
+            if previous and previous[2] == file_hash:
+                num_skipped += 1
+            else:
+                to_upload.append(file)
+                num_bytes += stat.st_size
+
+        start_time = time.monotonic()
+        if to_upload:
+            upload_files_to_uri(
+                local_path, uri, to_upload, num_threads=self._upload_num_threads
+            )
+        upload_time = time.monotonic() - start_time
+
+        self._uploaded_files.update(uploaded_files)
+        stats = self._sync_up_stats
+        stats["num_sync_ups"] += 1
+        stats["num_files_uploaded"] += len(to_upload)
+        stats["num_files_skipped"] += num_skipped
+        stats["bytes_uploaded"] += num_bytes
+        stats["upload_time_s"] += upload_time
+        logger.debug(
+            f"Uploaded {len(to_upload)} files ({num_bytes} bytes) from "
+            f"{local_path} to {uri} in {upload_time:.2f} seconds, "
+            f"skipped {num_skipped} unchanged files."
+        )
+
     def _sync_down_command(self, uri: str, local_path: str) -> Tuple[Callable, Dict]:
         return (
             download_from_uri,
@@ -596,7 +720,26 @@ class _DefaultSyncer(_BackgroundSyncer):
         )
 
     def _delete_command(self, uri: str) -> Tuple[Callable, Dict]:
-        return delete_at_uri, dict(uri=uri)
+        return self._delete_and_forget_uploads, dict(uri=uri)
+
+    def _delete_and_forget_uploads(self, uri: str):
+        delete_at_uri(uri)
+        prefix = uri.rstrip("/") + "/"
+        for file_uri in list(self._uploaded_files):
+            if file_uri.startswith(prefix):
+                self._uploaded_files.pop(file_uri, None)
+
+    def __getstate__(self):
+        state = super(_DefaultSyncer, self).__getstate__()
+        # The upload state refers to the local files of this process
+        state.pop("_uploaded_files", None)
+        state.pop("_sync_up_stats", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.setdefault("_upload_num_threads", 8)
+        self._reset_upload_state()
 
 
 @DeveloperAPI
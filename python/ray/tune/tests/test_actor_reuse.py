@@ -6,7 +6,7 @@ import time
 import ray
 from ray import tune, logger
 from ray.tune import Trainable, run_experiments, register_trainable
-from ray.tune.error import TuneError
+from ray.tune.experiment import Trial
 from ray.tune.schedulers.trial_scheduler import FIFOScheduler, TrialScheduler
 from ray.tune.tune import _check_mixin
 
@@ -187,24 +187,31 @@ def test_trial_reuse_with_failing(ray_start_1_cpu):
     ]
 
 
-def test_reuse_enabled_error(ray_start_1_cpu):
-    """Test that a class without reset() enabled throws an error on actor reuse."""
-    with pytest.raises(TuneError):
-        run_experiments(
-            {
-                "foo": {
-                    "run": MyResettableClass,
-                    "max_failures": 1,
-                    "num_samples": 1,
-                    "config": {
-                        "id": tune.grid_search([0, 1, 2, 3]),
-                        "fake_reset_not_supported": True,
-                    },
-                }
-            },
-            reuse_actors=True,
-            scheduler=FrequentPausesScheduler(),
-        )
+def test_reuse_enabled_without_reset(ray_start_1_cpu):
+    """Test that only the resources are reused if a class can't be reset.
+
+    Setup: Pass `reuse_actors=True` to tune.run() with a trainable whose
+    `reset_config()` returns False.
+
+    The trials should still succeed, but each one runs in a new actor.
+    """
+    trials = run_experiments(
+        {
+            "foo": {
+                "run": MyResettableClass,
+                "max_failures": 1,
+                "num_samples": 1,
+                "config": {
+                    "id": tune.grid_search([0, 1, 2, 3]),
+                    "fake_reset_not_supported": True,
+                },
+            }
+        },
+        reuse_actors=True,
+        scheduler=FrequentPausesScheduler(),
+    )
+    assert all(t.status == Trial.TERMINATED for t in trials)
+    assert [t.last_result["num_resets"] for t in trials] == [0, 0, 0, 0]
 
 
 def test_trial_reuse_log_to_file(ray_start_1_cpu):
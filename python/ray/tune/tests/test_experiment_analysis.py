@@ -1,16 +1,25 @@
+import glob
 import unittest
 import shutil
 import tempfile
 import random
 import os
 import pickle
+from unittest.mock import patch
+
 import pandas as pd
+import pytest
 from numpy import nan
 
 import ray
 from ray import tune
 from ray.tune import ExperimentAnalysis
+from ray.tune.analysis.experiment_analysis import (
+    _load_results_index,
+    _write_results_index,
+)
 import ray.tune.registry
+from ray.tune.result import EXPR_RESULTS_INDEX_FILE
 from ray.tune.utils.mock_trainable import MyTrainableClass
 from ray.tune.utils.util import is_nan
 
@@ -84,6 +93,93 @@ class ExperimentAnalysisSuite(unittest.TestCase):
         all_dataframes_via_csv2 = self.ea.fetch_trial_dataframes()
         assert set(all_dataframes_via_csv) == set(all_dataframes_via_csv2)
 
+    def testLoadProjectedColumns(self):
+        self.ea.set_filetype("csv")
+        dataframes = self.ea.fetch_trial_dataframes(metrics=[self.metric, "missing"])
+        self.assertEqual(len(dataframes), self.num_samples)
+        for df in dataframes.values():
+            self.assertEqual(list(df.columns), [self.metric])
+
+        # Projected dataframes don't replace the full ones.
+        df = self.ea.dataframe("training_iteration", mode="max")
+        self.assertEqual(df.shape[0], self.num_samples)
+        for df in self.ea.trial_dataframes.values():
+            self.assertIn("training_iteration", df.columns)
+
+    def testResultsIndex(self):
+        pytest.importorskip("pyarrow")
+        self.assertTrue(
+            os.path.exists(os.path.join(self.test_path, EXPR_RESULTS_INDEX_FILE))
+        )
+        # The index is built from the result files, without loading the
+        # dataframes of the returned analysis.
+        self.assertIsNone(self.ea._trial_dataframes)
+
+        analysis = ExperimentAnalysis(self.test_path)
+        with patch.object(
+            analysis, "_load_trial_dataframe", side_effect=RuntimeError
+        ) as load_mock:
+            via_index = analysis.trial_dataframes
+            projected = analysis.fetch_trial_dataframes(metrics=[self.metric])
+        load_mock.assert_not_called()
+
+        analysis.set_filetype("csv")
+        via_csv = analysis.trial_dataframes
+        self.assertEqual(set(via_index), set(via_csv))
+        for path, df in via_csv.items():
+            pd.testing.assert_frame_equal(via_index[path], df)
+            self.assertEqual(list(projected[path].columns), [self.metric])
+
+        # The index isn't used once the experiment state changed.
+        state_file = glob.glob(os.path.join(self.test_path, "experiment_state*.json"))[
+            0
+        ]
+        index_mtime = os.path.getmtime(
+            os.path.join(self.test_path, EXPR_RESULTS_INDEX_FILE)
+        )
+        os.utime(state_file, (index_mtime + 1, index_mtime + 1))
+        analysis = ExperimentAnalysis(self.test_path)
+        self.assertEqual(analysis._load_results_indexes(), {})
+
+    def testResultsIndexSynced(self):
+        pytest.importorskip("pyarrow")
+        # The index is written before the final sync of the experiment.
+        upload_dir = os.path.join(self.test_dir, "upload")
+        tune.run(
+            MyTrainableClass,
+            name="synced",
+            local_dir=self.test_dir,
+            stop={"training_iteration": 1},
+            num_samples=2,
+            sync_config=tune.SyncConfig(upload_dir=f"file://{upload_dir}"),
+        )
+        self.assertTrue(
+            os.path.exists(os.path.join(upload_dir, "synced", EXPR_RESULTS_INDEX_FILE))
+        )
+
+    def testResultsIndexDtypes(self):
+        pytest.importorskip("pyarrow")
+        # Columns that only some trials have keep their dtypes.
+        trial_dataframes = {
+            "trial_a": pd.DataFrame(
+                {"it": [1, 2], "flag": [True, False], "loss": [0.5, 1.5]}
+            ),
+            "trial_b": pd.DataFrame({"it": [1, 2, 3], "loss": [1.0, 2.0, nan]}),
+        }
+        _write_results_index(self.test_dir, trial_dataframes)
+
+        loaded = _load_results_index(self.test_dir)
+        for trial_dir, df in trial_dataframes.items():
+            pd.testing.assert_frame_equal(loaded[trial_dir], df)
+
+        loaded = _load_results_index(self.test_dir, ["it", "flag"])
+        pd.testing.assert_frame_equal(
+            loaded["trial_a"], trial_dataframes["trial_a"][["it", "flag"]]
+        )
+        pd.testing.assert_frame_equal(
+            loaded["trial_b"], trial_dataframes["trial_b"][["it"]]
+        )
+
     def testStats(self):
         assert self.ea.stats()
         assert self.ea.runner_data()
@@ -417,7 +513,6 @@ class ExperimentAnalysisStubSuite(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    import pytest
     import sys
 
     sys.exit(pytest.main(["-v", __file__]))
@@ -6,7 +6,12 @@ from collections import namedtuple
 import unittest
 import tempfile
 import shutil
+import time
+from unittest.mock import patch
+
 import numpy as np
+import pytest
+
 from ray.cloudpickle import cloudpickle
 
 from ray.tune.logger import (
@@ -14,14 +19,23 @@ from ray.tune.logger import (
     JsonLoggerCallback,
     JsonLogger,
     CSVLogger,
+    ParquetLoggerCallback,
     TBXLoggerCallback,
     TBXLogger,
 )
+from ray.tune.logger.buffered import _BufferedWriter
+from ray.tune.logger.parquet import (
+    _compact_parquet_parts,
+    _load_parquet_results,
+    _read_parquet_columns,
+    _write_parquet_part,
+)
 from ray.tune.result import (
     EXPR_PARAM_FILE,
     EXPR_PARAM_PICKLE_FILE,
     EXPR_PROGRESS_FILE,
     EXPR_RESULT_FILE,
+    EXPR_RESULT_PARQUET_DIR,
 )
 
 
@@ -94,6 +108,8 @@ class LoggerSuite(unittest.TestCase):
         logger.on_trial_start(0, [], t)
         logger.on_trial_start(0, [], t)
         logger.on_trial_result(1, [], t, result(1, 5))
+        # Results are written when the trial saves a checkpoint.
+        logger.on_trial_save(1, [], t)
 
         with open(os.path.join(self.test_dir, "progress.csv"), "rt") as f:
             csv_contents = f.read()
@@ -167,6 +183,82 @@ class LoggerSuite(unittest.TestCase):
 
         self.assertEqual(loaded_config, config)
 
+    def testJSONBuffered(self):
+        config = {"a": 2}
+        t = Trial(evaluated_params=config, trial_id="json", logdir=self.test_dir)
+        result_file = os.path.join(self.test_dir, EXPR_RESULT_FILE)
+        with patch.dict(os.environ, {"TUNE_LOGGER_FLUSH_INTERVAL_S": "1000"}):
+            logger = JsonLoggerCallback()
+        logger.on_trial_result(0, [], t, result(0, 4))
+        logger.on_trial_result(1, [], t, result(1, 5))
+        # Results are buffered until the trial saves a checkpoint or ends.
+        self.assertFalse(os.path.exists(result_file))
+        logger.on_trial_save(1, [], t)
+        with open(result_file, "rt") as fp:
+            self.assertEqual(len(fp.readlines()), 2)
+
+        logger.on_trial_result(2, [], t, result(2, 6))
+        logger.on_experiment_end([t])
+        with open(result_file, "rt") as fp:
+            self.assertEqual(len(fp.readlines()), 3)
+
+    def testBufferedWriterBackgroundFlush(self):
+        written = []
+        writer = _BufferedWriter(
+            lambda key, items: written.append((key, items)), flush_interval_s=0.1
+        )
+        writer.add("a", 1)
+        writer.add("a", 2)
+        writer.add("b", 3)
+        start = time.monotonic()
+        while len(written) < 2 and time.monotonic() - start < 10:
+            time.sleep(0.05)
+        self.assertEqual(sorted(written), [("a", [1, 2]), ("b", [3])])
+        writer.close()
+
+        # Writers can be pickled before and after they are used.
+        writer = cloudpickle.loads(cloudpickle.dumps(writer))
+        writer.add("a", 4)
+        writer.close()
+
+    def testParquet(self):
+        pytest.importorskip("pyarrow")
+        config = {"a": 2}
+        t = Trial(evaluated_params=config, trial_id="parquet", logdir=self.test_dir)
+        logger = ParquetLoggerCallback()
+        logger.on_trial_result(0, [], t, result(0, 4))
+        logger.on_trial_save(0, [], t)
+        logger.on_trial_result(1, [], t, result(1, 5))
+        logger.on_trial_result(
+            2, [], t, result(2, 6, score=[1, 2, 3], hello={"world": 1})
+        )
+        logger.on_trial_complete(3, [], t)
+
+        parquet_dir = os.path.join(self.test_dir, EXPR_RESULT_PARQUET_DIR)
+        # The part files are merged when the trial ends.
+        self.assertEqual(len(os.listdir(parquet_dir)), 1)
+        df = _load_parquet_results(parquet_dir)
+        self.assertSequenceEqual(list(df["episode_reward_mean"]), [4, 5, 6])
+        self.assertEqual(df["hello/world"].iloc[2], 1)
+        self.assertEqual(json.loads(df["score"].iloc[2]), [1, 2, 3])
+
+    def testParquetCompactTypes(self):
+        pa = pytest.importorskip("pyarrow")
+        parquet_dir = os.path.join(self.test_dir, EXPR_RESULT_PARQUET_DIR)
+        os.makedirs(parquet_dir)
+        _write_parquet_part(parquet_dir, [{"it": 1, "loss": 1, "tag": True}])
+        _write_parquet_part(parquet_dir, [{"it": 2, "loss": 0.5, "tag": "x"}])
+        _write_parquet_part(parquet_dir, [{"it": 3, "extra": None}])
+        _compact_parquet_parts(parquet_dir)
+
+        self.assertEqual(len(os.listdir(parquet_dir)), 1)
+        table = _read_parquet_columns(os.path.join(parquet_dir, "part-000000.parquet"))
+        # Integer columns stay integers, and missing values are nulls.
+        self.assertEqual(table.schema.field("it").type, pa.int64())
+        self.assertEqual(table.column("loss").to_pylist(), [1.0, 0.5, None])
+        self.assertEqual(table.column("tag").to_pylist(), ["true", "x", None])
+        self.assertEqual(table.column("extra").to_pylist(), [None, None, None])
+
     def testLegacyTBX(self):
         config = {
             "a": 2,
@@ -265,7 +357,6 @@ class LoggerSuite(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    import pytest
     import sys
 
     sys.exit(pytest.main(["-v", __file__] + sys.argv[1:]))
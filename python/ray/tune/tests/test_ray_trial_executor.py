@@ -15,6 +15,7 @@ from ray.tune.callback import Callback
 from ray.tune.execution.ray_trial_executor import (
     _ExecutorEvent,
     _ExecutorEventType,
+    _get_reuse_key,
     RayTrialExecutor,
 )
 from ray.tune.registry import _global_registry, TRAINABLE_CLASS, register_trainable
@@ -23,9 +24,10 @@ from ray.tune.search import BasicVariantGenerator
 from ray.tune.experiment import Trial
 from ray.tune.resources import Resources
 from ray.cluster_utils import Cluster
+from ray.exceptions import GetTimeoutError
 from ray.tune.execution.placement_groups import PlacementGroupFactory
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 
 def _make_trial(name, **kwargs):
@@ -163,6 +165,28 @@ class RayTrialExecutorTest(unittest.TestCase):
         self._simulate_starting_trial(trial)
         self.trial_executor.stop_trial(trial)
 
+    def testBatchedTrainingResults(self):
+        trials = [_make_trial("__fake"), _make_trial("__fake")]
+        for trial in trials:
+            self._simulate_starting_trial(trial)
+
+        # Wait until both training results are ready.
+        ray.wait(
+            list(self.trial_executor._futures), num_returns=len(trials), timeout=30
+        )
+        events = self.trial_executor.get_next_executor_events(
+            live_trials=set(trials), next_trial_exists=False
+        )
+        self.assertEqual(len(events), 2)
+        self.assertEqual({event.trial for event in events}, set(trials))
+        for event in events:
+            self.assertEqual(event.type, _ExecutorEventType.TRAINING_RESULT)
+            self.assertIn(_ExecutorEvent.KEY_FUTURE_RESULT, event.result)
+        self.assertFalse(self.trial_executor._futures)
+
+        for trial in trials:
+            self.trial_executor.stop_trial(trial)
+
     def testAsyncSave(self):
         """Tests that saved checkpoint value not immediately set."""
         trial = _make_trial("__fake")
@@ -671,6 +695,55 @@ class RayExecutorPlacementGroupTest(unittest.TestCase):
         # We used the cached placement group, now we shouldn't have anything staged
         assert len(executor._staged_trials) == 0
 
+    def testCachedActorCompatibleResources(self):
+        pgf_pack = PlacementGroupFactory([{"CPU": 1}], strategy="PACK")
+        pgf_spread = PlacementGroupFactory([{"CPU": 1}], strategy="SPREAD")
+        pgf_multi_pack = PlacementGroupFactory([{"CPU": 1}, {"CPU": 1}], "PACK")
+        pgf_multi_spread = PlacementGroupFactory([{"CPU": 1}, {"CPU": 1}], "SPREAD")
+
+        # The strategy only matters for placement groups with several bundles.
+        self.assertEqual(_get_reuse_key(pgf_pack), _get_reuse_key(pgf_spread))
+        self.assertNotEqual(
+            _get_reuse_key(pgf_multi_pack), _get_reuse_key(pgf_multi_spread)
+        )
+        self.assertNotEqual(
+            _get_reuse_key(PlacementGroupFactory([{"CPU": 2}])),
+            _get_reuse_key(pgf_pack),
+        )
+
+        executor = RayTrialExecutor(
+            reuse_actors=True, resource_manager=self._resourceManager()
+        )
+        cached = (object(), object(), "trainable")
+        executor._resource_request_to_cached_actors[pgf_pack].append(cached)
+        self.assertFalse(executor._has_cached_actor(pgf_multi_pack))
+        self.assertTrue(executor._has_cached_actor(pgf_spread))
+        self.assertIs(executor._pop_cached_actor(pgf_spread), cached)
+        self.assertFalse(executor._has_cached_actor(pgf_pack))
+
+    def testCachedActorResetTimeout(self):
+        executor = RayTrialExecutor(reuse_actors=True, resource_manager=MagicMock())
+        pgf = PlacementGroupFactory([{"CPU": 1}])
+        actor = MagicMock()
+        acquired_resources = object()
+        executor._resource_request_to_cached_actors[pgf].append(
+            (actor, acquired_resources, "trainable")
+        )
+        trial = MagicMock(trainable_name="trainable", placement_group_factory=pgf)
+
+        with patch.object(executor, "_reset_trial", side_effect=GetTimeoutError):
+            self.assertIsNone(executor._maybe_use_cached_actor(trial, None))
+
+        # A timeout doesn't mean the trainable can't be reset.
+        self.assertNotIn("trainable", executor._trainables_without_reset)
+        # The trial keeps the resources, and the old actor is stopped.
+        self.assertIs(executor._trial_to_acquired_resources[trial], acquired_resources)
+        stop_future = actor.stop.remote.return_value
+        self.assertEqual(
+            executor._futures[stop_future], (_ExecutorEventType.STOP_RESULT, None)
+        )
+        actor.__ray_terminate__.remote.assert_called_once()
+
     def testEmptyPlacementGroupFactory(self):
         # Empty bundles
         with self.assertRaises(ValueError):
@@ -302,6 +302,54 @@ def test_syncer_sync_exclude(temp_data_dirs):
     assert_file(False, tmp_target, "subdir_exclude/something/somewhere.txt")
 
 
+def test_syncer_sync_up_only_changed_files(temp_data_dirs):
+    """Check that unchanged files are not uploaded again"""
+    tmp_source, tmp_target = temp_data_dirs
+    remote_dir = "memory:///test/test_syncer_sync_up_only_changed_files"
+
+    syncer = _DefaultSyncer()
+
+    syncer.sync_up(local_dir=tmp_source, remote_dir=remote_dir)
+    syncer.wait()
+    assert syncer.sync_up_stats["num_files_uploaded"] == 7
+    assert syncer.sync_up_stats["num_files_skipped"] == 0
+    assert syncer.sync_up_stats["bytes_uploaded"] == 7 * len("Data")
+
+    syncer.sync_up(local_dir=tmp_source, remote_dir=remote_dir)
+    syncer.wait()
+    assert syncer.sync_up_stats["num_files_uploaded"] == 7
+    assert syncer.sync_up_stats["num_files_skipped"] == 7
+
+    # Rewriting a file with the same contents doesn't upload it again
+    with open(os.path.join(tmp_source, "level0.txt"), "w") as f:
+        f.write("Data")
+    with open(os.path.join(tmp_source, "subdir", "level1.txt"), "w") as f:
+        f.write("Changed")
+
+    syncer.sync_up(local_dir=tmp_source, remote_dir=remote_dir)
+    syncer.wait()
+    stats = syncer.sync_up_stats
+    assert stats["num_sync_ups"] == 3
+    assert stats["num_files_uploaded"] == 8
+    assert stats["num_files_skipped"] == 13
+    assert stats["bytes_uploaded"] == 7 * len("Data") + len("Changed")
+    assert stats["upload_throughput_bytes_per_s"] > 0
+
+    # Deleted remote files are uploaded again
+    syncer.delete(remote_dir=remote_dir)
+    syncer.wait()
+    syncer.sync_up(local_dir=tmp_source, remote_dir=remote_dir)
+    syncer.wait()
+    assert syncer.sync_up_stats["num_files_uploaded"] == 15
+
+    syncer.sync_down(remote_dir=remote_dir, local_dir=tmp_target)
+    syncer.wait()
+
+    with open(os.path.join(tmp_target, "subdir", "level1.txt"), "r") as f:
+        assert f.read() == "Changed"
+    assert_file(True, tmp_target, "subdir/nested/level2.txt")
+
+
 def test_sync_up_if_needed(temp_data_dirs):
     """Check that we only sync up again after sync period"""
     tmp_source, tmp_target = temp_data_dirs
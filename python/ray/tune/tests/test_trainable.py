@@ -180,6 +180,77 @@ def test_save_load_checkpoint_object_fn(ray_start_2_cpus, fn_trainable):
     ray.get(restoring_future)
 
 
+@pytest.mark.parametrize("return_type", ["object", "root"])
+def test_checkpoint_object_in_memory(return_type):
+    """Asserts that dict checkpoints are kept in memory by save_to_object()."""
+    trainable = SavingTrainable(return_type)
+    trainable.train()
+    trainable.train()
+
+    obj = trainable.save_to_object()
+
+    if return_type == "object":
+        assert isinstance(obj, Checkpoint)
+        assert obj.get_internal_representation()[0] == "data_dict"
+    else:
+        assert isinstance(obj, bytes)
+    assert not any(
+        name.endswith("save_to_object") for name in os.listdir(trainable.logdir)
+    )
+
+    restored = SavingTrainable(return_type)
+    restored.restore_from_object(obj)
+    assert restored.training_iteration == 2
+    assert restored.iteration == 2
+
+    # The checkpoint can be restored more than once
+    restored.restore_from_object(obj)
+    assert restored.training_iteration == 2
+
+
+class ReportingTrainable(tune.Trainable):
+    def setup(self, config, data=None):
+        pass
+
+    def step(self):
+        return {"loss": 1, "info": {"lr": 0.1, "hist": [1, 2]}, "big": [0] * 100}
+
+
+def reporting_function(config, data=None):
+    for _ in range(2):
+        session.report(
+            {"loss": 1, "info": {"lr": 0.1, "hist": [1, 2]}, "big": [0] * 100}
+        )
+
+
+@pytest.mark.parametrize("trainable", [ReportingTrainable, reporting_function])
+@pytest.mark.parametrize("with_parameters", [False, True])
+def test_with_reported_metrics(request, tmpdir, trainable, with_parameters):
+    """Asserts that only the reported metrics are returned by train()."""
+    trainable = tune.with_reported_metrics(trainable, ["loss", "info/lr"])
+    if with_parameters:
+        request.getfixturevalue("ray_start_2_cpus")
+        trainable = tune.with_parameters(trainable, data=[0] * 100)
+    if not isinstance(trainable, type):
+        trainable = wrap_function(trainable)
+    trainable = trainable(logger_creator=lambda config: NoopLogger(config, str(tmpdir)))
+
+    for i in range(2):
+        result = trainable.train()
+        assert result["loss"] == 1
+        assert result["info"] == {"lr": 0.1}
+        assert "big" not in result
+        assert result["training_iteration"] == i + 1
+    trainable.stop()
+
+    # The full results are written to the trial directory
+    with open(os.path.join(str(tmpdir), "result_full.json")) as f:
+        full_results = [json.loads(line) for line in f]
+    assert len(full_results) == 2
+    assert full_results[0]["info"] == {"lr": 0.1, "hist": [1, 2]}
+    assert full_results[1]["big"] == [0] * 100
+
+
 def test_checkpoint_object_no_sync(tmpdir):
     """Asserts that save_to_object() and restore_from_object() do not sync up/down"""
     trainable = SavingTrainable(
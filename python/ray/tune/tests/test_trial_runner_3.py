@@ -18,6 +18,10 @@ from ray.rllib import _register_all
 from ray.rllib.algorithms.callbacks import DefaultCallbacks
 
 from ray.tune import TuneError
+from ray.tune.execution.experiment_state import (
+    _ExperimentStateJournal,
+    _load_experiment_state,
+)
 from ray.tune.execution.ray_trial_executor import RayTrialExecutor
 from ray.tune.impl.placeholder import create_resolvers_map, inject_placeholders
 from ray.tune.result import TRAINING_ITERATION
@@ -1500,6 +1504,82 @@ class ResourcesTest(unittest.TestCase):
         self.assertEqual(original, new_resource)
 
 
+class ExperimentStateJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.state_path = os.path.join(self.tmpdir, "experiment_state-test.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _journal_files(self):
+        return [
+            f for f in os.listdir(self.tmpdir) if f.startswith("experiment_journal")
+        ]
+
+    def testAppendAndCompact(self):
+        journal = _ExperimentStateJournal(
+            self.tmpdir,
+            "experiment_state-test.json",
+            "test",
+            min_compaction_entries=4,
+        )
+        trial_states = {"a": "state_a_0", "b": "state_b_0"}
+        journal.save(trial_states, {"step": 0}, {"timestamp": 0})
+        snapshot_mtime = os.path.getmtime(self.state_path)
+        self.assertEqual(len(self._journal_files()), 1)
+
+        # Only the changed trial and the runner state are appended.
+        trial_states["a"] = "state_a_1"
+        journal.save(trial_states, {"step": 1}, {"timestamp": 1})
+        self.assertEqual(os.path.getmtime(self.state_path), snapshot_mtime)
+        with open(os.path.join(self.tmpdir, self._journal_files()[0])) as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+        state = _load_experiment_state(self.state_path)
+        self.assertEqual(state["checkpoints"], ["state_a_1", "state_b_0"])
+        self.assertEqual(state["runner_data"], {"step": 1})
+        self.assertEqual(state["stats"], {"timestamp": 1})
+        self.assertNotIn("journal", state)
+        self.assertNotIn("trial_ids", state)
+
+        # The journal would exceed 4 entries, so a new snapshot is written.
+        trial_states["a"] = "state_a_2"
+        trial_states["c"] = "state_c_0"
+        journal.save(trial_states, {"step": 2}, {"timestamp": 2})
+        self.assertEqual(len(self._journal_files()), 1)
+        with open(os.path.join(self.tmpdir, self._journal_files()[0])) as f:
+            self.assertEqual(f.read(), "")
+        state = _load_experiment_state(self.state_path)
+        self.assertEqual(state["checkpoints"], ["state_a_2", "state_b_0", "state_c_0"])
+        self.assertEqual(state["runner_data"], {"step": 2})
+
+        # Forced compaction.
+        trial_states["b"] = "state_b_1"
+        journal.save(trial_states, {"step": 3}, {"timestamp": 3}, compact=True)
+        with open(os.path.join(self.tmpdir, self._journal_files()[0])) as f:
+            self.assertEqual(f.read(), "")
+        state = _load_experiment_state(self.state_path)
+        self.assertEqual(state["checkpoints"], ["state_a_2", "state_b_1", "state_c_0"])
+
+    def testIncompleteJournalEntry(self):
+        journal = _ExperimentStateJournal(
+            self.tmpdir, "experiment_state-test.json", "test"
+        )
+        trial_states = {"a": "state_a_0"}
+        journal.save(trial_states, {"step": 0}, {"timestamp": 0})
+        trial_states["a"] = "state_a_1"
+        journal.save(trial_states, {"step": 1}, {"timestamp": 1})
+
+        # Simulate the experiment stopping while an entry was written.
+        with open(os.path.join(self.tmpdir, self._journal_files()[0]), "a") as f:
+            f.write('{"trial_id": "a", "sta')
+
+        state = _load_experiment_state(self.state_path)
+        self.assertEqual(state["checkpoints"], ["state_a_1"])
+        self.assertEqual(state["runner_data"], {"step": 1})
+
+
 if __name__ == "__main__":
     import pytest
 
@@ -29,6 +29,7 @@ from ray.tune.schedulers import (
     HyperBandForBOHB,
 )
 
+from ray.tune.schedulers.async_hyperband import _RungRecord
 from ray.tune.schedulers.pbt import _explore, PopulationBasedTrainingReplay
 from ray.tune.search._mock import _MockSearcher
 from ray.tune.search import ConcurrencyLimiter
@@ -2210,6 +2211,32 @@ class AsyncHyperBandSuite(unittest.TestCase):
             scheduler.on_trial_result(None, t3, result(2, 260)), TrialScheduler.STOP
         )
 
+    def testAsyncHBRungRecordPercentile(self):
+        rng = np.random.default_rng(0)
+        recorded = _RungRecord()
+        rewards = {}
+        self.assertIsNone(recorded.percentile(50))
+
+        recorded["nan"] = rewards["nan"] = np.nan
+        self.assertTrue(np.isnan(recorded.percentile(50)))
+
+        for i in range(200):
+            reward = np.nan if i % 10 == 5 else rng.normal()
+            recorded[str(i)] = rewards[str(i)] = reward
+            for q in [0, 50, 2 / 3 * 100, 100]:
+                self.assertAlmostEqual(
+                    recorded.percentile(q), np.nanpercentile(list(rewards.values()), q)
+                )
+        self.assertEqual(len(recorded), len(rewards))
+        self.assertIn("15", recorded)
+
+        # Overwriting a reward replaces it in the percentile computation.
+        recorded["1"] = rewards["1"] = 100.0
+        self.assertAlmostEqual(recorded.percentile(100), 100.0)
+        self.assertAlmostEqual(
+            recorded.percentile(50), np.nanpercentile(list(rewards.values()), 50)
+        )
+
     def testAsyncHBSaveRestore(self):
         _, tmpfile = tempfile.mkstemp()
 
@@ -9,6 +9,7 @@ from ray.rllib import _register_all
 from ray import tune
 from ray.tune.result import DEFAULT_RESULTS_DIR
 from ray.tune.search import grid_search, BasicVariantGenerator
+from ray.tune.search.sample import Categorical, Float
 from ray.tune.search.variant_generator import (
     RecursiveDependencyError,
     _resolve_nested_dict,
@@ -318,6 +319,32 @@ class VariantGeneratorTest(unittest.TestCase):
         self.assertEqual(trials[0].config, {"x": {"y": {"z": 1}}, "y": 12, "z": 100})
         self.assertEqual(trials[0].evaluated_params, {"x/y/z": 1, "y": 12, "z": 100})
 
+    def testVariantsDontShareConfigs(self):
+        spec = {
+            "run": "PPO",
+            "config": {
+                "a": grid_search([1, 2]),
+                "b": {"c": tune.uniform(0, 1), "d": {"e": [1, 2]}},
+                "f": grid_search([{"g": tune.choice([3, 4])}, {"g": 5}]),
+            },
+        }
+        trials = self.generate_trials(spec, "shared_configs")
+        self.assertEqual(len(trials), 4)
+        self.assertEqual([t.config["a"] for t in trials], [1, 2, 1, 2])
+        self.assertEqual([t.config["f"]["g"] for t in trials][2:], [5, 5])
+
+        # The spec was not modified
+        self.assertIsInstance(spec["config"]["b"]["c"], Float)
+        self.assertIsInstance(spec["config"]["f"]["grid_search"][0]["g"], Categorical)
+
+        # Trials don't share any part of their configs
+        trials[0].config["b"]["d"]["e"].append(3)
+        trials[0].config["f"]["g"] = 6
+        self.assertEqual(trials[1].config["b"]["d"]["e"], [1, 2])
+        self.assertEqual(trials[2].config["b"]["d"]["e"], [1, 2])
+        self.assertEqual(spec["config"]["b"]["d"]["e"], [1, 2])
+        self.assertIn(trials[1].config["f"]["g"], [3, 4])
+
     def testLogUniform(self):
         sampler = tune.loguniform(1e-10, 1e-1)
         results = sampler.sample(None, 1000)
@@ -620,6 +620,7 @@ def wrap_function(
         _name = name or (
             train_func.__name__ if hasattr(train_func, "__name__") else "func"
         )
+        _reported_metrics = getattr(train_func, "_reported_metrics", None)
 
         def __repr__(self):
             return self._name
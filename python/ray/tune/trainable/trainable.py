@@ -1,4 +1,5 @@
 import copy
+import json
 import logging
 import os
 import platform
@@ -20,11 +21,13 @@ from ray.air.checkpoint import (
 )
 from ray.tune.resources import Resources
 from ray.tune.result import (
+    AUTO_RESULT_KEYS,
     DEBUG_METRICS,
     DEFAULT_RESULTS_DIR,
     DONE,
     EPISODES_THIS_ITER,
     EPISODES_TOTAL,
+    EXPR_FULL_RESULT_FILE,
     HOSTNAME,
     NODE_IP,
     PID,
@@ -47,6 +50,7 @@ from ray.tune.utils.log import disable_ipython
 from ray.tune.execution.placement_groups import PlacementGroupFactory
 from ray.tune.trainable.util import TrainableUtil
 from ray.tune.utils.util import (
+    SafeFallbackEncoder,
     Tee,
     _delete_external_checkpoint,
     _get_checkpoint_from_remote_node,
@@ -61,6 +65,44 @@ logger = logging.getLogger(__name__)
 
 SETUP_TIME_THRESHOLD = 10
 
+# Key of the trainable metadata in in-memory checkpoints
+_TRAINABLE_METADATA_KEY = "_trainable_metadata"
+
+# Result keys that are always sent to the driver, even if the trainable only
+# reports some of its metrics
+_ALWAYS_REPORTED_KEYS = set(AUTO_RESULT_KEYS + DEBUG_METRICS) | {
+    DONE,
+    EPISODES_THIS_ITER,
+    RESULT_DUPLICATE,
+    SHOULD_CHECKPOINT,
+    TIMESTEPS_THIS_ITER,
+}
+
+
+def _filter_result(result: Dict, metrics: List[str]) -> Dict:
+    """Returns the given metrics and the always reported keys of a result.
+
+    Nested metrics can be given as paths joined by ``/``.
+    """
+    filtered = {k: v for k, v in result.items() if k in _ALWAYS_REPORTED_KEYS}
+    for metric in metrics:
+        if metric in result:
+            filtered[metric] = result[metric]
+            continue
+
+        path = metric.split("/")
+        value = result
+        for key in path:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = filtered
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = value
+    return filtered
+
 
 @PublicAPI
 class Trainable:
@@ -104,6 +146,9 @@ class Trainable:
 
     _checkpoint_cls: Type[Checkpoint] = Checkpoint
 
+    # Set by `tune.with_reported_metrics()`
+    _reported_metrics: Optional[List[str]] = None
+
     def __init__(
         self,
         config: Dict[str, Any] = None,
@@ -142,6 +187,12 @@ class Trainable:
         self._result_logger = self._logdir = None
         self._create_logger(self.config, logger_creator)
 
+        self._full_result_writer = None
+        if self._reported_metrics is not None:
+            from ray.tune.logger.buffered import _BufferedWriter, _append_to_file
+
+            self._full_result_writer = _BufferedWriter(_append_to_file)
+
         self._stdout_context = self._stdout_fp = self._stdout_stream = None
         self._stderr_context = self._stderr_fp = self._stderr_stream = None
         self._stderr_logging_handler = None
@@ -363,6 +414,8 @@ class Trainable:
 
         # We do not modify internal state nor update this result if duplicate.
         if RESULT_DUPLICATE in result:
+            if self._reported_metrics is not None:
+                result = _filter_result(result, self._reported_metrics)
             return result
 
         result = result.copy()
@@ -421,6 +474,15 @@ class Trainable:
 
         self._last_result = result
 
+        if self._reported_metrics is not None:
+            # Only send the reported metrics to the driver and write the
+            # full result to the trial directory.
+            self._full_result_writer.add(
+                os.path.join(self.logdir, EXPR_FULL_RESULT_FILE),
+                json.dumps(result, cls=SafeFallbackEncoder) + "\n",
+            )
+            result = _filter_result(result, self._reported_metrics)
+
         return result
 
     def get_state(self):
@@ -465,9 +527,23 @@ class Trainable:
         """
         checkpoint_dir = self._create_checkpoint_dir(checkpoint_dir=checkpoint_dir)
 
+        if self._full_result_writer:
+            self._full_result_writer.flush()
+
         # User saves checkpoint
         checkpoint_dict_or_path = self.save_checkpoint(checkpoint_dir)
 
+        return self._finish_save(
+            checkpoint_dict_or_path, checkpoint_dir, prevent_upload=prevent_upload
+        )
+
+    def _finish_save(
+        self,
+        checkpoint_dict_or_path: Union[str, Dict, None],
+        checkpoint_dir: Optional[str],
+        prevent_upload: bool = False,
+    ) -> str:
+        """Writes the metadata of a saved checkpoint and maybe uploads it."""
         if checkpoint_dict_or_path is None:
             # checkpoint_dict_or_path can only be None in class trainables.
             # In that case the default is to use the root checkpoint directory.
@@ -653,15 +729,34 @@ class Trainable:
         It also saves to disk but does not return the checkpoint path.
         It does not save the checkpoint to cloud storage.
 
+        If ``save_checkpoint()`` returns a dict and doesn't write any files,
+        the dict is returned as an in-memory checkpoint along with the
+        trainable metadata, without writing it to disk.
+
         Returns:
             Object holding checkpoint data.
         """
         temp_container_dir = tempfile.mkdtemp("save_to_object", dir=self.logdir)
-        checkpoint_dir = self.save(temp_container_dir, prevent_upload=True)
+        try:
+            checkpoint_dir = self._create_checkpoint_dir(temp_container_dir)
+            checkpoint_dict_or_path = self.save_checkpoint(checkpoint_dir)
 
-        obj_ref = self._checkpoint_cls.from_directory(checkpoint_dir).to_bytes()
-        shutil.rmtree(temp_container_dir)
-        return obj_ref
+            if isinstance(checkpoint_dict_or_path, dict) and os.listdir(
+                checkpoint_dir
+            ) == [".is_checkpoint"]:
+                return self._checkpoint_cls.from_dict(
+                    {
+                        **checkpoint_dict_or_path,
+                        _TRAINABLE_METADATA_KEY: self.get_state(),
+                    }
+                )
+
+            checkpoint_dir = self._finish_save(
+                checkpoint_dict_or_path, checkpoint_dir, prevent_upload=True
+            )
+            return self._checkpoint_cls.from_directory(checkpoint_dir).to_bytes()
+        finally:
+            shutil.rmtree(temp_container_dir)
 
     def _restore_from_checkpoint_obj(self, checkpoint: Checkpoint):
         with checkpoint.as_directory() as converted_checkpoint_path:
@@ -768,6 +863,11 @@ class Trainable:
             relative_checkpoint_path = metadata["relative_checkpoint_path"]
             to_load = os.path.join(checkpoint_dir, relative_checkpoint_path)
 
+        self._restore_from_metadata(metadata, to_load, checkpoint_dir)
+
+    def _restore_from_metadata(
+        self, metadata: Dict, to_load: Union[str, Dict], checkpoint_dir: str
+    ):
         # Set metadata
         self._iteration = metadata["iteration"]
         self._timesteps_total = metadata["timesteps_total"]
@@ -798,7 +898,20 @@ class Trainable:
 
         These checkpoints are returned from calls to save_to_object().
         """
-        checkpoint = self._checkpoint_cls.from_bytes(obj)
+        if isinstance(obj, Checkpoint):
+            checkpoint = obj
+        else:
+            checkpoint = self._checkpoint_cls.from_bytes(obj)
+
+        data_type, data = checkpoint.get_internal_representation()
+        if data_type == "data_dict" and _TRAINABLE_METADATA_KEY in data:
+            # In-memory checkpoint from `save_to_object()`, no need to go
+            # through a directory.
+            checkpoint_dict = checkpoint.to_dict().copy()
+            metadata = checkpoint_dict.pop(_TRAINABLE_METADATA_KEY)
+            checkpoint_dict.pop(_DICT_CHECKPOINT_ADDITIONAL_FILE_KEY, None)
+            self._restore_from_metadata(metadata, checkpoint_dict, "<object>")
+            return
 
         with checkpoint.as_directory() as checkpoint_path:
             self.restore(checkpoint_path)
@@ -885,6 +998,8 @@ class Trainable:
 
         self._result_logger.flush()
         self._result_logger.close()
+        if self._full_result_writer:
+            self._full_result_writer.flush()
 
         if logger_creator:
             logger.debug("Logger reset.")
@@ -1008,6 +1123,8 @@ class Trainable:
         """
         self._result_logger.flush()
         self._result_logger.close()
+        if self._full_result_writer:
+            self._full_result_writer.close()
         if self._monitor.is_alive():
             self._monitor.stop()
             self._monitor.join()
@@ -4,7 +4,7 @@ import logging
 import os
 import shutil
 import types
-from typing import Any, Callable, Dict, Optional, Type, Union, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Type, Union, TYPE_CHECKING
 
 import pandas as pd
 
@@ -415,6 +415,10 @@ def with_parameters(trainable: Union[Type["Trainable"], Callable], **kwargs):
         if hasattr(trainable, "_resources"):
             trainable_with_params._resources = trainable._resources
 
+        # Likewise for the `_reported_metrics` of `tune.with_reported_metrics`
+        if hasattr(trainable, "_reported_metrics"):
+            trainable_with_params._reported_metrics = trainable._reported_metrics
+
     trainable_with_params.__name__ = trainable_name
 
     # Mark this trainable as being wrapped by saving the attached parameter names
@@ -532,3 +536,91 @@ def with_resources(
         trainable = ResourceTrainable
 
     return trainable
+
+
+@PublicAPI(stability="alpha")
+def with_reported_metrics(
+    trainable: Union[Type["Trainable"], Callable], metrics: List[str]
+):
+    """Wrapper for trainables to only send some metrics to the driver.
+
+    By default, each result reported by a trainable is sent to the driver in
+    full. For trainables that report many or large metrics, this wrapper
+    limits the results sent to the driver to the given metrics and the
+    metrics auto-filled by Tune (e.g. ``training_iteration``). Nested
+    metrics can be specified as paths joined by ``/``.
+
+    The driver-side loggers, schedulers, search algorithms and stoppers
+    only see these metrics. The full results are written to
+    ``result_full.json`` in the trial directory by the trainable.
+
+    Args:
+        trainable: Trainable to wrap.
+        metrics: Metrics to send to the driver.
+
+    Example:
+
+    .. code-block:: python
+
+        from ray import tune
+        from ray.air import session
+        from ray.tune.tuner import Tuner
+
+        def train(config):
+            session.report({"loss": 0.1, "histogram": list(range(10000))})
+
+        tuner = Tuner(
+            tune.with_reported_metrics(train, metrics=["loss"]),
+            tune_config=tune.TuneConfig(metric="loss", mode="min"),
+        )
+        results = tuner.fit()
+
+    """
+    from ray.tune.trainable import Trainable
+
+    if not callable(trainable) or (
+        inspect.isclass(trainable) and not issubclass(trainable, Trainable)
+    ):
+        raise ValueError(
+            f"`tune.with_reported_metrics() only works with function trainables "
+            f"or classes that inherit from `tune.Trainable()`. Got type: "
+            f"{type(trainable)}."
+        )
+
+    metrics = list(metrics)
+
+    if not inspect.isclass(trainable):
+        if isinstance(trainable, types.MethodType):
+            # Methods cannot set arbitrary attributes, so we have to wrap them
+            use_checkpoint = _detect_checkpoint_function(trainable, partial=True)
+            if use_checkpoint:
+
+                def _trainable(config, checkpoint_dir):
+                    return trainable(config, checkpoint_dir=checkpoint_dir)
+
+            else:
+
+                def _trainable(config):
+                    return trainable(config)
+
+            _trainable._reported_metrics = metrics
+            return _trainable
+
+        # Just set an attribute. This will be resolved later in `wrap_function()`.
+        try:
+            trainable._reported_metrics = metrics
+        except AttributeError as e:
+            raise RuntimeError(
+                "Could not use `tune.with_reported_metrics()` on the supplied "
+                "trainable. Wrap your trainable in a regular function before "
+                "passing it to Ray Tune."
+            ) from e
+    else:
+
+        class ReportedMetricsTrainable(trainable):
+            _reported_metrics = metrics
+
+        ReportedMetricsTrainable.__name__ = trainable.__name__
+        trainable = ReportedMetricsTrainable
+
+    return trainable
@@ -392,7 +392,9 @@ def run(
         reuse_actors: Whether to reuse actors between different trials
             when possible. This can drastically speed up experiments that start
             and stop actors often (e.g., PBT in time-multiplexing mode). This
-            requires trials to have the same resource requirements.
+            requires trials to have the same resource requirements. If the
+            trainable doesn't implement ``reset_config()``, only the
+            resources of the actor are reused for the next trial.
             Defaults to ``True`` for function trainables and ``False`` for
             class and registered trainables.
         raise_on_failed_trial: Raise TuneError if there exists failed
@@ -773,7 +775,11 @@ def run(
     tune_taken = time.time() - tune_start
 
     try:
-        runner.checkpoint(force=True, wait=True)
+        # Cache all results in one file, which is much faster to load later.
+        # Results of interrupted trials may still be buffered by loggers.
+        runner.checkpoint(
+            force=True, wait=True, write_results_index=runner.is_finished()
+        )
     except Exception as e:
         logger.warning(f"Trial Runner checkpointing failed: {str(e)}")
 
@@ -818,13 +824,14 @@ def run(
             "`resume=True` to `tune.run()`"
         )
 
-    return ExperimentAnalysis(
+    analysis = ExperimentAnalysis(
         experiment_checkpoint,
         trials=all_trials,
         default_metric=metric,
         default_mode=mode,
         sync_config=sync_config,
     )
+    return analysis
 
 
 @PublicAPI
@@ -43,7 +43,9 @@ class TuneConfig:
         reuse_actors: Whether to reuse actors between different trials
             when possible. This can drastically speed up experiments that start
             and stop actors often (e.g., PBT in time-multiplexing mode). This
-            requires trials to have the same resource requirements.
+            requires trials to have the same resource requirements. If the
+            trainable doesn't implement ``reset_config()``, only the
+            resources of the actor are reused for the next trial.
             Defaults to ``True`` for function trainables (including most
             Ray AIR trainers) and ``False`` for class and registered trainables
             (e.g. RLlib).
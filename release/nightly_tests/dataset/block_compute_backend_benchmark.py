@@ -0,0 +1,89 @@
+import pyarrow.compute as pac
+
+import ray
+from ray.data.aggregate import Count, Max, Mean, Sum
+from ray.data.context import DatasetContext
+from ray.data.dataset import Dataset
+
+from benchmark import Benchmark
+
+
+def run_block_compute_backends(benchmark: Benchmark):
+    """Compare the polars block compute backend with the pyarrow and pandas paths.
+
+    Each case is run on the same input, once with pandas blocks, once with Arrow
+    blocks using the default pyarrow transforms, and once with Arrow blocks using
+    the polars transforms (``DatasetContext.use_polars = True``).
+    """
+    ctx = DatasetContext.get_current()
+    num_blocks = int(ray.cluster_resources().get("CPU", 1))
+    num_rows = 100_000_000
+
+    arrow_ds = (
+        ray.data.range_table(num_rows, parallelism=num_blocks)
+        .map_batches(
+            lambda t: t.append_column("key", pac.bit_wise_and(t["value"], 1023)),
+            batch_format="pyarrow",
+        )
+        .random_shuffle(seed=0)
+        .fully_executed()
+    )
+    pandas_ds = arrow_ds.map_batches(lambda df: df, batch_format="pandas")
+    pandas_ds = pandas_ds.fully_executed()
+
+    q_list = [
+        (sort, "sort"),
+        (groupby_sum, "groupby-sum"),
+        (groupby_multi_agg, "groupby-multi-agg"),
+        (filter_batches, "filter-batches"),
+    ]
+
+    for q, name in q_list:
+        ctx.use_polars = False
+        benchmark.run(f"{name}-pandas", q, ds=pandas_ds, batch_format="pandas")
+        benchmark.run(f"{name}-pyarrow", q, ds=arrow_ds, batch_format="pyarrow")
+        ctx.use_polars = True
+        benchmark.run(f"{name}-polars", q, ds=arrow_ds, batch_format="polars")
+    ctx.use_polars = False
+
+
+def sort(ds: Dataset, batch_format: str) -> Dataset:
+    return ds.sort("value")
+
+
+def groupby_sum(ds: Dataset, batch_format: str) -> Dataset:
+    return ds.groupby("key").sum("value")
+
+
+def groupby_multi_agg(ds: Dataset, batch_format: str) -> Dataset:
+    return ds.groupby("key").aggregate(
+        Count(), Sum("value"), Max("value"), Mean("value")
+    )
+
+
+def filter_batches(ds: Dataset, batch_format: str) -> Dataset:
+    if batch_format == "pandas":
+
+        def fn(df):
+            return df[df["key"] < 512]
+
+    elif batch_format == "pyarrow":
+
+        def fn(table):
+            return table.filter(pac.less(table["key"], 512))
+
+    else:
+        import polars as pl
+
+        def fn(df):
+            return df.filter(pl.col("key") < 512)
+
+    return ds.map_batches(fn, batch_format=batch_format)
+
+
+if __name__ == "__main__":
+    benchmark = Benchmark("block-compute-backend")
+
+    run_block_compute_backends(benchmark)
+
+    benchmark.write_result()
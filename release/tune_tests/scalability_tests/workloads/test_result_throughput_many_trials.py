@@ -0,0 +1,63 @@
+"""Result throughput with many trials
+
+In this run, we will start 1000 trials concurrently that each report 100
+results per second without buffering. Each result is a separate event for the
+driver, so this measures how many results per second the Tune event loop can
+process.
+
+Cluster: cluster_1x96.yaml
+
+Test owner: krfricke
+
+Acceptance criteria: Should run faster than 300 seconds.
+
+Theoretical minimum time: 60 seconds
+"""
+import json
+import os
+
+import ray
+
+from ray.tune.utils.release_test_util import timed_tune_run
+
+
+def main():
+    os.environ["TUNE_DISABLE_AUTO_CALLBACK_LOGGERS"] = "1"  # Tweak
+    os.environ["TUNE_RESULT_BUFFER_LENGTH"] = "1"
+
+    ray.init(address="auto")
+
+    num_samples = 1000
+    results_per_second = 100
+    trial_length_s = 60
+
+    max_runtime = 300
+
+    result = timed_tune_run(
+        name="result throughput many trials",
+        num_samples=num_samples,
+        results_per_second=results_per_second,
+        trial_length_s=trial_length_s,
+        max_runtime=max_runtime,
+        # Fit all trials on the 96 CPUs of the node.
+        resources_per_trial={"cpu": 0.09},
+    )
+
+    num_results = num_samples * results_per_second * trial_length_s
+    results_per_s = num_results / result["time_taken"]
+    print(f"Processed {results_per_s:.2f} results per second.")
+
+    result["perf_metrics"] = [
+        {
+            "perf_metric_name": "results_per_second",
+            "perf_metric_value": results_per_s,
+            "perf_metric_type": "THROUGHPUT",
+        }
+    ]
+    test_output_json = os.environ.get("TEST_OUTPUT_JSON", "/tmp/tune_test.json")
+    with open(test_output_json, "wt") as f:
+        json.dump(result, f)
+
+
+if __name__ == "__main__":
+    main()